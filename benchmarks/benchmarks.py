@@ -270,3 +270,131 @@ class EOSMIXTernaryTimeSuite(BaseTimeSuite):
     def time_eos_TV_numba_to(self, eos):
         return self.eos_instances_numba_PT[eos].to(V=.025, T=301.0, zs=self.zs2_np)
 
+
+
+class ImportTimeSuite(object):
+    # Each timeraw_ benchmark runs in a fresh interpreter
+    def timeraw_import_thermo(self):
+        return "import thermo"
+
+    def timeraw_import_flash(self):
+        return "from thermo import FlashVL"
+
+    def timeraw_import_star(self):
+        return "from thermo import *"
+
+
+class FlashPureVLSSaturationTableSuite(object):
+    # Steam and refrigerant cycles in the default Peng-Robinson configuration,
+    # without and with the saturation table as initial guesses or direct
+    # answers to the P-VF flashes
+    params = [[('water', 8e6, 1e4), ('1,1,1,2-tetrafluoroethane', 1.2e6, 2e5)],
+              ['none', 'guess', 'direct']]
+    param_names = ['fluid', 'VF_table']
+
+    def setup(self, fluid, mode):
+        from thermo import (ChemicalConstantsPackage, FlashPureVLS, CEOSGas,
+                            CEOSLiquid, PRMIX)
+        name, self.P_high, self.P_low = fluid
+        constants, correlations = ChemicalConstantsPackage.from_IDs([name])
+        kwargs = dict(eos_kwargs=dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas),
+                      HeatCapacityGases=correlations.HeatCapacityGases)
+        gas = CEOSGas(PRMIX, T=300.0, P=1e5, zs=[1.0], **kwargs)
+        liquid = CEOSLiquid(PRMIX, T=300.0, P=1e5, zs=[1.0], **kwargs)
+        self.flasher = flasher = FlashPureVLS(constants, correlations, gas, [liquid], [])
+        if mode != 'none':
+            flasher.VF_table = True
+            flasher.VF_table_direct = mode == 'direct'
+            flasher.build_VF_table()
+        self.T_sat = flasher.flash(P=self.P_low, VF=0.0).T
+
+    def time_flash_TVF(self, fluid, mode):
+        return self.flasher.flash_TVF(self.T_sat)
+
+    def time_flash_PVF(self, fluid, mode):
+        return self.flasher.flash_PVF(self.P_high)
+
+    def time_cycle(self, fluid, mode):
+        flasher, P_high, P_low = self.flasher, self.P_high, self.P_low
+        sat_vapor = flasher.flash(P=P_high, VF=1.0)
+        expanded = flasher.flash(P=P_low, S=sat_vapor.S())
+        sat_liquid = flasher.flash(P=P_low, VF=0.0)
+        pumped = flasher.flash(P=P_high, S=sat_liquid.S())
+        return expanded, pumped
+
+
+class HelmholtzDerivativesSuite(object):
+    # Caloric properties of IAPWS-95 water from the per-property derivative
+    # functions and from the single derivative bundle
+    params = [['individual', 'bundle']]
+    param_names = ['Ar_derivatives']
+
+    def setup(self, mode):
+        from thermo import IAPWS95
+        class IAPWS95Individual(IAPWS95):
+            _Ar_derivatives_func = None
+        cls = IAPWS95 if mode == 'bundle' else IAPWS95Individual
+        self.states = []
+        for T, P in ((300.0, 1e5), (500.0, 1e6), (800.0, 2e7)):
+            phase = cls(T=T, P=P, zs=[1.0])
+            self.states.append((cls, dict(phase.__dict__)))
+
+    def new_phases(self):
+        phases = []
+        for cls, state in self.states:
+            phase = cls.__new__(cls)
+            phase.__dict__.update(state)
+            phases.append(phase)
+        return phases
+
+    def time_H_S_Cp_w(self, mode):
+        for phase in self.new_phases():
+            phase.H(), phase.S(), phase.Cp(), phase.speed_of_sound()
+
+    def time_PH_jacobian(self, mode):
+        for phase in self.new_phases():
+            phase.H(), phase.dH_dT_V(), phase.dH_dV_T(), phase.dP_dT(), phase.dP_dV()
+
+
+class UNIFACSparseSuite(object):
+    # Many-subgroup UNIFAC mixtures with dense and sparse psi terms; one fifth
+    # of the subgroup pairs have interaction parameters, and each component
+    # has three subgroups
+    params = [[10, 25, 50, 100, 200], ['dense', 'sparse']]
+    param_names = ['N_groups', 'psis']
+
+    def setup(self, N_groups, mode):
+        from thermo import UNIFAC
+        rng = np.random.RandomState(0)
+        N = max(3, N_groups//4)
+        interacting = rng.rand(N_groups, N_groups) < 0.2
+        psi_abc = tuple(np.where(interacting, rng.uniform(-s, s, (N_groups, N_groups)), 0.0)
+                        for s in (500.0, 1.0, 1e-3))
+        vs = np.zeros((N_groups, N))
+        for i in range(N):
+            vs[rng.choice(N_groups, 3, replace=False), i] = rng.randint(1, 4, 3)
+        Qs = rng.uniform(0.2, 1.5, N_groups)
+        rs = vs.T.dot(rng.uniform(0.2, 1.5, N_groups))
+        xs = rng.rand(N)
+        self.xs = xs/xs.sum()
+        self.model = UNIFAC(T=330.0, xs=self.xs, rs=rs, qs=vs.T.dot(Qs), Qs=Qs, vs=vs,
+                            psi_abc=psi_abc, version=1, sparse=mode == 'sparse',
+                            T_cache_size=0)
+        self.model.gammas()
+        self.Ts = iter(np.linspace(300.0, 400.0, 100000))
+
+    def time_gammas_new_T(self, N_groups, mode):
+        return self.model.to_T_xs(T=next(self.Ts), xs=self.xs).gammas()
+
+    def time_gammas_same_T(self, N_groups, mode):
+        return self.model.to_T_xs(T=330.0, xs=self.xs[::-1]).gammas()
+
+    def mem_state(self, N_groups, mode):
+        # Arrays calculated for one new temperature and composition
+        model = self.model.to_T_xs(T=340.0, xs=self.xs)
+        model.gammas()
+        shared = self.model.__dict__
+        return {k: v for k, v in model.__dict__.items() if shared.get(k) is not v}
+
+    def peakmem_gammas(self, N_groups, mode):
+        return self.model.to_T_xs(T=340.0, xs=self.xs).gammas()
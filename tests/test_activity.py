@@ -28,7 +28,7 @@ from thermo.activity import GibbsExcess, IdealSolution
 from random import random
 import numpy as np
 from fluids.numerics import jacobian, hessian, derivative, normalize, assert_close, assert_close1d, assert_close2d
-from thermo.test_utils import check_np_output_activity
+from thermo.test_utils import check_np_output_activity, check_batch_activity
 import pickle
 import json
 
@@ -91,3 +91,12 @@ def test_IdealSolution():
     for s in GE._point_properties:
         if hasattr(GE, s):
             res = getattr(GE, s)()
+
+def test_IdealSolution_batch():
+    model = IdealSolution(T=300.0, xs=[0.2, 0.8])
+    check_batch_activity(model, 350.0, [[0.1, 0.9], [0.6, 0.4]])
+    assert_close1d(model.gammas_batch(350.0, [[0.1, 0.9], [0.6, 0.4]]).ravel(), [1.0]*4)
+    assert model.d2GE_dxixjs_batch(350.0, [[0.1, 0.9], [0.6, 0.4]]).shape == (2, 2, 2)
+    # The general implementation creates a model for each composition
+    assert_close1d(GibbsExcess.gammas_batch(model, 350.0, [[0.1, 0.9], [0.6, 0.4]]).ravel(), [1.0]*4)
+    assert GibbsExcess.d2GE_dxixjs_batch(model, 350.0, [[0.1, 0.9], [0.6, 0.4]]).shape == (2, 2, 2)
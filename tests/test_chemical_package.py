@@ -20,6 +20,7 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
+import sys
 import pytest
 import thermo
 from thermo import *
@@ -145,4 +146,89 @@ def test_add_PropertyCorrelationsPackage():
     c = a + b
     
     c_good = ChemicalConstantsPackage.correlations_from_IDs(IDs=['water', 'hexane', 'toluene'])
-    assert c == c_good
\ No newline at end of file
+    assert c == c_good
+
+
+def test_PropertyCorrelationsPackage_compile():
+    constants, correlations = ChemicalConstantsPackage.from_IDs(['water', 'ethanol'])
+    T = 350.0
+    expect = [(prop, i, obj.T_dependent_property(T))
+              for prop in correlations.pure_correlations
+              for i, obj in enumerate(getattr(correlations, prop)) if obj.method is not None]
+    assert correlations.compile() > 10
+    assert correlations.VaporPressures[1]._surrogate is not None
+    for prop, i, v in expect:
+        if v is not None:
+            assert_close(getattr(correlations, prop)[i].T_dependent_property(T), v, rtol=1e-9)
+    correlations.uncompile()
+    assert correlations.VaporPressures[1]._surrogate is None
+
+    # Any failure to compile leaves the method in use
+    def fail(**kwargs):
+        raise RuntimeError
+    correlations.VaporPressures[0].compile = fail
+    correlations.compile(props=['VaporPressures'])
+    assert correlations.VaporPressures[0]._surrogate is None
+    assert correlations.VaporPressures[1]._surrogate is not None
+    obj = correlations.VaporPressures[0]
+    assert obj.T_dependent_property(T) == obj.calculate(T, obj.method)
+    correlations.uncompile()
+
+
+def shared_constants_worker(shared):
+    constants = shared.constants
+    return constants, shared.arrays['Tcs'].flags.writeable
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason='multiprocessing.shared_memory needs Python 3.8')
+def test_SharedChemicalConstantsPackage():
+    import pickle
+    import multiprocessing
+    from multiprocessing.shared_memory import SharedMemory
+    from thermo import CEOSGas, CEOSLiquid, PRMIX, FlashVL
+    constants = ChemicalConstantsPackage.constants_from_IDs(['methane', 'ethane', 'water', 'decane'])
+    with SharedChemicalConstantsPackage(constants) as shared:
+        assert 'Tcs' in shared.shared_properties
+        assert 'names' not in shared.shared_properties
+        # Properties with missing values keep their None entries
+        for prop in shared.shared_properties:
+            assert None not in getattr(constants, prop)
+
+        # A copy attached in another process views the same block
+        attached = pickle.loads(pickle.dumps(shared))
+        arrays = attached.arrays
+        assert type(arrays['Tcs']) is np.ndarray
+        assert not arrays['Tcs'].flags.writeable
+        with pytest.raises(ValueError):
+            arrays['Tcs'][0] = 1.0
+        assert_close1d(arrays['Tcs'], constants.Tcs, rtol=0)
+        del arrays
+
+        # The rebuilt package is the same as the original
+        new = attached.constants
+        assert new == constants
+        assert hash(new) == hash(constants)
+        for prop in constants.properties:
+            assert getattr(new, prop) == getattr(constants, prop)
+        assert type(new.Tcs) is list
+
+        # and works with the usual phase setup
+        zs = [0.25]*4
+        eos_kwargs = dict(Tcs=new.Tcs, Pcs=new.Pcs, omegas=new.omegas)
+        flasher = FlashVL(new, PropertyCorrelationsPackage(new, skip_missing=True, HeatCapacityGases=[]),
+                          liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+        res = flasher.flash(T=300.0, P=1e6, zs=zs)
+        eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+        flasher = FlashVL(constants, PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=[]),
+                          liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+        assert_close(res.VF, flasher.flash(T=300.0, P=1e6, zs=zs).VF, rtol=1e-13)
+        del new
+        attached.close()
+
+        with multiprocessing.get_context('spawn').Pool(1) as pool:
+            remote, writeable = pool.apply(shared_constants_worker, (shared,))
+        assert remote == constants
+        assert not writeable
+        name = shared.name
+
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name)
@@ -94,6 +94,56 @@ def test_a_alpha_and_derivatives_quadratic_terms():
     assert_close1d(da_alpha_dT_j_rows, [-0.0006723873746135188, -0.0010642935017889568], rtol=1e-14)
 
 
+def test_a_alpha_quadratic_terms_sparse():
+    N = 30
+    Tcs = [190.0 + 12.0*i for i in range(N)]
+    Pcs = [4.6e6 - 6e4*i for i in range(N)]
+    omegas = [0.01 + 0.02*i for i in range(N)]
+    zs = [1.0/N]*N
+    a_alphas = [0.2 + 0.15*i for i in range(N)]
+    a_alpha_roots = [i**0.5 for i in a_alphas]
+    da_alpha_dTs = [-1e-4*(1.0 + 0.3*i) for i in range(N)]
+    d2a_alpha_dT2s = [5e-7*(1.0 + 0.2*i) for i in range(N)]
+
+    kijs = [[0.0]*N for _ in range(N)]
+    for i, j, kij in [(1, 0, 0.05), (7, 3, -0.02), (29, 11, 0.12), (20, 19, 0.01)]:
+        kijs[i][j] = kijs[j][i] = kij
+    kij_structure = kijs_sparse_structure(kijs)
+    assert kij_structure == ([1, 7, 20, 29], [0, 3, 19, 11], [0.05, -0.02, 0.01, 0.12])
+    assert kijs_sparse_structure([[0.1]*N for _ in range(N)]) is None
+    assert kijs_sparse_structure([[0.0]*N for _ in range(N)]) == ([], [], [])
+
+    for structure, dense in zip([kij_structure, ([], [], [])], [kijs, [[0.0]*N for _ in range(N)]]):
+        a_alpha, a_alpha_j_rows = a_alpha_quadratic_terms_sparse(a_alphas, a_alpha_roots, 300.0, zs, *structure)
+        a_alpha_expect, a_alpha_j_rows_expect = a_alpha_quadratic_terms(a_alphas, a_alpha_roots, 300.0, zs, dense)
+        assert_close(a_alpha, a_alpha_expect, rtol=1e-13)
+        assert_close1d(a_alpha_j_rows, a_alpha_j_rows_expect, rtol=1e-13)
+
+        calc = a_alpha_and_derivatives_quadratic_terms_sparse(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, 300.0, zs, *structure)
+        expect = a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, 300.0, zs, dense)
+        for v_calc, v_expect in zip(calc[:3], expect[:3]):
+            assert_close(v_calc, v_expect, rtol=1e-12)
+        assert_close1d(calc[3], expect[3], rtol=1e-13)
+        assert_close1d(calc[4], expect[4], rtol=1e-12)
+
+    # The EOS object uses the sparse path and gives the same results as the dense one
+    eos = PRMIX(T=300.0, P=1e5, zs=zs, Tcs=Tcs, Pcs=Pcs, omegas=omegas, kijs=kijs)
+    assert eos.kijs_sparse == kij_structure
+    dense = PRMIX(T=300.0, P=1e5, zs=zs, Tcs=Tcs, Pcs=Pcs, omegas=omegas, kijs=kijs)
+    dense._kijs_sparse = None
+    dense = dense.to_TP_zs_fast(T=300.0, P=1e5, zs=zs)
+    assert dense.kijs_sparse is None
+    assert_close(eos.a_alpha, dense.a_alpha, rtol=1e-13)
+    assert_close(eos.d2a_alpha_dT2, dense.d2a_alpha_dT2, rtol=1e-12)
+    assert_close1d(eos.fugacity_coefficients(eos.Z_g), dense.fugacity_coefficients(dense.Z_g), rtol=1e-12)
+    assert_close1d(eos.dlnphis_dT('g'), dense.dlnphis_dT('g'), rtol=1e-11)
+    assert_close2d(eos.d2a_alpha_dninjs, dense.d2a_alpha_dninjs, rtol=1e-11)
+    assert_close2d(eos.dlnphis_dns(eos.Z_g), dense.dlnphis_dns(dense.Z_g), rtol=1e-10)
+
+    new = eos.to_TP_zs_fast(T=310.0, P=2e5, zs=zs)
+    assert new.kijs_sparse is eos.kijs_sparse
+
+
 def test_a_alpha_aijs_composition_independent():
     kijs = [[0,.083],[0.083,0]]
     a_alphas = [0.2491099357671155, 0.6486495863528039]
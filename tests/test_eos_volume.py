@@ -26,6 +26,7 @@ from thermo.eos_volume import *
 from fluids.constants import R
 from math import log, exp, sqrt, log10
 from fluids.numerics import linspace, derivative, logspace, assert_close, assert_close1d, assert_close2d, assert_close3d
+import numpy as np
 
 
 def test_volume_solutions_sympy():
@@ -144,4 +145,73 @@ hard_solutions[(4714.866363457429, 0.01, 2.8986924337681703e-05, 4.9234672948217
 @pytest.mark.parametrize("params", hard_parameters)
 @pytest.mark.parametrize("solver", [volume_solutions_halley, GCEOS.volume_solutions])
 def test_hard_default_solver_volumes(solver, params):
-    validate_volume(params, solver, rtol=1e-14)
\ No newline at end of file
+    validate_volume(params, solver, rtol=1e-14)
+
+def test_volume_solutions_halley_vectorized_hard():
+    args = [np.array(v) for v in zip(*hard_parameters)]
+    Vs = volume_solutions_halley_vectorized(*args)
+    assert Vs.shape == (len(hard_parameters), 3)
+    for params, Vs_calc in zip(hard_parameters, Vs):
+        try:
+            Vs_expect = volume_solutions_halley(*params)
+        except Exception:
+            continue
+        assert_close1d(Vs_calc, Vs_expect, rtol=1e-14)
+
+    # Broadcasting and the grid shape is kept
+    eos = PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=400., P=1E6)
+    Ts = np.array(logspace(log10(10.0), log10(5000.0), 40))
+    Ps = np.array(logspace(-3.0, 9.0, 50))
+    Ts_grid, Ps_grid = np.meshgrid(Ts, Ps)
+    a_alphas = np.array([[eos.a_alpha_pure(T) for T in Ts]]*len(Ps))
+    Vs = volume_solutions_halley_vectorized(Ts_grid, Ps_grid, eos.b, eos.delta, eos.epsilon, a_alphas)
+    assert Vs.shape == (50, 40, 3)
+    for i in range(50):
+        for j in range(40):
+            Vs_expect = volume_solutions_halley(Ts[j], Ps[i], eos.b, eos.delta, eos.epsilon, a_alphas[i, j])
+            assert_close1d(Vs[i, j], Vs_expect, rtol=1e-14)
+
+
+def test_high_alpha_one_root_and_polish_vectorized():
+    b, delta, epsilon = 2.590839755349289e-05, 2.590839755349289e-05, 0.0
+    Ts = np.array([0.0001, 0.01, 1.0, 10.0])
+    Ps = np.array([1e-10, 1e-5, 1e2, 1e8])
+    a_alphas = np.array([348530.6151663297, 1e5, 3e4, 1e6])
+    V_calc = high_alpha_one_root_vectorized(Ts, Ps, b, delta, epsilon, a_alphas)
+    from thermo.eos_volume import high_alpha_one_root
+    for i in range(4):
+        assert_close(V_calc[i], high_alpha_one_root(Ts[i], Ps[i], b, delta, epsilon, a_alphas[i]), rtol=1e-14)
+
+    eos = PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=299., P=1E5)
+    Vs = volume_solution_polish_vectorized([eos.V_l*1.01, eos.V_g*0.99], eos.T, eos.P, eos.b, eos.delta, eos.epsilon, eos.a_alpha)
+    assert_close1d(Vs, [eos.V_l, eos.V_g], rtol=1e-13)
+
+
+def test_volumes_TP_pure_and_mixture():
+    from thermo.eos_mix import PRMIX, SRKMIX
+    Ts = np.array(linspace(150.0, 600.0, 30))
+    Ps = np.array(logspace(2.0, 7.5, 20))
+    eos = PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=400., P=1E6)
+    Vs = eos.volumes_TP(Ts[:, None], Ps[None, :])
+    assert Vs.shape == (30, 20, 3)
+    for i, T in enumerate(Ts):
+        for j, P in enumerate(Ps):
+            assert_close1d(Vs[i, j], eos.to(T=T, P=P).raw_volumes, rtol=1e-14)
+    assert eos.T == 400.0
+
+    kwargs = dict(Tcs=[190.56, 305.32, 369.83, 507.6], Pcs=[4599000.0, 4872000.0, 4248000.0, 3025000.0],
+                  omegas=[0.008, 0.098, 0.152, 0.2975], zs=[0.4, 0.3, 0.2, 0.1],
+                  kijs=[[0.0, 0.0, 0.0, 0.02], [0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0], [0.02, 0.0, 0.0, 0.0]])
+    for cls in (PRMIX, SRKMIX):
+        eos = cls(T=300.0, P=1e6, **kwargs)
+        a_alpha, V_g = eos.a_alpha, eos.V_g
+        Vs = eos.volumes_TP(Ts, 2e6)
+        for i, T in enumerate(Ts):
+            assert_close1d(Vs[i], eos.to(T=T, P=2e6, zs=eos.zs).raw_volumes, rtol=1e-13)
+        assert eos.T == 300.0
+        assert eos.a_alpha == a_alpha
+        assert eos.V_g == V_g
+        assert_close(eos.to_TP_zs_fast(T=300.0, P=1e6, zs=eos.zs).a_alpha, a_alpha, rtol=1e-15)
+
+    eos = IG(T=300.0, P=1e5)
+    assert_close2d(eos.volumes_TP([300.0, 400.0], 1e5), [[R*300.0/1e5, 0.0, 0.0], [R*400.0/1e5, 0.0, 0.0]], rtol=1e-14)
@@ -1983,4 +1983,89 @@ def test_VF_SF_spec_bound_0_1_and_negative_TPV():
         flasher.flash(T=300.0, P=0)
         
     with pytest.raises(ValueError):              
-        flasher.flash(T=300.0, V=0)
\ No newline at end of file
+        flasher.flash(T=300.0, V=0)
+
+def test_VF_table(tmp_path):
+    fluid_idx = 7 # methanol
+    pure_const, pure_props = constants.subset([fluid_idx]), correlations.subset([fluid_idx])
+    kwargs = dict(eos_kwargs=dict(Tcs=pure_const.Tcs, Pcs=pure_const.Pcs, omegas=pure_const.omegas),
+                  HeatCapacityGases=pure_props.HeatCapacityGases)
+    def make_flasher(generic=True):
+        liquid = CEOSLiquid(PRMIX, T=300.0, P=1e5, zs=[1.0], **kwargs)
+        gas = CEOSGas(PRMIX, T=300.0, P=1e5, zs=[1.0], **kwargs)
+        flasher = FlashPureVLS(pure_const, pure_props, gas, [liquid], [])
+        if generic:
+            # Use the generic solvers rather than the EOS saturation routines
+            flasher.VL_only_CEOSs_same = False
+        return flasher
+
+    # Default configuration; the EOS saturation routines
+    flasher = make_flasher(generic=False)
+    assert flasher.VL_only_CEOSs_same
+    Ps = [1e3, 1e5, 2e6]
+    Tsats = [flasher.flash_PVF(P)[0] for P in Ps]
+    flasher.VF_table = True
+    for P, Tsat in zip(Ps, Tsats):
+        Tsat_calc, liquid, gas, iterations, err = flasher.flash_PVF(P)
+        assert flasher.VF_table_lnPsat
+        assert 0 < iterations <= 3
+        assert_close(Tsat_calc, Tsat, rtol=1e-10)
+        assert_close(liquid.fugacities()[0], gas.fugacities()[0], rtol=1e-8)
+    flasher.VF_table_direct = True
+    for P, Tsat in zip(Ps, Tsats):
+        assert flasher.flash_PVF(P)[3] == 0
+        assert_close(flasher.flash_PVF(P)[0], Tsat, rtol=1e-8)
+
+    flasher = make_flasher()
+    Ts = [250.0, 350.0, 450.0, 500.0]
+    Ps = [1e3, 1e5, 2e6]
+    Psats = [flasher.flash_TVF(T)[0] for T in Ts]
+    PVF_iterations = [flasher.flash_PVF(P)[3] for P in Ps]
+    Tsats = [flasher.flash_PVF(P)[0] for P in Ps]
+
+    flasher.VF_table = True
+    assert flasher.VF_table_lnPsat is None
+    for T, Psat in zip(Ts, Psats):
+        res = flasher.flash_TVF(T)
+        assert_close(res[0], Psat, rtol=1e-10)
+    assert flasher.VF_table_lnPsat.xmin < 250.0
+    for P, Tsat, iterations in zip(Ps, Tsats, PVF_iterations):
+        res = flasher.flash_PVF(P)
+        assert_close(res[0], Tsat, rtol=1e-10)
+        assert res[3] < iterations
+
+    flasher.VF_table_direct = True
+    for T, Psat in zip(Ts, Psats):
+        Psat_calc, liquid, gas, iterations, err = flasher.flash_TVF(T)
+        assert iterations == 0
+        assert_close(Psat_calc, Psat, rtol=1e-8)
+        assert_close(liquid.fugacities()[0], gas.fugacities()[0], rtol=1e-7)
+    for P, Tsat in zip(Ps, Tsats):
+        assert flasher.flash_PVF(P)[3] == 0
+        assert_close(flasher.flash_PVF(P)[0], Tsat, rtol=1e-9)
+    res = flasher.flash(P=1e5, VF=0.3)
+    assert_close(res.T, Tsats[1], rtol=1e-9)
+
+    # Saved to disk and reloaded
+    path = str(tmp_path / 'methanol_PR.json')
+    flasher = make_flasher()
+    flasher.VF_table_path = path
+    table = flasher.build_VF_table()
+    assert os.path.exists(path)
+    reloaded = make_flasher()
+    reloaded.VF_table, reloaded.VF_table_path = True, path
+    assert_close(reloaded.flash_TVF(350.0)[0], Psats[1], rtol=1e-10)
+    assert reloaded.VF_table_lnPsat.as_json() == table.as_json()
+
+    # A table for another fluid is rebuilt
+    ethane_const, ethane_props = constants.subset([2]), correlations.subset([2])
+    ethane_kwargs = dict(eos_kwargs=dict(Tcs=ethane_const.Tcs, Pcs=ethane_const.Pcs, omegas=ethane_const.omegas),
+                         HeatCapacityGases=ethane_props.HeatCapacityGases)
+    ethane = FlashPureVLS(ethane_const, ethane_props, CEOSGas(PRMIX, **ethane_kwargs),
+                          [CEOSLiquid(PRMIX, **ethane_kwargs)], [])
+    ethane.VL_only_CEOSs_same = False
+    ethane.VF_table, ethane.VF_table_path = True, path
+    ethane_table = ethane.build_VF_table()
+    assert ethane_table.xmax < 305.32
+    with open(path) as f:
+        assert json.load(f)['lnPsat'] == ethane_table.as_json()
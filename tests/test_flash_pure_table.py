@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2023, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+import pytest
+from random import Random
+from fluids.numerics import assert_close
+from thermo import (ChemicalConstantsPackage, PropertyCorrelationsPackage,
+                    HeatCapacityGas, CEOSGas, CEOSLiquid, PRMIX, FlashPureVLS,
+                    PureFluidTable)
+
+
+@pytest.fixture(scope='module')
+def water_table():
+    constants = ChemicalConstantsPackage(Tcs=[647.14], Pcs=[22048320.0], omegas=[0.344], MWs=[18.01528], CASs=['7732-18-5'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759]))]
+    correlations = PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=HeatCapacityGases)
+    kwargs = dict(eos_kwargs=dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas),
+                  HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashPureVLS(constants, correlations, CEOSGas(PRMIX, **kwargs), [CEOSLiquid(PRMIX, **kwargs)], [])
+    return PureFluidTable(flasher, Tmin=300.0, Tmax=900.0, Pmin=1e3, Pmax=3e7,
+                          T_points=40, P_points=40, rtol=1e-6)
+
+
+def test_PureFluidTable_lookups(water_table):
+    table, flasher = water_table, water_table.flasher
+    rng = Random(0)
+    hits = table.hits
+    for _ in range(100):
+        T, P = rng.uniform(300.0, 900.0), 10.0**rng.uniform(3.0, 7.4)
+        state = flasher.flash(T=T, P=P)
+        V, H, S = state.V(), state.H(), state.S()
+        expect = (T, P, V, H, S, state.VF)
+        for res in (table.PT(T, P), table.PH(P, H), table.PS(P, S)):
+            assert_close(res[0], T, rtol=1e-6)
+            assert_close(res[1], P, rtol=1e-9)
+            assert_close(res[2], V, rtol=1e-5)
+            assert_close(res[3], H, atol=1e-5*(abs(H) + 8.314*T))
+            assert_close(res[4], S, atol=1e-5*(abs(S) + 8.314))
+            assert res[5] == expect[5]
+        res = table.DT(1.0/V, T)
+        assert_close(res[1], P, rtol=1e-5)
+        assert_close(res[3], H, atol=1e-5*(abs(H) + 8.314*T))
+    # Most lookups come from the table
+    assert table.hits - hits > 250
+
+
+def test_PureFluidTable_fallbacks(water_table):
+    table, flasher = water_table, water_table.flasher
+    # Cells crossed by the saturation curve are not used
+    Tsat = flasher.flash(P=1e5, VF=0.5).T
+    i = int((Tsat - table.Tmin)/table.dT)
+    j = max(jj for jj in range(table.P_points) if table.Ps[jj] <= 1e5)
+    assert not table.valid[i, j]
+
+    # Two-phase
+    sat = flasher.flash(P=1e5, VF=0.3)
+    fallbacks = table.fallbacks
+    res = table.PH(1e5, sat.H())
+    assert table.fallbacks == fallbacks + 1
+    assert_close(res[0], sat.T)
+    assert_close(res[5], 0.3)
+
+    # Outside the table
+    res = table.PT(1000.0, 1e5)
+    assert table.fallbacks == fallbacks + 2
+    assert_close(res[3], flasher.flash(T=1000.0, P=1e5).H())
+
+    # Liquid density lookups are too sensitive to the pressure
+    liquid = flasher.flash(T=320.0, P=1e6)
+    assert liquid.VF == 0
+    res = table.DT(1.0/liquid.V(), 320.0)
+    assert table.fallbacks == fallbacks + 3
+    assert_close(res[1], 1e6, rtol=1e-7)
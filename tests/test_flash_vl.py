@@ -445,3 +445,229 @@ def test_issue106_Michelson_stability_test_log_zero():
     assert res.phase_count == 1
     assert res.liquid0 is not None
     assert isinstance(res.liquid0, GibbsExcessLiquid)
+
+
+def test_grid_flash_arrays_C2_C5_PR():
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], Tms=[90.3, 143.15],
+                                         Tbs=[184.55, 309.21], CASs=['74-84-0', '109-66-0'],
+                                         names=['ethane', 'pentane'], MWs=[30.06904, 72.14878])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.537198394065234e-22, -4.946850205122326e-18, 1.4223747507170372e-14, -2.3451318313798008e-11, 2.4271676873997662e-08, -1.6055220805830093e-05, 0.006379734000450042, -1.0360272314628292, 141.84695243411866]))]
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases, skip_missing=True)
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+    zs = [.5, .5]
+    Ts = [250.0, 300.0, 350.0, 400.0]
+    Ps = [1e5, 5e5, 1e6, 2e6, 3e6]
+
+    values, failed = flasher.grid_flash_arrays(zs, Ts=Ts, Ps=Ps, props=['VF', 'H'])
+    assert values.shape == (2, 4, 5)
+    assert not failed.any()
+    for i, T in enumerate(Ts):
+        for j, P in enumerate(Ps):
+            res = flasher.flash(T=T, P=P, zs=zs)
+            assert_close(values[0, i, j], res.VF, atol=1e-7)
+            assert_close(values[1, i, j], res.H(), rtol=1e-7)
+
+    # Cold start gives the same answers
+    VFs_cold, _ = flasher.grid_flash_arrays(zs, Ts=Ts, Ps=Ps, props='VF', hot_start=False)
+    assert_close2d(VFs_cold, values[0], atol=1e-7)
+
+    # Failed points are masked and do not stop the grid
+    VFs, failed = flasher.grid_flash_arrays(zs, Ts=Ts, Ps=[1e5, -1.0, 1e6], props='VF')
+    assert failed[:, 1].all()
+    assert not failed[:, 0].any() and not failed[:, 2].any()
+    assert np.all(np.isnan(VFs[:, 1]))
+
+    # Rows can be divided among processes
+    VFs_pool, failed_pool = flasher.grid_flash_arrays(zs, Ts=Ts, Ps=Ps, props='VF', processes=2)
+    assert not failed_pool.any()
+    assert_close2d(VFs_pool, values[0], atol=1e-7)
+
+
+def test_flash_TP_batch_PR_SRK_kijs():
+    constants = ChemicalConstantsPackage(Tcs=[190.564, 305.32, 126.2, 469.7], Pcs=[4599000.0, 4872000.0, 3394387.5, 3370000.0],
+                                         omegas=[0.008, 0.098, 0.04, 0.251], MWs=[16.04246, 30.06904, 28.0134, 72.14878],
+                                         CASs=['74-82-8', '74-84-0', '7727-37-9', '109-66-0'])
+    correlations = PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=[])
+    kijs = [[0.0, -0.0059, 0.0289, 0.0236], [-0.0059, 0.0, 0.0533, 0.0078],
+            [0.0289, 0.0533, 0.0, 0.1], [0.0236, 0.0078, 0.1, 0.0]]
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas, 'kijs': kijs}
+    zs = [0.7, 0.1, 0.05, 0.15]
+    Ts = np.linspace(100.0, 450.0, 15)
+    Ps = np.logspace(4.0, 7.3, 15)
+    Ts, Ps = [a.ravel() for a in np.meshgrid(Ts, Ps)]
+
+    for eos in (PRMIX, SRKMIX):
+        gas = CEOSGas(eos, eos_kwargs)
+        liq = CEOSLiquid(eos, eos_kwargs)
+        flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+        res = flasher.flash_TP_batch(Ts, Ps, zs)
+        assert not res['failed'].any()
+        assert res['batch'].sum() > 0.9*len(Ts)
+        for i in range(len(Ts)):
+            state = flasher.flash(T=Ts[i], P=Ps[i], zs=zs)
+            assert res['phase_count'][i] == state.phase_count
+            assert_close(res['VF'][i], state.VF, atol=1e-5)
+            assert_close(res['V'][i], state.V(), rtol=1e-5)
+            if state.gas is not None:
+                assert_close1d(res['ys'][i], state.gas.zs, atol=1e-5)
+                assert_close(res['V_gas'][i], state.gas.V(), rtol=1e-5)
+            else:
+                assert np.all(np.isnan(res['ys'][i]))
+            if state.liquid_count:
+                assert_close1d(res['xs'][i], state.liquid0.zs, atol=1e-5)
+
+    # Different compositions per state; zero mole fractions and bad inputs
+    # go through the normal flash
+    zs_matrix = [[0.7, 0.1, 0.05, 0.15], [0.25, 0.25, 0.25, 0.25], [0.5, 0.0, 0.0, 0.5]]
+    res = flasher.flash_TP_batch([200.0, 250.0, 300.0], [2e6, 2e6, -1.0], zs_matrix)
+    assert res['batch'].tolist() == [True, True, False]
+    assert res['failed'].tolist() == [False, False, True]
+    assert_close(res['VF'][1], flasher.flash(T=250.0, P=2e6, zs=zs_matrix[1]).VF, atol=1e-5)
+
+
+def test_flash_cache_PR():
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], MWs=[30.06904, 72.14878],
+                                         CASs=['74-84-0', '109-66-0'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.537198394065234e-22, -4.946850205122326e-18, 1.4223747507170372e-14, -2.3451318313798008e-11, 2.4271676873997662e-08, -1.6055220805830093e-05, 0.006379734000450042, -1.0360272314628292, 141.84695243411866]))]
+    correlations = PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    flasher = FlashVL(constants, correlations, liquid=CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases),
+                      gas=CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases))
+    flasher2 = FlashVL(constants, correlations, liquid=CEOSLiquid(SRKMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases),
+                       gas=CEOSGas(SRKMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases))
+    zs = [0.5, 0.5]
+    assert flasher.cache is None
+    uncached = flasher.flash(T=300.0, P=2e6, zs=zs)
+    assert uncached is not flasher.flash(T=300.0, P=2e6, zs=zs)
+
+    cache = FlashCache(max_size=3, digits=10, hot_start_digits=3)
+    flasher.cache = flasher2.cache = cache
+    res = flasher.flash(T=300.0, P=2e6, zs=zs)
+    assert_close(res.VF, uncached.VF)
+    # Rounded specs hit the cache
+    assert flasher.flash(T=300.0*(1.0 + 1e-13), P=2e6, zs=zs) is res
+    assert (cache.hits, cache.misses, cache.hot_starts) == (1, 1, 0)
+
+    # Different flashers sharing a cache do not share results
+    res_SRK = flasher2.flash(T=300.0, P=2e6, zs=zs)
+    assert res_SRK is not res
+    assert res_SRK.V() != res.V()
+    assert flasher.model_hash() != flasher2.model_hash()
+    # The hash follows changes to the flasher's models
+    phases = flasher.phases
+    flasher.phases = flasher2.phases
+    assert flasher.model_hash() == flasher2.model_hash()
+    flasher.phases = phases
+    assert flasher.model_hash() != flasher2.model_hash()
+
+    # A nearby state is hot started from the cached result
+    near = flasher.flash(T=300.01, P=2e6, zs=zs)
+    assert cache.hot_starts == 1
+    assert_close(near.VF, flasher.flash_uncached(T=300.01, P=2e6, zs=zs).VF, rtol=1e-9)
+
+    # Least recently used results are evicted
+    flasher.flash(T=300.0, P=2e6, zs=zs)
+    flasher.flash(T=310.0, P=2e6, zs=zs)
+    assert len(cache) == 3
+    assert flasher.flash(T=300.0, P=2e6, zs=zs) is res
+    assert flasher2.flash(T=300.0, P=2e6, zs=zs) is not res_SRK
+    assert_close(cache.hit_ratio, 3/8)
+
+    # Other flash specs work too
+    PH = flasher.flash(P=2e6, H=res.H(), zs=zs)
+    assert flasher.flash(P=2e6, H=res.H(), zs=zs) is PH
+    assert_close(PH.T, 300.0)
+
+    cache.clear()
+    assert len(cache) == 0 and cache.hits == 0 and cache.misses == 0
+
+def test_phase_envelope_C1_C2_C3_PR():
+    constants = ChemicalConstantsPackage(Tcs=[190.564, 305.32, 369.83], Pcs=[4599000.0, 4872000.0, 4248000.0],
+                                         omegas=[0.008, 0.098, 0.152], MWs=[16.04246, 30.06904, 44.09562],
+                                         CASs=['74-82-8', '74-84-0', '74-98-6'])
+    correlations = PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=[])
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    flasher = FlashVL(constants, correlations, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    zs = [0.7, 0.2, 0.1]
+
+    dew = flasher.phase_envelope(zs, VF=1.0)
+    bubble = flasher.phase_envelope(zs, VF=0.0)
+    # Both lines are traced around the whole envelope
+    assert_close1d(dew['critical'], bubble['critical'], rtol=1e-5)
+    assert_close1d(dew['cricondentherm'], bubble['cricondentherm'], rtol=1e-7)
+    assert_close1d(dew['cricondenbar'], bubble['cricondenbar'], rtol=1e-7)
+    assert_close1d(dew['critical'], (256.0764, 8229608), rtol=1e-5)
+    assert dew['Ps'][-1] < 1e5 and bubble['Ps'][-1] < 1e5
+    assert dew['iterations'] < 4*len(dew['Ts'])
+
+    # The trace starts on the dew line and ends on the bubble line
+    for T, P in zip(dew['Ts'][:15:3], dew['Ps'][:15:3]):
+        assert_close(flasher.flash(P=P, VF=1.0, zs=zs).T, T, rtol=1e-6)
+    for T, P in zip(dew['Ts'][-15::3], dew['Ps'][-15::3]):
+        assert_close(flasher.flash(P=P, VF=0.0, zs=zs).T, T, rtol=1e-6)
+
+    # Nothing condenses just above the cricondentherm
+    T_ct, P_ct = dew['cricondentherm']
+    assert flasher.flash(T=T_ct - 0.01, P=P_ct, zs=zs).phase_count == 2
+    assert flasher.flash(T=T_ct + 0.01, P=P_ct, zs=zs).phase_count == 1
+
+    quality = flasher.phase_envelope(zs, VF=0.5, max_points=40)
+    for T, P in zip(quality['Ts'][:20:5], quality['Ps'][:20:5]):
+        assert_close(flasher.flash(T=T, P=P, zs=zs).VF, 0.5, rtol=1e-6)
+
+def test_flash_2P_reduced_PR_many_components():
+    N = 20
+    Tcs = linspace(190.0, 800.0, N)
+    Pcs = linspace(46e5, 12e5, N)
+    omegas = linspace(0.01, 1.0, N)
+    constants = ChemicalConstantsPackage(Tcs=Tcs, Pcs=Pcs, omegas=omegas, MWs=linspace(16.0, 400.0, N))
+    correlations = PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=[])
+    zs = normalize([5.0]*3 + [1.0]*(N-3))
+    kijs = [[0.0]*N for _ in range(N)]
+    for j in range(2, N):
+        kijs[0][j] = kijs[j][0] = 0.03
+        kijs[1][j] = kijs[j][1] = 0.1
+
+    for kij in (None, kijs):
+        eos_kwargs = dict(Tcs=Tcs, Pcs=Pcs, omegas=omegas, kijs=kij)
+        gas, liq = CEOSGas(PRMIX, eos_kwargs), CEOSLiquid(PRMIX, eos_kwargs)
+        flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+        reduced = FlashVL(constants, correlations, liquid=liq, gas=gas)
+        reduced.PT_SS_REDUCED = True
+        # Inexact reduction - finished with the full model
+        truncated = FlashVL(constants, correlations, liquid=liq, gas=gas)
+        truncated.PT_SS_REDUCED = True
+        truncated.PT_SS_REDUCED_RTOL = 0.2
+        for T, P in ((400.0, 3e6), (300.0, 1e5), (500.0, 1e6)):
+            expect = flasher.flash(T=T, P=P, zs=zs)
+            for obj in (reduced, truncated):
+                res = obj.flash(T=T, P=P, zs=zs)
+                assert_close(res.VF, expect.VF, rtol=1e-6)
+                assert_close1d(res.liquid0.zs, expect.liquid0.zs, rtol=1e-6)
+                assert_close1d(res.gas.zs, expect.gas.zs, rtol=1e-6)
+        (lambdas, _, err), u, w = reduced._kijs_reduction()
+        assert len(lambdas) == (1 if kij is None else 3)
+        assert err < 1e-12
+        assert (u, w) == (2.0, -1.0)
+        assert truncated._kijs_reduction()[0][2] > 1e-3 or kij is None
+
+        # Changing the tolerance of an existing flasher redoes the reduction
+        reduced.PT_SS_REDUCED_RTOL = 0.2
+        assert reduced._kijs_reduction()[0][2] == truncated._kijs_reduction()[0][2]
+        reduced.PT_SS_REDUCED_RTOL = 1e-12
+        assert reduced._kijs_reduction()[0][2] < 1e-12
+
+    # No reduction possible - regular flash used
+    kijs_full = [[0.0 if i == j else 0.01*(i + j) for j in range(N)] for i in range(N)]
+    eos_kwargs = dict(Tcs=Tcs, Pcs=Pcs, omegas=omegas, kijs=kijs_full)
+    flasher = FlashVL(constants, correlations, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    flasher.PT_SS_REDUCED = True
+    assert flasher._kijs_reduction() is None
+    assert flasher.flash(T=400.0, P=3e6, zs=zs).phase_count == 2
@@ -708,4 +708,94 @@ def test_sequential_substitution_2P_functional_vs_FlashVL():
                                        trivial_solution_tol=1e-5, V_over_F_guess=0.5)
     assert_close(VF_calc, VF_expect, rtol=1e-6)
     assert_close1d(xs_calc, xs_expect)
-    assert_close1d(ys_calc, ys_expect)
\ No newline at end of file
+    assert_close1d(ys_calc, ys_expect)
+
+
+def test_stability_bubble_dew_P_functional_vs_objects():
+    T, P = 300.0, 1.6e6
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], Tms=[90.3, 143.15],
+                                         Tbs=[184.55, 309.21], CASs=['74-84-0', '109-66-0'],
+                                         names=['ethane', 'pentane'], MWs=[30.06904, 72.14878])
+    correlations = PropertyCorrelationsPackage(constants, skip_missing=True)
+    zs = [.5, .5]
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    for eos in (PRMIX, SRKMIX):
+        gas = CEOSGas(eos, eos_kwargs, T=T, P=P, zs=zs)
+        liq = CEOSLiquid(eos, eos_kwargs, T=T, P=P, zs=zs)
+        trial = gas if gas.G_dep() < liq.G_dep() else liq
+        _, _, _, _, ys_guess = flash_wilson(zs=zs, Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas, T=T, P=P)
+
+        expect = stability_iteration_Michelsen(trial, ys_guess, test_phase=gas)
+        calc = stability_iteration_Michelsen_functional(zs, ys_guess, trial.lnphis_args(), gas.lnphis_args())
+        assert_close(calc[0], expect[0], rtol=1e-12)
+        assert_close1d(calc[1], expect[1], rtol=1e-12)
+        assert_close(calc[3], expect[3], rtol=1e-10)
+        assert_close(calc[6], expect[6], rtol=1e-10)
+
+        flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+        res = flasher.flash(T=T, VF=0, zs=zs)
+        P_calc, ys_calc, _, _ = bubble_P_functional(1e6, zs, liq.lnphis_args(), gas.lnphis_args())
+        assert_close(P_calc, res.P, rtol=1e-8)
+        assert_close1d(ys_calc, res.gas.zs, rtol=1e-7)
+
+        res = flasher.flash(T=T, VF=1, zs=zs)
+        P_calc, xs_calc, _, _ = dew_P_functional(1e6, zs, liq.lnphis_args(), gas.lnphis_args())
+        assert_close(P_calc, res.P, rtol=1e-8)
+        assert_close1d(xs_calc, res.liquid0.zs, rtol=1e-7)
+
+
+def test_flash_TP_newton_bubble_dew_T_functional_vs_objects():
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], Tms=[90.3, 143.15],
+                                         Tbs=[184.55, 309.21], CASs=['74-84-0', '109-66-0'],
+                                         names=['ethane', 'pentane'], MWs=[30.06904, 72.14878])
+    correlations = PropertyCorrelationsPackage(constants, skip_missing=True)
+    zs = [.5, .5]
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    for eos in (PRMIX, SRKMIX):
+        gas = CEOSGas(eos, eos_kwargs, T=300.0, P=1e6, zs=zs)
+        liq = CEOSLiquid(eos, eos_kwargs, T=300.0, P=1e6, zs=zs)
+        flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+        # Two phase, gas, liquid and a single root above the pseudocritical temperature
+        for T, P in [(300.0, 1.6e6), (250.0, 3e5), (300.0, 1e5), (300.0, 5e6), (400.0, 2e6)]:
+            l, g = liq.to(T=T, P=P, zs=zs), gas.to(T=T, P=P, zs=zs)
+            VF, xs, ys = flash_TP_functional(zs, l.lnphis_args(), g.lnphis_args(),
+                                             constants.Tcs, constants.Pcs, constants.omegas)
+            res = flasher.flash(T=T, P=P, zs=zs)
+            if 0.0 < res.VF < 1.0:
+                assert_close(VF, res.VF, rtol=1e-6)
+                assert_close1d(xs, res.liquid0.zs, rtol=1e-6)
+                assert_close1d(ys, res.gas.zs, rtol=1e-6)
+            else:
+                assert VF == res.VF
+                assert xs == ys == zs
+
+        l, g = liq.to(T=300.0, P=1.6e6, zs=zs), gas.to(T=300.0, P=1.6e6, zs=zs)
+        VF, xs, ys, _, err = nonlin_2P_newton_functional(zs, [.45, .55], [.95, .05], l.lnphis_args(),
+                                                         g.lnphis_args(), V_over_F_guess=0.1)
+        assert err < 1e-10
+        assert_close(VF, flasher.flash(T=300.0, P=1.6e6, zs=zs).VF, rtol=1e-6)
+
+        kappas = liq.eos_mix.kappas if eos is PRMIX else liq.eos_mix.ms
+        for P in (1e5, 3e6):
+            T_guess, _, _, _, ys_guess = flash_wilson(zs, constants.Tcs, constants.Pcs, constants.omegas, P=P, VF=0)
+            T_calc, ys_calc, _, _ = bubble_T_functional(T_guess, P, zs, liq.lnphis_args(), gas.lnphis_args(),
+                                                        constants.Tcs, liq.eos_mix.ais, kappas, ys_guess)
+            res = flasher.flash(P=P, VF=0, zs=zs)
+            assert_close(T_calc, res.T, rtol=1e-8)
+            assert_close1d(ys_calc, res.gas.zs, atol=1e-5)
+
+            T_guess, _, _, xs_guess, _ = flash_wilson(zs, constants.Tcs, constants.Pcs, constants.omegas, P=P, VF=1)
+            T_calc, xs_calc, _, _ = dew_T_functional(T_guess, P, zs, liq.lnphis_args(), gas.lnphis_args(),
+                                                     constants.Tcs, liq.eos_mix.ais, kappas, xs_guess)
+            res = flasher.flash(P=P, VF=1, zs=zs)
+            assert_close(T_calc, res.T, rtol=1e-8)
+            assert_close1d(xs_calc, res.liquid0.zs, atol=1e-5)
+
+    # Translated and other alpha function models are not supported
+    liq = CEOSLiquid(PRMIXTranslatedConsistent, eos_kwargs, T=300.0, P=1e6, zs=zs)
+    gas = CEOSGas(PRMIXTranslatedConsistent, eos_kwargs, T=300.0, P=1e6, zs=zs)
+    with pytest.raises(ValueError):
+        bubble_T_functional(300.0, 1e6, zs, liq.lnphis_args(), gas.lnphis_args(), constants.Tcs,
+                            liq.eos_mix.ais, liq.eos_mix.ais)
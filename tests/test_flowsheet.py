@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2017 Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+import pytest
+from thermo.stream import StreamArgs, EnergyStream, FlowsheetUnit, Flowsheet, EquilibriumStream
+from fluids.numerics import assert_close, assert_close1d
+
+
+def methane_ethane_flasher():
+    from thermo import (ChemicalConstantsPackage, PropertyCorrelationsPackage, HeatCapacityGas,
+                        CEOSGas, CEOSLiquid, PRMIX, FlashVL)
+    constants = ChemicalConstantsPackage(Tcs=[190.564, 305.32], Pcs=[4599000.0, 4872000.0], omegas=[0.008, 0.098],
+                                         MWs=[16.04246, 30.06904], CASs=['74-82-8', '74-84-0'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7703235945157e-22, -2.496905487234175e-18, 3.141019468969792e-15, -8.82689677472949e-13, -1.3709202525543862e-09, 1.232839237674241e-06, -0.0002832018460361874, 0.022944239587055416, 32.67333514157593])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228]))]
+    properties = PropertyCorrelationsPackage(constants=constants, HeatCapacityGases=HeatCapacityGases)
+    kwargs = dict(eos_kwargs=dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas),
+                  HeatCapacityGases=HeatCapacityGases)
+    return FlashVL(constants, properties, liquid=CEOSLiquid(PRMIX, **kwargs), gas=CEOSGas(PRMIX, **kwargs))
+
+@pytest.mark.parametrize("method", ['wegstein', 'broyden', 'substitution'])
+def test_Flowsheet_recycle(method):
+    flasher = methane_ethane_flasher()
+    feed = StreamArgs(ns=[1.0, 2.0], T=300.0, P=1e5, pkg=flasher)
+    recycle = StreamArgs(P=1e5, pkg=flasher)
+    mixed = StreamArgs(P=1e5, pkg=flasher)
+    heated = StreamArgs(T=400.0, P=1e5, pkg=flasher)
+    product = StreamArgs(P=1e5, pkg=flasher)
+    duty = EnergyStream(Q=None)
+
+    def split(unit):
+        inlet = unit.inlets[0]
+        ns = inlet.ns_calc
+        if ns is not None:
+            unit.outlets[1].ns = [0.75*n for n in ns]
+            unit.outlets[1].energy = 0.75*inlet.energy_calc
+
+    # Deliberately out of order
+    splitter = FlowsheetUnit([heated], [product, recycle], calculate=split, name='splitter')
+    mixer = FlowsheetUnit([feed, recycle], [mixed], name='mixer')
+    heater = FlowsheetUnit([mixed, duty], [heated], name='heater')
+    flowsheet = Flowsheet([splitter, mixer, heater], method=method)
+    assert flowsheet.order == [[mixer, heater, splitter]]
+    assert flowsheet.tears == [[recycle]]
+
+    flowsheet.solve()
+    if method != 'substitution':
+        # The loop is linear in the tear stream
+        assert flowsheet.iterations <= 3
+    assert_close1d(product.ns, [1.0, 2.0], rtol=1e-7)
+    assert_close1d(recycle.ns, [3.0, 6.0], rtol=1e-7)
+    assert_close(recycle.mixture.T, 400.0, rtol=1e-7)
+    assert_close(product.mixture.T, 400.0, rtol=1e-7)
+    assert_close(duty.Q, product.energy_calc - feed.energy_calc, rtol=1e-7)
+    T_mixed = flasher.flash(zs=[1/3., 2/3.], P=1e5, H=mixed.energy/12.0).T
+    assert_close(mixed.mixture.T, T_mixed, rtol=1e-7)
+
+    # Specifications changed through the flowsheet are kept; the previous
+    # solution is the starting point
+    flowsheet.update(feed, ns=[2.0, 1.0])
+    flowsheet.solve()
+    assert_close1d(product.ns, [2.0, 1.0], rtol=1e-7)
+    assert_close1d(recycle.ns, [6.0, 3.0], rtol=1e-7)
+    assert_close(duty.Q, product.energy_calc - feed.energy_calc, rtol=1e-7)
+
+
+def test_Flowsheet_sequential():
+    flasher = methane_ethane_flasher()
+    feed = StreamArgs(ns=[1.0, 2.0], T=300.0, P=1e5, pkg=flasher)
+    heated = StreamArgs(T=350.0, P=1e5, pkg=flasher)
+    cooled = StreamArgs(T=250.0, P=1e5, pkg=flasher)
+    duties = [EnergyStream(Q=None), EnergyStream(Q=None)]
+    cooler = FlowsheetUnit([heated], [cooled, duties[1]])
+    heater = FlowsheetUnit([feed, duties[0]], [heated])
+    flowsheet = Flowsheet([cooler, heater])
+    assert flowsheet.order == [[heater], [cooler]]
+    assert flowsheet.tears == [[], []]
+    flowsheet.solve()
+    assert flowsheet.iterations == 0
+    assert_close1d(cooled.ns, [1.0, 2.0])
+    assert_close(duties[0].Q + feed.energy_calc, heated.energy_calc)
+    assert_close(duties[1].Q + cooled.energy_calc, heated.energy_calc)
+
+
+def test_EquilibriumStream_update():
+    flasher = methane_ethane_flasher()
+    stream = EquilibriumStream(flasher, ns=[1.0, 2.0], T=200.0, P=1e6)
+    H = stream.H()
+
+    # Only the flow rate changes - no flash
+    stream.update(n=6.0)
+    assert stream.flashes_avoided == 1
+    assert_close1d(stream.ns, [2.0, 4.0])
+    assert_close1d(stream.zs, [1/3., 2/3.])
+    assert stream.H() == H
+    stream.update(m=1.0)
+    assert stream.flashes_avoided == 2
+    assert_close(stream.m, 1.0)
+    stream.update(T=200.0)
+    assert stream.flashes_avoided == 3
+
+    # Intensive changes flash again, with the previous state as a guess
+    stream.update(T=201.0, n=3.0)
+    assert stream.flashes_avoided == 3
+    expect = EquilibriumStream(flasher, zs=[1/3., 2/3.], n=3.0, T=201.0, P=1e6)
+    assert_close(stream.H(), expect.H(), rtol=1e-12)
+    assert_close1d(stream.betas, expect.betas, rtol=1e-9)
+    assert_close(stream.n, 3.0)
+
+    stream.update(ns=[2.0, 1.0])
+    expect = EquilibriumStream(flasher, ns=[2.0, 1.0], T=201.0, P=1e6)
+    assert_close(stream.G(), expect.G(), rtol=1e-12)
+    assert_close(stream.n, 3.0)
+
+    stream.update(zs=[0.5, 0.5])
+    assert_close1d(stream.ns, [1.5, 1.5])
+
+    # The state specification can be changed by giving both variables
+    stream.update(T=None, H=stream.H())
+    assert_close(stream.T, 201.0, rtol=1e-7)
+    with pytest.raises(ValueError):
+        stream.update(VF=0.5)
+    with pytest.raises(ValueError):
+        stream.update(rho=0.5)
+    assert stream.updates == 7
+
+
+def test_EquilibriumStream_update_arrays():
+    import numpy as np
+    flasher = methane_ethane_flasher()
+    stream = EquilibriumStream(flasher, zs=[1/3., 2/3.], n=3.0, T=200.0, P=1e6)
+    H = stream.H()
+    # The same composition as an array is not a change
+    stream.update(zs=np.array([1/3., 2/3.]))
+    assert stream.flashes_avoided == 1
+    assert stream.H() == H
+
+    stream.update(zs=np.array([0.5, 0.5]))
+    assert stream.flashes_avoided == 1
+    expect = EquilibriumStream(flasher, zs=[0.5, 0.5], n=3.0, T=200.0, P=1e6)
+    assert_close(stream.H(), expect.H(), rtol=1e-12)
+
+    stream.update(ns=np.array([2.0, 1.0]))
+    assert_close1d(stream.zs, [2/3., 1/3.])
+    assert_close(stream.n, 3.0)
+    stream.update(ns=np.array([2.0, 1.0]))
+    assert stream.flashes_avoided == 2
@@ -0,0 +1,71 @@
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2023, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+import sys
+import subprocess
+import importlib
+import thermo
+from thermo.lazy_names import lazy_names
+
+
+def run_python(code):
+    return subprocess.run([sys.executable, '-c', code], capture_output=True,
+                          text=True, check=True).stdout
+
+
+def test_lazy_names_up_to_date():
+    # If this fails, regenerate with `python -m thermo.lazy_names`
+    assert thermo._lazy_names_from_modules() == lazy_names
+
+
+def test_import_thermo_is_lazy():
+    out = run_python("import sys, thermo; print(sorted(m for m in sys.modules if m.startswith('thermo')))")
+    assert out.strip() == "['thermo']"
+
+    # Only the modules a name needs are imported
+    out = run_python("import sys; from thermo import Wilson; print('thermo.flash' in sys.modules, 'thermo.chemical' in sys.modules)")
+    assert out.strip() == 'False False'
+
+
+def test_lazy_attributes():
+    for name in thermo.__all__:
+        assert hasattr(thermo, name)
+    assert thermo.PRMIX is importlib.import_module('thermo.eos_mix').PRMIX
+    assert thermo.dippr is importlib.import_module('chemicals.dippr')
+    assert thermo.EQ101 is thermo.dippr.EQ101
+    assert thermo.serialize is importlib.import_module('thermo.serialize')
+    assert thermo.submodules[0] is thermo.activity
+    assert 'Chemical' in dir(thermo)
+
+    # Backwards compatibility
+    from thermo.chemical import Mixture, Stream
+    assert Mixture is thermo.Mixture
+    assert Stream is thermo.Stream
+
+    try:
+        thermo.not_a_thermo_name
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("Missing names should raise AttributeError")
+
+    out = run_python("from thermo import *; print(Chemical.__name__, FlashVL.__name__, EQ101.__name__)")
+    assert out.split() == ['Chemical', 'FlashVL', 'EQ101']
@@ -31,8 +31,9 @@ from random import random
 from thermo import *
 import numpy as np
 from fluids.numerics import jacobian, hessian, derivative, normalize, assert_close, assert_close1d, assert_close2d, linspace
-from thermo.test_utils import check_np_output_activity
+from thermo.test_utils import check_np_output_activity, check_batch_activity
 import pickle
+import json
 
 
 def test_NRTL_gammas():
@@ -612,4 +613,69 @@ def test_NRTL_one_component():
 
 def test_NRTL_can_return_zero_may_need_lngamma_call():
     obj = NRTL(T=8, xs=[0.999999, 2.5e-07, 2.5e-07, 2.5e-07, 2.5e-07], tau_as=[[0, -5.1549, 0, 0, 0], [5.8547, 0, -0.40926, 0, 0], [0, -0.39036, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]], tau_bs=[[0, 2270.62, 284.966, 0, 0], [229.497, 0, 1479.46, 0, 0], [-216.256, 447.003, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]], alpha_cs=[[0, 0.2, 0.3, 0, 0], [0.2, 0, 0.46, 0, 0], [0.3, 0.46, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]])
-    assert obj.gammas()[2] == 0
\ No newline at end of file
+    assert obj.gammas()[2] == 0
+
+
+def test_NRTL_T_cache():
+    kwargs = dict(tau_as=[[0.0, -5.1549], [5.8547, 0.0]], tau_bs=[[0.0, 2270.62], [229.497, 0.0]],
+                  alpha_cs=[[0.0, 0.2], [0.2, 0.0]])
+    model = NRTL(T=300.0, xs=[0.3, 0.7], **kwargs)
+    uncached = NRTL(T=300.0, xs=[0.3, 0.7], T_cache_size=0, **kwargs)
+    assert uncached.T_cache is None
+
+    T_cache = model.T_cache
+    first = model.to_T_xs(T=320.0, xs=[0.4, 0.6])
+    gammas = first.gammas()
+    assert (T_cache.hits, T_cache.misses) == (0, 1)
+
+    # Later models at the same temperature, from any model sharing the cache, reuse the terms
+    for parent in (model, first, model.to_T_xs(T=330.0, xs=[0.5, 0.5])):
+        new = parent.to_T_xs(T=320.0, xs=[0.1, 0.9])
+        assert new.T_cache is T_cache
+        assert new._taus is first._taus and new._Gs is first._Gs
+        assert_close1d(new.gammas(), uncached.to_T_xs(T=320.0, xs=[0.1, 0.9]).gammas(), rtol=1e-14)
+    # Each term reused counts as a hit; `first` passes its own terms on directly
+    T_only = [name for name in NRTL._T_only_attributes if name in first.__dict__]
+    assert len(T_only) >= 2
+    assert T_cache.hits == 2*len(T_only)
+    # The cache holds the terms, not the models
+    for entry in T_cache.entries.values():
+        assert not any(isinstance(v, NRTL) for v in entry.values())
+    assert_close1d(gammas, uncached.to_T_xs(T=320.0, xs=[0.4, 0.6]).gammas(), rtol=1e-14)
+
+    # Only the size of the cache is serialized
+    assert 'T_cache' not in uncached.to_T_xs(T=320.0, xs=[0.4, 0.6]).__dict__
+    new = NRTL.from_json(json.loads(json.dumps(first.as_json())))
+    assert new == first
+    assert new.T_cache.max_size == 16 and new.T_cache is not T_cache
+    assert hash(model.to_T_xs(T=350.0, xs=[0.4, 0.6])) == hash(uncached.to_T_xs(T=350.0, xs=[0.4, 0.6]))
+
+    # Pickles do not include the cache either
+    state = first.__getstate__()
+    assert state['T_cache'] == 16
+    new = pickle.loads(pickle.dumps(first))
+    assert new == first
+    assert new.T_cache is not T_cache and not new.T_cache.entries
+    assert_close1d(new.gammas(), gammas, rtol=1e-14)
+
+def test_NRTL_batch():
+    kwargs = dict(tau_as=[[0, -5.1549, 0.4], [5.8547, 0, -0.40926], [0.2, -0.39036, 0]],
+                  tau_bs=[[0, 2270.62, 284.966], [229.497, 0, 1479.46], [-216.256, 447.003, 0]],
+                  alpha_cs=[[0, 0.2, 0.3], [0.2, 0, 0.46], [0.3, 0.46, 0]])
+    xs_matrix = [[0.2, 0.3, 0.5], [0.9, 0.05, 0.05], [1e-5, 0.5, 0.49999]]
+    model = NRTL(T=350.0, xs=[0.2, 0.3, 0.5], **kwargs)
+    for T in (350.0, 300.0):
+        check_batch_activity(model, T, xs_matrix)
+    modelnp = NRTL(T=350.0, xs=np.array([0.2, 0.3, 0.5]), **{k: np.array(v) for k, v in kwargs.items()})
+    check_batch_activity(modelnp, 320.0, np.array(xs_matrix))
+
+    # The temperature terms come from the shared cache
+    T_cache = model.T_cache
+    model.gammas_batch(300.0, xs_matrix)
+    hits, misses = T_cache.hits, T_cache.misses
+    model.GE_batch(300.0, xs_matrix)
+    assert T_cache.hits >= hits + 2
+    assert T_cache.misses == misses
+
+    with pytest.raises(ValueError):
+        model.gammas_batch(300.0, [[0.5, 0.5], [0.2, 0.8]])
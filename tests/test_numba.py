@@ -219,6 +219,40 @@ def test_UNIFAC_numpy_output():
     new = UNIFACnp.from_json(json_string)
     assert new == modelnp
 
+@mark_as_numba
+def test_UNIFAC_sparse_numba():
+    from thermo.unifac import DOUFIP2006, DOUFSG
+    xs = np.array([0.2, 0.3, 0.1, 0.4])
+    chemgroups = [{9:6}, {78:6}, {1:1, 18:1}, {1:1, 2:1, 14:1}]
+    model = thermo.unifac.UNIFAC.from_subgroups(T=373.15, xs=xs, chemgroups=chemgroups, version=1,
+                                                interaction_data=DOUFIP2006, subgroups=DOUFSG, sparse=True)
+    modelnp = thermo.numba.unifac.UNIFAC.from_subgroups(T=373.15, xs=xs, chemgroups=chemgroups, version=1,
+                                                        interaction_data=DOUFIP2006, subgroups=DOUFSG, sparse=True)
+    for m, mnp in ((model, modelnp), (model.to_T_xs(330.0, xs[::-1]), modelnp.to_T_xs(330.0, xs[::-1]))):
+        assert_allclose(mnp.gammas(), m.gammas(), rtol=1e-13)
+        assert_allclose(mnp.lnGammas_subgroups_pure(), m.lnGammas_subgroups_pure(), rtol=1e-13)
+        assert_allclose(mnp.GE(), m.GE(), rtol=1e-13)
+        assert_allclose(mnp.dGE_dT(), m.dGE_dT(), rtol=1e-12)
+
+@mark_as_numba
+def test_activity_batch_numba():
+    xs_matrix = np.array([[0.2, 0.8], [0.5, 0.5], [0.9, 0.1]])
+    tau_bs = [[0, 3.5], [1.1, 0]]
+    alpha_cs = [[0, 0.3], [0.3, 0]]
+    model = NRTL(T=343.15, xs=[0.2, 0.8], tau_bs=tau_bs, alpha_cs=alpha_cs)
+    modelnp = thermo.numba.nrtl.NRTL(T=343.15, xs=np.array([0.2, 0.8]), tau_bs=np.array(tau_bs), alpha_cs=np.array(alpha_cs))
+
+    chemgroups = [{9:6}, {1:1, 2:1, 14:1}]
+    model2 = thermo.unifac.UNIFAC.from_subgroups(T=373.15, xs=[0.2, 0.8], chemgroups=chemgroups, version=0)
+    modelnp2 = thermo.numba.unifac.UNIFAC.from_subgroups(T=373.15, xs=np.array([0.2, 0.8]), chemgroups=chemgroups, version=0)
+
+    for m, mnp in ((model, modelnp), (model2, modelnp2)):
+        for T in (m.T, 350.0):
+            for name in ('GE_batch', 'dGE_dxs_batch', 'd2GE_dxixjs_batch', 'gammas_batch'):
+                res = getattr(mnp, name)(T, xs_matrix)
+                assert type(res) is np.ndarray
+                assert_allclose(res, getattr(m, name)(T, xs_matrix), rtol=1e-12)
+
 
 
 @mark_as_numba
@@ -442,6 +476,54 @@ def test_lnphis_direct_and_sequential_substitution_2P_functional():
     assert_close1d(ys_calc, ys_expect)
     
     
+@mark_as_numba
+def test_stability_bubble_dew_P_functional():
+    T, P = 300.0, 1.6e6
+    zs = np.array([.5, .5])
+    eos_kwargs = {'Pcs': np.array([4872000.0, 3370000.0]), 'Tcs': np.array([305.32, 469.7]),
+                  'omegas': np.array([0.098, 0.251])}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=None, T=T, P=P, zs=zs)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=None, T=T, P=P, zs=zs)
+    trial = gas if gas.G_dep() < liq.G_dep() else liq
+    ys_guess = np.array([0.9, 0.1])
+
+    expect = thermo.flash.flash_utils.stability_iteration_Michelsen_functional(zs.tolist(), ys_guess.tolist(), trial.lnphis_args(), gas.lnphis_args())
+    calc = thermo.numba.stability_iteration_Michelsen_functional(zs, ys_guess, trial.lnphis_args(), gas.lnphis_args())
+    assert_close(calc[0], expect[0])
+    assert_close1d(calc[1], expect[1])
+    assert_close(calc[6], expect[6])
+
+    P_expect = thermo.flash.flash_utils.bubble_P_functional(1e6, zs.tolist(), liq.lnphis_args(), gas.lnphis_args())[0]
+    assert_close(thermo.numba.bubble_P_functional(1e6, zs, liq.lnphis_args(), gas.lnphis_args())[0], P_expect)
+    P_expect = thermo.flash.flash_utils.dew_P_functional(1e6, zs.tolist(), liq.lnphis_args(), gas.lnphis_args())[0]
+    assert_close(thermo.numba.dew_P_functional(1e6, zs, liq.lnphis_args(), gas.lnphis_args())[0], P_expect)
+
+
+@mark_as_numba
+def test_flash_TP_newton_bubble_dew_T_functional():
+    T, P = 300.0, 1.6e6
+    zs = np.array([.5, .5])
+    Tcs, Pcs, omegas = np.array([305.32, 469.7]), np.array([4872000.0, 3370000.0]), np.array([0.098, 0.251])
+    eos_kwargs = {'Pcs': Pcs, 'Tcs': Tcs, 'omegas': omegas}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=None, T=T, P=P, zs=zs)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=None, T=T, P=P, zs=zs)
+
+    expect = thermo.flash.flash_utils.flash_TP_functional(zs.tolist(), liq.lnphis_args(), gas.lnphis_args(), Tcs.tolist(), Pcs.tolist(), omegas.tolist())
+    calc = thermo.numba.flash_TP_functional(zs, liq.lnphis_args(), gas.lnphis_args(), Tcs, Pcs, omegas)
+    assert_close(calc[0], expect[0])
+    assert_close1d(calc[1], expect[1])
+    assert_close1d(calc[2], expect[2])
+
+    calc = thermo.numba.nonlin_2P_newton_functional(zs, np.array([.45, .55]), np.array([.95, .05]), liq.lnphis_args(), gas.lnphis_args(), V_over_F_guess=0.1)
+    assert_close(calc[0], expect[0])
+
+    ais, kappas = liq.eos_mix.ais, liq.eos_mix.kappas
+    T_expect = thermo.flash.flash_utils.bubble_T_functional(270.0, 1e6, zs.tolist(), liq.lnphis_args(), gas.lnphis_args(), Tcs.tolist(), ais, kappas, [0.9, 0.1])[0]
+    assert_close(thermo.numba.bubble_T_functional(270.0, 1e6, zs, liq.lnphis_args(), gas.lnphis_args(), Tcs, ais, kappas, np.array([0.9, 0.1]))[0], T_expect)
+    T_expect = thermo.flash.flash_utils.dew_T_functional(360.0, 1e6, zs.tolist(), liq.lnphis_args(), gas.lnphis_args(), Tcs.tolist(), ais, kappas, [0.1, 0.9])[0]
+    assert_close(thermo.numba.dew_T_functional(360.0, 1e6, zs, liq.lnphis_args(), gas.lnphis_args(), Tcs, ais, kappas, np.array([0.1, 0.9]))[0], T_expect)
+
+
 @mark_as_numba
 def test_fit_T_dep_numba_Rackett():
     Tc, rhoc, b, n, MW = 545.03, 739.99, 0.3, 0.28571, 105.921
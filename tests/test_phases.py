@@ -20,6 +20,7 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
+import sys
 import pytest
 from fluids.numerics import derivative, assert_close, jacobian, hessian, assert_close1d, assert_close2d, assert_close3d, normalize
 import numpy as np
@@ -907,6 +908,58 @@ def test_GibbsExcessLiquid_at_methods():
     assert_close1d(liq2.dphis_dT(), liquid.dphis_dT_at(285.5, 1e4, [0.2, 0.0, 0.8]), rtol=1e-12)
 
 
+def test_GibbsExcessLiquid_at_Ts_methods():
+    VaporPressures = [VaporPressure(exp_poly_fit=(273.17, 647.086, [-2.8478502840358144e-21, 1.7295186670575222e-17, -4.034229148562168e-14, 5.0588958391215855e-11, -3.861625996277003e-08, 1.886271475957639e-05, -0.005928371869421494, 1.1494956887882308, -96.74302379151317])),
+                      VaporPressure(exp_poly_fit=(159.11, 514.7, [-2.3617526481119e-19, 7.318686894378096e-16, -9.835941684445551e-13, 7.518263303343784e-10, -3.598426432676194e-07, 0.00011171481063640762, -0.022458952185007635, 2.802615041941912, -166.43524219017118]))]
+    VolumeLiquids = [VolumeLiquid(poly_fit=(273.17, 637.096, [9.00307261049824e-24, -3.097008950027417e-20, 4.608271228765265e-17, -3.8726692841874345e-14, 2.0099220218891486e-11, -6.596204729785676e-09, 1.3368112879131157e-06, -0.00015298762503607717, 0.007589247005014652])),
+                     VolumeLiquid(poly_fit=(159.11, 504.71000000000004, [5.388587987308587e-23, -1.331077476340645e-19, 1.4083880805283782e-16, -8.327187308842775e-14, 3.006387047487587e-11, -6.781931902982022e-09, 9.331209920256822e-07, -7.153268618320437e-05, 0.0023871634205665524]))]
+    EnthalpyVaporizations = [EnthalpyVaporization(Tc=647.14, poly_fit_ln_tau=(273.17, 647.095, 647.14, [0.010220675607316746, 0.5442323619614213, 11.013674729940819, 110.72478547661254, 591.3170172192005, 1716.4863395285283, 4063.5975524922624, 17960.502354189244, 53916.28280689388])),
+                             EnthalpyVaporization(Tc=514.0, poly_fit_ln_tau=(159.11, 513.9999486, 514.0, [-0.002197958699297133, -0.1583773493009195, -4.716256555877727, -74.79765793302774, -675.8449382004112, -3387.5058752252276, -7531.327682252346, 5111.75264050548, 50774.16034043739]))]
+    liquid = GibbsExcessLiquid(VaporPressures=VaporPressures, VolumeLiquids=VolumeLiquids,
+                               EnthalpyVaporizations=EnthalpyVaporizations)
+    # Includes points below and above the fits' ranges, and above both Tcs
+    Ts = [100.0, 200.0, 273.17, 300.0, 450.0, 514.7, 600.0, 700.0]
+
+    Psats = liquid.Psats_at_Ts(Ts)
+    dPsats_dT = liquid.dPsats_dT_at_Ts(np.array(Ts))
+    d2Psats_dT2 = liquid.d2Psats_dT2_at_Ts(Ts)
+    Vms_sat = liquid.Vms_sat_at_Ts(Ts)
+    Hvaps = liquid.Hvaps_at_Ts(Ts)
+    for v in (Psats, dPsats_dT, d2Psats_dT2, Vms_sat, Hvaps):
+        assert v.shape == (len(Ts), 2)
+    for i, T in enumerate(Ts):
+        liq2 = liquid.to(T=T, P=1e5, zs=[0.5, 0.5])
+        assert_close1d(Psats[i], liq2.Psats(), rtol=1e-13)
+        assert_close1d(dPsats_dT[i], liq2.dPsats_dT(), rtol=1e-13)
+        assert_close1d(d2Psats_dT2[i], liq2.d2Psats_dT2(), rtol=1e-13)
+        assert_close1d(Vms_sat[i], liq2.Vms_sat(), rtol=1e-13)
+        assert_close1d(Hvaps[i], liq2.Hvaps(), rtol=1e-13)
+    assert Hvaps[-1].tolist() == [0.0, 0.0]
+
+    # Correlations which cannot be packed together are evaluated one by one
+    VaporPressures = [VaporPressures[0], VaporPressure(Tb=351.39, Tc=514.0, Pc=6137000.0, omega=0.635)]
+    liquid = GibbsExcessLiquid(VaporPressures=VaporPressures, VolumeLiquids=VolumeLiquids)
+    Psats = liquid.Psats_at_Ts(Ts)
+    dPsats_dT = liquid.dPsats_dT_at_Ts(Ts)
+    for i, T in enumerate(Ts):
+        liq2 = liquid.to(T=T, P=1e5, zs=[0.5, 0.5])
+        assert_close1d(Psats[i], liq2.Psats(), rtol=1e-13)
+        assert_close1d(dPsats_dT[i], liq2.dPsats_dT(), rtol=1e-13)
+
+    # Volumes from the pure component equations of state, with or without
+    # volume correlations given
+    eos_pure_instances = [PR(Tc=647.14, Pc=22048320.0, omega=0.344, T=300.0, P=1e5),
+                          PR(Tc=514.0, Pc=6137000.0, omega=0.635, T=300.0, P=1e5)]
+    Ts = [200.0, 300.0, 450.0, 600.0]
+    for volumes in (None, VolumeLiquids):
+        liquid = GibbsExcessLiquid(VaporPressures=VaporPressures, VolumeLiquids=volumes,
+                                   eos_pure_instances=eos_pure_instances, use_eos_volume=True)
+        Vms_sat = liquid.Vms_sat_at_Ts(Ts)
+        assert Vms_sat.shape == (len(Ts), 2)
+        for i, T in enumerate(Ts):
+            assert_close1d(Vms_sat[i], liquid.to(T=T, P=1e5, zs=[0.5, 0.5]).Vms_sat(), rtol=1e-13)
+
+
 def test_GibbsExcessLiquid_hashing_and_serialization():
     # water-ethanol
     T = 400.0
@@ -2659,6 +2712,92 @@ def test_IAPWS95_basics():
     dC_virial_dT_num = derivative(lambda T: obj.to(T=T, P=obj.P, zs=[1]).C_virial(), obj.T, dx=obj.T*1e-7)
     assert_close(obj.dC_virial_dT(), dC_virial_dT_num)
 
+def test_Helmholtz_Ar_derivatives():
+    from chemicals import iapws
+    funcs = (iapws.iapws95_Ar, iapws.iapws95_dAr_ddelta, iapws.iapws95_d2Ar_ddelta2,
+             iapws.iapws95_dAr_dtau, iapws.iapws95_d2Ar_dtau2, iapws.iapws95_d2Ar_ddeltadtau)
+    # Liquid, vapor, supercritical, near critical, and exactly on the critical density
+    for T, rho in [(300.0, 996.5), (273.16, 999.8), (400.0, 1.0), (1000.0, 1e-3), (647.1, 330.0),
+                   (700.0, 500.0), (647.0, 322.0)]:
+        tau, delta = iapws.iapws95_Tc/T, rho/iapws.iapws95_rhoc
+        expect = [f(tau, delta) for f in funcs]
+        # Near zero values lose relative precision
+        assert_close1d(IAPWS95.__dict__['_Ar_derivatives_func'](tau, delta), expect, rtol=1e-10, atol=1e-13)
+
+    # The bundle is cached and used for the caloric properties
+    class IAPWS95Individual(IAPWS95):
+        _Ar_derivatives_func = None
+
+    obj = IAPWS95(T=350.0, P=1e6, zs=[1])
+    ref = IAPWS95Individual(T=350.0, P=1e6, zs=[1])
+    ders = obj.Ar_derivatives()
+    assert obj.Ar_derivatives() is ders
+    assert_close(obj.d2A_ddeltadtau(), ref._d2Ar_ddeltadtau_func(ref.tau, ref.delta), rtol=1e-12)
+    for prop in ('H', 'S', 'Cp', 'Cv', 'dP_dT', 'dP_dV', 'dH_dT_V', 'dH_dV_T', 'dS_dV_T', 'speed_of_sound'):
+        new = IAPWS95(T=350.0, P=1e6, zs=[1])
+        assert_close(getattr(new, prop)(), getattr(ref, prop)(), rtol=1e-11)
+        assert '_Ar_derivatives' in new.__dict__
+    assert '_Ar_derivatives' not in ref.__dict__
+
+    # Without a fused function the individual functions are used once each
+    air = DryAirLemmon(T=300.0, P=1e5)
+    ders = air.Ar_derivatives()
+    assert_close(ders[2], air._d2Ar_ddelta2_func(air.tau, air.delta), rtol=1e-15)
+    assert_close(air.Cp(), 29.149477654366663, rtol=1e-13)
+
+def test_IAPWS95_rho_warm_start():
+    from chemicals import iapws
+    table = IAPWS95DensityTable(Tmin=280.0, Tmax=900.0, Pmin=1e3, Pmax=5e7, T_points=30, P_points=30)
+    base = IAPWS95(T=400.0, P=1e6, zs=[1], rho_table=table)
+    previous = IAPWS95(T=350.0, P=1e5, zs=[1])
+    for T, P in [(300.0, 1e5), (400.0, 1e6), (500.0, 3e6), (700.0, 3e7), (640.0, 2.1e7), (350.0, 2e3), (873.0, 4e7)]:
+        expect = iapws.iapws95_rho(T, P)
+        hits = table.hits
+        new = base.to_TP_zs(T, P, [1])
+        assert table.hits == hits + 1
+        assert new.rho_table is table
+        assert_close(new.rho_mass(), expect, rtol=1e-12)
+        assert_close(base.to(T=T, P=P, zs=[1], warm_start=previous).rho_mass(), expect, rtol=1e-12)
+        previous = new
+
+    # Outside the table the density is solved for from scratch
+    misses = table.misses
+    assert_close(base.to_TP_zs(1000.0, 1e5, [1]).rho_mass(), iapws.iapws95_rho(1000.0, 1e5), rtol=1e-13)
+    assert table.misses == misses + 1
+
+    # Near saturation a warm start from the other phase still finds the stable root
+    for T in (300.0, 450.0, 600.0, 645.0):
+        Psat = iapws.iapws95_Psat(T)
+        liquid = IAPWS95(T=T, P=Psat*1.0001, zs=[1])
+        gas = IAPWS95(T=T, P=Psat*0.9999, zs=[1])
+        assert liquid.rho_mass() > gas.rho_mass()
+        assert_close(gas.to_TP_zs(T, liquid.P, [1], warm_start=gas).rho_mass(), liquid.rho_mass(), rtol=1e-12)
+        assert_close(liquid.to_TP_zs(T, gas.P, [1], warm_start=liquid).rho_mass(), gas.rho_mass(), rtol=1e-12)
+
+def test_IAPWS95_rho_table_state():
+    import json
+    from thermo.serialize import dump_snapshot, load_snapshot
+    table = IAPWS95DensityTable(Tmin=280.0, Tmax=500.0, Pmin=1e4, Pmax=1e7, T_points=10, P_points=10)
+    liquid = IAPWS95Liquid(T=350.0, P=2e6, zs=[1.0], rho_table=table)
+    plain = copy(liquid)
+    del plain.rho_table
+    # The table only seeds the density solver; it is not part of the state
+    assert plain.rho_table is None
+    assert liquid == plain
+    assert hash(liquid) == hash(plain)
+    assert_close(liquid.rho_mass(), IAPWS95Liquid(T=350.0, P=2e6, zs=[1.0]).rho_mass(), rtol=1e-13)
+
+    json_repr = liquid.as_json()
+    assert 'rho_table' not in json_repr
+    new = Phase.from_json(json.loads(json.dumps(json_repr)))
+    assert new == liquid
+    assert new.rho_table is None
+
+    if sys.version_info >= (3, 8):
+        snapshot = load_snapshot(dump_snapshot(liquid))
+        assert snapshot == liquid
+        assert snapshot.rho_table is not None
+
 def test_Helmholtz_phase_export():
     # Check some nasty hash cases where the model was not actually included in the hash
     for t in (True, False):
@@ -3518,3 +3657,44 @@ def test_virial_phase_ternary_B_only_pitzer_curl_no_interactions():
     assert_close1d(gas_np.dnB_dns(), dnB_dns_expect, rtol=1e-13)
     assert isinstance(gas_np.dnB_dns(), np.ndarray)
 
+
+
+def test_virial_CSP_T_cache_and_array_T():
+    Tcs = [126.2, 190.564, 304.2]
+    Pcs = [3394387.5, 4599000.0, 7376460.0]
+    Vcs = [8.95e-05, 9.86e-05, 9.4e-05]
+    omegas = [0.04, 0.008, 0.2252]
+    model = VirialCSP(Tcs=Tcs, Pcs=Pcs, Vcs=Vcs, omegas=omegas,
+                      B_model=VIRIAL_B_TSONOPOULOS, C_model=VIRIAL_C_ORBEY_VERA)
+    uncached = VirialCSP(Tcs=Tcs, Pcs=Pcs, Vcs=Vcs, omegas=omegas,
+                         B_model=VIRIAL_B_TSONOPOULOS, C_model=VIRIAL_C_ORBEY_VERA,
+                         T_cache_size=0)
+    assert uncached.T_cache is None
+
+    Ts = [250.0, 300.0, 350.0]
+    for at_Ts, at_T, shape in ((model.B_interactions_at_Ts, uncached.B_interactions_at_T, (3, 3, 3)),
+                               (model.B_pures_at_Ts, uncached.B_pures_at_T, (3, 3)),
+                               (model.C_interactions_at_Ts, uncached.C_interactions_at_T, (3, 3, 3)),
+                               (model.C_pures_at_Ts, uncached.C_pures_at_T, (3, 3))):
+        stacked = at_Ts(Ts)
+        assert len(stacked) == 4
+        for i, T in enumerate(Ts):
+            expect = at_T(T)
+            for k in range(4):
+                assert stacked[k].shape == shape
+                assert_close1d(np.ravel(stacked[k][i]), np.ravel(expect[k]), rtol=1e-15)
+    assert model.T_cache.misses == 12
+    assert model.T_cache.hits == 0
+
+    # Phases at a temperature already evaluated reuse the results
+    zs = [.2, .3, .5]
+    gas = VirialGas(model, T=300.0, P=1e5, zs=zs)
+    gas_uncached = VirialGas(uncached, T=300.0, P=1e5, zs=zs)
+    hits = model.T_cache.hits
+    for P in (2e5, 3e5):
+        new = gas.to_TP_zs(T=300.0, P=P, zs=[.3, .3, .4])
+        expect = gas_uncached.to_TP_zs(T=300.0, P=P, zs=[.3, .3, .4])
+        assert_close1d(new.lnphis(), expect.lnphis(), rtol=1e-13)
+        assert_close(new.dS_dep_dT(), expect.dS_dep_dT(), rtol=1e-13)
+    assert model.T_cache.hits - hits >= 4
+    assert model.T_cache.misses == 12
@@ -29,7 +29,7 @@ import numpy as np
 from fluids.numerics import jacobian, hessian, assert_close, assert_close1d, assert_close2d, assert_close3d
 from random import random
 from chemicals import normalize
-from thermo.test_utils import check_np_output_activity
+from thermo.test_utils import check_np_output_activity, check_batch_activity
 import pickle
 
 def test_no_interactions():
@@ -286,3 +286,13 @@ def test_regular_solution_one_component():
         if hasattr(GE, s):
             res = getattr(GE, s)()
 
+def test_RegularSolution_batch():
+    Vs = [7.421e-05, 8.068e-05, 9.0e-05]
+    SPs = [19570.2, 18864.7, 23000.0]
+    lambda_coeffs = [[0.0, 0.01, -0.02], [0.015, 0.0, 0.005], [-0.01, 0.02, 0.0]]
+    xs_matrix = [[0.229, 0.175, 0.596], [0.9, 0.05, 0.05], [1e-5, 0.5, 0.49999]]
+    model = RegularSolution(T=300.0, xs=[0.229, 0.175, 0.596], Vs=Vs, SPs=SPs, lambda_coeffs=lambda_coeffs)
+    for T in (300.0, 350.0):
+        check_batch_activity(model, T, xs_matrix)
+    modelnp = RegularSolution(T=300.0, xs=np.array([0.229, 0.175, 0.596]), Vs=np.array(Vs), SPs=np.array(SPs))
+    check_batch_activity(modelnp, 300.0, np.array(xs_matrix))
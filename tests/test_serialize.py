@@ -0,0 +1,123 @@
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2023, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+
+import sys
+import json
+import numpy as np
+import pytest
+from fluids.numerics import assert_close, assert_close1d
+from thermo import (ChemicalConstantsPackage, PropertyCorrelationsPackage,
+                    CEOSGas, CEOSLiquid, PRMIX, FlashVLN, Phase,
+                    HeatCapacityLiquid)
+import thermo.serialize
+from thermo.serialize import dump_snapshot, load_snapshot
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 8), reason='Snapshots with out-of-band arrays need Python 3.8')
+
+
+def make_flasher(scalar=True):
+    constants, correlations = ChemicalConstantsPackage.from_IDs(['methane', 'ethane', 'water', 'decane'])
+    zs = [.25]*4
+    kijs = [[0.0]*4 for _ in range(4)]
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas, kijs=kijs)
+    if not scalar:
+        eos_kwargs = {k: np.array(v) for k, v in eos_kwargs.items()}
+        zs = np.array(zs)
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases, T=300, P=1e5, zs=zs)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases, T=300, P=1e5, zs=zs)
+    return FlashVLN(constants, correlations, liquids=[liq, liq], gas=gas)
+
+
+def test_snapshot_matches_json():
+    flasher = make_flasher()
+    objs = [flasher.constants, flasher.correlations, flasher.gas,
+            flasher.liquids[0], flasher.gas.eos_mix,
+            HeatCapacityLiquid(CASRN='7732-18-5')]
+    for obj in objs:
+        from_snapshot = load_snapshot(dump_snapshot(obj))
+        from_json = type(obj).from_json(json.loads(json.dumps(obj.as_json())))
+        assert from_snapshot == obj
+        assert from_snapshot == from_json
+        assert hash(from_snapshot) == hash(from_json)
+
+    # Data shared with the databanks stays shared
+    Cpl = objs[-1]
+    assert load_snapshot(dump_snapshot(Cpl)).Zabransky_spline_iso is Cpl.Zabransky_spline_iso
+
+
+def test_snapshot_flasher(tmp_path):
+    flasher = make_flasher()
+    zs = [.25]*4
+    expect = flasher.flash(T=300, P=1e6, zs=zs)
+    path = str(tmp_path/'flasher.snap')
+    dump_snapshot(flasher, path)
+    for new in (load_snapshot(path), load_snapshot(path, mmap=True)):
+        res = new.flash(T=300, P=1e6, zs=zs)
+        assert_close(res.VF, expect.VF, rtol=1e-13)
+        assert_close(res.H(), expect.H(), rtol=1e-13)
+        assert new.constants == flasher.constants
+        assert new.correlations == flasher.correlations
+        assert new.gas == flasher.gas
+
+
+def test_snapshot_arrays_memory_mapped(tmp_path):
+    gas = make_flasher(scalar=False).gas
+    path = str(tmp_path/'gas.snap')
+    dump_snapshot(gas, path)
+    # Arrays are stored as raw buffers; the pickle stream holds no float data
+    with open(path, 'rb') as f:
+        assert gas.eos_mix.kijs.tobytes() in f.read()
+
+    new = load_snapshot(path, mmap=True)
+    assert type(new.zs) is np.ndarray
+    assert new.zs.base is not None
+    assert_close1d(new.zs, gas.zs)
+    assert_close(new.to(T=310, P=2e5, zs=gas.zs).H(), gas.to(T=310, P=2e5, zs=gas.zs).H(), rtol=1e-13)
+
+    # Modifying an array does not change the file
+    new.zs[0] = 1.0
+    assert_close1d(load_snapshot(path, mmap=True).zs, gas.zs)
+
+
+def test_snapshot_invalid():
+    with pytest.raises(ValueError):
+        load_snapshot(b'not a snapshot')
+    snapshot = bytearray(dump_snapshot(1.0))
+    snapshot[8] = 99
+    with pytest.raises(ValueError):
+        load_snapshot(bytes(snapshot))
+
+
+def test_snapshot_inline_arrays(tmp_path, monkeypatch):
+    # Format written before Python 3.8, with the arrays in the pickle stream
+    gas = make_flasher(scalar=False).gas
+    snapshot = dump_snapshot(gas)
+    monkeypatch.setattr(thermo.serialize, 'SNAPSHOT_BUFFERS', False)
+    with pytest.raises(ValueError):
+        load_snapshot(snapshot)
+    path = str(tmp_path/'gas.snap')
+    dump_snapshot(gas, path)
+    for new in (load_snapshot(path), load_snapshot(path, mmap=True)):
+        assert_close1d(new.zs, gas.zs)
+        assert new == gas
+    monkeypatch.setattr(thermo.serialize, 'SNAPSHOT_BUFFERS', True)
+    assert load_snapshot(path) == gas
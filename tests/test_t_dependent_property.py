@@ -21,8 +21,9 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 import pytest
 from thermo.utils import TDependentProperty
-from fluids.numerics import assert_close
-from math import log
+from fluids.numerics import assert_close, assert_close1d
+from math import log, cos
+import os
 
 def test_local_constant_method():
     # Test user defined method
@@ -330,4 +331,115 @@ def test_t_dependent_property_exceptions():
                                   "component with CASRN '7732-18-5'")
             raise error
         
-    
\ No newline at end of file
+    
+def test_compile_surrogate(tmp_path):
+    from thermo import VaporPressure, SurfaceTension
+    from thermo.utils import PiecewiseChebyshev
+    from math import exp, sin
+    approx = PiecewiseChebyshev.fit(lambda x: exp(x)*sin(5*x), 0.0, 3.0, rtol=0, atol=1e-12)
+    assert approx.N > 1
+    for x in (0.0, 0.3, 1.1, 2.2, 3.0):
+        assert_close(approx(x), exp(x)*sin(5*x), atol=1e-12)
+        assert_close(approx.derivative(x), exp(x)*(sin(5*x) + 5*cos(5*x)), atol=1e-9)
+        assert_close(approx.derivative(x, 2), exp(x)*(10*cos(5*x) - 24*sin(5*x)), atol=1e-6)
+    F = lambda x: exp(x)*(sin(5*x) - 5*cos(5*x))/26.0
+    assert_close(approx.integral(0.2, 2.9), F(2.9) - F(0.2), rtol=1e-11)
+    assert PiecewiseChebyshev.from_json(approx.as_json()).coeffs == approx.coeffs
+
+    obj = VaporPressure(CASRN='7732-18-5')
+    hash_before, json_before = hash(obj), obj.as_json()
+    T1, T2 = 300.0, 600.0
+    expect = [obj.T_dependent_property(450.0), obj.T_dependent_property_derivative(450.0),
+              obj.T_dependent_property_derivative(450.0, order=2),
+              obj.T_dependent_property_integral(T1, T2),
+              obj.T_dependent_property_integral_over_T(T1, T2)]
+    obj.compile(rtol=1e-12, cache_dir=str(tmp_path))
+    assert obj._surrogate is not None
+    assert hash(obj) == hash_before
+    assert obj.as_json() == json_before
+    got = [obj.T_dependent_property(450.0), obj.T_dependent_property_derivative(450.0),
+           obj.T_dependent_property_derivative(450.0, order=2),
+           obj.T_dependent_property_integral(T1, T2),
+           obj.T_dependent_property_integral_over_T(T1, T2)]
+    assert_close(got[0], expect[0], rtol=1e-11)
+    assert_close(got[1], expect[1], rtol=1e-8)
+    assert_close(got[2], expect[2], rtol=1e-5)
+    assert_close(got[3], expect[3], rtol=1e-11)
+    assert_close(got[4], expect[4], rtol=1e-11)
+
+    # Outside the surrogate range the method is still extrapolated
+    assert obj.T_dependent_property(700.0) == obj.extrapolate(700.0, obj.method)
+    # The surrogate only applies to the compiled method
+    obj.method = 'ANTOINE_POLING'
+    assert obj.T_dependent_property(450.0) == obj.calculate(450.0, 'ANTOINE_POLING')
+    obj.method = 'IAPWS'
+    obj.uncompile()
+    assert obj.T_dependent_property(450.0) == expect[0]
+
+    # Second compile is loaded from disk
+    assert len(os.listdir(str(tmp_path))) == 1
+    obj2 = VaporPressure(CASRN='7732-18-5')
+    obj2.compile(rtol=1e-12, cache_dir=str(tmp_path))
+    assert obj2.T_dependent_property(450.0) == got[0]
+
+    # The cache is keyed on the coefficients, not the repr
+    obj3 = VaporPressure(CASRN='64-17-5', method='ANTOINE_POLING')
+    obj3.compile(cache_dir=str(tmp_path))
+    obj4 = VaporPressure(CASRN='64-17-5', method='ANTOINE_POLING')
+    obj4.ANTOINE_POLING_coefs = [10.4, 1648.22, -42.232]
+    assert repr(obj4) == repr(obj3)
+    obj4.compile(cache_dir=str(tmp_path))
+    assert len(os.listdir(str(tmp_path))) == 3
+    assert_close(obj4.T_dependent_property(320.0), obj4.calculate(320.0, 'ANTOINE_POLING'), rtol=1e-9)
+
+    # Zero at the critical point - range stops just short of Tc
+    sigma = SurfaceTension(CASRN='7732-18-5')
+    sigma.compile()
+    Tc = sigma.T_limits[sigma.method][1]
+    assert Tc - 1e-2 < sigma._surrogate.Tmax < Tc
+    assert sigma.T_dependent_property(Tc) == sigma.calculate(Tc, sigma.method)
+
+def test_array_evaluation():
+    import numpy as np
+    from thermo import VaporPressure, HeatCapacityGas, ViscosityLiquid
+    from thermo.utils import VDI_TABULAR
+
+    def scalar_values(f, Ts, *args):
+        vals = [f(T, *args) for T in Ts.tolist()]
+        return np.array([np.nan if v is None else v for v in vals])
+
+    Ts = np.linspace(1.0, 1200.0, 301)
+    # Antoine, Wagner, DIPPR and tabular methods, with extrapolation either side
+    obj = VaporPressure(CASRN='64-17-5')
+    for method in obj.all_methods:
+        obj.method = method
+        assert_close1d(obj.T_dependent_property(Ts), scalar_values(obj.T_dependent_property, Ts), rtol=1e-12)
+
+    obj = HeatCapacityGas(CASRN='7732-18-5')
+    for method in obj.all_methods:
+        obj.method = method
+        assert_close1d(obj(Ts), scalar_values(obj.T_dependent_property, Ts), rtol=1e-12)
+        assert_close1d(obj.T_dependent_property_derivative(Ts), scalar_values(obj.T_dependent_property_derivative, Ts), rtol=1e-10)
+
+    obj = HeatCapacityGas(CASRN="7782-44-7", extrapolation="linear", method="POLY_FIT", poly_fit=(50.0, 1000.0, [7.682842888382947e-22, -3.3797331490434755e-18, 6.036320672021355e-15, -5.560319277907492e-12, 2.7591871443240986e-09, -7.058034933954475e-07, 9.350023770249747e-05, -0.005794412013028436, 29.229215579932934]))
+    assert_close1d(obj.T_dependent_property_derivative(Ts, 2), scalar_values(obj.T_dependent_property_derivative, Ts, 2), rtol=1e-12)
+    T1s = np.linspace(200.0, 2000.0, 7)
+    assert_close1d(obj.T_dependent_property_integral(T1s, 500.0),
+                   [obj.T_dependent_property_integral(T1, 500.0) for T1 in T1s.tolist()], rtol=1e-13)
+    assert_close1d(obj.T_dependent_property_integral_over_T(T1s, 500.0),
+                   [obj.T_dependent_property_integral_over_T(T1, 500.0) for T1 in T1s.tolist()], rtol=1e-13)
+
+    # Extrapolations which overflow are None in the scalar path
+    obj = VaporPressure(CASRN='7664-41-7')
+    obj.method = VDI_TABULAR
+    assert obj.T_dependent_property(1.0) is None
+    assert_close1d(obj.T_dependent_property(Ts), scalar_values(obj.T_dependent_property, Ts), rtol=1e-12)
+
+    # Shape is preserved; invalid values are NaN rather than None
+    obj = ViscosityLiquid(CASRN='64-17-5')
+    obj.method = VDI_TABULAR
+    obj.extrapolation = None
+    mus = obj.T_dependent_property(np.array([[300.0, 5000.0], [350.0, 400.0]]))
+    assert mus.shape == (2, 2)
+    assert np.isnan(mus[0, 1])
+    assert_close(mus[1, 0], obj.T_dependent_property(350.0), rtol=1e-13)
@@ -30,9 +30,10 @@ from thermo.unifac import *
 from fluids.numerics import *
 from fluids.constants import R
 from thermo.unifac import UFIP, LLEUFIP, LUFIP, DOUFIP2006, DOUFIP2016, NISTUFIP, NISTKTUFIP, PSRKIP, VTPRIP, DOUFSG
+import os
 import types
 import pickle, json
-from thermo.test_utils import check_np_output_activity
+from thermo.test_utils import check_np_output_activity, check_batch_activity
 
 '''
 Test suite currently takes ~0.2 seconds :)
@@ -1001,6 +1002,164 @@ def test_UNIFAC_one_component():
             res = getattr(GE, s)()
 
 
+def test_UNIFAC_T_cache():
+    chemgroups = [{9:6}, {78:6}, {1:1, 18:1}, {1:1, 2:1, 14:1}]
+    xs = [0.2, 0.3, 0.1, 0.4]
+    GE = UNIFAC.from_subgroups(T=373.15, xs=xs, chemgroups=chemgroups, version=1,
+                               interaction_data=DOUFIP2006, subgroups=DOUFSG)
+    T_cache = GE.T_cache
+    flash_like, gammas = [], []
+    for T in (350.0, 360.0, 350.0, 360.0):
+        for xs2 in ([0.1, 0.2, 0.3, 0.4], [0.25, 0.25, 0.25, 0.25]):
+            model = GE.to_T_xs(T=T, xs=xs2)
+            gammas.append(model.gammas())
+            model.dHE_dT()
+            flash_like.append(model)
+    # Every term calculated at a temperature is reused by the later models there
+    T_only = [name for name in UNIFAC._T_only_attributes if name in flash_like[0].__dict__]
+    assert (T_cache.hits, T_cache.misses) == (6*len(T_only), 2)
+    # Temperature-only terms are calculated once per temperature
+    assert flash_like[5]._psis is flash_like[0]._psis
+    assert flash_like[6]._lnGammas_subgroups_pure is flash_like[2]._lnGammas_subgroups_pure
+    assert flash_like[7]._d2psis_dT2 is flash_like[3]._d2psis_dT2
+
+    uncached = UNIFAC.from_subgroups(T=373.15, xs=xs, chemgroups=chemgroups, version=1,
+                                     interaction_data=DOUFIP2006, subgroups=DOUFSG)
+    uncached.T_cache = None
+    for model, expect in zip(flash_like, gammas):
+        assert_close1d(uncached.to_T_xs(T=model.T, xs=model.xs).gammas(), expect, rtol=1e-14)
+        assert_close(uncached.to_T_xs(T=model.T, xs=model.xs).dHE_dT(), model.dHE_dT(), rtol=1e-14)
+
+    assert UNIFAC.from_json(flash_like[3].as_json()) == flash_like[3]
+
+
+def test_UNIFAC_sparse():
+    chemgroups = [{9:6}, {78:6}, {1:1, 18:1}, {1:1, 2:1, 14:1}]
+    xs = np.array([0.2, 0.3, 0.1, 0.4])
+    for version, kwargs in ((0, {}), (1, dict(interaction_data=DOUFIP2006, subgroups=DOUFSG))):
+        dense = UNIFAC.from_subgroups(T=373.15, xs=xs, chemgroups=chemgroups, version=version, **kwargs)
+        sparse = UNIFAC.from_subgroups(T=373.15, xs=xs, chemgroups=chemgroups, version=version, sparse=True, **kwargs)
+        # Pairs of subgroups in the same main group do not interact
+        assert len(sparse.psi_rows) < sparse.N_groups**2
+        assert_close1d(sparse.lnGammas_subgroups_pure().ravel(), dense.lnGammas_subgroups_pure().ravel(), rtol=1e-13)
+        for dense, sparse in ((dense, sparse), (dense.to_T_xs(330.0, xs[::-1]), sparse.to_T_xs(330.0, xs[::-1]))):
+            assert_close1d(sparse.gammas(), dense.gammas(), rtol=1e-13)
+            assert_close1d(sparse.lnGammas_subgroups(), dense.lnGammas_subgroups(), rtol=1e-13)
+            assert_close(sparse.GE(), dense.GE(), rtol=1e-13)
+            assert_close(sparse.dGE_dT(), dense.dGE_dT(), rtol=1e-12)
+            assert_close2d(sparse.d2GE_dxixjs(), dense.d2GE_dxixjs(), rtol=1e-12)
+            assert_close2d(sparse.psis(), dense.psis(), rtol=1e-13)
+        assert UNIFAC.from_json(json.loads(json.dumps(sparse.as_json()))) == sparse
+
+    # Lyngby temperature dependence, with random parameters for half the pairs
+    N_groups, N = 12, 5
+    rng = np.random.RandomState(0)
+    mask = rng.rand(N_groups, N_groups) < 0.5
+    psi_abc = tuple(np.where(mask, rng.uniform(-s, s, (N_groups, N_groups)), 0.0) for s in (500.0, 1.0, 1e-2))
+    vs = np.zeros((N_groups, N))
+    for i in range(N):
+        vs[rng.choice(N_groups, 3, replace=False), i] = rng.randint(1, 4, 3)
+    Qs = rng.uniform(0.2, 1.5, N_groups)
+    kwargs = dict(T=320.0, xs=np.array(normalize(rng.rand(N).tolist())), rs=vs.T @ rng.uniform(0.2, 1.5, N_groups),
+                  qs=vs.T @ Qs, Qs=Qs, vs=vs, psi_abc=psi_abc, version=4)
+    dense, sparse = UNIFAC(**kwargs), UNIFAC(sparse=True, **kwargs)
+    assert_close1d(sparse.gammas(), dense.gammas(), rtol=1e-13)
+    assert_close(sparse.HE(), dense.HE(), rtol=1e-12)
+    assert 'sparse=True' in repr(sparse)
+
+    with pytest.raises(ValueError):
+        UNIFAC.from_subgroups(T=373.15, xs=xs.tolist(), chemgroups=chemgroups, sparse=True)
+
+
+def test_UNIFAC_ip_arrays(tmp_path):
+    import thermo.unifac
+    from thermo.serialize import load_snapshot
+    arrays = load_unifac_ip_arrays()
+    for name, interaction_data in (('UFIP', UFIP), ('DOUFIP2016', DOUFIP2016), ('VTPRIP', VTPRIP),
+                                   ('NISTUFIP', NISTUFIP), ('LUFIP', LUFIP)):
+        assert np.array_equal(arrays[name], unifac_ip_to_array(interaction_data))
+    assert arrays['UFIP'][0, 1, 2] == UFIP[1][2] and arrays['UFIP'][1, 1, 2] == 0.0
+    assert_close1d(arrays['DOUFIP2016'][:, 1, 7], DOUFIP2016[1][7], rtol=0)
+
+    compiled = compile_unifac_ip(str(tmp_path/'ip.snapshot'))
+    loaded = load_snapshot(str(tmp_path/'ip.snapshot'), mmap=True)
+    assert sorted(loaded) == sorted(compiled) == sorted(arrays)
+    assert all(np.array_equal(loaded[k], arrays[k]) for k in arrays)
+
+    # The defaults come from the arrays, and match walking the dictionaries
+    chemgroups = [{9:6}, {78:6}, {1:1, 18:1}, {1:1, 2:1, 14:1}]
+    for version, interaction_data in ((0, UFIP), (1, DOUFIP2016)):
+        for xs in ([0.2, 0.3, 0.1, 0.4], np.array([0.2, 0.3, 0.1, 0.4])):
+            default = UNIFAC.from_subgroups(T=373.15, xs=xs, chemgroups=chemgroups, version=version)
+            walked = UNIFAC.from_subgroups(T=373.15, xs=xs, chemgroups=chemgroups, version=version,
+                                           interaction_data=interaction_data)
+            assert default == walked
+            assert type(default.psi_a) is type(walked.psi_a)
+    GE = UNIFAC.from_subgroups(T=373.15, xs=xs, chemgroups=chemgroups, version=1,
+                               interaction_data=DOUFIP2006, subgroups=DOUFSG)
+    GE2 = UNIFAC.from_subgroups(T=373.15, xs=xs, chemgroups=chemgroups, version=1,
+                                interaction_data=unifac_ip_to_array(DOUFIP2006), subgroups=DOUFSG)
+    assert GE == GE2
+
+    # Main groups beyond the array have no parameters
+    small = unifac_ip_to_array({1: {5: 10.0}, 5: {1: 20.0}})
+    GE = UNIFAC.from_subgroups(T=373.15, xs=xs, chemgroups=chemgroups, version=1,
+                               interaction_data=small, subgroups=DOUFSG)
+    assert GE.psi_a[1][3] == 10.0 and GE.psi_a[3][1] == 20.0
+    assert np.count_nonzero(GE.psi_a) == 4
+
+
+def test_UNIFAC_ip_arrays_cache_file(tmp_path, monkeypatch):
+    import thermo.unifac
+    import thermo.serialize
+    from thermo.serialize import SNAPSHOT_BUFFERS
+    expect = {name: unifac_ip_to_array(getattr(thermo.unifac, name)) for name in ('UFIP', 'DOUFIP2016')}
+    def load(path):
+        monkeypatch.setattr(thermo.unifac, 'unifac_ip_arrays_path', path)
+        monkeypatch.setattr(thermo.unifac, 'UNIFAC_IP_ARRAYS', None)
+        arrays = load_unifac_ip_arrays()
+        assert all(np.array_equal(arrays[k], v) for k, v in expect.items())
+        return arrays
+
+    # Written to the user data directory, created if needed, and mapped afterwards
+    path = str(tmp_path/'thermo'/'ip.snapshot')
+    load(path)
+    assert os.path.exists(path) == SNAPSHOT_BUFFERS
+    load(path)
+
+    # Without a data directory, or if the file cannot be written or read,
+    # the arrays are kept in memory
+    load(None)
+    blocker = tmp_path/'not a directory'
+    blocker.write_text('')
+    load(str(blocker/'ip.snapshot'))
+    corrupt = tmp_path/'corrupt.snapshot'
+    corrupt.write_bytes(b'garbage')
+    load(str(corrupt))
+    assert not [name for name in os.listdir(str(tmp_path)) if name.endswith('.tmp')]
+
+    # Files which cannot be memory-mapped are not written
+    monkeypatch.setattr(thermo.serialize, 'SNAPSHOT_BUFFERS', False)
+    path = str(tmp_path/'old python.snapshot')
+    load(path)
+    assert not os.path.exists(path)
+
+
+def test_UNIFAC_batch():
+    chemgroups = [{1:2, 2:4}, {1:1, 2:1, 14:1}, {9:6}, {16:1}]
+    xs = [0.2, 0.3, 0.1, 0.4]
+    xs_matrix = [xs, [0.7, 0.1, 0.1, 0.1], [1e-5, 0.5, 0.3, 0.19999]]
+    for version, subgroups, interaction_data in ((0, UFSG, UFIP), (1, DOUFSG, DOUFIP2016), (3, NISTKTUFSG, NISTKTUFIP), (4, LUFSG, LUFIP)):
+        model = UNIFAC.from_subgroups(T=373.15, xs=xs, chemgroups=chemgroups, version=version,
+                                      interaction_data=interaction_data, subgroups=subgroups)
+        for T in (373.15, 330.0):
+            check_batch_activity(model, T, xs_matrix)
+    for sparse in (False, True):
+        modelnp = UNIFAC.from_subgroups(T=373.15, xs=np.array(xs), chemgroups=chemgroups, version=1,
+                                        interaction_data=DOUFIP2016, subgroups=DOUFSG, sparse=sparse)
+        check_batch_activity(modelnp, 330.0, np.array(xs_matrix))
+
+
 def test_UNIFAC_large():
     constants, correlations = ChemicalConstantsPackage.from_IDs(IDs=list(dippr_compounds())[0:200])
     groups, CASs = [], []
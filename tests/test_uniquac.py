@@ -31,7 +31,7 @@ from random import random
 from thermo import *
 import numpy as np
 from fluids.numerics import jacobian, hessian, derivative, normalize, assert_close, assert_close1d, assert_close2d, assert_close3d, linspace
-from thermo.test_utils import check_np_output_activity
+from thermo.test_utils import check_np_output_activity, check_batch_activity
 import pickle
 
 def test_UNIQUAC_functional():
@@ -402,3 +402,15 @@ def test_UNIQUAC_one_component():
         if hasattr(GE, s):
             res = getattr(GE, s)()
             # print(res, s)
+
+def test_UNIQUAC_batch():
+    rs = [2.5735, 2.87, 1.4311]
+    qs = [2.336, 2.41, 1.432]
+    tau_bs = [[0.0, 235.0, -169.0], [-160, 0.0, -715.0], [11.2, 144.0, 0.0]]
+    xs_matrix = [[0.229, 0.175, 0.596], [0.9, 0.05, 0.05], [1e-5, 0.5, 0.49999]]
+    model = UNIQUAC(T=331.42, xs=[0.229, 0.175, 0.596], rs=rs, qs=qs, tau_bs=tau_bs)
+    # The second derivatives are written differently, and lose a few digits near the pure components
+    for T in (331.42, 300.0):
+        check_batch_activity(model, T, xs_matrix, rtol=1e-10)
+    modelnp = UNIQUAC(T=331.42, xs=np.array([0.229, 0.175, 0.596]), rs=np.array(rs), qs=np.array(qs), tau_bs=np.array(tau_bs))
+    check_batch_activity(modelnp, 350.0, np.array(xs_matrix), rtol=1e-10)
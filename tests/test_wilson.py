@@ -29,7 +29,7 @@ from thermo.activity import GibbsExcess
 from thermo import *
 import numpy as np
 from fluids.numerics import jacobian, hessian, derivative, normalize, assert_close, assert_close1d, assert_close2d, assert_close3d, linspace
-from thermo.test_utils import check_np_output_activity
+from thermo.test_utils import check_np_output_activity, check_batch_activity
 import pickle
 
 def test_Wilson():
@@ -829,3 +829,13 @@ def test_wilson_gammas_binaries():
     
     all_gammas = wilson_gammas_binaries(xs, lambda12, lambda21)
     assert_close1d(all_gammas, gammas_object, rtol=1e-13)
+
+def test_Wilson_batch():
+    lambda_as = [[0.0, 3.870101271243586, 0.35], [0.07939943395502425, 0.0, -0.2], [0.1, 0.4, 0.0]]
+    lambda_bs = [[0.0, -1917.2096099114794, -300.0], [-313.7522384428703, 0.0, 120.0], [-80.0, -200.0, 0.0]]
+    xs_matrix = [[0.229, 0.175, 0.596], [0.9, 0.05, 0.05], [1e-5, 0.5, 0.49999]]
+    model = Wilson(T=331.42, xs=[0.229, 0.175, 0.596], lambda_as=lambda_as, lambda_bs=lambda_bs)
+    for T in (331.42, 300.0):
+        check_batch_activity(model, T, xs_matrix)
+    modelnp = Wilson(T=331.42, xs=np.array([0.229, 0.175, 0.596]), lambda_as=np.array(lambda_as), lambda_bs=np.array(lambda_bs))
+    check_batch_activity(modelnp, 350.0, np.array(xs_matrix))
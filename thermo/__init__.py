@@ -18,136 +18,61 @@ FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
 AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
 LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-SOFTWARE.'''
+SOFTWARE.
+
+
+Importing `thermo` does not import its submodules; following PEP 562, each
+name in the `thermo` namespace is imported from the module which defines it
+the first time it is accessed. `from thermo import *`, `dir(thermo)` and
+:obj:`complete_lazy_loading` import everything, as the package used to on
+import.
+'''
 
 import os
 from fluids import numerics
 
 if not numerics.is_micropython:
+    import importlib
+    import importlib.util
+
+    # Modules whose public names are re-exported, in order of precedence
+    # (later modules win)
+    _star_modules = ('thermo.eos_alpha_functions', 'thermo.eos_mix_methods',
+                     'thermo.eos_volume', 'chemicals.acentric',
+                     'chemicals.rachford_rice', 'chemicals.flash_basic',
+                     'thermo.chemical', 'thermo.chemical_package',
+                     'chemicals.combustion', 'chemicals.critical',
+                     'thermo.coolprop', 'chemicals.dipole', 'chemicals.dippr',
+                     'thermo.datasheet', 'thermo.electrochem',
+                     'chemicals.elements', 'chemicals.environment', 'thermo.eos',
+                     'thermo.eos_mix', 'thermo.flash', 'thermo.heat_capacity',
+                     'thermo.group_contribution', 'chemicals.identifiers',
+                     'thermo.interaction_parameters', 'thermo.law', 'thermo.bulk',
+                     'chemicals.lennard_jones', 'chemicals.miscdata',
+                     'thermo.mixture', 'thermo.permittivity',
+                     'thermo.phase_change', 'thermo.phases',
+                     'thermo.phase_identification', 'thermo.property_package',
+                     'thermo.property_package_constants', 'chemicals.reaction',
+                     'chemicals.refractivity', 'thermo.regular_solution',
+                     'chemicals.safety', 'chemicals.solubility', 'thermo.stream',
+                     'thermo.interface', 'thermo.thermal_conductivity',
+                     'chemicals.triple', 'thermo.unifac', 'thermo.utils',
+                     'thermo.vapor_pressure', 'chemicals.virial',
+                     'thermo.viscosity', 'thermo.volume', 'thermo.chemical_utils',
+                     'thermo.wilson', 'thermo.nrtl', 'thermo.uniquac',
+                     'thermo.equilibrium', 'chemicals.temperature',
+                     'thermo.activity', 'thermo.fitting',
+                     'thermo.functional_groups')
+
+    # Submodules of chemicals available as attributes of thermo
+    _chemicals_submodules = ('acentric', 'rachford_rice', 'flash_basic',
+                             'combustion', 'critical', 'dipole', 'dippr',
+                             'elements', 'environment', 'identifiers',
+                             'lennard_jones', 'miscdata', 'reaction',
+                             'refractivity', 'safety', 'solubility', 'triple',
+                             'virial', 'temperature')
 
-    from . import eos_alpha_functions
-    from . import eos_volume
-    from chemicals import acentric
-    from chemicals import rachford_rice
-    from chemicals import flash_basic
-    from . import chemical
-    from . import chemical_package
-    from chemicals import combustion
-    from chemicals import critical
-    from . import coolprop
-    from chemicals import dipole
-    from chemicals import dippr
-    from . import datasheet
-    from . import electrochem
-    from chemicals import elements
-    from chemicals import environment
-    from . import eos
-    from . import eos_mix
-    from . import equilibrium
-    from . import flash
-    from . import heat_capacity
-    from chemicals import identifiers
-    from . import interaction_parameters
-    from . import group_contribution
-    from . import law
-    from chemicals import lennard_jones
-    from chemicals import miscdata
-    from . import mixture
-    from . import permittivity
-    from . import phase_change
-    from . import phases
-    from . import phase_identification
-    from . import property_package
-    from . import property_package_constants
-    from chemicals import reaction
-    from chemicals import refractivity
-    from . import regular_solution
-    from chemicals import safety
-    from chemicals import solubility
-    from . import stream
-    from . import interface
-    from . import thermal_conductivity
-    from chemicals import triple
-    from . import unifac
-    from . import utils
-    from . import vapor_pressure
-    from chemicals import virial
-    from . import viscosity
-    from . import volume
-    from . import fitting
-    from . import chemical_utils
-    from . import wilson
-    from . import nrtl
-    from . import uniquac
-    from . import bulk
-    from chemicals import temperature
-    from . import eos_mix_methods
-    from . import activity
-    
-    from .eos_alpha_functions import *
-    from .eos_mix_methods import *
-    from .eos_volume import *
-    from chemicals.acentric import *
-    from chemicals.rachford_rice import *
-    from chemicals.flash_basic import *
-    from .chemical import *
-    from .chemical_package import *
-    from chemicals.combustion import *
-    from chemicals.critical import *
-    from .coolprop import *
-    from chemicals.dipole import *
-    from chemicals.dippr import *
-    from .datasheet import *
-    from .electrochem import *
-    from chemicals.elements import *
-    from chemicals.environment import *
-    from .eos import *
-    from .eos_mix import *
-    from .flash import *
-    from .heat_capacity import *
-    from .group_contribution import *
-    from chemicals.identifiers import *
-    from .interaction_parameters import *
-    from .law import *
-    from .bulk import *
-    from chemicals.lennard_jones import *
-    from chemicals.miscdata import *
-    from .mixture import *
-    from .permittivity import *
-    from .phase_change import *
-    from .phases import *
-    from .phase_identification import *
-    from .property_package import *
-    from .property_package_constants import *
-    from chemicals.reaction import *
-    from chemicals.refractivity import *
-    from .regular_solution import *
-    from chemicals.safety import *
-    from chemicals.solubility import *
-    from .stream import *
-    from .interface import *
-    from .thermal_conductivity import *
-    from chemicals.triple import *
-    from .unifac import *
-    from .utils import *
-    from .vapor_pressure import *
-    from chemicals.virial import *
-    from .viscosity import *
-    from .volume import *
-    from .chemical_utils import *
-    from .wilson import *
-    from .nrtl import *
-    from .uniquac import *
-    from .equilibrium import *
-    from chemicals.temperature import *
-    from .activity import *
-    from .fitting import *
-    from .functional_groups import *
-    
-    #from chemicals import *
-    
-    
-    __all__ = ['rachford_rice', 'flash_basic', 'chemical', 'chemical_package', 'combustion', 'critical', 'flash',
+    _all_modules = ['rachford_rice', 'flash_basic', 'chemical', 'chemical_package', 'combustion', 'critical', 'flash',
      'dipole', 'electrochem', 'elements', 'environment', 'eos', 'eos_mix',
      'heat_capacity',  'identifiers', 'group_contribution', 'law', 'lennard_jones',
      'miscdata',
@@ -160,96 +85,102 @@ if not numerics.is_micropython:
      'equilibrium', 'phase_identification', 'temperature', 'fitting',
      'eos_alpha_functions', 'eos_volume', 'bulk', 'eos_mix_methods', 'activity',
      'functional_groups']
-    
-    __all__.extend(eos_volume.__all__)
-    __all__.extend(eos_alpha_functions.__all__)
-    __all__.extend(acentric.__all__)
-    __all__.extend(rachford_rice.__all__)
-    __all__.extend(flash_basic.__all__)
-    __all__.extend(chemical_package.__all__)
-    __all__.extend(chemical.__all__)
-    __all__.extend(combustion.__all__)
-    __all__.extend(critical.__all__)
-    __all__.extend(coolprop.__all__)
-    #__all__.extend(dipole.__all__)
-    __all__.extend(dippr.__all__)
-    __all__.extend(datasheet.__all__)
-    __all__.extend(electrochem.__all__)
-    __all__.extend(elements.__all__)
-    __all__.extend(environment.__all__)
-    __all__.extend(eos.__all__)
-    __all__.extend(eos_mix.__all__)
-    __all__.extend(flash.__all__)
-    __all__.extend(heat_capacity.__all__)
-    __all__.extend(identifiers.__all__)
-    __all__.extend(interaction_parameters.__all__)
-    __all__.extend(group_contribution.__all__)
-    __all__.extend(law.__all__)
-    __all__.extend(lennard_jones.__all__)
-    __all__.extend(miscdata.__all__)
-    __all__.extend(mixture.__all__)
-    __all__.extend(permittivity.__all__)
-    __all__.extend(phase_change.__all__)
-    __all__.extend(phases.__all__)
-    __all__.extend(phase_identification.__all__)
-    __all__.extend(property_package.__all__)
-    __all__.extend(reaction.__all__)
-    __all__.extend(refractivity.__all__)
-    __all__.extend(safety.__all__)
-    __all__.extend(solubility.__all__)
-    __all__.extend(stream.__all__)
-    __all__.extend(interface.__all__)
-    __all__.extend(thermal_conductivity.__all__)
-    __all__.extend(triple.__all__)
-    __all__.extend(utils.__all__)
-    __all__.extend(unifac.__all__)
-    __all__.extend(vapor_pressure.__all__)
-    __all__.extend(virial.__all__)
-    __all__.extend(viscosity.__all__)
-    __all__.extend(volume.__all__)
-    __all__.extend(property_package_constants.__all__)
-    __all__.extend(chemical_utils.__all__)
-    __all__.extend(wilson.__all__)
-    __all__.extend(nrtl.__all__)
-    __all__.extend(uniquac.__all__)
-    __all__.extend(regular_solution.__all__)
-    __all__.extend(equilibrium.__all__)
-    __all__.extend(temperature.__all__)
-    __all__.extend(bulk.__all__)
-    __all__.extend(eos_mix_methods.__all__)
-    __all__.extend(activity.__all__)
-    __all__.extend(fitting.__all__)
-    __all__.extend(functional_groups.__all__)
-    
-    
-    # backwards compatibility hack to allow thermo.chemical.Mixture to still be importable
-    try:
-        chemical.__dict__['Mixture'] = mixture.Mixture
-        chemical.__dict__['Stream'] = stream.Stream
-    except:
-        pass
-    # However, they cannot go in thermo.chemical's __all__ or they will appear in the
-    # documentation and Sphinx currently has no wat to exclude them
-    submodules = [activity, chemical, chemical_package, chemical_utils, coolprop, datasheet,
-                  electrochem, eos, eos_mix, equilibrium, heat_capacity,
-                  identifiers, interaction_parameters, interface, group_contribution.joback, law,
-                  mixture, nrtl, permittivity, phase_change, phase_identification,
-                  property_package, property_package_constants, regular_solution, 
-                  stream, thermal_conductivity, unifac, uniquac, safety,
-                  fitting,functional_groups,
-                  utils, vapor_pressure, viscosity, volume, wilson, eos_alpha_functions,
-                  eos_volume, eos_mix_methods,              
-                  flash, flash.flash_base, flash.flash_pure_vls,
-                  flash.flash_utils, flash.flash_vl, flash.flash_vln,              
-                  phases, phases.air_phase, phases.ceos, phases.combined, 
-                  phases.coolprop_phase, phases.gibbs_excess, phases.helmholtz_eos,
-                  phases.iapws_phase, phases.ideal_gas, phases.petroleum, 
-                  phases.phase, phases.phase_utils, phases.virial_phase,
-                  utils.functional, utils.mixture_property,
-                  utils.t_dependent_property, utils.tp_dependent_property,
-                  utils.multi_cheb_1d]
-    
+
+    # Modules whose __all__ is appended to thermo.__all__, in order
+    _all_extended = ('eos_volume', 'eos_alpha_functions', 'acentric',
+                     'rachford_rice', 'flash_basic', 'chemical_package',
+                     'chemical', 'combustion', 'critical', 'coolprop', 'dippr',
+                     'datasheet', 'electrochem', 'elements', 'environment', 'eos',
+                     'eos_mix', 'flash', 'heat_capacity', 'identifiers',
+                     'interaction_parameters', 'group_contribution', 'law',
+                     'lennard_jones', 'miscdata', 'mixture', 'permittivity',
+                     'phase_change', 'phases', 'phase_identification',
+                     'property_package', 'reaction', 'refractivity', 'safety',
+                     'solubility', 'stream', 'interface', 'thermal_conductivity',
+                     'triple', 'utils', 'unifac', 'vapor_pressure', 'virial',
+                     'viscosity', 'volume', 'property_package_constants',
+                     'chemical_utils', 'wilson', 'nrtl', 'uniquac',
+                     'regular_solution', 'equilibrium', 'temperature', 'bulk',
+                     'eos_mix_methods', 'activity', 'fitting', 'functional_groups')
+
+    _submodule_names = ('activity', 'chemical', 'chemical_package', 'chemical_utils', 'coolprop', 'datasheet',
+                  'electrochem', 'eos', 'eos_mix', 'equilibrium', 'heat_capacity',
+                  'identifiers', 'interaction_parameters', 'interface', 'group_contribution.joback', 'law',
+                  'mixture', 'nrtl', 'permittivity', 'phase_change', 'phase_identification',
+                  'property_package', 'property_package_constants', 'regular_solution',
+                  'stream', 'thermal_conductivity', 'unifac', 'uniquac', 'safety',
+                  'fitting', 'functional_groups',
+                  'utils', 'vapor_pressure', 'viscosity', 'volume', 'wilson', 'eos_alpha_functions',
+                  'eos_volume', 'eos_mix_methods',
+                  'flash', 'flash.flash_base', 'flash.flash_pure_vls',
+                  'flash.flash_utils', 'flash.flash_vl', 'flash.flash_vln', 'flash.flash_pure_table',
+                  'phases', 'phases.air_phase', 'phases.ceos', 'phases.combined',
+                  'phases.coolprop_phase', 'phases.gibbs_excess', 'phases.helmholtz_eos',
+                  'phases.iapws_phase', 'phases.ideal_gas', 'phases.petroleum',
+                  'phases.phase', 'phases.phase_utils', 'phases.virial_phase',
+                  'utils.functional', 'utils.mixture_property',
+                  'utils.t_dependent_property', 'utils.tp_dependent_property',
+                  'utils.multi_cheb_1d')
+
+    _name_modules = None
+
+    def _module_path(name):
+        if name in _chemicals_submodules:
+            return 'chemicals.' + name
+        return 'thermo.' + name
+
+    def _load_name_modules():
+        # Names exported by thermo's own modules come from the index in
+        # thermo.lazy_names, which is generated from the modules' __all__;
+        # the ones from chemicals are looked up from the installed version
+        global _name_modules
+        from thermo.lazy_names import lazy_names
+        name_modules = {}
+        for module_name in _star_modules:
+            if module_name.startswith('chemicals.'):
+                for name in importlib.import_module(module_name).__all__:
+                    name_modules[name] = module_name
+            else:
+                for name in lazy_names.get(module_name, ()):
+                    name_modules[name] = module_name
+        _name_modules = name_modules
+        return name_modules
+
+    def _load_all():
+        global __all__, submodules
+        __all__ = list(_all_modules)
+        for name in _all_extended:
+            __all__.extend(getattr(importlib.import_module(_module_path(name)), '__all__'))
+        submodules = [importlib.import_module(_module_path(name)) for name in _submodule_names]
+
+    def _lazy_names_from_modules():
+        r'''Import every module re-exported by `thermo` and return the names
+        each of thermo's own modules contributes to the namespace, as stored
+        in :obj:`thermo.lazy_names`; a name exported by several modules is
+        listed under the last one, which is the one `thermo` resolves it to.
+
+        Returns
+        -------
+        lazy_names : dict[str, tuple[str]]
+            Public names for each module, [-]
+        '''
+        owners = {}
+        for module_name in _star_modules:
+            for name in importlib.import_module(module_name).__all__:
+                owners[name] = module_name
+        lazy_names = {}
+        for name, module_name in owners.items():
+            if module_name.startswith('thermo.'):
+                lazy_names.setdefault(module_name, []).append(name)
+        return {k: tuple(v) for k, v in lazy_names.items()}
+
+    def _import_all():
+        _load_all()
+        for name in __all__:
+            globals()[name] = __getattr__(name)
+
     def complete_lazy_loading():
+        _import_all()
         import chemicals
         chemicals.complete_lazy_loading()
         electrochem._load_electrochem_data()
@@ -262,36 +193,47 @@ if not numerics.is_micropython:
             import CoolProp
         except:
             pass
+
+    def __getattr__(name):
+        if name == '__all__' or name == 'submodules':
+            _load_all()
+            return globals()[name]
+        name_modules = _name_modules
+        if name_modules is None:
+            name_modules = _load_name_modules()
+        if name in name_modules:
+            obj = getattr(importlib.import_module(name_modules[name]), name)
+        elif name in _chemicals_submodules:
+            obj = importlib.import_module('chemicals.' + name)
+        elif name == 'numba_vectorized':
+            import thermo.numba
+            import thermo.numba_vectorized as obj
+        elif not name.startswith('__') and importlib.util.find_spec('thermo.' + name) is not None:
+            obj = importlib.import_module('thermo.' + name)
+        else:
+            raise AttributeError("module %s has no attribute %s" %(__name__, name))
+        globals()[name] = obj
+        return obj
+
+    def __dir__():
+        _load_all()
+        return sorted(set(globals()) | set(__all__))
+
+    # backwards compatibility hack to allow thermo.chemical.Mixture to still be
+    # importable is in thermo.chemical.__getattr__
+
+    if not numerics.PY37:
+        # Module __getattr__ is not supported
+        _import_all()
+        from . import vectorized
+
     if hasattr(os, '_called_from_test'):
         # pytest timings are hard to measure with lazy loading
         complete_lazy_loading()
-    
-    global vectorized, numba, units, numba_vectorized
-    if numerics.PY37:
-        def __getattr__(name):
-            global vectorized, numba, units, numba_vectorized
-            if name == 'vectorized':
-                import thermo.vectorized as vectorized
-                return vectorized
-            if name == 'numba':
-                import thermo.numba as numba
-                return numba
-            if name == 'units':
-                import thermo.units as units
-                return units
-            if name == 'numba_vectorized':
-                import thermo.numba as numba
-                import thermo.numba_vectorized as numba_vectorized
-                return numba_vectorized
-            raise AttributeError("module %s has no attribute %s" %(__name__, name))
-    else:
-        from . import vectorized
-    
+
 try:
     thermo_dir = os.path.dirname(__file__)
 except:
     thermo_dir = ''
 
 __version__ = '0.2.20'
-
-
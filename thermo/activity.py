@@ -46,7 +46,7 @@ Ideal Liquid Class
 ==================
 
 .. autoclass:: IdealSolution
-    :members: to_T_xs, GE, dGE_dT, d2GE_dT2, d3GE_dT3, d2GE_dTdxs, dGE_dxs, d2GE_dxixjs, d3GE_dxixjxks
+    :members: to_T_xs, GE, dGE_dT, d2GE_dT2, d3GE_dT3, d2GE_dTdxs, dGE_dxs, d2GE_dxixjs, d3GE_dxixjxks, GE_batch, dGE_dxs_batch, d2GE_dxixjs_batch, gammas_batch
     :undoc-members:
     :show-inheritance:
     :exclude-members: gammas
@@ -74,6 +74,8 @@ from chemicals.utils import exp, log
 from chemicals.utils import normalize, dxs_to_dns, dxs_to_dn_partials, dns_to_dn_partials, d2xs_to_dxdn_partials, hash_any_primitive
 from thermo import serialize
 from thermo.fitting import fit_customized
+from thermo.utils.temperature_cache import TemperatureCache
+from weakref import ref
 
 try:
     npexp, ones, zeros, array, ndarray = np.exp, np.ones, np.zeros, np.array, np.ndarray
@@ -92,6 +94,12 @@ def gibbs_excess_gammas(xs, dG_dxs, GE, T, gammas=None):
         gammas[i] = exp((dG_dxs[i] + xdx_totF)*RT_inv)
     return gammas
 
+def gibbs_excess_gammas_batch(xs, dGE_dxs, GE, T):
+    # `gibbs_excess_gammas` for many compositions at once; `xs` and `dGE_dxs`
+    # are (M, N) arrays and `GE` is an (M,) array.
+    xdx_totF = GE - (xs*dGE_dxs).sum(axis=1)
+    return np.exp((dGE_dxs + xdx_totF[:, None])*(R_inv/T))
+
 def gibbs_excess_dHE_dxs(dGE_dxs, d2GE_dTdxs, N, T, dHE_dxs=None):
     if dHE_dxs is None:
         dHE_dxs = [0.0]*N
@@ -288,6 +296,18 @@ class GibbsExcess(object):
     as not all models can mathematically be evaluated at zero mole-fraction.'''
     
     
+    T_cache = None
+    ''':obj:`TemperatureCache <thermo.utils.TemperatureCache>` shared by a
+    model and every model created from it with `to_T_xs`, through which
+    models at a temperature seen recently reuse the temperature-only terms
+    already calculated there; None if disabled. Only those terms and a weak
+    reference to the latest model at each temperature are kept, and the
+    cache is not pickled.'''
+
+    _T_only_attributes = ()
+    '''Names of the stored results which depend on temperature only, and can
+    be reused by any model with the same parameters at the same temperature.'''
+
     _point_properties = ('CpE', 'GE', 'HE', 'SE', 'd2GE_dT2', 'd2GE_dTdns',
                          'd2GE_dTdxs', 'd2GE_dxixjs', 'd2nGE_dTdns', 'd2nGE_dninjs',
                          'dGE_dT', 'dGE_dns', 'dGE_dxs', 'dHE_dT', 'dHE_dns', 'dHE_dxs',
@@ -332,9 +352,70 @@ class GibbsExcess(object):
             Hash of the object, [-]
         '''
         d = self.__dict__
+        if 'T_cache' in d:
+            d = d.copy()
+            del d['T_cache']
         ans = hash_any_primitive((self.__class__.__name__, d))
         return ans
 
+    def __getstate__(self):
+        d = self.__dict__.copy()
+        T_cache = d.pop('T_cache', None)
+        if T_cache is not None:
+            d['T_cache'] = T_cache.max_size
+        return d
+
+    def __setstate__(self, d):
+        if 'T_cache' in d:
+            d['T_cache'] = TemperatureCache(d['T_cache'])
+        self.__dict__ = d
+
+    def _set_T_cache(self, T_cache_size):
+        if T_cache_size:
+            self.T_cache = TemperatureCache(T_cache_size)
+
+    def _cache_T_only(self):
+        # Copy the temperature-only terms calculated so far into `T_cache`
+        T_cache = self.T_cache
+        if T_cache is not None:
+            d = self.__dict__
+            entry = T_cache.entry(self.T)
+            for name in self._T_only_attributes:
+                if name in d:
+                    entry[name] = d[name]
+
+    def _transfer_T_only(self, new):
+        # Called by `to_T_xs` once `new` has its parameters. Without a cache,
+        # only a model at exactly the same temperature shares its results; with
+        # one, every term calculated at the new temperature by this model, by
+        # the latest model created there if it still exists, or by earlier
+        # models is reused.
+        T, names, new_d = new.T, self._T_only_attributes, new.__dict__
+        if T == self.T:
+            d = self.__dict__
+            for name in names:
+                if name in d:
+                    new_d[name] = d[name]
+        T_cache = self.T_cache
+        if T_cache is not None:
+            new.T_cache = T_cache
+            self._cache_T_only()
+            entry = T_cache.entry(T)
+            last = entry.get('model')
+            last = last() if last is not None else None
+            if last is not None and last is not self:
+                last._cache_T_only()
+            reused = 0
+            for name in names:
+                if name not in new_d and name in entry:
+                    new_d[name] = entry[name]
+                    reused += 1
+            if reused:
+                T_cache.hits += reused
+            elif not any(name in new_d for name in names):
+                T_cache.misses += 1
+            entry['model'] = ref(new)
+
     def model_hash(self):
         r'''Basic method to calculate a hash of the non-state parts of the model
         This is useful for comparing to models to
@@ -401,6 +482,9 @@ class GibbsExcess(object):
         '''
         # vaguely jsonpickle compatible
         d = self.__dict__.copy()
+        T_cache = d.pop('T_cache', None)
+        if T_cache is not None:
+            d['T_cache'] = T_cache.max_size
         if not self.scalar:
             d = serialize.arrays_to_lists(d)
         d["py/object"] = self.__full_path__
@@ -443,6 +527,9 @@ class GibbsExcess(object):
             d['cmp_group_idx'] = tuple(array(v) for v in d['cmp_group_idx'])
         if not scalar and 'group_cmp_idx' in d:
             d['group_cmp_idx'] = tuple(array(v) for v in d['group_cmp_idx'])
+        if not scalar and 'psi_rows' in d:
+            d['psi_rows'] = array(d['psi_rows'], dtype=int)
+            d['psi_cols'] = array(d['psi_cols'], dtype=int)
 
 
 #        if cls is GibbsExcess:
@@ -450,6 +537,8 @@ class GibbsExcess(object):
 
         del d['py/object']
         del d["json_version"]
+        if 'T_cache' in d:
+            d['T_cache'] = TemperatureCache(d['T_cache'])
 
         new = cls.__new__(cls)
         new.__dict__ = d
@@ -1022,6 +1111,123 @@ class GibbsExcess(object):
         self._dgammas_dT = dgammas_dT
         return dgammas_dT
     
+    def _batch_xs(self, xs_matrix):
+        xs_matrix = np.ascontiguousarray(xs_matrix, dtype=float)
+        if xs_matrix.ndim != 2 or xs_matrix.shape[1] != self.N:
+            raise ValueError("xs_matrix must have one row of %d mole fractions "
+                             "for each composition" %(self.N,))
+        return xs_matrix
+
+    def _batch_T_terms(self, T, *methods):
+        # Temperature-only terms at `T` for a batch, as arrays, from the
+        # methods named; with a `T_cache`, repeated batches at one
+        # temperature share them.
+        model = self if T == self.T else self.to_T_xs(T, self.xs)
+        terms = [array(getattr(model, method)()) for method in methods]
+        model._cache_T_only()
+        return terms
+
+    def _batch_rows(self, T, xs_matrix, name):
+        # Fallback for models without array kernels - one model per row
+        xs_matrix = self._batch_xs(xs_matrix)
+        return array([getattr(self.to_T_xs(T, xs.tolist() if self.scalar else xs), name)()
+                      for xs in xs_matrix])
+
+    def GE_batch(self, T, xs_matrix):
+        r'''Calculate and return the excess Gibbs energy of many liquid
+        compositions at the temperature `T`, with the parameters of this
+        model.
+
+        The models in thermo evaluate all of the compositions together with
+        array operations, without creating a model object for each
+        composition; this is much faster than calling :obj:`to_T_xs` for each
+        one when constructing phase diagrams or regressing parameters. The
+        temperature-only terms are calculated once, and shared through the
+        `T_cache` of the model if it has one.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        GE : ndarray
+            Excess Gibbs energy of each composition, [J/mol]
+
+        Examples
+        --------
+        >>> IdealSolution(T=300.0, xs=[.5, .5]).GE_batch(350.0, [[.1, .9], [.6, .4]])
+        array([0., 0.])
+        '''
+        return self._batch_rows(T, xs_matrix, 'GE')
+
+    def dGE_dxs_batch(self, T, xs_matrix):
+        r'''Calculate and return the mole fraction derivatives of excess Gibbs
+        energy of many liquid compositions at the temperature `T`, with the
+        parameters of this model. See :obj:`GE_batch`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        dGE_dxs : ndarray
+            Mole fraction derivatives of excess Gibbs energy, one row per
+            composition, [J/mol]
+        '''
+        return self._batch_rows(T, xs_matrix, 'dGE_dxs')
+
+    def d2GE_dxixjs_batch(self, T, xs_matrix):
+        r'''Calculate and return the second mole fraction derivatives of excess
+        Gibbs energy of many liquid compositions at the temperature `T`, with
+        the parameters of this model. See :obj:`GE_batch`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        d2GE_dxixjs : ndarray
+            Second mole fraction derivatives of excess Gibbs energy, size
+            number of compositions x N x N, [J/mol]
+        '''
+        return self._batch_rows(T, xs_matrix, 'd2GE_dxixjs')
+
+    def gammas_batch(self, T, xs_matrix):
+        r'''Calculate and return the activity coefficients of many liquid
+        compositions at the temperature `T`, with the parameters of this
+        model. See :obj:`GE_batch`.
+
+        .. math::
+            \gamma_i = \exp\left(\frac{\frac{\partial n_i G^E}{\partial n_i }}{RT}\right)
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        gammas : ndarray
+            Activity coefficients, one row per composition, [-]
+        '''
+        xs_matrix = self._batch_xs(xs_matrix)
+        return gibbs_excess_gammas_batch(xs_matrix, self.dGE_dxs_batch(T, xs_matrix),
+                                         self.GE_batch(T, xs_matrix), T)
+
     @classmethod
     def _regress_binary_parameters(cls, gammas, xs, fitting_func, fit_parameters,
                                    use_fit_parameters, initial_guesses=None, analytical_jac=None,
@@ -1275,6 +1481,23 @@ class IdealSolution(GibbsExcess):
         else:
             return ones(self.N)
 
+    def GE_batch(self, T, xs_matrix):
+        return zeros(len(self._batch_xs(xs_matrix)))
+
+    def dGE_dxs_batch(self, T, xs_matrix):
+        return zeros(self._batch_xs(xs_matrix).shape)
+
+    def d2GE_dxixjs_batch(self, T, xs_matrix):
+        return zeros((len(self._batch_xs(xs_matrix)), self.N, self.N))
+
+    def gammas_batch(self, T, xs_matrix):
+        return ones(self._batch_xs(xs_matrix).shape)
+
+    GE_batch.__doc__ = GibbsExcess.GE_batch.__doc__
+    dGE_dxs_batch.__doc__ = GibbsExcess.dGE_dxs_batch.__doc__
+    d2GE_dxixjs_batch.__doc__ = GibbsExcess.d2GE_dxixjs_batch.__doc__
+    gammas_batch.__doc__ = GibbsExcess.gammas_batch.__doc__
+
     try:
         gammas.__doc__ = GibbsExcess.__doc__
     except:
@@ -3186,3 +3186,16 @@ class Chemical(object): # pragma: no cover
     def Peclet_heat(self, V=None, D=None):
         return Peclet_heat(V=V, L=D, rho=self.rho, Cp=self.Cp, k=self.k)
 
+
+
+# Backwards compatibility; thermo.chemical.Mixture and thermo.chemical.Stream
+# are still importable, but cannot go in __all__ or they appear in the
+# documentation
+def __getattr__(name):
+    if name == 'Mixture':
+        from thermo.mixture import Mixture
+        return Mixture
+    if name == 'Stream':
+        from thermo.stream import Stream
+        return Stream
+    raise AttributeError("module %s has no attribute %s" %(__name__, name))
@@ -38,11 +38,16 @@ Chemical Constants Class
     :undoc-members:
     :exclude-members:
 
+Sharing Constants Between Processes
+===================================
+.. autoclass:: SharedChemicalConstantsPackage
+    :members: constants, close, unlink
+
 Chemical Correlations Class
 ===========================
 
 .. autoclass:: PropertyCorrelationsPackage
-    :members: subset, __add__
+    :members: subset, __add__, compile, uncompile
     :undoc-members:
     :exclude-members:
 
@@ -58,10 +63,12 @@ Sample Constants and Correlations
 from __future__ import division
 
 __all__ = ['ChemicalConstantsPackage', 'PropertyCorrelationsPackage',
+           'SharedChemicalConstantsPackage',
            'iapws_constants', 'iapws_correlations', 'lemmon2000_constants',
            'lemmon2000_correlations']
 
 from fluids.constants import R
+from fluids.numerics import numpy as np
 
 from thermo.chemical import Chemical, get_chemical_constants
 from chemicals.identifiers import *
@@ -1303,6 +1310,167 @@ except:
     pass # py2
 #print(constants_doc)
 
+
+class SharedChemicalConstantsPackage(object):
+    r'''Class which stores the numeric per-component properties of a
+    :obj:`ChemicalConstantsPackage` in a single
+    :obj:`multiprocessing.shared_memory.SharedMemory` block, so worker
+    processes can use the package without each receiving and rebuilding a
+    copy of it.
+
+    Pickling this object only sends the name of the block and the
+    properties which could not be stored in it. In any process, the
+    :obj:`arrays` attribute holds read-only NumPy arrays viewing the block,
+    and the :obj:`constants` attribute is a :obj:`ChemicalConstantsPackage`
+    equal to the original one, built from the block without unpickling it.
+
+    The process which creates the object owns the block, and should call
+    :obj:`unlink` (or use the object as a context manager) once the workers
+    are done with it.
+
+    Parameters
+    ----------
+    constants : :obj:`ChemicalConstantsPackage`
+        Package to share, [-]
+    name : str, optional
+        Name of the shared memory block to create; a unique one is chosen
+        if not given, [-]
+
+    Attributes
+    ----------
+    shared_properties : tuple[str]
+        Properties stored in the shared memory block, [-]
+    name : str
+        Name of the shared memory block, [-]
+
+    Notes
+    -----
+    Only properties which have a float value for every component are
+    stored in the block, as float64 arrays. Properties with missing (None)
+    values, integers, strings, tuples or dictionaries are pickled along
+    with this object, so they keep their original types.
+
+    Requires Python 3.8 or later. Before Python 3.13, processes not started
+    by `multiprocessing` from the owning process should not attach to the
+    block, as their resource tracker frees it when they exit.
+
+    The properties of :obj:`constants` are lists of floats, as in the
+    original package, so it can be used with the phase and flash objects
+    like any other package; only :obj:`arrays` avoids copying the data.
+
+    Examples
+    --------
+    >>> constants = ChemicalConstantsPackage(MWs=[18.01528, 106.165], Tcs=[647.14, 617.0], names=['water', 'm-xylene'])
+    >>> with SharedChemicalConstantsPackage(constants) as shared:
+    ...     shared.constants.Tcs, shared.arrays['Tcs']
+    ([647.14, 617.0], array([647.14, 617.  ]))
+    '''
+    def __init__(self, constants, name=None):
+        from multiprocessing.shared_memory import SharedMemory
+        shared = []
+        other = {}
+        for prop in constants.properties:
+            values = getattr(constants, prop)
+            if (values is not None and len(values) == constants.N
+                    and all(type(v) is float for v in values)):
+                shared.append(prop)
+            elif values is not None:
+                other[prop] = values
+        N = constants.N
+        size = max(8*N*len(shared), 1)
+        shm = SharedMemory(name=name, create=True, size=size)
+        data = np.ndarray((len(shared), N), dtype=np.float64, buffer=shm.buf)
+        for i, prop in enumerate(shared):
+            data[i] = getattr(constants, prop)
+        del data
+        self._shm = shm
+        self._owner = True
+        self.name = shm.name
+        self.N = N
+        self.shared_properties = tuple(shared)
+        self._other = other
+        self._constants = self._arrays = None
+
+    def __getstate__(self):
+        return {'name': self.name, 'N': self.N,
+                'shared_properties': self.shared_properties,
+                '_other': self._other}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._shm = None
+        self._owner = False
+        self._constants = self._arrays = None
+
+    def _attach(self):
+        from multiprocessing.shared_memory import SharedMemory
+        try:
+            shm = SharedMemory(name=self.name, track=False)
+        except TypeError:
+            # Before Python 3.13 attaching registers the block with the
+            # resource tracker; processes started by multiprocessing share
+            # the owner's tracker, so this does not free it early
+            shm = SharedMemory(name=self.name)
+        self._shm = shm
+
+    @property
+    def arrays(self):
+        r'''Dictionary of the shared properties as read-only NumPy arrays
+        viewing the shared memory block; created on first access in each
+        process, [-]'''
+        if self._arrays is None:
+            if self._shm is None:
+                self._attach()
+            data = np.ndarray((len(self.shared_properties), self.N),
+                              dtype=np.float64, buffer=self._shm.buf)
+            data.flags.writeable = False
+            self._arrays = {prop: data[i] for i, prop in enumerate(self.shared_properties)}
+        return self._arrays
+
+    @property
+    def constants(self):
+        r'''The :obj:`ChemicalConstantsPackage`, equal to the shared one and
+        with the same types of properties; created on first access in each
+        process, [-]'''
+        if self._constants is None:
+            kwargs = self._other.copy()
+            for prop, values in self.arrays.items():
+                kwargs[prop] = values.tolist()
+            self._constants = ChemicalConstantsPackage(**kwargs)
+        return self._constants
+
+    def close(self):
+        r'''Detach from the shared memory block in this process.'''
+        self._constants = self._arrays = None
+        if self._shm is not None:
+            try:
+                self._shm.close()
+            except BufferError:
+                # Arrays from `arrays` are still referenced; the mapping
+                # is released when they are garbage collected
+                pass
+            self._shm = None
+
+    def unlink(self):
+        r'''Detach from and free the shared memory block; only the process
+        which created the block should call this.'''
+        shm = self._shm
+        if shm is None:
+            self._attach()
+            shm = self._shm
+        self.close()
+        shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+
 properties_to_classes = {'VaporPressures': VaporPressure,
 'VolumeLiquids': VolumeLiquid,
 'VolumeGases': VolumeGas,
@@ -1818,6 +1986,62 @@ class PropertyCorrelationsPackage(object):
         self.SurfaceTensionMixture = SurfaceTensionMixtureObj
 
 
+    def compile(self, props=None, rtol=1e-10, deg=12, cache_dir=None):
+        r'''Method to replace the selected method of every pure-component
+        temperature-dependent property with a piecewise Chebyshev surrogate;
+        see :obj:`TDependentProperty.compile <thermo.utils.TDependentProperty.compile>`.
+
+        Properties without a selected method are skipped, as are those whose
+        method cannot be compiled for any reason (for instance methods with no
+        temperature limits); those keep using their method directly.
+
+        Parameters
+        ----------
+        props : list[str], optional
+            Names of the properties to compile, such as
+            'HeatCapacityGases'; defaults to all of them, [-]
+        rtol : float, optional
+            Relative tolerance of the surrogates, [-]
+        deg : int, optional
+            Degree of each Chebyshev piece, [-]
+        cache_dir : str, optional
+            Directory to store the surrogates in and look them up from, [-]
+
+        Returns
+        -------
+        compiled : int
+            Number of property objects compiled, [-]
+        '''
+        if props is None:
+            props = self.pure_correlations
+        compiled = 0
+        for prop in props:
+            prop_objs = getattr(self, prop)
+            if prop_objs is None:
+                continue
+            for obj in prop_objs:
+                if obj is None or obj.method is None:
+                    continue
+                try:
+                    obj.compile(rtol=rtol, deg=deg, cache_dir=cache_dir)
+                except Exception:
+                    # The method itself keeps being used
+                    obj.uncompile()
+                    continue
+                compiled += 1
+        return compiled
+
+    def uncompile(self):
+        r'''Method to remove all surrogates created by
+        :obj:`PropertyCorrelationsPackage.compile`.'''
+        for prop in self.pure_correlations:
+            prop_objs = getattr(self, prop)
+            if prop_objs is None:
+                continue
+            for obj in prop_objs:
+                if obj is not None:
+                    obj.uncompile()
+
     def as_poly_fit(self, props=None):
         multiple_props = isinstance(props, (tuple, list)) and isinstance(props[0], str)
         if props is None or multiple_props:
@@ -267,6 +267,7 @@ __all__.extend(['main_derivatives_and_departures',
 
 
 from cmath import log as clog
+from copy import copy
 from math import isnan, isinf
 from fluids.numerics import (chebval, brenth, third, sixth, roots_cubic,
                              roots_cubic_a1, numpy as np, newton,
@@ -291,7 +292,8 @@ from thermo.eos_volume import (volume_solutions_mpmath, volume_solutions_mpmath_
                                volume_solutions_halley, volume_solutions_fast,
                                volume_solutions_Cardano, volume_solutions_numpy,
                                volume_solutions_ideal, volume_solutions_a1, volume_solutions_a2,
-                               volume_solutions_doubledouble_float)
+                               volume_solutions_doubledouble_float,
+                               volume_solutions_halley_vectorized)
 from thermo.eos_alpha_functions import (Poly_a_alpha, Twu91_a_alpha, Mathias_Copeman_poly_a_alpha,
                                         TwuSRK95_a_alpha, TwuPR95_a_alpha, Soave_1979_a_alpha,
                                         TWU_a_alpha_common)
@@ -1778,6 +1780,62 @@ class GCEOS(object):
 
 #    volume_solutions = volume_solutions_mpmath_float
 
+    def volumes_TP(self, Ts, Ps):
+        r'''Method to solve the EOS for its three volume roots at many
+        temperatures and pressures at once, with all the other parameters
+        (and for mixtures, the composition) of this object. This is
+        intended for generating tables of properties, where creating a new
+        EOS object at each point would be too slow.
+
+        `a_alpha` is calculated once for each unique temperature, and the
+        cubic is solved for all the points together with
+        :obj:`thermo.eos_volume.volume_solutions_halley_vectorized`. EOSs
+        which use another :obj:`volume_solutions` method are solved point by
+        point with it. This object is not modified.
+
+        Parameters
+        ----------
+        Ts : ndarray or float
+            Temperatures, [K]
+        Ps : ndarray or float
+            Pressures; broadcast with `Ts`, [Pa]
+
+        Returns
+        -------
+        Vs : ndarray
+            Three possible molar volumes at each point, with shape of the
+            broadcast inputs plus a last dimension of length 3; imaginary
+            roots are set to zero, [m^3/mol]
+
+        Notes
+        -----
+        The largest root is the gas-like volume and the smallest root above
+        `b` is the liquid-like volume, as in :obj:`set_from_PT`.
+
+        Examples
+        --------
+        >>> eos = PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=400., P=1E6)
+        >>> eos.volumes_TP([300.0, 400.0, 500.0], 1e6)
+        array([[0.00013038, 0.        , 0.        ],
+               [0.00015607, 0.00214188, 0.0009193 ],
+               [0.00356689, 0.        , 0.        ]])
+        '''
+        Ts, Ps = np.broadcast_arrays(np.asarray(Ts, dtype=np.float64), np.asarray(Ps, dtype=np.float64))
+        T_unique, T_inverse = np.unique(Ts, return_inverse=True)
+        # Mixtures store temperature-dependent state when calculating a_alpha
+        work = copy(self)
+        a_alphas = np.array([float(work.a_alpha_and_derivatives(T, full=False))
+                             for T in T_unique.tolist()])[T_inverse].reshape(Ts.shape)
+        volume_solutions = self.volume_solutions
+        if volume_solutions is volume_solutions_halley:
+            return volume_solutions_halley_vectorized(Ts, Ps, self.b, self.delta, self.epsilon, a_alphas)
+        b, delta, epsilon = self.b, self.delta, self.epsilon
+        Vs = np.zeros(Ts.shape + (3,))
+        for i in np.ndindex(Ts.shape):
+            Vs[i] = [v.real if isinstance(v, complex) else v
+                     for v in volume_solutions(float(Ts[i]), float(Ps[i]), b, delta, epsilon, float(a_alphas[i]))]
+        return Vs
+
     @property
     def mpmath_volumes(self):
         r'''Method to calculate to a high precision the exact roots to the
@@ -212,7 +212,8 @@ from thermo import serialize
 from thermo.eos_mix_methods import (a_alpha_aijs_composition_independent,
     a_alpha_aijs_composition_independent_support_zeros, a_alpha_and_derivatives, a_alpha_and_derivatives_full,
     a_alpha_quadratic_terms, a_alpha_and_derivatives_quadratic_terms,
-    G_dep_lnphi_d_helper, eos_mix_dV_dzs, VDW_lnphis, SRK_lnphis, eos_mix_db_dns, PR_translated_ddelta_dns,
+    kijs_sparse_structure, a_alpha_quadratic_terms_sparse,
+    a_alpha_and_derivatives_quadratic_terms_sparse, G_dep_lnphi_d_helper, eos_mix_dV_dzs, VDW_lnphis, SRK_lnphis, eos_mix_db_dns, PR_translated_ddelta_dns,
     PR_translated_depsilon_dns, PR_depsilon_dns, PR_translated_d2epsilon_dzizjs,
     PR_d2epsilon_dninjs, PR_d3epsilon_dninjnks, PR_d2delta_dninjs, PR_d3delta_dninjnks,
     PR_ddelta_dzs, PR_ddelta_dns, PR_d2epsilon_dzizjs, PR_depsilon_dzs,
@@ -269,6 +270,11 @@ class GCEOSMIX(GCEOS):
     multicomponent = True
     '''All inherited classes of GCEOSMIX are multicomponent.
     '''
+    kijs_sparse_N_min = 5
+    '''Minimum number of components for which the nonzero `kijs` are
+    extracted and `a_alpha` is computed by the sparse routines; see
+    :obj:`kijs_sparse <GCEOSMIX.kijs_sparse>`.
+    '''
     scalar = True
     '''Whether the model is implemented using pure-Python lists of floats,
     or numpy arrays of float64.
@@ -472,6 +478,10 @@ class GCEOSMIX(GCEOS):
         new.Pcs = self.Pcs
         new.omegas = self.omegas
         new.kijs = self.kijs
+        try:
+            new._kijs_sparse = self._kijs_sparse
+        except AttributeError:
+            pass
         new.kwargs = self.kwargs
         new.ais = self.ais
         new.bs = self.bs
@@ -1003,6 +1013,8 @@ class GCEOSMIX(GCEOS):
                 else:
                     self.a_alphas = a_alphas = self.a_alphas_vectorized(T)
                     da_alpha_dTs = d2a_alpha_dT2s = None
+        if self.kijs_sparse is not None:
+            return self.a_alpha_and_derivatives_sparse(a_alphas, da_alpha_dTs, d2a_alpha_dT2s, T, full=full, quick=quick)
         if not IS_PYPY and self.N > 2000:
             return self.a_alpha_and_derivatives_numpy(a_alphas, da_alpha_dTs, d2a_alpha_dT2s, T, full=full, quick=quick)
         return self.a_alpha_and_derivatives_py(a_alphas, da_alpha_dTs, d2a_alpha_dT2s, T, full=full, quick=quick)
@@ -1191,6 +1203,73 @@ class GCEOSMIX(GCEOS):
 
 
 
+    @property
+    def kijs_sparse(self):
+        r'''The nonzero `kijs` of the mixture as computed by
+        :obj:`thermo.eos_mix_methods.kijs_sparse_structure`, or None if the
+        `kijs` are too dense to benefit from it. When available, `a_alpha`
+        and the row vectors needed for fugacities and their temperature
+        derivatives are computed in time and memory linear in the number of
+        components plus the number of nonzero `kijs`.
+
+        The structure is computed once and shared with the objects created
+        by :obj:`to_TP_zs_fast <GCEOSMIX.to_TP_zs_fast>`. Mixtures with fewer
+        than :obj:`kijs_sparse_N_min <GCEOSMIX.kijs_sparse_N_min>` components
+        always use the dense routines.
+
+        Returns
+        -------
+        kijs_sparse : tuple(list[int], list[int], list[float]) or None
+            Row indexes, column indexes, and values of the nonzero `kijs`,
+            [-]
+
+        Examples
+        --------
+        >>> eos = PRMIX(T=115, P=1E6, Tcs=[126.1, 190.6, 305.32, 369.83, 425.12],
+        ...             Pcs=[33.94E5, 46.04E5, 48.72E5, 42.48E5, 37.96E5],
+        ...             omegas=[0.04, 0.011, 0.098, 0.152, 0.193], zs=[0.2]*5)
+        >>> eos.kijs_sparse
+        ([], [], [])
+        '''
+        try:
+            return self._kijs_sparse
+        except AttributeError:
+            pass
+        if self.N < self.kijs_sparse_N_min:
+            kijs_sparse = None
+        else:
+            kijs_sparse = kijs_sparse_structure(self.kijs)
+        self._kijs_sparse = kijs_sparse
+        return kijs_sparse
+
+    def a_alpha_and_derivatives_sparse(self, a_alphas, da_alpha_dTs, d2a_alpha_dT2s, T, full=True, quick=True):
+        zs, scalar, N = self.zs, self.scalar, self.N
+        if full and 0.0 in a_alphas:
+            # The temperature derivatives need the inverse of each root
+            return self.a_alpha_and_derivatives_py(a_alphas, da_alpha_dTs, d2a_alpha_dT2s, T, full=full, quick=quick)
+        kij_is, kij_js, kij_vals = self.kijs_sparse
+        if scalar:
+            self.a_alpha_roots = a_alpha_roots = [sqrt(i) for i in a_alphas]
+        else:
+            self.a_alpha_roots = a_alpha_roots = npsqrt(a_alphas)
+        if full:
+            if scalar:
+                a_alpha_j_rows, da_alpha_dT_j_rows = [0.0]*N, [0.0]*N
+            else:
+                a_alpha_j_rows, da_alpha_dT_j_rows = zeros(N), zeros(N)
+            a_alpha, da_alpha_dT, d2a_alpha_dT2, self.a_alpha_j_rows, self.da_alpha_dT_j_rows = (
+                    a_alpha_and_derivatives_quadratic_terms_sparse(a_alphas, a_alpha_roots, da_alpha_dTs,
+                                                                   d2a_alpha_dT2s, T, zs, kij_is, kij_js, kij_vals,
+                                                                   a_alpha_j_rows=a_alpha_j_rows,
+                                                                   da_alpha_dT_j_rows=da_alpha_dT_j_rows))
+            return a_alpha, da_alpha_dT, d2a_alpha_dT2
+        else:
+            a_alpha_j_rows = [0.0]*N if scalar else zeros(N)
+            a_alpha, self.a_alpha_j_rows = a_alpha_quadratic_terms_sparse(a_alphas, a_alpha_roots, T, zs,
+                                                                          kij_is, kij_js, kij_vals,
+                                                                          a_alpha_j_rows=a_alpha_j_rows)
+            return a_alpha
+
     def a_alpha_and_derivatives_numpy(self, a_alphas, da_alpha_dTs, d2a_alpha_dT2s, T, full=True, quick=True):
         zs, kijs = self.zs, np.array(self.kijs)
         a_alphas = np.array(a_alphas)
@@ -3087,24 +3166,36 @@ class GCEOSMIX(GCEOS):
         except:
             a_alpha_j_rows = self._a_alpha_j_rows
         a_alpha = self.a_alpha
-        a_alpha_ijs = self.a_alpha_ijs
         N = self.N
-        zs = self.zs
         a_alpha3 = 3.0*a_alpha
         
         if self.scalar:
             hessian = [[0.0]*N for _ in range(N)]
         else:
             hessian = zeros((N, N))
+        # term_{i,j} is the sum of the row sums of `i` and `j`
+        kijs_sparse = self.kijs_sparse
+        if kijs_sparse is not None:
+            # Build (a alpha)_{ij} into the hessian directly instead of
+            # allocating a second N^2 matrix
+            a_alpha_roots = self.a_alpha_roots
+            for i in range(N):
+                hessian_i, root_i = hessian[i], a_alpha_roots[i]
+                for j in range(N):
+                    hessian_i[j] = root_i*a_alpha_roots[j]
+            for i, j, kij in zip(*kijs_sparse):
+                hessian[i][j] -= kij*hessian[i][j]
+                hessian[j][i] = hessian[i][j]
+            for i in range(N):
+                hessian_i, row_i = hessian[i], a_alpha_j_rows[i]
+                for j in range(N):
+                    hessian_i[j] = 2.0*(a_alpha3 + hessian_i[j] - 2.0*(row_i + a_alpha_j_rows[j]))
+            return hessian
+
+        a_alpha_ijs = self.a_alpha_ijs
         for i in range(N):
             for j in range(i+1):
-                if i == j:
-                    term = 2.0*a_alpha_j_rows[i]
-                else:
-                    term = 0.0
-                    for k in range(N):
-                        term += zs[k]*(a_alpha_ijs[i][k] + a_alpha_ijs[j][k])
-
+                term = a_alpha_j_rows[i] + a_alpha_j_rows[j]
                 hessian[i][j] = hessian[j][i] = 2.0*(a_alpha3 + a_alpha_ijs[i][j] -2.0*term)
 #                row.append(2.0*(a_alpha3 + a_alpha_ijs[i][j] -2.0*term))
 #            hessian.append(row)
@@ -50,6 +50,13 @@ Faster implementations which do not store N^2 matrices:
 
 .. autofunction:: a_alpha_quadratic_terms
 .. autofunction:: a_alpha_and_derivatives_quadratic_terms
+
+Implementations which scale with the number of nonzero `kijs`, for mixtures
+with many components and few interaction parameters:
+
+.. autofunction:: kijs_sparse_structure
+.. autofunction:: a_alpha_quadratic_terms_sparse
+.. autofunction:: a_alpha_and_derivatives_quadratic_terms_sparse
 '''
 '''
 Direct fugacity calls
@@ -75,6 +82,8 @@ from thermo.eos_volume import volume_solutions_halley, volume_solutions_fast
 __all__ = ['a_alpha_aijs_composition_independent',
            'a_alpha_and_derivatives', 'a_alpha_and_derivatives_full',
            'a_alpha_quadratic_terms', 'a_alpha_and_derivatives_quadratic_terms',
+           'kijs_sparse_structure', 'a_alpha_quadratic_terms_sparse',
+           'a_alpha_and_derivatives_quadratic_terms_sparse',
            'PR_lnphis', 'VDW_lnphis', 'SRK_lnphis', 'eos_mix_lnphis_general',
            
            'VDW_lnphis_fastest', 'PR_lnphis_fastest',
@@ -745,6 +754,258 @@ def a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots,
     return a_alpha, da_alpha_dT, d2a_alpha_dT2, a_alpha_j_rows, da_alpha_dT_j_rows
 
 
+def kijs_sparse_structure(kijs, max_fill=0.25):
+    r'''Extracts the nonzero off-diagonal entries of a `kijs` matrix so the
+    quadratic mixing terms can be evaluated in time and memory proportional
+    to the number of components plus the number of nonzero interaction
+    parameters, rather than the square of the number of components.
+
+    Only the lower triangle of `kijs` is read, the same convention as
+    :obj:`a_alpha_quadratic_terms` and
+    :obj:`a_alpha_and_derivatives_quadratic_terms`.
+
+    Parameters
+    ----------
+    kijs : list[list[float]]
+        Constant kijs, [-]
+    max_fill : float, optional
+        Maximum fraction of the off-diagonal pairs which may be nonzero for
+        the sparse representation to be returned, [-]
+
+    Returns
+    -------
+    kij_is : list[int]
+        Row indexes of the nonzero kijs, [-]
+    kij_js : list[int]
+        Column indexes of the nonzero kijs, always less than the row index
+        [-]
+    kij_vals : list[float]
+        Values of the nonzero kijs, [-]
+
+    Notes
+    -----
+    None is returned instead if the matrix is too dense to benefit or has a
+    nonzero diagonal. An all-zero `kijs` matrix gives three empty lists, in
+    which case the mixing terms are evaluated in :math:`O(N)`.
+
+    Examples
+    --------
+    >>> kijs_sparse_structure([[0.0, 0.0, 0.1], [0.0, 0.0, 0.0], [0.1, 0.0, 0.0]], max_fill=0.5)
+    ([2], [0], [0.1])
+    >>> kijs_sparse_structure([[0.0, 0.1], [0.1, 0.0]]) is None
+    True
+    '''
+    N = len(kijs)
+    kij_is, kij_js, kij_vals = [], [], []
+    max_nnz = int(max_fill*N*(N - 1)//2)
+    for i in range(N):
+        kijs_i = kijs[i]
+        if kijs_i[i] != 0.0:
+            return None
+        for j in range(i):
+            kij = kijs_i[j]
+            if kij != 0.0:
+                if len(kij_vals) == max_nnz:
+                    return None
+                kij_is.append(i)
+                kij_js.append(j)
+                kij_vals.append(float(kij))
+    return kij_is, kij_js, kij_vals
+
+def a_alpha_quadratic_terms_sparse(a_alphas, a_alpha_roots, T, zs, kij_is,
+                                   kij_js, kij_vals, a_alpha_j_rows=None):
+    r'''Calculates the `a_alpha` term for an equation of state along with the
+    vector quantities needed to compute the fugacities of the mixture, using
+    the sparse `kijs` representation from :obj:`kijs_sparse_structure`.
+    The result is the same as that of :obj:`a_alpha_quadratic_terms`.
+
+    .. math::
+        \sum_j z_j(a\alpha)_{ij} = \sqrt{(a\alpha)_i}\left(S
+        - \sum_{j, k_{ij}\ne 0} k_{ij} z_j \sqrt{(a\alpha)_j}\right)
+
+    .. math::
+        S = \sum_j z_j \sqrt{(a\alpha)_j}
+
+    Parameters
+    ----------
+    a_alphas : list[float]
+        EOS attractive terms, [J^2/mol^2/Pa]
+    a_alpha_roots : list[float]
+        Square roots of `a_alphas`; provided for speed [J/mol/Pa^0.5]
+    T : float
+        Temperature, not used, [K]
+    zs : list[float]
+        Mole fractions of each species
+    kij_is : list[int]
+        Row indexes of the nonzero kijs, [-]
+    kij_js : list[int]
+        Column indexes of the nonzero kijs, [-]
+    kij_vals : list[float]
+        Values of the nonzero kijs, [-]
+    a_alpha_j_rows : list[float], optional
+        EOS attractive term row destimation vector (does not need
+        to be zeroed, should be provided to prevent allocations),
+        [J^2/mol^2/Pa]
+
+    Returns
+    -------
+    a_alpha : float
+        EOS attractive term, [J^2/mol^2/Pa]
+    a_alpha_j_rows : list[float]
+        EOS attractive term row sums, [J^2/mol^2/Pa]
+
+    Examples
+    --------
+    >>> zs = [0.1164203, 0.8835797]
+    >>> a_alphas = [0.2491099357671155, 0.6486495863528039]
+    >>> a_alpha_roots = [i**0.5 for i in a_alphas]
+    >>> a_alpha_quadratic_terms_sparse(a_alphas, a_alpha_roots, 299.0, zs, [1], [0], [0.083])
+    (0.58562139582, [0.35469988173, 0.61604757237])
+    '''
+    N = len(a_alphas)
+    if a_alpha_j_rows is None:
+        a_alpha_j_rows = [0.0]*N
+
+    S = 0.0
+    for i in range(N):
+        S += zs[i]*a_alpha_roots[i]
+    for i in range(N):
+        a_alpha_j_rows[i] = S
+
+    for m in range(len(kij_vals)):
+        i, j, kij = kij_is[m], kij_js[m], kij_vals[m]
+        a_alpha_j_rows[i] -= kij*zs[j]*a_alpha_roots[j]
+        a_alpha_j_rows[j] -= kij*zs[i]*a_alpha_roots[i]
+
+    a_alpha = 0.0
+    for i in range(N):
+        a_alpha_j_rows[i] *= a_alpha_roots[i]
+        a_alpha += a_alpha_j_rows[i]*zs[i]
+    return a_alpha, a_alpha_j_rows
+
+def a_alpha_and_derivatives_quadratic_terms_sparse(a_alphas, a_alpha_roots,
+                                                   da_alpha_dTs, d2a_alpha_dT2s,
+                                                   T, zs, kij_is, kij_js,
+                                                   kij_vals, a_alpha_j_rows=None,
+                                                   da_alpha_dT_j_rows=None):
+    r'''Calculates the `a_alpha` term, and its first two temperature
+    derivatives, for an equation of state along with the vector quantities
+    needed to compute the fugacities and temperature derivatives of
+    fugacities of the mixture, using the sparse `kijs` representation from
+    :obj:`kijs_sparse_structure`. The result is the same as that of
+    :obj:`a_alpha_and_derivatives_quadratic_terms`.
+
+    The sums are split into a rank-one part which costs :math:`O(N)` and a
+    correction for each nonzero `kij`, with :math:`r_i = \sqrt{(a\alpha)_i}`
+    and :math:`S = \sum_i z_i r_i`:
+
+    .. math::
+        a \alpha = S^2 - 2\sum_{i > j, k_{ij}\ne 0} z_i z_j k_{ij} r_i r_j
+
+    .. math::
+        \frac{\partial r_i}{\partial T} = \frac{1}{2r_i}
+        \frac{\partial (a\alpha)_i}{\partial T}
+
+    .. math::
+        \frac{\partial^2 r_i}{\partial T^2} = \frac{1}{2r_i}
+        \frac{\partial^2 (a\alpha)_i}{\partial T^2} - \frac{1}{r_i}
+        \left(\frac{\partial r_i}{\partial T}\right)^2
+
+    Parameters
+    ----------
+    a_alphas : list[float]
+        EOS attractive terms, [J^2/mol^2/Pa]
+    a_alpha_roots : list[float]
+        Square roots of `a_alphas`; provided for speed [J/mol/Pa^0.5]
+    da_alpha_dTs : list[float]
+        Temperature derivative of coefficient calculated by EOS-specific
+        method, [J^2/mol^2/Pa/K]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of coefficient calculated by
+        EOS-specific method, [J^2/mol^2/Pa/K**2]
+    T : float
+        Temperature, not used, [K]
+    zs : list[float]
+        Mole fractions of each species
+    kij_is : list[int]
+        Row indexes of the nonzero kijs, [-]
+    kij_js : list[int]
+        Column indexes of the nonzero kijs, [-]
+    kij_vals : list[float]
+        Values of the nonzero kijs, [-]
+
+    Returns
+    -------
+    a_alpha : float
+        EOS attractive term, [J^2/mol^2/Pa]
+    da_alpha_dT : float
+        Temperature derivative of coefficient calculated by EOS-specific
+        method, [J^2/mol^2/Pa/K]
+    d2a_alpha_dT2 : float
+        Second temperature derivative of coefficient calculated by
+        EOS-specific method, [J^2/mol^2/Pa/K**2]
+    a_alpha_j_rows : list[float]
+        EOS attractive term row sums, [J^2/mol^2/Pa]
+    da_alpha_dT_j_rows : list[float]
+        Temperature derivative of EOS attractive term row sums, [J^2/mol^2/Pa/K]
+
+    Examples
+    --------
+    >>> zs = [0.1164203, 0.8835797]
+    >>> a_alphas = [0.2491099357671155, 0.6486495863528039]
+    >>> a_alpha_roots = [i**0.5 for i in a_alphas]
+    >>> da_alpha_dTs = [-0.0005102028006086241, -0.0011131153520304886]
+    >>> d2a_alpha_dT2s = [1.8651128859234162e-06, 3.884331923127011e-06]
+    >>> a_alpha_and_derivatives_quadratic_terms_sparse(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, 299.0, zs, [1], [0], [0.083])
+    (0.58562139582, -0.001018667672, 3.56669817856e-06, [0.35469988173, 0.61604757237], [-0.000672387374, -0.001064293501])
+    '''
+    N = len(a_alphas)
+    if a_alpha_j_rows is None:
+        a_alpha_j_rows = [0.0]*N
+    if da_alpha_dT_j_rows is None:
+        da_alpha_dT_j_rows = [0.0]*N
+
+    # The root derivatives are held in `da_alpha_dT_j_rows` until the end
+    S = dS = d2S = 0.0
+    for i in range(N):
+        root_inv = 1.0/a_alpha_roots[i]
+        dr = 0.5*da_alpha_dTs[i]*root_inv
+        S += zs[i]*a_alpha_roots[i]
+        dS += zs[i]*dr
+        d2S += zs[i]*(0.5*d2a_alpha_dT2s[i] - dr*dr)*root_inv
+        da_alpha_dT_j_rows[i] = dr
+        a_alpha_j_rows[i] = 0.0
+
+    a_alpha = S*S
+    da_alpha_dT = 2.0*S*dS
+    d2a_alpha_dT2 = 2.0*(dS*dS + S*d2S)
+
+    # sum_j kij*z_j*r_j goes into `a_alpha_j_rows`, sum_j kij*z_j*dr_j
+    # into `dr_sums`
+    dr_sums = [0.0]*N
+    for m in range(len(kij_vals)):
+        i, j, kij = kij_is[m], kij_js[m], kij_vals[m]
+        ri, rj = a_alpha_roots[i], a_alpha_roots[j]
+        dri, drj = da_alpha_dT_j_rows[i], da_alpha_dT_j_rows[j]
+        d2ri = (0.5*d2a_alpha_dT2s[i] - dri*dri)/ri
+        d2rj = (0.5*d2a_alpha_dT2s[j] - drj*drj)/rj
+        zi_zj_kij2 = 2.0*zs[i]*zs[j]*kij
+        a_alpha -= zi_zj_kij2*ri*rj
+        da_alpha_dT -= zi_zj_kij2*(dri*rj + ri*drj)
+        d2a_alpha_dT2 -= zi_zj_kij2*(d2ri*rj + 2.0*dri*drj + ri*d2rj)
+        a_alpha_j_rows[i] += kij*zs[j]*rj
+        a_alpha_j_rows[j] += kij*zs[i]*ri
+        dr_sums[i] += kij*zs[j]*drj
+        dr_sums[j] += kij*zs[i]*dri
+
+    for i in range(N):
+        ri = a_alpha_roots[i]
+        row_sum = S - a_alpha_j_rows[i]
+        da_alpha_dT_j_rows[i] = da_alpha_dT_j_rows[i]*row_sum + ri*(dS - dr_sums[i])
+        a_alpha_j_rows[i] = ri*row_sum
+    return a_alpha, da_alpha_dT, d2a_alpha_dT2, a_alpha_j_rows, da_alpha_dT_j_rows
+
+
 
 
 def eos_mix_dV_dzs(T, P, Z, b, delta, epsilon, a_alpha, db_dzs, ddelta_dzs,
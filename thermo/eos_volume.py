@@ -66,6 +66,12 @@ Numerical Solvers
 .. autofunction:: volume_solutions_NR
 .. autofunction:: volume_solutions_NR_low_P
 
+Vectorized Solvers
+------------------
+.. autofunction:: volume_solutions_halley_vectorized
+.. autofunction:: volume_solution_polish_vectorized
+.. autofunction:: high_alpha_one_root_vectorized
+
 Higher-Precision Solvers
 ------------------------
 .. autofunction:: volume_solutions_mpmath
@@ -80,7 +86,9 @@ __all__ = ['volume_solutions_mpmath', 'volume_solutions_mpmath_float',
            'volume_solutions_fast', 'volume_solutions_Cardano', 'volume_solutions_a1',
            'volume_solutions_a2', 'volume_solutions_numpy', 'volume_solutions_ideal',
            'volume_solutions_doubledouble_float',
-           'volume_solution_polish', 'volume_solutions_sympy']
+           'volume_solution_polish', 'volume_solutions_sympy',
+           'volume_solutions_halley_vectorized', 'volume_solution_polish_vectorized',
+           'high_alpha_one_root_vectorized']
 
 
 from cmath import sqrt as csqrt
@@ -1645,3 +1653,346 @@ def high_alpha_one_root(T, P, b, delta, epsilon, a_alpha):
     if V == b_eos:
         V = b_eos*(1.0 + 3e-16)
     return V
+
+
+def _as_float_arrays(*args):
+    arrays = np.broadcast_arrays(*[np.asarray(v, dtype=np.float64) for v in args])
+    shape = arrays[0].shape
+    return shape, [np.ascontiguousarray(v).ravel() for v in arrays]
+
+def volume_solution_polish_vectorized(V, T, P, b, delta, epsilon, a_alpha):
+    r'''Vectorized version of :obj:`volume_solution_polish`, performing the
+    same Halley's method iterations on many volumes at once. Each element
+    stops iterating on the same criteria as the scalar function.
+
+    Parameters
+    ----------
+    V : ndarray
+        Volume guesses, [m^3/mol]
+    T : ndarray or float
+        Temperatures, [K]
+    P : ndarray or float
+        Pressures, [Pa]
+    b : ndarray or float
+        Coefficients calculated by EOS-specific method, [m^3/mol]
+    delta : ndarray or float
+        Coefficients calculated by EOS-specific method, [m^3/mol]
+    epsilon : ndarray or float
+        Coefficients calculated by EOS-specific method, [m^6/mol^2]
+    a_alpha : ndarray or float
+        Coefficients calculated by EOS-specific method, [J^2/mol^2/Pa]
+
+    Returns
+    -------
+    V : ndarray
+        Polished volumes, [m^3/mol]
+
+    Examples
+    --------
+    >>> b, delta, epsilon = 0.000108539570, 0.000217079141, -1.17808384e-08
+    >>> volume_solution_polish_vectorized([0.000130, 0.0245], 299.0, 1e5, b, delta, epsilon, 3.80126200)
+    array([0.00013047, 0.02336426])
+    '''
+    shape, (V, T, P, b, delta, epsilon, a_alpha) = _as_float_arrays(V, T, P, b, delta, epsilon, a_alpha)
+    V = V.copy()
+    RT = R*T
+    RT_2 = RT + RT
+    a_alpha_2 = a_alpha + a_alpha
+    P_inv = 1.0/P
+
+    n = V.size
+    fval_oldold = np.ones(n)
+    fval_old = np.zeros(n)
+    active = np.arange(n)
+    with np.errstate(all='ignore'):
+        for j in range(50):
+            if not active.size:
+                break
+            Va, ba, deltaa, a_alphaa, RTa = V[active], b[active], delta[active], a_alpha[active], RT[active]
+            x1_inv_den = Va*(Va + deltaa) + epsilon[active]
+            x0_inv = 1.0/(Va - ba)
+            x1_inv = 1.0/x1_inv_den
+            x2 = Va + Va + deltaa
+            fval = RTa*x0_inv - P[active] - a_alphaa*x1_inv
+            x0_inv2 = x0_inv*x0_inv
+            x1_inv2 = x1_inv*x1_inv
+            x3 = a_alphaa*x1_inv2
+            fder = x2*x3 - RTa*x0_inv2
+            fder2 = RT_2[active]*x0_inv2*x0_inv - a_alpha_2[active]*x2*x2*x1_inv2*x1_inv + x3 + x3
+            fder_inv = 1.0/fder
+            step = fval*fder_inv
+            rel_err = np.abs(fval*P_inv[active])
+            step_den = 1.0 - 0.5*step*fder2*fder_inv
+
+            stopped = (x1_inv_den == 0.0) | (fder == 0.0)
+            stepping = ~stopped & (step_den != 0.0)
+            V[active[stepping]] = Va[stepping] - step[stepping]/step_den[stepping]
+
+            fval_olda, fval_oldolda = fval_old[active], fval_oldold[active]
+            converged = stepping & ((rel_err < 3e-15) | (fval_olda == fval) | (fval == fval_oldolda)
+                                    | ((j > 10) & (rel_err < 1e-12)))
+            update = stepping & ~converged
+            fval_oldold[active[update]] = fval_olda[update]
+            fval_old[active[update]] = fval[update]
+            active = active[~(stopped | converged)]
+    return V.reshape(shape)
+
+def high_alpha_one_root_vectorized(T, P, b, delta, epsilon, a_alpha):
+    r'''Vectorized version of :obj:`high_alpha_one_root`. Uses Cardano's
+    method where the cubic has a single real root by a wide margin, followed
+    by Newton's method polishing of the root in the reduced variable.
+
+    Parameters
+    ----------
+    T : ndarray or float
+        Temperatures, [K]
+    P : ndarray or float
+        Pressures, [Pa]
+    b : ndarray or float
+        Coefficients calculated by EOS-specific method, [m^3/mol]
+    delta : ndarray or float
+        Coefficients calculated by EOS-specific method, [m^3/mol]
+    epsilon : ndarray or float
+        Coefficients calculated by EOS-specific method, [m^6/mol^2]
+    a_alpha : ndarray or float
+        Coefficients calculated by EOS-specific method, [J^2/mol^2/Pa]
+
+    Returns
+    -------
+    V : ndarray
+        Volume of the only root, or 0 where the criteria for this method
+        was not met and another solver must be used, [m^3/mol]
+    '''
+    shape, (T, P, b_eos, delta, epsilon, a_alpha) = _as_float_arrays(T, P, b, delta, epsilon, a_alpha)
+    RT_inv = R_inv/T
+    RT_P = R*T/P
+
+    P_RT_inv = P*RT_inv
+    B = etas = b_eos*P_RT_inv
+    deltas = delta*P_RT_inv
+    thetas = a_alpha*P_RT_inv*RT_inv
+    epsilons = epsilon*P_RT_inv*P_RT_inv
+
+    b = (deltas - B - 1.0)
+    c = (thetas + epsilons - deltas*(B + 1.0))
+    d = -(epsilons*(B + 1.0) + thetas*etas)
+
+    V = np.zeros(b.size)
+    with np.errstate(all='ignore'):
+        f = c - b*b*third
+        g = (2.0*(b*b*b) - (9.0*b*c) + 27.0*d)*one_27
+        h = (0.25*(g*g) + (f*f*f)*one_27)
+        ok = np.where((h >= 200.0) & (np.abs(g) <= 1e152))[0]
+        if not ok.size:
+            return V.reshape(shape)
+        b, c, d, g, h, RT_P = b[ok], c[ok], d[ok], g[ok], h[ok], RT_P[ok]
+        root_h = np.sqrt(h)
+        x = np.cbrt(-0.5*g + root_h) + np.cbrt(-(0.5*g) - root_h) - b*third
+
+        # Newton polish, bounded below by the co-volume
+        low = b_eos[ok]/RT_P
+        active = np.arange(ok.size)
+        for _ in range(100):
+            xa, ba, ca, da = x[active], b[active], c[active], d[active]
+            fval = ((xa + ba)*xa + ca)*xa + da
+            der = (3.0*xa + 2.0*ba)*xa + ca
+            x_new = xa - fval/der
+            below = x_new < low[active]
+            x_new[below] = low[active][below]
+            x[active] = x_new
+            active = active[(np.abs(x_new - xa) >= np.abs(1e-16*x_new)) & (der != 0.0)]
+            if not active.size:
+                break
+    Vs = x*RT_P
+    b_ok = b_eos[ok]
+    at_b = Vs == b_ok
+    Vs[at_b] = b_ok[at_b]*(1.0 + 3e-16)
+    V[ok] = Vs
+    return V.reshape(shape)
+
+def volume_solutions_halley_vectorized(T, P, b, delta, epsilon, a_alpha):
+    r'''Vectorized version of :obj:`volume_solutions_halley`, solving the
+    cubic EOS for many states at once. The inputs are broadcast together,
+    so for example a single `b` can be used with arrays of `T` and `P`.
+
+    The algorithm is the same - a bracketed Halley's method solve for one
+    root, analytical deflation of the cubic, and Halley's method polishing
+    of the remaining two roots - with every step applied to all the states
+    still being solved at once. Any state which does not produce finite
+    volumes is re-solved with :obj:`volume_solutions_halley`.
+
+    Parameters
+    ----------
+    T : ndarray or float
+        Temperatures, [K]
+    P : ndarray or float
+        Pressures, [Pa]
+    b : ndarray or float
+        Coefficients calculated by EOS-specific method, [m^3/mol]
+    delta : ndarray or float
+        Coefficients calculated by EOS-specific method, [m^3/mol]
+    epsilon : ndarray or float
+        Coefficients calculated by EOS-specific method, [m^6/mol^2]
+    a_alpha : ndarray or float
+        Coefficients calculated by EOS-specific method, [J^2/mol^2/Pa]
+
+    Returns
+    -------
+    Vs : ndarray
+        Three possible molar volumes for each state, with shape of the
+        broadcast inputs plus a last dimension of length 3; imaginary roots
+        are set to zero, as in :obj:`volume_solutions_halley` [m^3/mol]
+
+    Examples
+    --------
+    >>> b, delta, epsilon = 0.000108539570, 0.000217079141, -1.17808384e-08
+    >>> volume_solutions_halley_vectorized([299.0, 400.0], 1e5, b, delta, epsilon, [3.80126200, 3.20408565])
+    array([[0.00013047, 0.02336426, 0.00125697],
+           [0.00015745, 0.03238695, 0.00060492]])
+    '''
+    shape, inputs = _as_float_arrays(T, P, b, delta, epsilon, a_alpha)
+    T, P, b, delta, epsilon, a_alpha = inputs
+    n = T.size
+    Vs = np.zeros((n, 3))
+    with np.errstate(all='ignore'):
+        remaining = np.ones(n, dtype=bool)
+        ideal = a_alpha/(b*(b + delta) + epsilon) + P == P
+        Vs[ideal, 0] = b[ideal] + R*T[ideal]/P[ideal]
+        remaining &= ~ideal
+
+        high = np.where(remaining & (a_alpha > 1e4))[0]
+        if high.size:
+            V_high = high_alpha_one_root_vectorized(T[high], P[high], b[high], delta[high],
+                                                    epsilon[high], a_alpha[high])
+            found = high[V_high != 0.0]
+            Vs[found, 0] = V_high[V_high != 0.0]
+            remaining[found] = False
+
+        idx = np.where(remaining)[0]
+        T, P, b, delta, epsilon, a_alpha = T[idx], P[idx], b[idx], delta[idx], epsilon[idx], a_alpha[idx]
+        RT = R*T
+        RT_2 = RT + RT
+        a_alpha_2 = a_alpha + a_alpha
+        P_inv = 1.0/P
+
+        RT_inv = R_inv/T
+        P_RT_inv = P*RT_inv
+        B = etas = b*P_RT_inv
+        deltas = delta*P_RT_inv
+        thetas = a_alpha*P_RT_inv*RT_inv
+        epsilons = epsilon*P_RT_inv*P_RT_inv
+
+        b2 = (deltas - B - 1.0)
+        c2 = (thetas + epsilons - deltas*(B + 1.0))
+        d2 = -(epsilons*(B + 1.0) + thetas*etas)
+        RT_P = RT*P_inv
+
+        low_V, high_V = b*(1.0+8e-16), -RT_P*d2/c2
+        bad_high = high_V <= low_V
+        high_V[bad_high] = b[bad_high]*1.000001
+
+        # Solve for the first root; `stop_j` records the iteration each
+        # state stopped on, with 49 meaning the solver failed
+        V = high_V.copy()
+        stop_j = np.full(idx.size, 49)
+        active = np.arange(idx.size)
+        for j in range(50):
+            if not active.size:
+                break
+            Va, ba, deltaa, a_alphaa, RTa = V[active], b[active], delta[active], a_alpha[active], RT[active]
+            x0_inv = 1.0/(Va - ba)
+            x1_inv = 1.0/(Va*(Va + deltaa) + epsilon[active])
+            x2 = Va + Va + deltaa
+            fval = RTa*x0_inv - P[active] - a_alphaa*x1_inv
+
+            negative = fval < 0.0
+            high_Va, low_Va = high_V[active], low_V[active]
+            high_Va[negative] = Va[negative]
+            low_Va[~negative] = Va[~negative]
+            if j == 0:
+                high_guess = RT_P[active]*10.0
+                too_low = high_guess < 10.0*ba
+                high_guess[too_low] = 10.0*ba[too_low]
+                high_Va[~negative] = high_guess[~negative]
+
+            x0_inv2 = x0_inv*x0_inv
+            x1_inv2 = x1_inv*x1_inv
+            x3 = a_alphaa*x1_inv2
+            fder = x2*x3 - RTa*x0_inv2
+            fder2 = RT_2[active]*x0_inv2*x0_inv - a_alpha_2[active]*x2*x2*x1_inv2*x1_inv + x3 + x3
+
+            fder_inv = 1.0/fder
+            step = fval*fder_inv
+            rel_err = np.abs(fval*P_inv[active])
+            step_den = 1.0 - 0.5*step*fder2*fder_inv
+            halley = step_den != 0.0
+            step[halley] = step[halley]/step_den[halley]
+            V_new = Va - step
+
+            converged = (np.abs(1.0 - V_new/Va) < 6e-16) | ((j > 25) & (rel_err < 1e-12))
+            bisect = ~converged & ((V_new <= low_Va) | (V_new >= high_Va))
+            V_new[bisect] = 0.5*(low_Va[bisect] + high_Va[bisect])
+            finished = bisect & ((V_new == low_Va) | (V_new == high_Va))
+            V_new[finished] = Va[finished]
+
+            V[active] = V_new
+            high_V[active], low_V[active] = high_Va, low_Va
+            stopped = converged | finished
+            stop_j[active[stopped]] = j
+            active = active[~stopped]
+
+        solved = stop_j != 49
+        V0 = V
+        Vs[idx[solved], 0] = V0[solved]
+
+        # Deflate the cubic with the found root
+        x0 = V*P_RT_inv
+        F = b2 + x0
+        G = -d2/x0
+        D = F*F - 4.0*G
+        D_root = np.sqrt(D)
+        x1 = 0.5*(D_root - F)
+        x2 = 0.5*(-F - D_root)
+        one_root = (D < 0.0) | (x1 == 0.0)
+
+        main0 = R*T/(V - b)
+        main1 = a_alpha/(V*V + delta*V + epsilon)
+        main_diff = main0 - main1
+        one_root |= (main0 + main1 == main0) | ((main_diff != 0.0) & (np.abs(1.0 - (main0 + main1)/main_diff) < 1e-12))
+
+        three = np.where(solved & ~one_root)[0]
+        V1 = x1[three]*RT_P[three]
+        V2 = x2[three]*RT_P[three]
+        Tt, Pt, bt, deltat, epsilont, a_alphat = T[three], P[three], b[three], delta[three], epsilon[three], a_alpha[three]
+
+        low_P = Pt < 1e-2
+        if low_P.any():
+            polish_V1 = low_P & (x1[three] != 1.0)
+            V1[polish_V1] = volume_solution_polish_vectorized(V1[polish_V1], Tt[polish_V1], Pt[polish_V1], bt[polish_V1],
+                                                              deltat[polish_V1], epsilont[polish_V1], a_alphat[polish_V1])
+            V2[low_P] = volume_solution_polish_vectorized(V2[low_P], Tt[low_P], Pt[low_P], bt[low_P],
+                                                          deltat[low_P], epsilont[low_P], a_alphat[low_P])
+        step_P = ~low_P
+        RTt, RT_2t, a_alpha_2t = RT[three], RT_2[three], a_alpha_2[three]
+        for V_root in (V1, V2):
+            Vr = V_root
+            t90 = Vr*(Vr + deltat) + epsilont
+            x0_inv = 1.0/(Vr - bt)
+            x1_inv = 1.0/t90
+            xx2 = Vr + Vr + deltat
+            fval = -Pt + RTt*x0_inv - a_alphat*x1_inv
+            x0_inv2 = x0_inv*x0_inv
+            x1_inv2 = x1_inv*x1_inv
+            x3 = a_alphat*x1_inv2
+            fder = xx2*x3 - RTt*x0_inv2
+            fder2 = RT_2t*x0_inv2*x0_inv - a_alpha_2t*xx2*xx2*x1_inv2*x1_inv + x3 + x3
+            fder_inv = 1.0/fder
+            step = fval*fder_inv
+            take = step_P & (t90 != 0.0) & (fder != 0.0)
+            V_root[take] = (Vr - step/(1.0 - 0.5*step*fder2*fder_inv))[take]
+        Vs[idx[three], 1] = V1
+        Vs[idx[three], 2] = V2
+
+    for i in np.where(~np.isfinite(Vs).all(axis=1))[0]:
+        Vs[i] = volume_solutions_halley(*[float(v[i]) for v in inputs])
+    return Vs.reshape(shape + (3,))
@@ -58,6 +58,18 @@ Base Flash Class
    :members: flash, plot_TP
    :exclude-members:
 
+Flash Cache
+-----------
+.. autoclass:: FlashCache
+   :members: clear, hit_ratio
+   :exclude-members:
+
+Pure Fluid Property Tables
+--------------------------
+.. autoclass:: PureFluidTable
+   :members: PT, PH, PS, DT
+   :exclude-members:
+
 
 Specific Flash Algorithms
 =========================
@@ -71,13 +83,16 @@ from . import flash_base
 from . import flash_vl
 from . import flash_vln
 from . import flash_pure_vls
+from . import flash_pure_table
 
 from .flash_utils import *
 from .flash_base import *
 from .flash_vl import *
 from .flash_vln import *
 from .flash_pure_vls import *
+from .flash_pure_table import *
 
 __all__ = (flash_utils.__all__ + flash_base.__all__ + flash_vl.__all__
-           + flash_vln.__all__ + flash_pure_vls.__all__)
+           + flash_vln.__all__ + flash_pure_vls.__all__
+           + flash_pure_table.__all__)
 
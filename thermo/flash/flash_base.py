@@ -58,6 +58,12 @@ Base Flash Class
    :members: flash, plot_TP
    :exclude-members:
 
+Flash Cache
+-----------
+.. autoclass:: FlashCache
+   :members: clear, hit_ratio
+   :exclude-members:
+
 
 Specific Flash Algorithms
 =========================
@@ -67,14 +73,17 @@ future, but reading their source code may be helpful for instructive purposes.
 
 '''
 
-__all__ = ['Flash']
+__all__ = ['Flash', 'FlashCache']
 
+from collections import OrderedDict
 from fluids.constants import R
+from chemicals.utils import hash_any_primitive
 from thermo.equilibrium import EquilibriumState
 from thermo.phase_identification import identify_sort_phases
 from thermo.utils import has_matplotlib
 from fluids.numerics import logspace, linspace, numpy as np
 from chemicals.utils import log10, floor
+from fluids.numerics import inf
 from thermo import phases
 
 spec_to_iter_vars = {
@@ -110,13 +119,211 @@ empty_flash_conv = {'iterations': 0, 'err': 0.0, 'stab_guess_name': None}
 one_in_list = [1.0]
 empty_list = []
 
+grid_flash_spec_order = ('T', 'P', 'V', 'H', 'S', 'U', 'VF', 'SF')
+
+def grid_flash_specs(Ts=None, Ps=None, Vs=None, Hs=None, Ss=None, Us=None,
+                     VFs=None, SFs=None):
+    # Returns the names and values of the two specifications of a grid flash,
+    # in the order they are iterated
+    spec_keys = []
+    spec_iters = []
+    for key, values in zip(grid_flash_spec_order, (Ts, Ps, Vs, Hs, Ss, Us, VFs, SFs)):
+        if values is not None:
+            spec_keys.append(key)
+            spec_iters.append(values)
+    if len(spec_keys) != 2:
+        raise ValueError("Exactly two specifications are required for a grid flash")
+    return spec_keys, spec_iters
+
+def grid_flash_row(flasher, zs, key0, spec0, key1, specs1, props,
+                   hot_start=True, seed=None):
+    # Flash one row of a grid, optionally using each converged point as the
+    # initial guess for the next one. Returns the property values, the failure
+    # mask, and the first successfully converged state of the row.
+    N1, N_props = len(specs1), len(props)
+    values = np.full((N_props, N1), np.nan)
+    failed = np.zeros(N1, dtype=bool)
+    first, last = None, seed
+    for n1 in range(N1):
+        flash_specs = {'zs': zs, key0: spec0, key1: specs1[n1]}
+        try:
+            state = flasher.flash(hot_start=last, **flash_specs)
+            for i in range(N_props):
+                values[i, n1] = state.value(props[i])
+        except Exception:
+            failed[n1] = True
+            # Do not carry a guess across a failure
+            last = None
+            continue
+        if hot_start:
+            last = state
+        if first is None:
+            first = state
+    return values, failed, first
+
+_grid_flash_flasher = None
+
+def _grid_flash_pool_init(flasher):
+    global _grid_flash_flasher
+    _grid_flash_flasher = flasher
+
+def _grid_flash_pool_row(args):
+    values, failed, _ = grid_flash_row(_grid_flash_flasher, *args)
+    return values, failed
+
+flash_cache_spec_names = ('T', 'P', 'VF', 'SF', 'V', 'H', 'S', 'G', 'U', 'A')
+
+def round_sig(value, digits):
+    # Round a number to a number of significant digits; 0 and non-finite
+    # values are returned unchanged
+    if value == 0.0 or value != value or value in (inf, -inf):
+        return value
+    return round(value, digits - 1 - int(floor(log10(abs(value)))))
+
+class FlashCache(object):
+    r'''Bounded least-recently-used cache of flash results, which can be
+    attached to any :obj:`Flash` object by setting its `cache` attribute.
+    Results are keyed on the model hash of the flasher and the flash
+    specifications (including the composition) rounded to `digits` significant
+    figures; as the model hash is part of the key, one cache can be shared
+    between several flashers.
+
+    When a flash is not found, a previous result whose specifications match to
+    `hot_start_digits` significant figures is used as the `hot_start` of the
+    new flash.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Maximum number of results to keep, [-]
+    digits : int, optional
+        Number of significant figures the specifications are rounded to when
+        looking up an existing result, [-]
+    hot_start_digits : int or None, optional
+        Number of significant figures the specifications are rounded to when
+        looking up a result to start a new flash from; set to None to disable
+        this, [-]
+
+    Attributes
+    ----------
+    hits : int
+        Number of flashes returned from the cache, [-]
+    misses : int
+        Number of flashes that had to be calculated, [-]
+    hot_starts : int
+        Number of calculated flashes which were started from a nearby cached
+        result, [-]
+
+    Notes
+    -----
+    Cached :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`
+    objects are returned as is, so the same object may be returned by more
+    than one call. Flashes with a callable `solution` or a `dest` are never
+    cached.
+
+    Examples
+    --------
+    >>> from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, CEOSGas, CEOSLiquid, PRMIX, FlashVL, FlashCache
+    >>> constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0], omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+    >>> correlations = PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=[])
+    >>> eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    >>> flasher = FlashVL(constants, correlations, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    >>> flasher.cache = FlashCache(max_size=100)
+    >>> a = flasher.flash(T=300.0, P=2e6, zs=[0.5, 0.5])
+    >>> b = flasher.flash(T=300.0, P=2e6, zs=[0.5, 0.5])
+    >>> a is b, flasher.cache.hits, flasher.cache.misses
+    (True, 1, 1)
+    '''
+    def __init__(self, max_size=1000, digits=13, hot_start_digits=4):
+        self.max_size = max_size
+        self.digits = digits
+        self.hot_start_digits = hot_start_digits
+        self.clear()
+
+    def __len__(self):
+        return len(self.states)
+
+    def clear(self):
+        r'''Method to remove all stored results and reset the statistics.
+        '''
+        self.states = OrderedDict()
+        self.hot_start_states = OrderedDict()
+        self.hits = self.misses = self.hot_starts = 0
+
+    @property
+    def hit_ratio(self):
+        r'''Fraction of flashes which were returned from the cache, [-]'''
+        calls = self.hits + self.misses
+        return self.hits/calls if calls else 0.0
+
+    def key(self, model_hash, zs, specs, solution, digits):
+        spec_key = tuple([(name, round_sig(v, digits)) for name, v in zip(flash_cache_spec_names, specs) if v is not None])
+        zs_key = tuple([round_sig(zi, digits) for zi in zs]) if zs is not None else None
+        return (model_hash, zs_key, spec_key, solution)
+
+    def flash(self, flasher, zs, specs, solution, hot_start, retry):
+        states = self.states
+        model_hash = flasher.model_hash()
+        key = self.key(model_hash, zs, specs, solution, self.digits)
+        state = states.get(key, None)
+        if state is not None:
+            states.move_to_end(key)
+            self.hits += 1
+            return state
+        self.misses += 1
+
+        hot_start_digits = self.hot_start_digits
+        if hot_start_digits is not None:
+            near_key = self.key(model_hash, zs, specs, solution, hot_start_digits)
+            if hot_start is None:
+                hot_start = self.hot_start_states.get(near_key, None)
+                if hot_start is not None:
+                    self.hot_starts += 1
+
+        T, P, VF, SF, V, H, S, G, U, A = specs
+        state = flasher.flash_uncached(zs=zs, T=T, P=P, VF=VF, SF=SF, V=V, H=H, S=S,
+                                       G=G, U=U, A=A, solution=solution,
+                                       hot_start=hot_start, retry=retry)
+        states[key] = state
+        if len(states) > self.max_size:
+            states.popitem(last=False)
+        if hot_start_digits is not None:
+            hot_start_states = self.hot_start_states
+            hot_start_states[near_key] = state
+            hot_start_states.move_to_end(near_key)
+            if len(hot_start_states) > self.max_size:
+                hot_start_states.popitem(last=False)
+        return state
+
+
 class Flash(object):
     r'''Base class for performing flash calculations. All Flash objects need
     to inherit from this, and common methods can be added to it.'''
 
+    cache = None
+    r'''Optional :obj:`FlashCache` storing the results of flashes, [-]'''
+
     def __init_subclass__(cls):
         cls.__full_path__ = "%s.%s" %(cls.__module__, cls.__qualname__)
 
+    def model_hash(self):
+        r'''Method to compute a hash of the flasher's phase models and
+        constants; flashers with the same hash give the same results.
+
+        Returns
+        -------
+        model_hash : int
+            Hash of the flasher's models, [-]
+
+        Notes
+        -----
+        The hash is recomputed on every call so that replacing a phase or the
+        constants of the flasher is reflected in it.
+        '''
+        to_hash = [self.__class__.__name__, hash(self.constants)]
+        to_hash.extend([p.model_hash() for p in self.phases])
+        return hash_any_primitive(to_hash)
+
     def flash(self, zs=None, T=None, P=None, VF=None, SF=None, V=None, H=None,
               S=None, G=None, U=None, A=None, solution=None, hot_start=None,
               retry=False, dest=None):
@@ -203,9 +410,24 @@ class Flash(object):
             multiple solutions, discontinuities, and other not-fun issues for
             the algorithms.
 
+        If a :obj:`FlashCache` is set as the `cache` attribute, results are
+        looked up in and stored in it.
+
         Examples
         --------
         '''
+        cache = self.cache
+        if cache is not None and dest is None and not callable(solution):
+            return cache.flash(self, zs, (T, P, VF, SF, V, H, S, G, U, A),
+                               solution, hot_start, retry)
+        return self.flash_uncached(zs=zs, T=T, P=P, VF=VF, SF=SF, V=V, H=H,
+                                   S=S, G=G, U=U, A=A, solution=solution,
+                                   hot_start=hot_start, retry=retry, dest=dest)
+
+    def flash_uncached(self, zs=None, T=None, P=None, VF=None, SF=None, V=None,
+                       H=None, S=None, G=None, U=None, A=None, solution=None,
+                       hot_start=None, retry=False, dest=None):
+        # Implementation of `flash`, bypassing the cache
         if zs is None:
             if self.N == 1:
                 zs = [1.0]
@@ -544,43 +766,8 @@ class Flash(object):
                    props=None, store=True):
 
         flashes = []
-
-        T_spec = Ts is not None
-        P_spec = Ps is not None
-        V_spec = Vs is not None
-        H_spec = Hs is not None
-        S_spec = Ss is not None
-        U_spec = Us is not None
-        VF_spec = VFs is not None
-        SF_spec = SFs is not None
-
-        flash_specs = {'zs': zs}
-        spec_keys = []
-        spec_iters = []
-        if T_spec:
-            spec_keys.append('T')
-            spec_iters.append(Ts)
-        if P_spec:
-            spec_keys.append('P')
-            spec_iters.append(Ps)
-        if V_spec:
-            spec_keys.append('V')
-            spec_iters.append(Vs)
-        if H_spec:
-            spec_keys.append('H')
-            spec_iters.append(Hs)
-        if S_spec:
-            spec_keys.append('S')
-            spec_iters.append(Ss)
-        if U_spec:
-            spec_keys.append('U')
-            spec_iters.append(Us)
-        if VF_spec:
-            spec_keys.append('VF')
-            spec_iters.append(VFs)
-        if SF_spec:
-            spec_keys.append('SF')
-            spec_iters.append(SFs)
+        spec_keys, spec_iters = grid_flash_specs(Ts=Ts, Ps=Ps, Vs=Vs, Hs=Hs, Ss=Ss,
+                                                 Us=Us, VFs=VFs, SFs=SFs)
 
         do_props = props is not None
         scalar_props = isinstance(props, str)
@@ -622,6 +809,107 @@ class Flash(object):
             return flashes
         return None
 
+    def grid_flash_arrays(self, zs, Ts=None, Ps=None, Vs=None,
+                          VFs=None, SFs=None, Hs=None, Ss=None, Us=None,
+                          props='H', hot_start=True, processes=None):
+        r'''Method to flash a two-dimensional grid of specifications and
+        return the requested properties as dense arrays. Exactly two of the
+        specification arrays must be provided; the first one varies along the
+        rows and the second along the columns of the outputs.
+
+        Parameters
+        ----------
+        zs : list[float]
+            Mole fractions of each component, [-]
+        Ts : list[float], optional
+            Temperatures, [K]
+        Ps : list[float], optional
+            Pressures, [Pa]
+        Vs : list[float], optional
+            Molar volumes of the overall bulk, [m^3/mol]
+        VFs : list[float], optional
+            Vapor fractions, [-]
+        SFs : list[float], optional
+            Solid fractions, [-]
+        Hs : list[float], optional
+            Molar enthalpies of the overall bulk, [J/mol]
+        Ss : list[float], optional
+            Molar entropies of the overall bulk, [J/(mol*K)]
+        Us : list[float], optional
+            Molar internal energies of the overall bulk, [J/mol]
+        props : str or list[str], optional
+            Property or properties to retrieve from each flashed state with
+            :obj:`EquilibriumState.value <thermo.equilibrium.EquilibriumState.value>`, [-]
+        hot_start : bool, optional
+            Whether or not to use each converged point as the `hot_start` of
+            the next point in its row; the first point of each row is started
+            from the first converged point of the previous row when not
+            running in parallel, [-]
+        processes : int, optional
+            If specified, the rows are divided among a pool of this many
+            processes, [-]
+
+        Returns
+        -------
+        values : ndarray
+            Calculated properties, with shape (len(specs0), len(specs1)) if
+            `props` is a string, otherwise (len(props), len(specs0),
+            len(specs1)); failed points are NaN, [various]
+        failed : ndarray
+            Boolean mask of the points which did not converge, with shape
+            (len(specs0), len(specs1)) [-]
+
+        Notes
+        -----
+        When `processes` is used, the flasher is sent to the worker processes
+        when they are created; on platforms which do not fork, this requires
+        the flasher and all of its correlations to be picklable.
+
+        Examples
+        --------
+        >>> from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, HeatCapacityGas, PRMIX, CEOSGas, CEOSLiquid, FlashVL
+        >>> constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0], omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+        >>> HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+        ...                      HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.537198394065234e-22, -4.946850205122326e-18, 1.4223747507170372e-14, -2.3451318313798008e-11, 2.4271676873997662e-08, -1.6055220805830093e-05, 0.006379734000450042, -1.0360272314628292, 141.84695243411866]))]
+        >>> correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases, skip_missing=True)
+        >>> eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+        >>> gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        >>> liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        >>> flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+        >>> VFs, failed = flasher.grid_flash_arrays([.5, .5], Ts=[300.0, 350.0], Ps=[1e5, 1e6, 3e6], props='VF')
+        >>> VFs.shape, failed.any()
+        ((2, 3), False)
+        '''
+        spec_keys, spec_iters = grid_flash_specs(Ts=Ts, Ps=Ps, Vs=Vs, Hs=Hs, Ss=Ss,
+                                                 Us=Us, VFs=VFs, SFs=SFs)
+        (key0, key1), (specs0, specs1) = spec_keys, spec_iters
+        scalar_props = isinstance(props, str)
+        if scalar_props:
+            props = [props]
+        N0, N1, N_props = len(specs0), len(specs1), len(props)
+
+        values = np.full((N_props, N0, N1), np.nan)
+        failed = np.zeros((N0, N1), dtype=bool)
+        if processes is not None and processes > 1 and N0 > 1:
+            from multiprocessing import Pool
+            args = [(zs, key0, specs0[n0], key1, specs1, props, hot_start) for n0 in range(N0)]
+            with Pool(processes, initializer=_grid_flash_pool_init, initargs=(self,)) as pool:
+                rows = pool.map(_grid_flash_pool_row, args)
+            for n0 in range(N0):
+                values[:, n0, :], failed[n0, :] = rows[n0]
+        else:
+            seed = None
+            for n0 in range(N0):
+                row_values, row_failed, first = grid_flash_row(self, zs, key0, specs0[n0], key1,
+                                                               specs1, props, hot_start=hot_start,
+                                                               seed=seed)
+                values[:, n0, :], failed[n0, :] = row_values, row_failed
+                if hot_start and first is not None:
+                    seed = first
+        if scalar_props:
+            return values[0], failed
+        return values, failed
+
     def debug_grid_flash(self, zs, check0, check1, Ts=None, Ps=None, Vs=None,
                          VFs=None, SFs=None, Hs=None, Ss=None, Us=None,
                          retry=False, verbose=True):
@@ -883,7 +1171,7 @@ class Flash(object):
                 specs.append(SFs)
 
         specs0, specs1 = specs
-        props = self.grid_flash(zs, Ts=Ts, Ps=Ps, Vs=Vs, VFs=VFs, props=prop, store=False)
+        props, _ = self.grid_flash_arrays(zs, Ts=Ts, Ps=Ps, Vs=Vs, VFs=VFs, props=prop)
 #        props = []
 #        pts_iter = range(pts)
 #        for i in pts_iter:
@@ -0,0 +1,440 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2023, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+__all__ = ['PureFluidTable']
+
+from bisect import bisect_right
+from math import exp, log
+from fluids.constants import R
+from fluids.numerics import numpy as np
+
+# Rows of the matrix converting the values and derivatives at the corners of
+# a unit cell into the coefficients of a cubic Hermite polynomial
+_hermite_matrix = [[1.0, 0.0, 0.0, 0.0],
+                   [0.0, 0.0, 1.0, 0.0],
+                   [-3.0, 3.0, -2.0, -1.0],
+                   [2.0, -2.0, 1.0, 1.0]]
+
+def _cross_derivative(d, same_phase, h, axis):
+    # Differentiate the first derivative `d` along `axis` with central
+    # differences, or one-sided differences where the neighbour on one side
+    # is in another phase or outside the grid
+    d = np.moveaxis(d, axis, 0)
+    same = np.moveaxis(same_phase, axis, 0)
+    out = np.zeros_like(d)
+    n = d.shape[0]
+    fwd = np.zeros(d.shape, dtype=bool)
+    bwd = np.zeros(d.shape, dtype=bool)
+    fwd[:n-1] = same[:n-1]
+    bwd[1:] = same[:n-1]
+    fwd_diff = np.zeros_like(d)
+    bwd_diff = np.zeros_like(d)
+    fwd_diff[:n-1] = (d[1:] - d[:n-1])/h
+    bwd_diff[1:] = (d[1:] - d[:n-1])/h
+    both = fwd & bwd
+    out[both] = 0.5*(fwd_diff[both] + bwd_diff[both])
+    only_fwd = fwd & ~bwd
+    out[only_fwd] = fwd_diff[only_fwd]
+    only_bwd = bwd & ~fwd
+    out[only_bwd] = bwd_diff[only_bwd]
+    out[~np.isfinite(out)] = 0.0
+    return np.moveaxis(out, 0, axis)
+
+def _evaluate_cell(a, x, y):
+    # Evaluate the bicubic with coefficients a[m][n] of x^m*y^n
+    b0, b1, b2, b3 = [r[0] + y*(r[1] + y*(r[2] + y*r[3])) for r in a]
+    return b0 + x*(b1 + x*(b2 + x*b3))
+
+def _solve_cubic_unit(c0, c1, c2, c3, target):
+    # Root of c0 + c1*t + c2*t^2 + c3*t^3 = target in [0, 1], or None if the
+    # end points do not bracket it
+    low, high = 0.0, 1.0
+    f_low = c0 - target
+    f_high = c0 + c1 + c2 + c3 - target
+    if f_low == 0.0:
+        return 0.0
+    if f_high == 0.0:
+        return 1.0
+    if (f_low < 0.0) == (f_high < 0.0):
+        return None
+    increasing = f_high > 0.0
+    t = f_low/(f_low - f_high)
+    for _ in range(100):
+        f = c0 + t*(c1 + t*(c2 + t*c3)) - target
+        if f == 0.0:
+            return t
+        if (f > 0.0) == increasing:
+            high = t
+        else:
+            low = t
+        df = c1 + t*(2.0*c2 + 3.0*t*c3)
+        t_new = t - f/df if df != 0.0 else 0.5*(low + high)
+        if not (low <= t_new <= high):
+            t_new = 0.5*(low + high)
+        if abs(t_new - t) < 1e-14:
+            return t_new
+        t = t_new
+    return t
+
+
+class PureFluidTable(object):
+    r'''Class for tabulating the single-phase properties of a pure fluid on a
+    grid of temperature and pressure, and looking them up much faster than
+    a flash calculation, in the spirit of the tabular backends of CoolProp.
+    Temperature - pressure, pressure - enthalpy, pressure - entropy, and
+    density - temperature lookups are supported.
+
+    The molar volume (as its logarithm), enthalpy and entropy are tabulated
+    at nodes evenly spaced in `T` and `ln(P)`, along with their first
+    derivatives from the phase models; the cross derivatives are obtained by
+    differencing those. Within each cell a bicubic Hermite polynomial is
+    used. Lookups with an enthalpy, entropy or density specification solve
+    the polynomial of the cell containing the answer for the other variable.
+
+    A cell is only used if every corner is in the same phase, which
+    excludes all cells crossed by the saturation curve, and if its
+    interpolated values at its center match a flash calculation to within
+    `rtol` - in the logarithm of volume, and in enthalpy and entropy
+    relative to their magnitude plus `R*T` and `R` respectively. All other
+    lookups, including those outside the table and those in the two-phase
+    region, are done with the flasher itself, so the table can be used
+    close to the saturation curve and the critical point.
+
+    Parameters
+    ----------
+    flasher : :obj:`FlashPureVLS <thermo.flash.FlashPureVLS>`
+        Flasher whose results are tabulated, [-]
+    Tmin : float
+        Lowest temperature of the table, [K]
+    Tmax : float
+        Highest temperature of the table, [K]
+    Pmin : float
+        Lowest pressure of the table, [Pa]
+    Pmax : float
+        Highest pressure of the table, [Pa]
+    T_points : int, optional
+        Number of temperature nodes, [-]
+    P_points : int, optional
+        Number of pressure nodes, [-]
+    rtol : float, optional
+        Tolerance of the check at the center of each cell, [-]
+
+    Attributes
+    ----------
+    Ts : list[float]
+        Temperatures of the nodes, [K]
+    Ps : list[float]
+        Pressures of the nodes, [Pa]
+    valid : ndarray
+        Whether each cell is used, indexed by temperature then pressure
+        cell, [-]
+    hits : int
+        Number of lookups answered from the table, [-]
+    fallbacks : int
+        Number of lookups which needed a flash calculation, [-]
+
+    Notes
+    -----
+    Every lookup returns the tuple (`T`, `P`, `V`, `H`, `S`, `VF`), in units
+    of [K], [Pa], [m^3/mol], [J/mol], [J/(mol*K)] and [-]. Results from the
+    table are single phase, with `VF` 0 for a liquid and 1 for a gas.
+
+    Density - temperature lookups are only answered from the table where
+    :math:`|\partial \ln V/\partial \ln P|_T` is at least 0.1, so that
+    the error in volume is magnified at most tenfold in pressure; this
+    excludes most liquids.
+
+    Building a table takes one flash per node and one per cell.
+
+    Examples
+    --------
+    >>> from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, HeatCapacityGas, CEOSGas, CEOSLiquid, PRMIX, FlashPureVLS, PureFluidTable
+    >>> constants = ChemicalConstantsPackage(Tcs=[647.14], Pcs=[22048320.0], omegas=[0.344], MWs=[18.01528], CASs=['7732-18-5'])
+    >>> HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759]))]
+    >>> correlations = PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=HeatCapacityGases)
+    >>> kwargs = dict(eos_kwargs=dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas), HeatCapacityGases=HeatCapacityGases)
+    >>> flasher = FlashPureVLS(constants, correlations, CEOSGas(PRMIX, **kwargs), [CEOSLiquid(PRMIX, **kwargs)], [])
+    >>> table = PureFluidTable(flasher, Tmin=300.0, Tmax=900.0, Pmin=1e3, Pmax=1e7, T_points=40, P_points=40)
+    >>> T, P, V, H, S, VF = table.PT(700.0, 1e5)
+    >>> round(H, 2), round(flasher.flash(T=700.0, P=1e5).H(), 2)
+    (14165.23, 14165.23)
+    >>> T, P, V, H, S, VF = table.PH(1e5, H)
+    >>> round(T, 6), table.hits, table.fallbacks
+    (700.0, 2, 0)
+    '''
+    props = ('lnV', 'H', 'S')
+
+    def __init__(self, flasher, Tmin, Tmax, Pmin, Pmax, T_points=100,
+                 P_points=100, rtol=1e-6):
+        self.flasher = flasher
+        self.Tmin, self.Tmax, self.Pmin, self.Pmax = Tmin, Tmax, Pmin, Pmax
+        self.T_points, self.P_points = T_points, P_points
+        self.rtol = rtol
+        self.hits = self.fallbacks = 0
+
+        self.dT = dT = (Tmax - Tmin)/(T_points - 1)
+        self.lnPmin = lnPmin = log(Pmin)
+        self.lnPmax = lnPmax = log(Pmax)
+        self.dlnP = dlnP = (lnPmax - lnPmin)/(P_points - 1)
+        self.Ts = Ts = [Tmin + i*dT for i in range(T_points)]
+        self.lnPs = lnPs = [lnPmin + j*dlnP for j in range(P_points)]
+        self.Ps = [exp(v) for v in lnPs]
+
+        shape = (T_points, P_points)
+        values = {k: np.full(shape, np.nan) for k in self.props}
+        d_dT = {k: np.full(shape, np.nan) for k in self.props}
+        d_dlnP = {k: np.full(shape, np.nan) for k in self.props}
+        # 0 for liquid, 1 for gas, -1 where the flash failed
+        phase = np.full(shape, -1, dtype=int)
+        for i, T in enumerate(Ts):
+            for j, lnP in enumerate(lnPs):
+                node = self._node(T, exp(lnP))
+                if node is None:
+                    continue
+                phase[i, j] = node[0]
+                for k, (v, dv_dT, dv_dlnP) in zip(self.props, node[1:]):
+                    values[k][i, j] = v
+                    d_dT[k][i, j] = dv_dT
+                    d_dlnP[k][i, j] = dv_dlnP
+        self.phase = phase
+
+        same_T = (phase[:-1, :] == phase[1:, :]) & (phase[:-1, :] >= 0)
+        same_P = (phase[:, :-1] == phase[:, 1:]) & (phase[:, :-1] >= 0)
+        same_T_full = np.zeros(shape, dtype=bool)
+        same_T_full[:-1, :] = same_T
+        same_P_full = np.zeros(shape, dtype=bool)
+        same_P_full[:, :-1] = same_P
+
+        valid = (same_T[:, :-1] & same_T[:, 1:] & same_P[:-1, :] & same_P[1:, :])
+
+        H = np.array(_hermite_matrix)
+        # Coefficients of each cell, indexed by cell, property, and the powers
+        # of the scaled temperature and log pressure
+        self.coeffs = coeffs = np.empty((T_points - 1, P_points - 1, len(self.props), 4, 4))
+        for p, k in enumerate(self.props):
+            f, fx, fy = values[k], d_dT[k]*dT, d_dlnP[k]*dlnP
+            fxy = 0.5*(_cross_derivative(fx, same_P_full, 1.0, 1)
+                       + _cross_derivative(fy, same_T_full, 1.0, 0))
+            # Corner matrix of each cell, per the usual bicubic formulation
+            F = np.empty((T_points - 1, P_points - 1, 4, 4))
+            F[..., 0, 0], F[..., 0, 1] = f[:-1, :-1], f[:-1, 1:]
+            F[..., 1, 0], F[..., 1, 1] = f[1:, :-1], f[1:, 1:]
+            F[..., 0, 2], F[..., 0, 3] = fy[:-1, :-1], fy[:-1, 1:]
+            F[..., 1, 2], F[..., 1, 3] = fy[1:, :-1], fy[1:, 1:]
+            F[..., 2, 0], F[..., 2, 1] = fx[:-1, :-1], fx[:-1, 1:]
+            F[..., 3, 0], F[..., 3, 1] = fx[1:, :-1], fx[1:, 1:]
+            F[..., 2, 2], F[..., 2, 3] = fxy[:-1, :-1], fxy[:-1, 1:]
+            F[..., 3, 2], F[..., 3, 3] = fxy[1:, :-1], fxy[1:, 1:]
+            coeffs[:, :, p] = np.einsum('mi,abij,nj->abmn', H, F, H)
+        self.values = values
+
+        for i in range(T_points - 1):
+            for j in range(P_points - 1):
+                if valid[i, j] and not self._cell_accurate(i, j):
+                    valid[i, j] = False
+        self.valid = valid
+        # Node values along each row and column, used to find the cell
+        # containing an inverse lookup
+        self._H_rows = values['H'].T.tolist()
+        self._S_rows = values['S'].T.tolist()
+        self._lnV_columns = (-values['lnV']).tolist()
+
+    def __repr__(self):
+        return '%s(flasher=%s, Tmin=%s, Tmax=%s, Pmin=%s, Pmax=%s, T_points=%s, P_points=%s, rtol=%s)' %(
+            self.__class__.__name__, self.flasher, self.Tmin, self.Tmax, self.Pmin,
+            self.Pmax, self.T_points, self.P_points, self.rtol)
+
+    def _node(self, T, P):
+        try:
+            state = self.flasher.flash(T=T, P=P)
+        except Exception:
+            return None
+        if len(state.phases) != 1:
+            return None
+        phase = state.phases[0]
+        V = phase.V()
+        return (1 if state.gas is not None else 0,
+                (log(V), phase.dV_dT()/V, P*phase.dV_dP()/V),
+                (phase.H(), phase.dH_dT(), P*phase.dH_dP()),
+                (phase.S(), phase.dS_dT(), P*phase.dS_dP()))
+
+    def _cell_accurate(self, i, j):
+        T, lnP = self.Ts[i] + 0.5*self.dT, self.lnPs[j] + 0.5*self.dlnP
+        node = self._node(T, exp(lnP))
+        if node is None or node[0] != self.phase[i, j]:
+            return False
+        rtol = self.rtol
+        lnV, H, S = [_evaluate_cell(a, 0.5, 0.5) for a in self.coeffs[i, j].tolist()]
+        return (abs(lnV - node[1][0]) <= rtol
+                and abs(H - node[2][0]) <= rtol*(abs(node[2][0]) + R*T)
+                and abs(S - node[3][0]) <= rtol*(abs(node[3][0]) + R))
+
+    def _result(self, cell, i, j, x, y, phase):
+        T = self.Ts[i] + x*self.dT
+        P = exp(self.lnPs[j] + y*self.dlnP)
+        lnV, H, S = [_evaluate_cell(a, x, y) for a in cell]
+        self.hits += 1
+        return T, P, exp(lnV), H, S, float(phase)
+
+    def _flash(self, **kwargs):
+        self.fallbacks += 1
+        state = self.flasher.flash(**kwargs)
+        return state.T, state.P, state.V(), state.H(), state.S(), state.VF
+
+    def _locate_P(self, P):
+        if not (self.Pmin <= P <= self.Pmax):
+            return None, None
+        y = (log(P) - self.lnPmin)/self.dlnP
+        j = min(int(y), self.P_points - 2)
+        return j, y - j
+
+    def PT(self, T, P):
+        r'''Look up the properties of the fluid at a specified temperature
+        and pressure.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+
+        Returns
+        -------
+        values : tuple(float, float, float, float, float, float)
+            `T`, `P`, `V`, `H`, `S`, `VF`, [various]
+        '''
+        j, y = self._locate_P(P)
+        if j is not None and self.Tmin <= T <= self.Tmax:
+            x = (T - self.Tmin)/self.dT
+            i = min(int(x), self.T_points - 2)
+            if self.valid[i, j]:
+                return self._result(self.coeffs[i, j].tolist(), i, j, x - i, y, self.phase[i, j])
+        return self._flash(T=T, P=P)
+
+    def _lookup_P_spec(self, P, prop, value, rows):
+        j, y = self._locate_P(P)
+        if j is None:
+            return None
+        last = self.T_points - 2
+        # Enthalpy and entropy increase with temperature along an isobar;
+        # the cell is near where the value falls in the rows either side
+        i0 = bisect_right(rows[j], value) - 1
+        i1 = bisect_right(rows[j+1], value) - 1
+        low, high = min(i0, i1), max(i0, i1)
+        candidates = list(range(max(low, 0), min(high + 1, last) + 1))
+        if low > 0:
+            candidates.append(low - 1)
+        valid, phase, coeffs = self.valid, self.phase, self.coeffs
+        for i in candidates:
+            if not valid[i, j]:
+                continue
+            c = [r[0] + y*(r[1] + y*(r[2] + y*r[3])) for r in coeffs[i, j, prop].tolist()]
+            x = _solve_cubic_unit(c[0], c[1], c[2], c[3], value)
+            if x is not None:
+                return self._result(coeffs[i, j].tolist(), i, j, x, y, phase[i, j])
+        return None
+
+    def PH(self, P, H):
+        r'''Look up the properties of the fluid at a specified pressure and
+        molar enthalpy.
+
+        Parameters
+        ----------
+        P : float
+            Pressure, [Pa]
+        H : float
+            Molar enthalpy, [J/mol]
+
+        Returns
+        -------
+        values : tuple(float, float, float, float, float, float)
+            `T`, `P`, `V`, `H`, `S`, `VF`, [various]
+        '''
+        res = self._lookup_P_spec(P, 1, H, self._H_rows)
+        return res if res is not None else self._flash(P=P, H=H)
+
+    def PS(self, P, S):
+        r'''Look up the properties of the fluid at a specified pressure and
+        molar entropy.
+
+        Parameters
+        ----------
+        P : float
+            Pressure, [Pa]
+        S : float
+            Molar entropy, [J/(mol*K)]
+
+        Returns
+        -------
+        values : tuple(float, float, float, float, float, float)
+            `T`, `P`, `V`, `H`, `S`, `VF`, [various]
+        '''
+        res = self._lookup_P_spec(P, 2, S, self._S_rows)
+        return res if res is not None else self._flash(P=P, S=S)
+
+    def DT(self, rho, T):
+        r'''Look up the properties of the fluid at a specified molar density
+        and temperature.
+
+        Parameters
+        ----------
+        rho : float
+            Molar density, [mol/m^3]
+        T : float
+            Temperature, [K]
+
+        Returns
+        -------
+        values : tuple(float, float, float, float, float, float)
+            `T`, `P`, `V`, `H`, `S`, `VF`, [various]
+        '''
+        if self.Tmin <= T <= self.Tmax and rho > 0.0:
+            x = (T - self.Tmin)/self.dT
+            i = min(int(x), self.T_points - 2)
+            x -= i
+            # Volume decreases with pressure along an isotherm; the columns
+            # hold -ln(V) so they increase
+            target = log(rho)
+            columns = self._lnV_columns
+            j0 = bisect_right(columns[i], target) - 1
+            j1 = bisect_right(columns[i+1], target) - 1
+            last = self.P_points - 2
+            low, high = min(j0, j1), max(j0, j1)
+            candidates = list(range(max(low, 0), min(high + 1, last) + 1))
+            if low > 0:
+                candidates.append(low - 1)
+            valid, phase, coeffs = self.valid, self.phase, self.coeffs
+            for j in candidates:
+                if not valid[i, j]:
+                    continue
+                a = coeffs[i, j, 0].tolist()
+                c = [a[0][n] + x*(a[1][n] + x*(a[2][n] + x*a[3][n])) for n in range(4)]
+                y = _solve_cubic_unit(c[0], c[1], c[2], c[3], -target)
+                if y is not None:
+                    # In a nearly incompressible liquid the error in volume
+                    # is magnified in pressure; use the flash instead
+                    dlnV_dlnP = (c[1] + y*(2.0*c[2] + 3.0*y*c[3]))/self.dlnP
+                    if abs(dlnV_dlnP) < 0.1:
+                        break
+                    return self._result(coeffs[i, j].tolist(), i, j, x, y, phase[i, j])
+        return self._flash(T=T, V=1.0/rho)
@@ -22,6 +22,9 @@ SOFTWARE.'''
 
 __all__ = ['FlashPureVLS']
 
+import json
+import os
+from math import exp, log
 from thermo.flash.flash_base import Flash
 from fluids.numerics import (
     numpy as np,
@@ -67,6 +70,7 @@ from thermo.phases import (
     GibbsExcessLiquid,
     DryAirLemmon
 )
+from thermo.utils.multi_cheb_1d import PiecewiseChebyshev
 from thermo.flash.flash_utils import (
     TVF_pure_secant,
     PVF_pure_newton,
@@ -177,6 +181,23 @@ class FlashPureVLS(Flash):
     PSF_xtol : float
         Convergence tolerance in the pressure dimension when converging a
         flashes with a pressure and solid fraction specification, [-]
+    VF_table : bool
+        Whether or not to tabulate the saturation curve the first time it is
+        needed and use the table in later flashes with a vapor fraction
+        specification, for the phase models whose saturation point is
+        otherwise solved iteratively; see :obj:`FlashPureVLS.build_VF_table`,
+        [-]
+    VF_table_direct : bool
+        If True, saturation points inside the range of the table are taken
+        from it directly; otherwise they are only used as initial guesses
+        and converged with the phase models as usual, [-]
+    VF_table_tol : float
+        Absolute tolerance in the natural logarithm of the vapor pressure to
+        which the table is fit; this is roughly the relative error in
+        `Psat` of the direct answers, [-]
+    VF_table_path : str
+        Path of a JSON file the table is loaded from if it exists, and
+        saved to after it is built; None to keep it in memory only, [-]
 
 
     Notes
@@ -267,6 +288,12 @@ class FlashPureVLS(Flash):
     PSF_maxiter = 200
     PSF_xtol = 1e-10
 
+    VF_table = False
+    VF_table_direct = False
+    VF_table_tol = 1e-9
+    VF_table_path = None
+    VF_table_lnPsat = None
+
     def __repr__(self):
         return "FlashPureVLS(gas=%s, liquids=%s, solids=%s)" %(self.gas, self.liquids, self.solids)
     def __init__(self, constants, correlations, gas, liquids, solids,
@@ -543,7 +570,13 @@ class FlashPureVLS(Flash):
             sat_gas = self.gas.to(T=T, V=rho_to_Vm(iapws95_rhog_sat(T), self.gas._MW), zs=zs)
             sat_liq = self.liquid.to(T=T, V=rho_to_Vm(iapws95_rhol_sat(T), self.liquid._MW), zs=zs)
             return Psat, sat_liq, sat_gas, 0, 0.0
-        Psat = self.Psat_guess(T)
+        Psat = None
+        if self.VF_table and not self.VL_only_CEOSs_same:
+            Psat = self._Psat_from_VF_table(T)
+            if Psat is not None and self.VF_table_direct and self.liquid_count == 1:
+                return Psat, self.liquid.to_TP_zs(T, Psat, zs), self.gas.to_TP_zs(T, Psat, zs), 0, 0.0
+        if Psat is None:
+            Psat = self.Psat_guess(T)
         gas = self.gas.to_TP_zs(T, Psat, zs)
 
         if self.VL_only_CEOSs_same:
@@ -571,21 +604,40 @@ class FlashPureVLS(Flash):
             sat_gas = self.gas.from_AS(sat_gas_CoolProp)
             sat_liq = self.liquids[0].to(zs=zs, T=sat_gas.T, V=1.0/sat_gas_CoolProp.saturated_liquid_keyed_output(CPiDmolar))
             return sat_gas.T, sat_liq, sat_gas, 0, 0.0
-        elif self.VL_only_CEOSs_same:
+        Tsat = None
+        if self.VF_table and not self.VL_only_IAPWS95:
+            Tsat = self._Tsat_from_VF_table(P)
+            if Tsat is not None and self.VF_table_direct and self.liquid_count == 1:
+                sat_gas = self.gas.to_TP_zs(Tsat, P, zs)
+                if self.VL_only_CEOSs_same:
+                    sat_liq = self.liquid.to_TP_zs(Tsat, P, zs, other_eos=sat_gas.eos_mix)
+                else:
+                    sat_liq = self.liquid.to_TP_zs(Tsat, P, zs)
+                return Tsat, sat_liq, sat_gas, 0, 0.0
+
+        if self.VL_only_CEOSs_same:
             if P > self.constants.Pcs[0]:
                 raise PhaseExistenceImpossible("Specified P is in the supercritical region", zs=zs, P=P)
+            iterations = 0
             try:
-                Tsat = self.eos_pure_STP.Tsat(P)
+                if Tsat is not None:
+                    Tsat, iterations = self._Tsat_polish(Tsat, P, self._lnPsat_CEOS)
+                else:
+                    Tsat = self.eos_pure_STP.Tsat(P)
             except:
                 raise PhaseExistenceImpossible("Failed to calculate VL equilibrium T; likely supercritical", zs=zs, P=P)
             sat_gas = self.gas.to_TP_zs(Tsat, P, zs)
             sat_liq = self.liquids[0].to_TP_zs(Tsat, P, zs, other_eos=sat_gas.eos_mix)
-            return Tsat, sat_liq, sat_gas, 0, 0.0
+            return Tsat, sat_liq, sat_gas, iterations, 0.0
         elif self.VL_IG_activity:
-            Tsat = self.correlations.VaporPressures[0].solve_property(P)
+            iterations = 0
+            if Tsat is not None:
+                Tsat, iterations = self._Tsat_polish(Tsat, P, self._lnPsat_correlation)
+            else:
+                Tsat = self.correlations.VaporPressures[0].solve_property(P)
             sat_gas = self.gas.to_TP_zs(Tsat, P, zs)
             sat_liq = self.liquid.to_TP_zs(Tsat, P, zs)
-            return Tsat, sat_liq, sat_gas, 0, 0.0
+            return Tsat, sat_liq, sat_gas, iterations, 0.0
         elif self.VL_only_IAPWS95:
             if P > iapws95_Pc:
                 raise PhaseExistenceImpossible("Specified P is in the supercritical region", zs=zs, P=P)
@@ -594,7 +646,7 @@ class FlashPureVLS(Flash):
             sat_gas = self.gas.to(T=Tsat, V=1e-3*iapws95_MW/iapws95_rhog_sat(Tsat), zs=zs)
             sat_liq = self.liquid.to(T=Tsat, V=1e-3*iapws95_MW/iapws95_rhol_sat(Tsat), zs=zs)
             return Tsat, sat_liq, sat_gas, 0, 0.0
-        else:
+        elif Tsat is None:
             Tsat = self.correlations.VaporPressures[0].solve_property(P)
         gas = self.gas.to_TP_zs(Tsat, P, zs)
         liquids = [l.to_TP_zs(Tsat, P, zs) for l in self.liquids]
@@ -604,6 +656,27 @@ class FlashPureVLS(Flash):
         return Tsat, l, g, iterations, err
 #        return PVF_pure_secant(Tsat, P, liquids, gas, maxiter=200, xtol=1E-10)
 
+    def _lnPsat_CEOS(self, T):
+        dPsat_dT, Psat = self.eos_pure_STP.dPsat_dT(T, also_Psat=True)
+        return log(Psat), dPsat_dT/Psat
+
+    def _lnPsat_correlation(self, T):
+        VaporPressure = self.correlations.VaporPressures[0]
+        Psat = VaporPressure.T_dependent_property(T)
+        return log(Psat), VaporPressure.T_dependent_property_derivative(T)/Psat
+
+    def _Tsat_polish(self, Tsat, P, lnPsat_func):
+        # Newton's method on ln(Psat) from a saturation table guess; one or
+        # two iterations are normally needed
+        lnP = log(P)
+        for iteration in range(self.PVF_maxiter):
+            lnPsat, dlnPsat_dT = lnPsat_func(Tsat)
+            step = (lnPsat - lnP)/dlnPsat_dT
+            Tsat -= step
+            if abs(step) < self.PVF_xtol*Tsat:
+                return Tsat, iteration + 1
+        raise UnconvergedError("Could not converge the saturation temperature")
+
     def flash_TSF(self, T, SF=None, zs=None, hot_start=None):
         # if under triple point search for gas - otherwise search for liquid
         # For water only there is technically two solutions at some point for both
@@ -1120,6 +1193,139 @@ class FlashPureVLS(Flash):
 
 
 
+    def build_VF_table(self):
+        r'''Tabulate the saturation curve of the fluid, for use by
+        :obj:`flash_TVF <FlashPureVLS.flash_TVF>` and
+        :obj:`flash_PVF <FlashPureVLS.flash_PVF>` when
+        :obj:`VF_table <FlashPureVLS.VF_table>` is set. This is called
+        automatically the first time the table is needed.
+
+        The natural logarithm of the vapor pressure is fit as a function of
+        temperature with a :obj:`PiecewiseChebyshev <thermo.utils.PiecewiseChebyshev>`
+        approximation to within :obj:`VF_table_tol <FlashPureVLS.VF_table_tol>`,
+        from the temperature at which the vapor pressure is 0.01 Pa to just
+        under the critical temperature; the range is reduced to exclude
+        temperatures at which the `T`-`VF` flash cannot be converged, which
+        are usually close to the critical point. The inverse,
+        temperature as a function of the logarithm of pressure, is fit from
+        the first approximation without any further flashes.
+
+        The phase models whose saturation pressure is not solved iteratively
+        - IAPWS-95 and CoolProp, and the cubic equations of state and the
+        ideal gas with activity coefficient liquid for `T`-`VF` flashes - do
+        not use the table for them; they are already as fast as the table.
+        For the cubic equations of state and for the ideal gas with activity
+        coefficient liquid, `P`-`VF` flashes use the table's temperature as
+        the initial guess to a Newton solver on their vapor pressure function
+        instead of their usual bounded solvers, unless
+        :obj:`VF_table_direct <FlashPureVLS.VF_table_direct>` is set.
+
+        If :obj:`VF_table_path <FlashPureVLS.VF_table_path>` is set, the
+        table is loaded from that file if it exists and was fit to the same
+        or a tighter tolerance, after checking a point in its middle against
+        a flash calculation; otherwise the table is built and saved there.
+
+        Returns
+        -------
+        table : PiecewiseChebyshev or bool
+            Fit of `ln(Psat)` as a function of `T`, or False if the table
+            could not be built; flashes then fall back to the usual solvers,
+            [-]
+        '''
+        # Flashes done while building must not consult the table
+        self.VF_table_lnPsat = False
+        self.VF_table_Tsat = None
+        path = self.VF_table_path
+        table = None
+        if path is not None and os.path.exists(path):
+            table = self._load_VF_table(path)
+        if table is None:
+            try:
+                table = self._fit_VF_table()
+            except Exception:
+                return False
+            if path is not None:
+                with open(path, 'w') as f:
+                    json.dump({'tol': self.VF_table_tol, 'lnPsat': table.as_json()}, f)
+        self.VF_table_Tsat = self._fit_VF_table_inverse(table)
+        self.VF_table_lnPsat = table
+        return table
+
+    def _fit_VF_table(self):
+        tol = self.VF_table_tol
+        Tmin = self.flash_PVF(P=1e-2, VF=.5, zs=[1.0])[0]
+        Tmax = self.constants.Tcs[0]*(1.0 - 1e-4)
+        T_last = [None]
+
+        def lnPsat(T):
+            T_last[0] = T
+            return log(self.flash_TVF(T, VF=.5, zs=[1.0])[0])
+
+        for _ in range(20):
+            if Tmax <= Tmin:
+                break
+            try:
+                return PiecewiseChebyshev.fit(lnPsat, Tmin, Tmax, rtol=0.0, atol=tol,
+                                              truncate=True)
+            except (PhaseExistenceImpossible, UnconvergedError, ValueError):
+                # The flash failed, usually close to the critical point or
+                # at very low pressure; shrink the range to exclude the point
+                T, step = T_last[0], 0.01*(Tmax - Tmin)
+                if T - Tmin < Tmax - T:
+                    Tmin = T + step
+                else:
+                    Tmax = T - step
+        raise ValueError("Could not tabulate the saturation curve")
+
+    def _fit_VF_table_inverse(self, table):
+        Tmin, Tmax = table.xmin, table.xmax
+        lnPmin, lnPmax = table(Tmin), table(Tmax)
+        # ln(P) is nearly linear in 1/T; interpolate in it for the guess
+        Tmin_inv, Tmax_inv = 1.0/Tmin, 1.0/Tmax
+        slope = (Tmax_inv - Tmin_inv)/(lnPmax - lnPmin)
+
+        def Tsat(lnP):
+            guess = 1.0/(Tmin_inv + (lnP - lnPmin)*slope)
+            return newton(lambda T: (table(T) - lnP, table.derivative(T)), guess,
+                          fprime=True, low=Tmin, high=Tmax, xtol=1e-13*guess)
+
+        return PiecewiseChebyshev.fit(Tsat, lnPmin, lnPmax, rtol=1e-2*self.VF_table_tol)
+
+    def _load_VF_table(self, path):
+        with open(path) as f:
+            data = json.load(f)
+        if data.get('tol', 1.0) > self.VF_table_tol:
+            return None
+        table = PiecewiseChebyshev.from_json(data['lnPsat'])
+        T_check = 0.5*(table.xmin + table.xmax)
+        try:
+            lnP = log(self.flash_TVF(T_check, VF=.5, zs=[1.0])[0])
+        except Exception:
+            return None
+        # The file is for some other fluid or model
+        if abs(table(T_check) - lnP) > 10.0*self.VF_table_tol:
+            return None
+        return table
+
+    def _Psat_from_VF_table(self, T):
+        table = self.VF_table_lnPsat
+        if table is None:
+            table = self.build_VF_table()
+        if table and table.xmin <= T <= table.xmax:
+            return exp(table(T))
+        return None
+
+    def _Tsat_from_VF_table(self, P):
+        table = self.VF_table_lnPsat
+        if table is None:
+            table = self.build_VF_table()
+        if table and P > 0.0:
+            inverse = self.VF_table_Tsat
+            lnP = log(P)
+            if inverse.xmin <= lnP <= inverse.xmax:
+                return inverse(lnP)
+        return None
+
     def flash_VF_HSGUA(self, fixed_var_val, spec_val, fixed_var='VF', spec_var='H', zs=None,
                        hot_start=None, solution='high'):
         # solution at high T by default
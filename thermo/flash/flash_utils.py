@@ -25,8 +25,19 @@ from __future__ import division
 __all__ = [
     'sequential_substitution_2P', 
     'sequential_substitution_2P_functional',
+    'kijs_reduction',
+    'sequential_substitution_2P_reduced',
+    'stability_iteration_Michelsen_functional',
+    'bubble_P_functional',
+    'dew_P_functional',
+    'nonlin_2P_newton_functional',
+    'bubble_T_functional',
+    'dew_T_functional',
+    'flash_TP_functional',
     'sequential_substitution_GDEM3_2P',
-    'dew_bubble_Michelsen_Mollerup', 
+    'dew_bubble_Michelsen_Mollerup',
+    'phase_envelope_residuals',
+    'phase_envelope_Michelsen', 
     'bubble_T_Michelsen_Mollerup',
     'dew_T_Michelsen_Mollerup',
     'bubble_P_Michelsen_Mollerup',
@@ -56,7 +67,12 @@ __all__ = [
     'nonlin_spec_NP',
     'TPV_solve_HSGUA_guesses_VL',
     'solve_P_VF_IG_K_composition_independent',
-    'solve_T_VF_IG_K_composition_independent'
+    'solve_T_VF_IG_K_composition_independent',
+    'cubic_Z_roots_batch',
+    'cubic_lnphis_batch',
+    'Rachford_Rice_batch',
+    'stability_Michelsen_batch',
+    'sequential_substitution_2P_batch',
 ]
 
 
@@ -69,9 +85,9 @@ from fluids.numerics import (UnconvergedError, trunc_exp, newton,
                              best_bounding_bounds, isclose, newton_system,
                              make_damp_initial, newton_minimize,
                              root, minimize, fsolve)
-from fluids.numerics import py_solve, trunc_log
+from fluids.numerics import py_solve, trunc_log, roots_cubic
 
-from chemicals.utils import (exp, log, copysign, normalize,
+from chemicals.utils import (exp, log, sqrt, pi, copysign, normalize,
                              mixing_simple, property_mass_to_molar)
 from chemicals.heat_capacity import (Dadgostar_Shaw_integral, 
                                      Dadgostar_Shaw_integral_over_T, 
@@ -87,6 +103,7 @@ from chemicals.flash_basic import flash_wilson, flash_Tb_Tc_Pc, flash_ideal
 from chemicals.exceptions import TrivialSolutionError
 from thermo.phases import Phase, CoolPropPhase, CEOSLiquid, CEOSGas, IAPWS95
 from thermo.phases.phase_utils import lnphis_direct
+from thermo.eos_alpha_functions import PR_a_alphas_vectorized
 from thermo.coolprop import CPiP_min
 
 LASTOVKA_SHAW = 'Lastovka Shaw'
@@ -310,6 +327,108 @@ def sequential_substitution_2P(T, P, V, zs, xs_guess, ys_guess, liquid_phase,
         err1, err2, err3 = err, err1, err2
     raise UnconvergedError('End of SS without convergence')
 
+def kijs_reduction(kijs, rtol=1e-12):
+    # Spectral decomposition of the binary interaction parameter matrix, so
+    # 1 - kij = sum_k lambdas[k]*vectors[i][k]*vectors[j][k]. Eigenvalues
+    # smaller than `rtol` times the largest are dropped; the largest error of
+    # the truncated decomposition is also returned.
+    one_minus_kijs = 1.0 - np.array(kijs, dtype=float)
+    one_minus_kijs = 0.5*(one_minus_kijs + one_minus_kijs.T)
+    lambdas, vectors = np.linalg.eigh(one_minus_kijs)
+    keep = np.abs(lambdas) > rtol*np.abs(lambdas).max()
+    lambdas, vectors = lambdas[keep], vectors[:, keep]
+    err = float(np.abs(one_minus_kijs - np.dot(vectors*lambdas, vectors.T)).max())
+    return lambdas, vectors, err
+
+def sequential_substitution_2P_reduced(T, P, V, zs, xs_guess, ys_guess,
+                                       liquid_phase, gas_phase, reduction, u, w,
+                                       maxiter=1000, tol=1E-13,
+                                       trivial_solution_tol=1e-5,
+                                       V_over_F_guess=None, newton_err=1e-4):
+    # Reduction method TP flash for a cubic equation of state with the
+    # quadratic mixing rule (Hendriks and van Bergen, 1992; Nichita and
+    # Graciaa, 2011). With `reduction` from `kijs_reduction`, ln phi_i is a
+    # linear combination of 1, b_i and sqrt(a_alpha_i)*vectors[i], so ln K is
+    # solved for in those M + 2 coefficients instead of N variables.
+    # Substitution steps are taken until the error is under `newton_err`,
+    # followed by Newton steps. The result is exact only when the
+    # decomposition is; the caller is responsible for polishing otherwise.
+    lambdas, vectors = reduction[0], reduction[1]
+    M = len(lambdas) + 2
+    if liquid_phase.T != T or liquid_phase.P != P:
+        liquid_phase = liquid_phase.to_TP_zs(T=T, P=P, zs=xs_guess)
+    if gas_phase.T != T or gas_phase.P != P:
+        gas_phase = gas_phase.to_TP_zs(T=T, P=P, zs=ys_guess)
+    eos_mix = liquid_phase.eos_mix
+    bs = np.array(eos_mix.bs)
+    S = np.sqrt(np.array(eos_mix.a_alphas))[:, None]*vectors
+    C = np.column_stack((np.ones(len(bs)), bs, S))
+    RT = R*T
+    d = sqrt(u*u - 4.0*w)
+
+    def coefficients(xs, root):
+        b = np.dot(xs, bs)
+        Q = np.dot(xs, S)
+        a_alpha = float(np.dot(lambdas, Q*Q))
+        A, B = a_alpha*P/(RT*RT), b*P/RT
+        c2, c1, c0 = (u - 1.0)*B - 1.0, A + w*B*B - u*B - u*B*B, -(A*B + w*B*B + w*B*B*B)
+        Zs = [Z.real for Z in roots_cubic(1.0, c2, c1, c0) if Z.imag == 0.0 and Z.real > B]
+        Z = max(Zs) if root == 1 else min(Zs)
+        for _ in range(2):
+            Z -= (((Z + c2)*Z + c1)*Z + c0)/((3.0*Z + 2.0*c2)*Z + c1)
+        G = A/(B*d)*log((2.0*Z + B*(u + d))/(2.0*Z + B*(u - d)))
+        c = np.empty(M)
+        c[0] = -log(Z - B)
+        c[1] = (Z - 1.0 + G)/b
+        c[2:] = -2.0*G/a_alpha*lambdas*Q
+        return c
+
+    def substitute(h, V_over_F):
+        Ks = np.exp(np.dot(C, h)).tolist()
+        try:
+            V_over_F, xs, ys = flash_inner_loop(zs, Ks, guess=V_over_F)
+        except Exception:
+            V_over_F, xs, ys = flash_inner_loop(zs, Ks, guess=V_over_F, check=True)
+        xs, ys = np.array(xs), np.array(ys)
+        return coefficients(xs, root_l) - coefficients(ys, root_g), V_over_F, xs, ys
+
+    # Each phase keeps the volume root its class would select
+    root_l = 1 if liquid_phase.is_gas else -1
+    root_g = 1 if gas_phase.is_gas else -1
+    V_over_F = 0.5 if V_over_F_guess is None else V_over_F_guess
+    h = coefficients(np.array(xs_guess), root_l) - coefficients(np.array(ys_guess), root_g)
+    for iteration in range(maxiter):
+        h_new, V_over_F, xs, ys = substitute(h, V_over_F)
+        dlnKs = np.dot(C, h_new - h)
+        err = float(np.dot(np.expm1(dlnKs), np.expm1(dlnKs)))
+        comp_difference = float(np.abs(xs - ys).sum())
+        if comp_difference < trivial_solution_tol:
+            raise TrivialSolutionError("Converged to trivial condition, compositions of both phases equal",
+                                       comp_difference, iteration, err)
+        if err < tol:
+            xs, ys = xs.tolist(), ys.tolist()
+            l = liquid_phase.to(xs, T=T, P=P, V=V)
+            g = gas_phase.to(ys, T=T, P=P, V=V)
+            return V_over_F, xs, ys, l, g, iteration, err
+        if err != err:
+            break
+        if err < newton_err:
+            # Newton step on h, with a finite difference Jacobian
+            F = h_new - h
+            J = np.empty((M, M))
+            for k in range(M):
+                h_dh = h.copy()
+                dh = 1e-7*max(abs(h[k]), 1e-3)
+                h_dh[k] += dh
+                J[:, k] = (substitute(h_dh, V_over_F)[0] - h_dh - F)/dh
+            try:
+                h = h - np.linalg.solve(J, F)
+            except np.linalg.LinAlgError:
+                h = h_new
+        else:
+            h = h_new
+    raise UnconvergedError('End of SS without convergence')
+
 def sequential_substitution_2P_functional(zs, xs_guess, ys_guess,
                                liquid_args, gas_args, maxiter=1000, tol=1E-13,
                                trivial_solution_tol=1e-5, V_over_F_guess=0.5):
@@ -377,6 +496,401 @@ def sequential_substitution_2P_functional(zs, xs_guess, ys_guess,
     raise ValueError('End of SS without convergence')
 
 
+def stability_iteration_Michelsen_functional(zs, zs_test, trial_args, test_args,
+                                             maxiter=20, xtol=1E-12):
+    # Array-only version of `stability_iteration_Michelsen`; `trial_args` are
+    # the `lnphis_args` of the lowest Gibbs energy phase at the feed
+    # composition, and `test_args` those of the phase the stationary point is
+    # searched for in.
+    N = len(zs)
+    zs_test2 = [0.0]*N
+    for i in range(N):
+        zs_test2[i] = zs_test[i]
+        if zs_test2[i] == 0.0:
+            zs_test2[i] = 1e-50
+    zs_test = zs_test2
+    zs2 = [0.0]*N
+    for i in range(N):
+        zs2[i] = zs[i]
+        if zs2[i] == 0.0:
+            zs2[i] = 1e-50
+    zs = zs2
+
+    lnphis_trial = lnphis_direct(zs, *trial_args)
+    # Copy, as the same arguments may be used to evaluate the test phase
+    lnphis_trial2 = [0.0]*N
+    for i in range(N):
+        lnphis_trial2[i] = lnphis_trial[i]
+    lnphis_trial = lnphis_trial2
+
+    Ks = [0.0]*N
+    for i in range(N):
+        Ks[i] = zs_test[i]/zs[i]
+
+    sum_zs_test = sum_zs_test_inv = 1.0
+    converged = False
+    for _ in range(maxiter):
+        lnphis_test = lnphis_direct(zs_test, *test_args)
+        err = 0.0
+        for i in range(N):
+            ci = zs[i]/zs_test[i]*trunc_exp(lnphis_trial[i] - lnphis_test[i])*sum_zs_test_inv
+            Ks[i] *= ci
+            err += (ci - 1.0)*(ci - 1.0)
+        if err < xtol:
+            converged = True
+            break
+
+        for i in range(N):
+            zs_test[i] = Ks[i]*zs[i]
+        sum_zs_test = 0.0
+        for i in range(N):
+            sum_zs_test += zs_test[i]
+        if sum_zs_test == 0.0:
+            converged = True
+            break
+        sum_zs_test_inv = 1.0/sum_zs_test
+        for i in range(N):
+            zs_test[i] *= sum_zs_test_inv
+
+    if not converged:
+        raise UnconvergedError('End of stability_iteration_Michelsen_functional without convergence')
+    try:
+        V_over_F, trial_zs, appearing_zs = flash_inner_loop(zs, Ks)
+    except:
+        V_over_F, trial_zs, appearing_zs = 0.0, zs, zs
+
+    dG_RT = 0.0
+    if V_over_F != 0.0:
+        lnphis_test = lnphis_direct(zs_test, *test_args)
+        for i in range(N):
+            dG_RT += zs_test[i]*(trunc_log(zs_test[i]) + lnphis_test[i])
+        dG_RT *= V_over_F
+    return sum_zs_test, Ks, zs_test, V_over_F, trial_zs, appearing_zs, dG_RT
+
+def bubble_P_functional(P_guess, zs, liquid_args, gas_args, ys_guess=None,
+                        maxiter=200, xtol=1E-10):
+    # Bubble pressure by successive substitution on the pressure and incipient
+    # gas composition, with array-only phase arguments. Only the pressure of
+    # the `lnphis_args` tuples is changed, so the temperature is fixed.
+    N = len(zs)
+    model_l, T, model_g = liquid_args[0], liquid_args[1], gas_args[0]
+    P = P_guess
+    if ys_guess is None:
+        ys_guess = zs
+    ys = [0.0]*N
+    for i in range(N):
+        ys[i] = ys_guess[i]
+    Ks = [0.0]*N
+    for iteration in range(maxiter):
+        lnphis_l = lnphis_direct(zs, model_l, T, P, N, *liquid_args[4:])
+        lnphis_g = lnphis_direct(ys, model_g, T, P, N, *gas_args[4:])
+        S = 0.0
+        for i in range(N):
+            Ks[i] = trunc_exp(lnphis_l[i] - lnphis_g[i])
+            S += zs[i]*Ks[i]
+        err = 0.0
+        for i in range(N):
+            yi = zs[i]*Ks[i]/S
+            err += abs(yi - ys[i])
+            ys[i] = yi
+        P *= S
+        if abs(S - 1.0) < xtol and err < xtol:
+            return P, ys, iteration, abs(S - 1.0)
+    raise UnconvergedError('End of bubble_P_functional without convergence')
+
+def dew_P_functional(P_guess, zs, liquid_args, gas_args, xs_guess=None,
+                     maxiter=200, xtol=1E-10):
+    # Dew pressure counterpart of `bubble_P_functional`
+    N = len(zs)
+    model_l, T, model_g = liquid_args[0], liquid_args[1], gas_args[0]
+    P = P_guess
+    if xs_guess is None:
+        xs_guess = zs
+    xs = [0.0]*N
+    for i in range(N):
+        xs[i] = xs_guess[i]
+    Ks = [0.0]*N
+    for iteration in range(maxiter):
+        lnphis_l = lnphis_direct(xs, model_l, T, P, N, *liquid_args[4:])
+        lnphis_g = lnphis_direct(zs, model_g, T, P, N, *gas_args[4:])
+        S = 0.0
+        for i in range(N):
+            Ks[i] = trunc_exp(lnphis_l[i] - lnphis_g[i])
+            S += zs[i]/Ks[i]
+        err = 0.0
+        for i in range(N):
+            xi = zs[i]/(Ks[i]*S)
+            err += abs(xi - xs[i])
+            xs[i] = xi
+        P /= S
+        if abs(S - 1.0) < xtol and err < xtol:
+            return P, xs, iteration, abs(S - 1.0)
+    raise UnconvergedError('End of dew_P_functional without convergence')
+
+
+def nonlin_2P_newton_functional_err(lnKsVF, zs, liquid_args, gas_args, xs, ys, Fs):
+    # Residuals of `nonlin_2P_newton_functional` in the log K and vapor
+    # fraction variables; `xs`, `ys` and `Fs` are filled in
+    N = len(zs)
+    VF = lnKsVF[N]
+    err_RR = 0.0
+    for i in range(N):
+        Ki = exp(lnKsVF[i])
+        t = 1.0/(1.0 + VF*(Ki - 1.0))
+        xs[i] = zs[i]*t
+        ys[i] = Ki*xs[i]
+        err_RR += zs[i]*(Ki - 1.0)*t
+    lnphis_l = lnphis_direct(xs, *liquid_args)
+    for i in range(N):
+        Fs[i] = lnKsVF[i] - lnphis_l[i]
+    lnphis_g = lnphis_direct(ys, *gas_args)
+    for i in range(N):
+        Fs[i] += lnphis_g[i]
+    Fs[N] = err_RR
+    return Fs
+
+def nonlin_2P_newton_functional(zs, xs_guess, ys_guess, liquid_args, gas_args,
+                                maxiter=100, xtol=1E-10,
+                                trivial_solution_tol=1e-5, V_over_F_guess=0.5):
+    # Array-only version of `nonlin_2P_newton`, solving for the log K values
+    # and the vapor fraction. The `lnphis_args` tuples do not carry the
+    # composition derivatives of lnphis, so the Jacobian is obtained by
+    # forward differences.
+    N = len(zs)
+    size = N + 1
+    lnKsVF = [0.0]*size
+    for i in range(N):
+        lnKsVF[i] = log(ys_guess[i]/xs_guess[i])
+    lnKsVF[N] = V_over_F_guess
+    xs, ys, xs_step, ys_step = [0.0]*N, [0.0]*N, [0.0]*N, [0.0]*N
+    Fs, Fs_step, rhs = [0.0]*size, [0.0]*size, [0.0]*size
+    J = [[0.0]*size for _ in range(size)] # numba: delete
+#    J = np.zeros((size, size)) # numba: uncomment
+
+    for iteration in range(maxiter):
+        nonlin_2P_newton_functional_err(lnKsVF, zs, liquid_args, gas_args, xs, ys, Fs)
+        err = 0.0
+        for i in range(size):
+            err += abs(Fs[i])
+
+        comp_difference = 0.0
+        for i in range(N):
+            comp_difference += abs(xs[i] - ys[i])
+        if comp_difference < trivial_solution_tol:
+            raise ValueError("Converged to trivial condition, compositions of both phases equal")
+        if err < xtol:
+            return lnKsVF[N], xs, ys, iteration, err
+
+        for j in range(size):
+            v = lnKsVF[j]
+            h = 1e-7*max(abs(v), 1.0)
+            lnKsVF[j] = v + h
+            nonlin_2P_newton_functional_err(lnKsVF, zs, liquid_args, gas_args, xs_step, ys_step, Fs_step)
+            lnKsVF[j] = v
+            h_inv = 1.0/h
+            for i in range(size):
+                J[i][j] = (Fs_step[i] - Fs[i])*h_inv
+        for i in range(size):
+            rhs[i] = -Fs[i]
+        dx = py_solve(J, rhs)
+        # Damp the first steps, as in `nonlin_2P_newton`
+        damping = 0.5 if iteration < 3 else 1.0
+        for i in range(size):
+            lnKsVF[i] += damping*dx[i]
+    raise UnconvergedError('End of nonlin_2P_newton_functional without convergence')
+
+def lnphis_args_Soave_at_TP(T, P, args, Tcs, ais, kappas):
+    # Copy of cubic EOS `lnphis_args` at a new temperature and pressure, with
+    # the `a_alpha` terms recomputed for a Soave type alpha function. Only
+    # the untranslated layout of the arguments is supported.
+    N = args[3]
+    a_alphas = PR_a_alphas_vectorized(T, Tcs, ais, kappas)
+    a_alpha_roots = [0.0]*N
+    for i in range(N):
+        a_alpha_roots[i] = sqrt(a_alphas[i])
+    return (args[0], T, P, N, args[4], args[5], args[6], args[7], a_alphas,
+            a_alpha_roots, args[10], args[11])
+
+def bubble_dew_T_functional_S(T, P, zs, comp, liquid_args, gas_args, Tcs,
+                              ais, kappas, bubble, Ks):
+    # Sum of the incipient phase mole fractions for `bubble_T_functional` and
+    # `dew_T_functional`; `Ks` is filled in
+    N = len(zs)
+    liquid_args = lnphis_args_Soave_at_TP(T, P, liquid_args, Tcs, ais, kappas)
+    gas_args = lnphis_args_Soave_at_TP(T, P, gas_args, Tcs, ais, kappas)
+    if bubble:
+        lnphis_l = lnphis_direct(zs, *liquid_args)
+        for i in range(N):
+            Ks[i] = lnphis_l[i]
+        lnphis_g = lnphis_direct(comp, *gas_args)
+    else:
+        lnphis_l = lnphis_direct(comp, *liquid_args)
+        for i in range(N):
+            Ks[i] = lnphis_l[i]
+        lnphis_g = lnphis_direct(zs, *gas_args)
+    S = 0.0
+    for i in range(N):
+        Ks[i] = trunc_exp(Ks[i] - lnphis_g[i])
+        if bubble:
+            S += zs[i]*Ks[i]
+        else:
+            S += zs[i]/Ks[i]
+    return S
+
+def bubble_dew_T_functional(T_guess, P, zs, liquid_args, gas_args, Tcs, ais,
+                            kappas, comp_guess, bubble, maxiter, xtol):
+    if liquid_args[0] not in (10200, 10201, 10100) or gas_args[0] not in (10200, 10201, 10100):
+        raise ValueError("Only the PRMIX, PR78MIX and SRKMIX models are supported")
+    N = len(zs)
+    T = T_guess
+    if comp_guess is None:
+        comp_guess = zs
+    comp = [0.0]*N
+    for i in range(N):
+        comp[i] = comp_guess[i]
+    Ks = [0.0]*N
+    for iteration in range(maxiter):
+        S = bubble_dew_T_functional_S(T, P, zs, comp, liquid_args, gas_args,
+                                      Tcs, ais, kappas, bubble, Ks)
+        err = 0.0
+        for i in range(N):
+            ci = zs[i]*Ks[i]/S if bubble else zs[i]/(Ks[i]*S)
+            err += abs(ci - comp[i])
+            comp[i] = ci
+        lnS = log(S)
+        if abs(lnS) < xtol and err < xtol:
+            comp_difference = 0.0
+            for i in range(N):
+                comp_difference += abs(zs[i] - comp[i])
+            if comp_difference < 1e-5:
+                raise ValueError("Converged to trivial condition, compositions of both phases equal")
+            return T, comp, iteration, abs(lnS)
+        # Newton step on ln(S) in T at the updated incipient phase composition
+        dT = T*1e-7
+        S_dT = bubble_dew_T_functional_S(T + dT, P, zs, comp, liquid_args, gas_args,
+                                         Tcs, ais, kappas, bubble, Ks)
+        S = bubble_dew_T_functional_S(T, P, zs, comp, liquid_args, gas_args,
+                                      Tcs, ais, kappas, bubble, Ks)
+        dlnS_dT = (log(S_dT) - log(S))/dT
+        step = -log(S)/dlnS_dT
+        if step > 0.1*T:
+            step = 0.1*T
+        elif step < -0.1*T:
+            step = -0.1*T
+        T += step
+    raise UnconvergedError('End of bubble_dew_T_functional without convergence')
+
+def bubble_T_functional(T_guess, P, zs, liquid_args, gas_args, Tcs, ais, kappas,
+                        ys_guess=None, maxiter=200, xtol=1E-10):
+    # Bubble temperature with array-only phase arguments. The `a_alpha` terms
+    # in the `lnphis_args` tuples depend on temperature, so they are
+    # recomputed from `Tcs`, `ais` and `kappas` (`ms` for SRK); this covers
+    # cubic EOSs with a Soave alpha function only.
+    return bubble_dew_T_functional(T_guess, P, zs, liquid_args, gas_args, Tcs,
+                                   ais, kappas, ys_guess, True, maxiter, xtol)
+
+def dew_T_functional(T_guess, P, zs, liquid_args, gas_args, Tcs, ais, kappas,
+                     xs_guess=None, maxiter=200, xtol=1E-10):
+    # Dew temperature counterpart of `bubble_T_functional`
+    return bubble_dew_T_functional(T_guess, P, zs, liquid_args, gas_args, Tcs,
+                                   ais, kappas, xs_guess, False, maxiter, xtol)
+
+def flash_TP_functional(zs, liquid_args, gas_args, Tcs, Pcs, omegas,
+                        maxiter_SS=30, tol_SS=1E-8, maxiter_newton=100,
+                        xtol_newton=1E-10):
+    # Array-only two-phase TP flash: the phase with the lowest Gibbs energy at
+    # the feed is tested for stability from Wilson vapor and liquid-like
+    # guesses, and an unstable feed is split by successive substitution
+    # followed by `nonlin_2P_newton_functional`. Returns the vapor fraction
+    # and the liquid and gas compositions; a single phase is reported with
+    # a vapor fraction of 0 if the liquid root has the lower Gibbs energy, or
+    # if the EOS has a single root below the pseudocritical temperature.
+    N = len(zs)
+    T, P = liquid_args[1], liquid_args[2]
+    G_liq = G_gas = 0.0
+    lnphis = lnphis_direct(zs, *liquid_args)
+    for i in range(N):
+        G_liq += zs[i]*lnphis[i]
+    lnphis = lnphis_direct(zs, *gas_args)
+    for i in range(N):
+        G_gas += zs[i]*lnphis[i]
+    if G_liq == G_gas:
+        # Only one root; identify it with the pseudocritical temperature
+        Tpc = 0.0
+        for i in range(N):
+            Tpc += zs[i]*Tcs[i]
+        liquid_min = T < Tpc
+    else:
+        liquid_min = G_liq < G_gas
+    if liquid_min:
+        min_args, other_args = liquid_args, gas_args
+    else:
+        min_args, other_args = gas_args, liquid_args
+
+    Ks_wilson = [0.0]*N
+    for i in range(N):
+        Ks_wilson[i] = Pcs[i]/P*exp(5.37*(1.0 + omegas[i])*(1.0 - Tcs[i]/T))
+    stable = True
+    vapor_like = True
+    trial_zs = appearing_zs = zs
+    V_over_F = 0.5
+    for guess in range(2):
+        vapor_like = guess == 0
+        zs_test = [0.0]*N
+        tot = 0.0
+        for i in range(N):
+            zs_test[i] = zs[i]*Ks_wilson[i] if vapor_like else zs[i]/Ks_wilson[i]
+            tot += zs_test[i]
+        for i in range(N):
+            zs_test[i] /= tot
+        try:
+            sum_zs_test, Ks, _, V_over_F, trial_zs, appearing_zs, _ = stability_iteration_Michelsen_functional(
+                zs, zs_test, min_args, other_args)
+        except:
+            continue
+        lnK_2_tot = 0.0
+        for i in range(N):
+            lnK = trunc_log(Ks[i])
+            lnK_2_tot += lnK*lnK
+        if abs(sum_zs_test - 1.0) < 1e-9 or lnK_2_tot < 1e-7:
+            continue
+        if -1e-6 <= V_over_F <= 1.0 + 1e-6:
+            stable = False
+            break
+
+    if not stable:
+        # The appearing phase is the gas if it was found from the vapor-like
+        # guess, and the liquid otherwise
+        if vapor_like:
+            xs, ys = trial_zs, appearing_zs
+        else:
+            xs, ys = appearing_zs, trial_zs
+            V_over_F = 1.0 - V_over_F
+        try:
+            V_over_F, xs, ys, _, _ = sequential_substitution_2P_functional(
+                zs, xs, ys, liquid_args, gas_args, maxiter=maxiter_SS,
+                tol=tol_SS, V_over_F_guess=V_over_F)
+        except:
+            # Not converged yet; Newton continues from the stability test
+            pass
+        try:
+            V_over_F, xs, ys, _, _ = nonlin_2P_newton_functional(
+                zs, xs, ys, liquid_args, gas_args, maxiter=maxiter_newton,
+                xtol=xtol_newton, V_over_F_guess=V_over_F)
+        except:
+            stable = True
+        else:
+            if V_over_F < 0.0 or V_over_F > 1.0:
+                stable = True
+
+    if stable:
+        xs, ys = [0.0]*N, [0.0]*N
+        for i in range(N):
+            xs[i] = ys[i] = zs[i]
+        return (0.0 if liquid_min else 1.0), xs, ys
+    return V_over_F, xs, ys
+
+
 def sequential_substitution_NP(T, P, zs, compositions_guesses, betas_guesses,
                                phases, maxiter=1000, tol=1E-13,
                                trivial_solution_tol=1e-5, ref_phase=2):
@@ -1997,6 +2511,237 @@ def dew_bubble_Michelsen_Mollerup(guess, fixed_val, zs, liquid_phase, gas_phase,
     return guess, comp_guess, iter_phase, const_phase, iteration, abs(guess - guess_old)
 
 
+def phase_envelope_residuals(X, spec_idx, spec_val, zs, V_over_F, liquid_phase,
+                             gas_phase, jac=True):
+    # Michelsen's (1980) envelope equations in ln K, ln T, ln P at a fixed
+    # vapor fraction; the last equation sets the specified variable
+    N = len(zs)
+    T, P = exp(X[N]), exp(X[N+1])
+    Ks = [exp(X[i]) for i in range(N)]
+    xs, ys, ds = [0.0]*N, [0.0]*N, [0.0]*N
+    x_sum = y_sum = 0.0
+    for i in range(N):
+        ds[i] = d = 1.0 + V_over_F*(Ks[i] - 1.0)
+        xs[i] = zs[i]/d
+        ys[i] = Ks[i]*xs[i]
+        x_sum += xs[i]
+        y_sum += ys[i]
+    x_sum_inv, y_sum_inv = 1.0/x_sum, 1.0/y_sum
+    liquid = liquid_phase.to_TP_zs(T=T, P=P, zs=[x*x_sum_inv for x in xs])
+    gas = gas_phase.to_TP_zs(T=T, P=P, zs=[y*y_sum_inv for y in ys])
+    lnphis_l, lnphis_g = liquid.lnphis(), gas.lnphis()
+    F = [X[i] + lnphis_g[i] - lnphis_l[i] for i in range(N)]
+    F.append(y_sum - x_sum)
+    F.append(X[spec_idx] - spec_val)
+    if not jac:
+        return F, liquid, gas
+
+    try:
+        dlnphis_dns_l, dlnphis_dns_g = liquid.dlnphis_dns(), gas.dlnphis_dns()
+        dlnphis_dT_l, dlnphis_dT_g = liquid.dlnphis_dT(), gas.dlnphis_dT()
+        dlnphis_dP_l, dlnphis_dP_g = liquid.dlnphis_dP(), gas.dlnphis_dP()
+    except (AttributeError, NotImplementedError):
+        # Finite difference the whole system for phases without derivatives
+        J = [[0.0]*(N+2) for _ in range(N+2)]
+        h = 1e-7
+        for j in range(N+2):
+            X2 = list(X)
+            X2[j] += h
+            F2 = phase_envelope_residuals(X2, spec_idx, spec_val, zs, V_over_F,
+                                          liquid_phase, gas_phase, jac=False)[0]
+            for i in range(N+2):
+                J[i][j] = (F2[i] - F[i])/h
+        return F, J, liquid, gas
+
+    J = []
+    for i in range(N):
+        row = [0.0]*(N+2)
+        dlnphis_dns_li, dlnphis_dns_gi = dlnphis_dns_l[i], dlnphis_dns_g[i]
+        for j in range(N):
+            # The fugacity coefficients are homogeneous of degree zero in the
+            # unnormalized compositions
+            dx = -V_over_F*zs[j]*Ks[j]/(ds[j]*ds[j])
+            dy = (1.0 - V_over_F)*zs[j]*Ks[j]/(ds[j]*ds[j])
+            row[j] = dlnphis_dns_gi[j]*dy*y_sum_inv - dlnphis_dns_li[j]*dx*x_sum_inv
+        row[i] += 1.0
+        row[N] = T*(dlnphis_dT_g[i] - dlnphis_dT_l[i])
+        row[N+1] = P*(dlnphis_dP_g[i] - dlnphis_dP_l[i])
+        J.append(row)
+    row = [0.0]*(N+2)
+    for j in range(N):
+        row[j] = zs[j]*Ks[j]/(ds[j]*ds[j])
+    J.append(row)
+    row = [0.0]*(N+2)
+    row[spec_idx] = 1.0
+    J.append(row)
+    return F, J, liquid, gas
+
+def phase_envelope_Michelsen(zs, liquid_phase, gas_phase, T, P, xs, ys,
+                             V_over_F=1.0, P_min=None, P_max=1e9, step=0.1,
+                             max_step=0.25, min_step=1e-6, max_points=500,
+                             maxiter=20, xtol=1e-8, critical_step=0.05):
+    # Trace a constant vapor fraction line of the phase envelope by
+    # continuation from a converged point (Michelsen, 1980). The variables are
+    # ln K, ln T and ln P; each new point is predicted by cubic extrapolation
+    # from the last two converged points and their sensitivities dX/dS, which
+    # reuse the Jacobian of the Newton solution. The specified variable is
+    # switched to the one changing fastest, so the maxima in T and P are
+    # passed without trouble. The critical point is stepped over in ln K;
+    # past it the incipient phase is the vapor-like one, so the phase models
+    # are swapped.
+    N = len(zs)
+    X = [log(ys[i]/xs[i]) for i in range(N)]
+    X.append(log(T))
+    X.append(log(P))
+    if P_min is None:
+        P_min = P
+    lnP_min, lnP_max = log(P_min), log(P_max)
+
+    ref = 0
+    for i in range(1, N):
+        if abs(X[i]) > abs(X[ref]):
+            ref = i
+
+    def solve_point(X, spec_idx, swapped):
+        liquid, gas = (gas_phase, liquid_phase) if swapped else (liquid_phase, gas_phase)
+        X = list(X)
+        spec_val = X[spec_idx]
+        for iteration in range(maxiter):
+            F, J, _, _ = phase_envelope_residuals(X, spec_idx, spec_val, zs, V_over_F, liquid, gas)
+            dX = py_solve(J, [-v for v in F])
+            err = 0.0
+            for i in range(N+2):
+                X[i] += dX[i]
+                err = max(err, abs(dX[i]))
+            if err != err:
+                break
+            if err < xtol:
+                F, J, liquid, gas = phase_envelope_residuals(X, spec_idx, spec_val, zs, V_over_F, liquid, gas)
+                rhs = [0.0]*(N+2)
+                rhs[N+1] = 1.0
+                return X, py_solve(J, rhs), liquid, gas, iteration + 1
+        raise UnconvergedError('Phase envelope point did not converge')
+
+    swapped = False
+    spec_idx = N + 1
+    X, sens, liquid, gas, iterations_total = solve_point(X, spec_idx, swapped)
+    points, sensitivities, swaps = [X], [sens], [swapped]
+    liquids, gases = [liquid], [gas]
+    criticals = []
+    ds = step
+    while len(points) < max_points:
+        X1, d1 = points[-1], sensitivities[-1]
+        # Specify the variable changing fastest along the curve
+        k = 0
+        for i in range(1, N+2):
+            if abs(d1[i]) > abs(d1[k]):
+                k = i
+        if abs(X1[ref]) < critical_step and d1[ref]*d1[spec_idx]*ds*X1[ref] < 0.0:
+            # Approaching the critical point; jump over it to the point with
+            # the opposite ln K
+            k = ref
+            ds = -2.0*X1[ref]*d1[spec_idx]/d1[ref]
+        ds *= d1[k]/d1[spec_idx]
+        spec_idx = k
+        ds = copysign(min(abs(ds), max_step), ds)
+
+        d1k = [v/d1[k] for v in d1]
+        X_guess = [X1[i] + ds*d1k[i] for i in range(N+2)]
+        if len(points) > 1 and sensitivities[-2][k] != 0.0:
+            X0, d0 = points[-2], sensitivities[-2]
+            h = X1[k] - X0[k]
+            if h*ds > 0.0:
+                # Cubic Hermite extrapolation in the specified variable
+                t = 1.0 + ds/h
+                t2 = t*t
+                t3 = t*t2
+                h00, h10, h01, h11 = 2.0*t3 - 3.0*t2 + 1.0, t3 - 2.0*t2 + t, 3.0*t2 - 2.0*t3, t3 - t2
+                d0k_inv = h/d0[k]
+                X_guess = [h00*X0[i] + h10*d0[i]*d0k_inv + h01*X1[i] + h11*d1k[i]*h
+                           for i in range(N+2)]
+
+        crossing = (X_guess[ref] > 0.0) != (X1[ref] > 0.0)
+        try:
+            X, sens, liquid, gas, iterations = solve_point(X_guess, spec_idx, swapped ^ crossing)
+            if (X[ref] > 0.0) != (X_guess[ref] > 0.0):
+                raise ValueError("Crossed the critical point with the wrong phase models")
+            if spec_idx != ref and max([abs(X[i]) for i in range(N)]) < 1e-5:
+                raise ValueError("Converged to trivial solution")
+        except Exception:
+            ds *= 0.5
+            if abs(ds) < min_step:
+                break
+            continue
+        iterations_total += iterations
+        if crossing:
+            swapped = not swapped
+            # Cubic Hermite interpolation in ln K to where all K values are one
+            S0, S1 = X1[ref], X[ref]
+            h = S1 - S0
+            t = -S0/h
+            t2 = t*t
+            t3 = t*t2
+            h00, h10, h01, h11 = 2.0*t3 - 3.0*t2 + 1.0, t3 - 2.0*t2 + t, 3.0*t2 - 2.0*t3, t3 - t2
+            lnT_c, lnP_c = [h00*X1[i] + h10*d1[i]/d1[ref]*h + h01*X[i] + h11*sens[i]/sens[ref]*h
+                            for i in (N, N+1)]
+            criticals.append((exp(lnT_c), exp(lnP_c)))
+        points.append(X)
+        sensitivities.append(sens)
+        swaps.append(swapped)
+        liquids.append(liquid)
+        gases.append(gas)
+        if X[N+1] < lnP_min or X[N+1] > lnP_max:
+            break
+        if iterations <= 2:
+            ds *= 2.0
+        elif iterations <= 3:
+            ds *= 1.5
+        elif iterations > 5:
+            ds *= 0.5
+
+    def extremum(idx, spec_idx):
+        # Locate the maximum of variable `idx` by regula falsi in the other of
+        # ln T and ln P, where its derivative along the curve is zero
+        values = [X[idx] for X in points]
+        m = values.index(max(values))
+        gs = [d[idx]/d[spec_idx] for d in sensitivities]
+        for j in (m-1, m):
+            if j < 0 or j + 1 >= len(points) or gs[j]*gs[j+1] > 0.0:
+                continue
+            Xa, Xb = points[j], points[j+1]
+            Sa, Sb, ga, gb = Xa[spec_idx], Xb[spec_idx], gs[j], gs[j+1]
+            S_old = Sa
+            try:
+                for _ in range(maxiter):
+                    S = Sb - gb*(Sb - Sa)/(gb - ga)
+                    frac = (S - Xa[spec_idx])/(Xb[spec_idx] - Xa[spec_idx])
+                    X_guess = [Xa[i] + frac*(Xb[i] - Xa[i]) for i in range(N+2)]
+                    X_guess[spec_idx] = S
+                    # The bracket may contain the critical point
+                    swapped = swaps[j] if (X_guess[ref] > 0.0) == (Xa[ref] > 0.0) else swaps[j+1]
+                    X_new, d, _, _, _ = solve_point(X_guess, spec_idx, swapped)
+                    if (X_new[ref] > 0.0) != (X_guess[ref] > 0.0):
+                        X_new, d, _, _, _ = solve_point(X_guess, spec_idx, not swapped)
+                    g = d[idx]/d[spec_idx]
+                    if abs(S - S_old) < xtol:
+                        return exp(X_new[N]), exp(X_new[N+1])
+                    S_old = S
+                    if g*gb < 0.0:
+                        Sa, ga = Sb, gb
+                    else:
+                        ga *= 0.5
+                    Sb, gb = S, g
+            except Exception:
+                pass
+        return exp(points[m][N]), exp(points[m][N+1])
+
+    cricondentherm = extremum(N, N+1)
+    cricondenbar = extremum(N+1, N)
+    Ts = [exp(X[N]) for X in points]
+    Ps = [exp(X[N+1]) for X in points]
+    return Ts, Ps, liquids, gases, criticals, cricondentherm, cricondenbar, iterations_total
+
+
 l_undefined_T_msg = "Could not calculate liquid conditions at provided temperature %s K (mole fracions %s)"
 g_undefined_T_msg = "Could not calculate vapor conditions at provided temperature %s K (mole fracions %s)"
 l_undefined_P_msg = "Could not calculate liquid conditions at provided pressure %s Pa (mole fracions %s)"
@@ -4261,6 +5006,187 @@ def TPV_solve_HSGUA_guesses_VL(zs, method, constants, correlations,
         return val, info[0], info[1], info[2]
 
 
+def cubic_Z_roots_batch(A, B, u, w):
+    # Solve the cubic in compressibility factor for many states at once, for
+    # an equation of state of the form P = RT/(V-b) - a/(V^2 + u*b*V + w*b^2).
+    # Returns the smallest and largest roots above `B`; where there is only one
+    # real root, both are the same.
+    c2 = (u - 1.0)*B - 1.0
+    c1 = A + w*B*B - u*B - u*B*B
+    c0 = -(A*B + w*B*B + w*B*B*B)
+    c2_3 = c2/3.0
+    p = c1 - c2*c2_3
+    q = 2.0*c2_3*c2_3*c2_3 - c2_3*c1 + c0
+    disc = 0.25*q*q + p*p*p/27.0
+
+    one_root = disc > 0.0
+    sqrt_disc = np.sqrt(np.where(one_root, disc, 0.0))
+    t_one = np.cbrt(-0.5*q + sqrt_disc) + np.cbrt(-0.5*q - sqrt_disc)
+
+    m = 2.0*np.sqrt(np.where(one_root, 0.0, -p/3.0))
+    arg = np.where(one_root, 0.0, 3.0*q/np.where(m == 0.0, 1.0, p*m))
+    theta = np.arccos(np.clip(arg, -1.0, 1.0))/3.0
+    t_high = m*np.cos(theta)
+    t_mid = m*np.cos(theta - 2.0*pi/3.0)
+    t_low = m*np.cos(theta + 2.0*pi/3.0)
+
+    Z_high = np.where(one_root, t_one, t_high) - c2_3
+    Z_mid = np.where(one_root, Z_high, t_mid - c2_3)
+    Z_low = np.where(one_root, Z_high, t_low - c2_3)
+    Z_low = np.where(Z_low > B, Z_low, np.where(Z_mid > B, Z_mid, Z_high))
+
+    # Newton polish of the analytical roots
+    for Z in (Z_low, Z_high):
+        for _ in range(3):
+            f = ((Z + c2)*Z + c1)*Z + c0
+            df = (3.0*Z + 2.0*c2)*Z + c1
+            Z -= f/np.where(df == 0.0, 1.0, df)
+    return Z_low, Z_high
+
+def cubic_lnphis_batch(zs, T, P, bs, a_alpha_roots, one_minus_kijs, u, w,
+                       root=0):
+    # Log fugacity coefficients for a quadratic mixing rule cubic equation of
+    # state, for many states at once. `zs` and `a_alpha_roots` are (M, N)
+    # arrays, `T` and `P` are (M,) arrays. `root` is 1 to select the largest
+    # root, -1 for the smallest root, or 0 for the root with the lowest Gibbs
+    # energy.
+    zr = zs*a_alpha_roots
+    a_alpha_j_rows = a_alpha_roots*np.dot(zr, one_minus_kijs)
+    a_alpha = (zs*a_alpha_j_rows).sum(axis=1)
+    b = np.dot(zs, bs)
+    RT = R*T
+    A = a_alpha*P/(RT*RT)
+    B = b*P/RT
+
+    d = sqrt(u*u - 4.0*w)
+    Z_low, Z_high = cubic_Z_roots_batch(A, B, u, w)
+
+    def G_dep_RT(Z):
+        log_ratio = np.log((2.0*Z + B*(u + d))/(2.0*Z + B*(u - d)))
+        return Z - 1.0 - np.log(Z - B) - A/(B*d)*log_ratio, log_ratio
+
+    G_high, log_ratio_high = G_dep_RT(Z_high)
+    if root == 1:
+        Z, log_ratio = Z_high, log_ratio_high
+    else:
+        G_low, log_ratio_low = G_dep_RT(Z_low)
+        if root == -1:
+            Z, log_ratio = Z_low, log_ratio_low
+        else:
+            low = G_low < G_high
+            Z = np.where(low, Z_low, Z_high)
+            log_ratio = np.where(low, log_ratio_low, log_ratio_high)
+
+    bs_b = bs[None, :]/b[:, None]
+    lnphis = (bs_b*(Z - 1.0)[:, None] - np.log(Z - B)[:, None]
+              + (A/(B*d)*log_ratio)[:, None]*(bs_b - 2.0*a_alpha_j_rows/a_alpha[:, None]))
+    return lnphis, Z
+
+def Rachford_Rice_batch(zs, Ks, guess=None, maxiter=100, xtol=1e-14):
+    # Solve the Rachford-Rice equation for many states at once, with Newton's
+    # method safeguarded by bisection within the asymptotes. The vapor
+    # fraction may be outside of [0, 1]; states without both a K above and
+    # below 1 are returned as NaN.
+    Km1 = Ks - 1.0
+    K_max, K_min = Ks.max(axis=1), Ks.min(axis=1)
+    valid = (K_max > 1.0) & (K_min < 1.0)
+    low = np.where(valid, 1.0/(1.0 - np.where(valid, K_max, 2.0)), 0.0)
+    high = np.where(valid, 1.0/(1.0 - np.where(valid, K_min, 0.5)), 1.0)
+    if guess is None:
+        V_over_F = np.full(len(Ks), 0.5)
+    else:
+        V_over_F = np.where(np.isnan(guess), 0.5, guess)
+    V_over_F = np.where((V_over_F > low) & (V_over_F < high), V_over_F, 0.5*(low + high))
+
+    zKm1 = zs*Km1
+    for _ in range(maxiter):
+        t = 1.0/(1.0 + V_over_F[:, None]*Km1)
+        terms = zKm1*t
+        err = terms.sum(axis=1)
+        derr = -(terms*Km1*t).sum(axis=1)
+        positive = err > 0.0
+        low = np.where(positive, V_over_F, low)
+        high = np.where(positive, high, V_over_F)
+        V_over_F_new = V_over_F - err/derr
+        V_over_F_new = np.where((V_over_F_new > low) & (V_over_F_new < high),
+                                V_over_F_new, 0.5*(low + high))
+        step = np.abs(V_over_F_new - V_over_F)
+        V_over_F = V_over_F_new
+        if np.all(step[valid] <= xtol*(1.0 + np.abs(V_over_F[valid]))):
+            break
+    V_over_F = np.where(valid, V_over_F, np.nan)
+    xs = zs/(1.0 + V_over_F[:, None]*Km1)
+    ys = Ks*xs
+    return V_over_F, xs, ys
+
+def stability_Michelsen_batch(zs, lnphis_fun, lnphis_feed, Ks_guess,
+                              maxiter=500, xtol=5e-9):
+    # Michelsen tangent plane stability test for many states at once, using
+    # the vapor-like and liquid-like Wilson compositions as trial phases.
+    # `lnphis_fun(ws, mask)` returns the lowest Gibbs energy log fugacity
+    # coefficients of the states in `mask`.
+    # Returns a mask of unstable states, and K values for the states that
+    # estimate the incipient phase split.
+    M = zs.shape[0]
+    ds = np.log(zs) + lnphis_feed
+    unstable = np.zeros(M, dtype=bool)
+    sum_W_best = np.ones(M)
+    Ks = np.array(Ks_guess, copy=True)
+    for vapor_like in (True, False):
+        Ws = zs*Ks_guess if vapor_like else zs/Ks_guess
+        active = np.ones(M, dtype=bool)
+        for _ in range(maxiter):
+            idx = np.flatnonzero(active)
+            if not len(idx):
+                break
+            W = Ws[idx]
+            ws = W/W.sum(axis=1)[:, None]
+            lnWs_new = ds[idx] - lnphis_fun(ws, idx)
+            Ws_new = np.exp(lnWs_new)
+            err = ((Ws_new/W - 1.0)**2).sum(axis=1)
+            Ws[idx] = Ws_new
+            active[idx] = err > xtol
+        sum_W = Ws.sum(axis=1)
+        ws = Ws/sum_W[:, None]
+        trivial = (np.log(ws/zs)**2).sum(axis=1) < 1e-7
+        is_unstable = (sum_W > 1.0 + 1e-9) & ~trivial & (sum_W > sum_W_best)
+        if vapor_like:
+            Ks = np.where(is_unstable[:, None], ws/zs, Ks)
+        else:
+            Ks = np.where(is_unstable[:, None], zs/ws, Ks)
+        sum_W_best = np.where(is_unstable, sum_W, sum_W_best)
+        unstable |= is_unstable
+    return unstable, Ks
+
+def sequential_substitution_2P_batch(zs, Ks, lnphis_l_fun, lnphis_g_fun,
+                                     maxiter=5000, tol=1e-13,
+                                     trivial_solution_tol=1e-5):
+    # Sequential substitution for many two-phase states at once. Returns the
+    # vapor fractions, phase compositions, and a mask of the states which
+    # converged.
+    M = zs.shape[0]
+    V_over_F, xs, ys = Rachford_Rice_batch(zs, Ks)
+    converged = np.zeros(M, dtype=bool)
+    active = ~np.isnan(V_over_F)
+    for _ in range(maxiter):
+        idx = np.flatnonzero(active)
+        if not len(idx):
+            break
+        x, y = xs[idx], ys[idx]
+        Ks_new = np.exp(lnphis_l_fun(x, idx) - lnphis_g_fun(y, idx))
+        err = ((Ks_new*x/y - 1.0)**2).sum(axis=1)
+        V_over_F_new, xs_new, ys_new = Rachford_Rice_batch(zs[idx], Ks_new, guess=V_over_F[idx])
+
+        done = err < tol
+        failed = np.isnan(V_over_F_new) | (np.abs(xs_new - ys_new).sum(axis=1) < trivial_solution_tol)
+        converged[idx[done]] = True
+        update = ~done & ~failed
+        xs[idx[update]], ys[idx[update]] = xs_new[update], ys_new[update]
+        V_over_F[idx[update]] = V_over_F_new[update]
+        active[idx[done | failed]] = False
+    return V_over_F, xs, ys, converged
+
+
 global cm_flash
 cm_flash = None
 def cm_flash_tol():
@@ -45,14 +45,22 @@ from .flash_utils import (
     TPV_solve_HSGUA_guesses_VL,
     SHAW_ELEMENTAL, IDEAL_WILSON,
     nonlin_spec_NP,
+    cubic_lnphis_batch,
+    stability_Michelsen_batch,
+    sequential_substitution_2P_batch,
+    phase_envelope_Michelsen,
+    kijs_reduction,
+    sequential_substitution_2P_reduced,
 )
 from .flash_pure_vls  import FlashPureVLS
 from chemicals.utils import log
 from chemicals.exceptions import TrivialSolutionError
-from fluids.numerics import secant, trunc_log, UnconvergedError
+from fluids.constants import R
+from fluids.numerics import secant, trunc_log, UnconvergedError, numpy as np
 from thermo.property_package import StabilityTester
 from thermo.bulk import default_settings
 from thermo.coolprop import CPiP_min
+from thermo.phase_identification import VL_ID_PIP
 from thermo import phases
 
 __all__ = ['FlashVL']
@@ -248,6 +256,13 @@ class FlashVL(Flash):
     PT_SS_POLISH_VF = 1e-6 # 5e-8
     PT_SS_POLISH_MAXITER = 1000
 
+    # Reduction method two-phase flash for cubic equations of state, solving
+    # in a few variables from a spectral decomposition of the kijs; used only
+    # when that is fewer variables than there are components
+    PT_SS_REDUCED = False
+    PT_SS_REDUCED_RTOL = 1e-12
+    PT_SS_REDUCED_EXACT_TOL = 1e-12
+
     SS_2P_STAB_HIGHEST_COMP_DIFF = False
     SS_2P_STAB_COMP_DIFF_MIN = None
 
@@ -303,6 +318,13 @@ class FlashVL(Flash):
     HSGUA_NEWTON_ANALYTICAL_JAC = True
     TPV_HSGUA_SECANT_MAXITER = 1000
 
+    # Cubic equation of state models which can be used by `flash_TP_batch`,
+    # with their `u` and `w` parameters (`delta` = u*b, `epsilon` = w*b^2)
+    batch_cubic_models = {10200: (2.0, -1.0), 10201: (2.0, -1.0), 10204: (2.0, -1.0),
+                          10205: (2.0, -1.0), 10206: (2.0, -1.0),
+                          10100: (1.0, 0.0), 10104: (1.0, 0.0), 10105: (1.0, 0.0),
+                          10002: (1.0, 0.0)}
+
     solids = None
     skip_solids = True
     K_composition_independent = False
@@ -676,12 +698,18 @@ class FlashVL(Flash):
             self.PT_converge(T=T, P=P, zs=zs, xs_guess=trial_zs, ys_guess=appearing_zs, liquid_phase=min_phase,
                         gas_phase=other_phase, V_over_F_guess=V_over_F_guess)
         try:
-            V_over_F, xs, ys, l, g, iteration, err = sequential_substitution_2P(T=T, P=P, V=None,
-                                                                                zs=zs, xs_guess=trial_zs, ys_guess=appearing_zs,
-                                                                                liquid_phase=min_phase,
-                                                                                gas_phase=other_phase, maxiter=self.PT_SS_MAXITER,
-                                                                                tol=self.PT_SS_TOL,
-                                                                                V_over_F_guess=V_over_F_guess)
+            sln = None
+            if self.PT_SS_REDUCED:
+                sln = self.flash_2P_reduced(T, P, zs, trial_zs, appearing_zs, min_phase, other_phase,
+                                            V_over_F_guess)
+            if sln is None:
+                sln = sequential_substitution_2P(T=T, P=P, V=None,
+                                                 zs=zs, xs_guess=trial_zs, ys_guess=appearing_zs,
+                                                 liquid_phase=min_phase,
+                                                 gas_phase=other_phase, maxiter=self.PT_SS_MAXITER,
+                                                 tol=self.PT_SS_TOL,
+                                                 V_over_F_guess=V_over_F_guess)
+            V_over_F, xs, ys, l, g, iteration, err = sln
         except TrivialSolutionError:
             ls, g = ([liquid], None) if min_phase is liquid else ([], gas)
             return g, ls, [], [1.0], {'iterations': 0, 'err': 0.0, 'stab_info': stab_info}
@@ -714,6 +742,92 @@ class FlashVL(Flash):
 
         return g, ls, [], [V_over_F, 1.0 - V_over_F], {'iterations': iteration, 'err': err, 'stab_info': stab_info}
 
+    def flash_2P_reduced(self, T, P, zs, xs_guess, ys_guess, liquid_phase,
+                         gas_phase, V_over_F_guess=None):
+        r'''Method to perform a two-phase TP flash with the reduction method,
+        for cubic equations of state with many components and few nonzero
+        binary interaction parameters. The fugacity coefficients of the
+        quadratic mixing rule depend on the composition only through a few
+        reduced variables obtained from a spectral decomposition of the
+        `kijs` matrix, so the flash is solved in those instead of in the
+        K values of every component.
+
+        When the truncated decomposition is not exact, the solution is
+        finished by regular sequential substitution with the full model.
+        None is returned when the phases are not suitable or the reduction
+        would not save any variables, and when the reduced solution fails;
+        the caller should then use the regular flash.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+        zs : list[float]
+            Mole fractions of the feed, [-]
+        xs_guess : list[float]
+            Guess for the mole fractions of the `liquid_phase`, [-]
+        ys_guess : list[float]
+            Guess for the mole fractions of the `gas_phase`, [-]
+        liquid_phase : :obj:`CEOSLiquid <thermo.phases.CEOSLiquid>` or :obj:`CEOSGas <thermo.phases.CEOSGas>`
+            First phase, [-]
+        gas_phase : :obj:`CEOSLiquid <thermo.phases.CEOSLiquid>` or :obj:`CEOSGas <thermo.phases.CEOSGas>`
+            Second phase, [-]
+        V_over_F_guess : float, optional
+            Guess for the phase fraction of `gas_phase`, [-]
+
+        Returns
+        -------
+        solution : tuple or None
+            Phase fraction of `gas_phase`, the two compositions, the two
+            phases, the number of iterations and the final error, as returned
+            by :obj:`sequential_substitution_2P <thermo.flash.flash_utils.sequential_substitution_2P>`, [-]
+        '''
+        reduction = self._kijs_reduction()
+        if reduction is None:
+            return None
+        reduction, u, w = reduction
+        try:
+            sln = sequential_substitution_2P_reduced(T=T, P=P, V=None, zs=zs, xs_guess=xs_guess,
+                                                     ys_guess=ys_guess, liquid_phase=liquid_phase,
+                                                     gas_phase=gas_phase, reduction=reduction, u=u, w=w,
+                                                     maxiter=self.PT_SS_MAXITER, tol=self.PT_SS_TOL,
+                                                     V_over_F_guess=V_over_F_guess)
+        except TrivialSolutionError:
+            raise
+        except Exception:
+            return None
+        if reduction[2] > self.PT_SS_REDUCED_EXACT_TOL:
+            V_over_F, xs, ys, l, g, iteration, err = sln
+            V_over_F, xs, ys, l, g, iteration_full, err = sequential_substitution_2P(
+                T=T, P=P, V=None, zs=zs, xs_guess=xs, ys_guess=ys, liquid_phase=l,
+                gas_phase=g, maxiter=self.PT_SS_MAXITER, tol=self.PT_SS_TOL,
+                V_over_F_guess=V_over_F)
+            sln = (V_over_F, xs, ys, l, g, iteration + iteration_full, err)
+        return sln
+
+    def _kijs_reduction(self):
+        # Recomputed if the tolerance or the phases are changed
+        gas, liquid, rtol = self.gas, self.liquid, self.PT_SS_REDUCED_RTOL
+        try:
+            key, reduction = self._kijs_reduction_cache
+            if key[0] == rtol and key[1] is gas and key[2] is liquid:
+                return reduction
+        except AttributeError:
+            pass
+        reduction = None
+        if (isinstance(gas, phases.CEOSGas) and isinstance(liquid, phases.CEOSLiquid)
+            and liquid.eos_class is gas.eos_class and not gas.eos_mix.translated):
+            model = self.batch_cubic_models.get(gas.eos_class.model_id, None)
+            kijs = gas.eos_mix.kijs
+            if model is not None and kijs is not None:
+                decomposition = kijs_reduction(kijs, rtol=rtol)
+                if len(decomposition[0]) + 2 < self.N:
+                    reduction = (decomposition, model[0], model[1])
+        self._kijs_reduction_cache = ((rtol, gas, liquid), reduction)
+        return reduction
+
     def PT_converge(self, T, P, zs, xs_guess, ys_guess, liquid_phase,
                     gas_phase, V_over_F_guess=0.5):
         for algo in self.PT_algorithms:
@@ -725,7 +839,8 @@ class FlashVL(Flash):
                 a = 1
 
     def flash_TPV(self, T, P, V, zs=None, solution=None, hot_start=None):
-        if hot_start is not None:
+        if hot_start is not None and hot_start.phase_count > 1:
+            # Only allow hot start when there are multiple phases
             try:
                 VF_guess, xs, ys = hot_start.beta_gas, hot_start.liquid0.zs, hot_start.gas.zs
                 liquid, gas = self.liquid, self.gas
@@ -739,12 +854,307 @@ class FlashVL(Flash):
                 assert 0.0 <= V_over_F <= 1.0
                 return g, [l], [], [V_over_F, 1.0 - V_over_F], {'iterations': iteration, 'err': err}
             except Exception as e:
-                print('FAILED from hot start TP')
+                # Fall back to the full flash, e.g. when the hot start
+                # guess leads to a single phase
                 pass
 
 
         return self.flash_TP_stability_test(T, P, zs, self.liquid, self.gas, solution=solution)
 
+    def flash_TP_batch(self, Ts, Ps, zs):
+        r'''Method to perform many TP flashes at once, returning the results
+        as arrays rather than :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`
+        objects.
+
+        When the gas and liquid phases are the same cubic equation of state
+        (Peng-Robinson or SRK family, without volume translation), the
+        stability test and sequential substitution are performed on all of the
+        states simultaneously with NumPy arrays, and no phase objects are
+        created. Any state which this fails to converge, and every state for
+        other models, is flashed individually with :obj:`flash <thermo.flash.Flash.flash>`.
+
+        Parameters
+        ----------
+        Ts : float or list[float]
+            Temperatures, [K]
+        Ps : float or list[float]
+            Pressures, [Pa]
+        zs : list[float] or list[list[float]]
+            Mole fractions of each component, either one composition for all
+            states or one row per state, [-]
+
+        Returns
+        -------
+        results : dict[str : ndarray]
+            Arrays of the results, with one entry per state: 'VF' (gas phase
+            fraction), 'xs' (liquid composition), 'ys' (gas composition),
+            'V' (bulk molar volume), 'V_liquid', 'V_gas', 'phase_count',
+            'failed' (boolean mask of states which could not be flashed), and
+            'batch' (boolean mask of states solved simultaneously); values
+            for phases which are not present are NaN, [various]
+
+        Notes
+        -----
+        The simultaneous stability test uses only the vapor-like and
+        liquid-like Wilson guesses as trial phases; the individual flash tries
+        more trial phases.
+
+        Examples
+        --------
+        >>> from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, CEOSGas, CEOSLiquid, PRMIX, FlashVL
+        >>> constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0], omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+        >>> correlations = PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=[])
+        >>> eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+        >>> gas = CEOSGas(PRMIX, eos_kwargs)
+        >>> liq = CEOSLiquid(PRMIX, eos_kwargs)
+        >>> flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+        >>> res = flasher.flash_TP_batch([300.0, 350.0, 400.0], 2e6, [0.5, 0.5])
+        >>> res['VF'].tolist()
+        [0.0, 0.4297, 1.0]
+        '''
+        Ts, Ps = np.broadcast_arrays(np.atleast_1d(np.array(Ts, dtype=float)),
+                                     np.atleast_1d(np.array(Ps, dtype=float)))
+        zs = np.array(zs, dtype=float)
+        if zs.ndim == 1:
+            zs = np.tile(zs, (len(Ts), 1))
+        elif len(Ts) == 1:
+            Ts, Ps = np.full(len(zs), Ts[0]), np.full(len(zs), Ps[0])
+        M, N = zs.shape
+
+        VFs, Vs, Vs_liquid, Vs_gas = np.full(M, np.nan), np.full(M, np.nan), np.full(M, np.nan), np.full(M, np.nan)
+        xs, ys = np.full((M, N), np.nan), np.full((M, N), np.nan)
+        phase_counts = np.zeros(M, dtype=int)
+        batch = np.zeros(M, dtype=bool)
+        failed = np.zeros(M, dtype=bool)
+        results = {'VF': VFs, 'xs': xs, 'ys': ys, 'V': Vs, 'V_liquid': Vs_liquid,
+                   'V_gas': Vs_gas, 'phase_count': phase_counts, 'failed': failed,
+                   'batch': batch}
+
+        model = self._flash_TP_batch_model()
+        if model is not None:
+            idx = np.flatnonzero(np.all(zs > 0.0, axis=1) & (Ps > 0.0) & (Ts >= self.T_MIN_FLASH))
+            if len(idx):
+                self._flash_TP_batch_cubic(Ts[idx], Ps[idx], zs[idx], idx, model, results)
+
+        for i in np.flatnonzero(~batch):
+            try:
+                res = self.flash(T=float(Ts[i]), P=float(Ps[i]), zs=zs[i].tolist())
+            except Exception:
+                failed[i] = True
+                continue
+            VFs[i] = res.VF
+            Vs[i] = res.V()
+            phase_counts[i] = res.phase_count
+            if res.gas is not None:
+                ys[i], Vs_gas[i] = res.gas.zs, res.gas.V()
+            if res.liquid_count:
+                xs[i], Vs_liquid[i] = res.liquid0.zs, res.liquid0.V()
+        return results
+
+    def _flash_TP_batch_model(self):
+        gas, liquid = self.gas, self.liquid
+        if (self.N < 2 or self.max_phases != 2 or self.gas_to_unique_liquid is None
+            or self.settings.VL_ID != VL_ID_PIP
+            or not isinstance(gas, phases.CEOSGas) or not isinstance(liquid, phases.CEOSLiquid)):
+            return None
+        eos_mix = gas.eos_mix
+        if eos_mix.translated or liquid.eos_class is not gas.eos_class:
+            return None
+        return self.batch_cubic_models.get(gas.eos_class.model_id, None)
+
+    def _flash_TP_batch_cubic(self, Ts, Ps, zs, idx, model, results):
+        u, w = model
+        eos_mix = self.gas.eos_mix
+        constants = self.constants
+        bs = np.array(eos_mix.bs)
+        one_minus_kijs = 1.0 - np.array(eos_mix.kijs)
+
+        Ts_unique, T_idxs = np.unique(Ts, return_inverse=True)
+        a_alphas, da_alpha_dTs = [], []
+        for T in Ts_unique:
+            a_alpha, da_alpha_dT, _ = eos_mix.a_alpha_and_derivatives_vectorized(float(T))
+            a_alphas.append(a_alpha)
+            da_alpha_dTs.append(da_alpha_dT)
+        a_alphas = np.array(a_alphas)[T_idxs]
+        da_alpha_dTs = np.array(da_alpha_dTs)[T_idxs]
+        a_alpha_roots = np.sqrt(a_alphas)
+
+        def lnphis_fun(root):
+            def fun(comps, j):
+                return cubic_lnphis_batch(comps, Ts[j], Ps[j], bs, a_alpha_roots[j],
+                                          one_minus_kijs, u, w, root=root)[0]
+            return fun
+
+        def V_PIP(comps, Z, j):
+            # Molar volume and phase identification parameter of each phase
+            T, P, a_alpha_roots_j = Ts[j], Ps[j], a_alpha_roots[j]
+            zr_sums = np.dot(comps*a_alpha_roots_j, one_minus_kijs)
+            a_alpha = (comps*a_alpha_roots_j*zr_sums).sum(axis=1)
+            da_alpha_dT = (comps*da_alpha_dTs[j]/a_alpha_roots_j*zr_sums).sum(axis=1)
+            b = np.dot(comps, bs)
+            V = Z*R*T/P
+            delta, epsilon = u*b, w*b*b
+            Vmb = V - b
+            den = V*V + delta*V + epsilon
+            x2 = (2.0*V + delta)/(den*den)
+            dP_dT = R/Vmb - da_alpha_dT/den
+            d2P_dTdV = -R/(Vmb*Vmb) + da_alpha_dT*x2
+            dP_dV = -R*T/(Vmb*Vmb) + a_alpha*x2
+            d2P_dV2 = 2.0*R*T/(Vmb*Vmb*Vmb) + 2.0*a_alpha/(den*den) - 2.0*a_alpha*(2.0*V + delta)*x2/den
+            return V, V*(d2P_dTdV/dP_dT - d2P_dV2/dP_dV)
+
+        lnphis_feed, Z_feed = cubic_lnphis_batch(zs, Ts, Ps, bs, a_alpha_roots,
+                                                 one_minus_kijs, u, w, root=0)
+        Tcs, Pcs, omegas = np.array(constants.Tcs), np.array(constants.Pcs), np.array(constants.omegas)
+        Ks_Wilson = Pcs/Ps[:, None]*np.exp(5.37*(1.0 + omegas)*(1.0 - Tcs/Ts[:, None]))
+        unstable, Ks = stability_Michelsen_batch(zs, lnphis_fun(0), lnphis_feed, Ks_Wilson,
+                                                 maxiter=self.PT_STABILITY_MAXITER,
+                                                 xtol=self.PT_STABILITY_XTOL)
+
+        VFs, xs, ys, phase_counts = results['VF'], results['xs'], results['ys'], results['phase_count']
+
+        V, PIP = V_PIP(zs, Z_feed, slice(None))
+        gas = PIP <= 1.00000000000001
+
+        def set_one_phase(k):
+            g, l = k[gas[k]], k[~gas[k]]
+            results['V'][idx[k]] = V[k]
+            phase_counts[idx[k]] = 1
+            VFs[idx[g]], VFs[idx[l]] = 1.0, 0.0
+            ys[idx[g]], results['V_gas'][idx[g]] = zs[g], V[g]
+            xs[idx[l]], results['V_liquid'][idx[l]] = zs[l], V[l]
+            results['batch'][idx[k]] = True
+
+        set_one_phase(np.flatnonzero(~unstable))
+
+        j = np.flatnonzero(unstable)
+        if not len(j):
+            return
+        liquid_fun, gas_fun = lnphis_fun(-1), lnphis_fun(1)
+        V_over_F, xs_2P, ys_2P, converged = sequential_substitution_2P_batch(
+            zs[j], Ks[j], lambda comps, k: liquid_fun(comps, j[k]),
+            lambda comps, k: gas_fun(comps, j[k]),
+            maxiter=self.PT_SS_MAXITER, tol=self.PT_SS_TOL)
+
+        Z_l = cubic_lnphis_batch(xs_2P, Ts[j], Ps[j], bs, a_alpha_roots[j],
+                                 one_minus_kijs, u, w, root=-1)[1]
+        Z_g = cubic_lnphis_batch(ys_2P, Ts[j], Ps[j], bs, a_alpha_roots[j],
+                                 one_minus_kijs, u, w, root=1)[1]
+        V_l, PIP_l = V_PIP(xs_2P, Z_l, j)
+        V_g, PIP_g = V_PIP(ys_2P, Z_g, j)
+
+        # The more vapor-like phase is the gas; two liquids are left to the
+        # individual flash
+        swap = PIP_l < PIP_g
+        gas_PIP = np.where(swap, PIP_l, PIP_g)
+        in_range = (V_over_F > 0.0) & (V_over_F < 1.0)
+        good = converged & in_range & (gas_PIP <= 1.00000000000001)
+
+        # A converged negative flash means the feed is a single phase after all
+        k = j[converged & ~in_range]
+        set_one_phase(k)
+        V_over_F = np.where(swap, 1.0 - V_over_F, V_over_F)
+        xs_2P, ys_2P = np.where(swap[:, None], ys_2P, xs_2P), np.where(swap[:, None], xs_2P, ys_2P)
+        V_l, V_g = np.where(swap, V_g, V_l), np.where(swap, V_l, V_g)
+
+        k = idx[j[good]]
+        VFs[k] = V_over_F[good]
+        xs[k], ys[k] = xs_2P[good], ys_2P[good]
+        results['V_liquid'][k], results['V_gas'][k] = V_l[good], V_g[good]
+        results['V'][k] = V_over_F[good]*V_g[good] + (1.0 - V_over_F[good])*V_l[good]
+        phase_counts[k] = 2
+        results['batch'][k] = True
+
+    def phase_envelope(self, zs, VF=1.0, P_start=1e5, P_min=None, P_max=1e9,
+                       step=0.1, max_points=500):
+        r'''Method to trace a constant vapor fraction line of the phase
+        envelope by continuation, as described in [1]_. Starting from a
+        converged point at `P_start`, each new point is predicted from the
+        sensitivities of the last one, so only a few Newton iterations are
+        needed per point and the cricondentherm, cricondenbar and critical
+        point are passed without the convergence problems of independent
+        dew and bubble point flashes.
+
+        Tracing the dew line (`VF` = 1) continues through the critical
+        point and returns along the bubble line, and vice versa.
+
+        Parameters
+        ----------
+        zs : list[float]
+            Mole fractions of the feed, [-]
+        VF : float, optional
+            Vapor fraction of the line to trace, [-]
+        P_start : float, optional
+            Pressure of the first point, [Pa]
+        P_min : float, optional
+            The tracing stops once the pressure falls below this; defaults to
+            `P_start`, [Pa]
+        P_max : float, optional
+            The tracing stops once the pressure rises above this, [Pa]
+        step : float, optional
+            Initial step in the log of pressure, [-]
+        max_points : int, optional
+            Maximum number of points to calculate, [-]
+
+        Returns
+        -------
+        envelope : dict
+            'Ts' and 'Ps' (temperatures [K] and pressures [Pa] of the points),
+            'xs' and 'ys' (compositions of the liquid and gas phases; past
+            the critical point the liquid phase is the vapor-like one),
+            'critical' (interpolated (T, P) of the critical point, or None),
+            'cricondentherm' and 'cricondenbar' (interpolated (T, P) of the
+            maximum temperature and pressure of the line), and 'iterations'
+            (the total number of Newton iterations), [various]
+
+        Notes
+        -----
+        The liquid and gas phase models must both be able to represent either
+        phase (as with a cubic equation of state) for the envelope to be
+        traced past the critical point. Analytical derivatives of the
+        fugacity coefficients are used when the phases provide them.
+
+        A line with a vapor fraction between 0 and 1 ends at the critical
+        point and continues past it as the line of vapor fraction `1 - VF`.
+
+        Examples
+        --------
+        >>> from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, CEOSGas, CEOSLiquid, PRMIX, FlashVL
+        >>> constants = ChemicalConstantsPackage(Tcs=[190.564, 305.32, 369.83], Pcs=[4599000.0, 4872000.0, 4248000.0], omegas=[0.008, 0.098, 0.152], MWs=[16.04246, 30.06904, 44.09562], CASs=['74-82-8', '74-84-0', '74-98-6'])
+        >>> correlations = PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=[])
+        >>> eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+        >>> flasher = FlashVL(constants, correlations, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+        >>> envelope = flasher.phase_envelope([0.7, 0.2, 0.1])
+        >>> T_c, P_c = envelope['critical']
+        >>> round(T_c, 1), round(P_c/1e5, 1)
+        (256.1, 82.3)
+
+        References
+        ----------
+        .. [1] Michelsen, Michael L. "Calculation of Phase Envelopes and
+           Critical Points for Multicomponent Mixtures." Fluid Phase
+           Equilibria 4, no. 1 (1980): 1-10.
+           https://doi.org/10.1016/0378-3812(80)80001-X.
+        '''
+        liquid, gas = self.liquid, self.gas
+        if VF == 0.0 or VF == 1.0:
+            res = self.flash(P=P_start, VF=VF, zs=zs)
+            T, xs, ys = res.T, res.liquid0.zs, res.gas.zs
+        else:
+            # Newton on the envelope equations converges from an ideal guess
+            # at low pressures
+            T, _, _, xs, ys = TP_solve_VF_guesses(zs=zs, method=WILSON_GUESS, constants=self.constants,
+                                                   correlations=self.correlations, P=P_start, VF=VF)
+        (Ts, Ps, liquids, gases, criticals, cricondentherm, cricondenbar,
+         iterations) = phase_envelope_Michelsen(zs, liquid, gas, T, P_start, xs, ys, V_over_F=VF,
+                                                P_min=P_min, P_max=P_max, step=step,
+                                                max_points=max_points)
+        return {'Ts': Ts, 'Ps': Ps, 'xs': [l.zs for l in liquids],
+                'ys': [g.zs for g in gases],
+                'critical': criticals[0] if criticals else None,
+                'cricondentherm': cricondentherm, 'cricondenbar': cricondenbar,
+                'iterations': iterations}
+
     def flash_TPV_HSGUA(self, fixed_val, spec_val, fixed_var='P', spec='H',
                         iter_var='T', zs=None, solution=None,
                         selection_fun_1P=None, hot_start=None):
@@ -138,6 +138,7 @@ from thermo.utils import TDependentProperty, MixtureProperty, IAPWS
 from thermo.coolprop import *
 from cmath import log as clog, exp as cexp
 from thermo.utils import VDI_TABULAR, COOLPROP, POLY_FIT, LINEAR
+from thermo.utils.vectorized_correlations import TRCCp_vectorized
 from chemicals.miscdata import JOBACK
 
 TRCIG = 'TRCIG'
@@ -476,6 +477,34 @@ class HeatCapacityGas(TDependentProperty):
             return self._base_calculate(T, method)
         return Cp
 
+    def calculate_vectorized(self, Ts, method):
+        r'''Method to calculate ideal-gas heat capacity of a compound at an
+        array of temperatures with a given method; the TRC, Joback, and
+        Poling polynomial methods are evaluated with NumPy and other methods
+        are handled by
+        :obj:`thermo.utils.TDependentProperty.calculate_vectorized`.
+
+        Parameters
+        ----------
+        Ts : ndarray
+            Temperatures at which to calculate heat capacity, [K]
+        method : str
+            Name of the method to use
+
+        Returns
+        -------
+        Cps : ndarray
+            Calculated heat capacities, [J/mol/K]
+        '''
+        if method == TRCIG:
+            return TRCCp_vectorized(Ts, *self.TRCIG_coefs)
+        elif method == JOBACK:
+            return horner(self.joback_coeffs, Ts)
+        elif method == POLING_POLY:
+            A, B, C, D, E = self.POLING_coefs
+            return R*(A + Ts*(B + Ts*(C + Ts*(D + E*Ts))))
+        return super(HeatCapacityGas, self).calculate_vectorized(Ts, method)
+
     def test_method_validity(self, T, method):
         r'''Method to test the validity of a specified method for a given
         temperature.
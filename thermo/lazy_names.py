@@ -0,0 +1,780 @@
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2023, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Index of the public names each of thermo's modules contributes to the `thermo`
+namespace, used to import only the module defining a name when it is first
+accessed. Regenerate it after changing any module's `__all__` with::
+
+    python -m thermo.lazy_names
+'''
+
+lazy_names = {'thermo.eos_alpha_functions': ('PR_a_alphas_vectorized',
+                                'PR_a_alpha_and_derivatives_vectorized',
+                                'RK_a_alphas_vectorized',
+                                'RK_a_alpha_and_derivatives_vectorized',
+                                'SRK_a_alphas_vectorized',
+                                'SRK_a_alpha_and_derivatives_vectorized',
+                                'PRSV_a_alphas_vectorized',
+                                'PRSV_a_alpha_and_derivatives_vectorized',
+                                'PRSV2_a_alphas_vectorized',
+                                'PRSV2_a_alpha_and_derivatives_vectorized',
+                                'APISRK_a_alphas_vectorized',
+                                'APISRK_a_alpha_and_derivatives_vectorized',
+                                'a_alpha_base',
+                                'Poly_a_alpha',
+                                'Soave_1972_a_alpha',
+                                'Heyen_a_alpha',
+                                'Harmens_Knapp_a_alpha',
+                                'Mathias_1983_a_alpha',
+                                'Mathias_Copeman_untruncated_a_alpha',
+                                'Mathias_Copeman_poly_a_alpha',
+                                'Gibbons_Laughton_a_alpha',
+                                'Soave_1984_a_alpha',
+                                'Yu_Lu_a_alpha',
+                                'Trebble_Bishnoi_a_alpha',
+                                'Melhem_a_alpha',
+                                'Androulakis_a_alpha',
+                                'Schwartzentruber_a_alpha',
+                                'Almeida_a_alpha',
+                                'Twu91_a_alpha',
+                                'Soave_1993_a_alpha',
+                                'Gasem_a_alpha',
+                                'Coquelet_a_alpha',
+                                'Haghtalab_a_alpha',
+                                'Saffari_a_alpha',
+                                'Chen_Yang_a_alpha',
+                                'TwuSRK95_a_alpha',
+                                'TwuPR95_a_alpha',
+                                'Soave_1979_a_alpha',
+                                'Twu91_alpha_pure',
+                                'Soave_1972_alpha_pure',
+                                'Soave_1979_alpha_pure',
+                                'Heyen_alpha_pure',
+                                'Harmens_Knapp_alpha_pure',
+                                'Mathias_1983_alpha_pure',
+                                'Mathias_Copeman_untruncated_alpha_pure',
+                                'Gibbons_Laughton_alpha_pure',
+                                'Soave_1984_alpha_pure',
+                                'Yu_Lu_alpha_pure',
+                                'Trebble_Bishnoi_alpha_pure',
+                                'Melhem_alpha_pure',
+                                'Androulakis_alpha_pure',
+                                'Schwartzentruber_alpha_pure',
+                                'Almeida_alpha_pure',
+                                'Soave_1993_alpha_pure',
+                                'Gasem_alpha_pure',
+                                'Coquelet_alpha_pure',
+                                'Haghtalab_alpha_pure',
+                                'Saffari_alpha_pure',
+                                'Chen_Yang_alpha_pure',
+                                'Mathias_Copeman_a_alpha'),
+ 'thermo.eos_mix_methods': ('a_alpha_aijs_composition_independent',
+                            'a_alpha_and_derivatives',
+                            'a_alpha_and_derivatives_full',
+                            'a_alpha_quadratic_terms',
+                            'a_alpha_and_derivatives_quadratic_terms',
+                            'kijs_sparse_structure',
+                            'a_alpha_quadratic_terms_sparse',
+                            'a_alpha_and_derivatives_quadratic_terms_sparse',
+                            'PR_lnphis',
+                            'VDW_lnphis',
+                            'SRK_lnphis',
+                            'eos_mix_lnphis_general',
+                            'VDW_lnphis_fastest',
+                            'PR_lnphis_fastest',
+                            'SRK_lnphis_fastest',
+                            'RK_lnphis_fastest',
+                            'PR_translated_lnphis_fastest',
+                            'G_dep_lnphi_d_helper',
+                            'RK_d3delta_dninjnks',
+                            'PR_ddelta_dzs',
+                            'PR_ddelta_dns',
+                            'PR_d2delta_dninjs',
+                            'PR_d3delta_dninjnks',
+                            'PR_depsilon_dns',
+                            'PR_d2epsilon_dninjs',
+                            'PR_d3epsilon_dninjnks',
+                            'PR_d2epsilon_dzizjs',
+                            'PR_depsilon_dzs',
+                            'PR_translated_d2delta_dninjs',
+                            'PR_translated_d3delta_dninjnks',
+                            'PR_translated_d3epsilon_dninjnks',
+                            'PR_translated_ddelta_dzs',
+                            'PR_translated_ddelta_dns',
+                            'PR_translated_depsilon_dzs',
+                            'PR_translated_depsilon_dns',
+                            'PR_translated_d2epsilon_dzizjs',
+                            'PR_translated_d2epsilon_dninjs',
+                            'SRK_translated_ddelta_dns',
+                            'SRK_translated_depsilon_dns',
+                            'SRK_translated_d2epsilon_dzizjs',
+                            'SRK_translated_depsilon_dzs',
+                            'SRK_translated_d2delta_dninjs',
+                            'SRK_translated_d3delta_dninjnks',
+                            'SRK_translated_d2epsilon_dninjs',
+                            'SRK_translated_d3epsilon_dninjnks',
+                            'SRK_translated_lnphis_fastest',
+                            'eos_mix_db_dns',
+                            'eos_mix_da_alpha_dns',
+                            'eos_mix_dV_dzs',
+                            'eos_mix_a_alpha_volume'),
+ 'thermo.eos_volume': ('volume_solutions_mpmath',
+                       'volume_solutions_mpmath_float',
+                       'volume_solutions_NR',
+                       'volume_solutions_NR_low_P',
+                       'volume_solutions_halley',
+                       'volume_solutions_fast',
+                       'volume_solutions_Cardano',
+                       'volume_solutions_a1',
+                       'volume_solutions_a2',
+                       'volume_solutions_numpy',
+                       'volume_solutions_ideal',
+                       'volume_solutions_doubledouble_float',
+                       'volume_solution_polish',
+                       'volume_solutions_sympy',
+                       'volume_solutions_halley_vectorized',
+                       'volume_solution_polish_vectorized',
+                       'high_alpha_one_root_vectorized'),
+ 'thermo.chemical': ('Chemical', 'reference_states'),
+ 'thermo.chemical_package': ('ChemicalConstantsPackage',
+                             'PropertyCorrelationsPackage',
+                             'SharedChemicalConstantsPackage',
+                             'iapws_constants',
+                             'iapws_correlations',
+                             'lemmon2000_constants',
+                             'lemmon2000_correlations'),
+ 'thermo.coolprop': ('has_CoolProp',
+                     'coolprop_dict',
+                     'CP_fluid',
+                     'coolprop_fluids',
+                     'CoolProp_T_dependent_property',
+                     'CoolProp_failing_PT_flashes',
+                     'PropsSI',
+                     'PhaseSI',
+                     'HAPropsSI',
+                     'AbstractState',
+                     'Helmholtz_A0',
+                     'Helmholtz_dA0_dtau',
+                     'Helmholtz_d2A0_dtau2',
+                     'Helmholtz_d3A0_dtau3',
+                     'CoolProp_json_alpha0_to_kwargs',
+                     'Helmholtz_A0_data',
+                     'Cp_ideal_gas_Helmholtz',
+                     'H_ideal_gas_Helmholtz',
+                     'S_ideal_gas_Helmholtz'),
+ 'thermo.datasheet': ('tabulate_solid',
+                      'tabulate_liq',
+                      'tabulate_gas',
+                      'tabulate_constants',
+                      'tabulate_streams'),
+ 'thermo.electrochem': ('Laliberte_density',
+                        'Laliberte_heat_capacity',
+                        'Laliberte_viscosity',
+                        'Laliberte_viscosity_mix',
+                        'Laliberte_viscosity_w',
+                        'Laliberte_viscosity_i',
+                        'Laliberte_density_w',
+                        'Laliberte_density_i',
+                        'Laliberte_density_mix',
+                        'Laliberte_heat_capacity_w',
+                        'Laliberte_heat_capacity_i',
+                        'Laliberte_heat_capacity_mix',
+                        'dilute_ionic_conductivity',
+                        'conductivity_McCleskey',
+                        'conductivity',
+                        'conductivity_methods',
+                        'conductivity_all_methods',
+                        'thermal_conductivity_Magomedov',
+                        'Magomedov_mix',
+                        'ionic_strength',
+                        'Kweq_1981',
+                        'Kweq_IAPWS_gas',
+                        'Kweq_IAPWS',
+                        'Kweq_Arcis_Tremaine_Bandura_Lvov',
+                        'balance_ions'),
+ 'thermo.eos': ('GCEOS',
+                'PR',
+                'SRK',
+                'PR78',
+                'PRSV',
+                'PRSV2',
+                'VDW',
+                'RK',
+                'APISRK',
+                'TWUPR',
+                'TWUSRK',
+                'eos_list',
+                'eos_2P_list',
+                'IG',
+                'PRTranslatedPPJP',
+                'SRKTranslatedPPJP',
+                'PRTranslatedConsistent',
+                'SRKTranslatedConsistent',
+                'MSRKTranslated',
+                'SRKTranslated',
+                'PRTranslated',
+                'PRTranslatedCoqueletChapoyRichon',
+                'PRTranslatedTwu',
+                'PRTranslatedPoly',
+                'main_derivatives_and_departures',
+                'main_derivatives_and_departures_VDW',
+                'eos_lnphi'),
+ 'thermo.eos_mix': ('GCEOSMIX',
+                    'PRMIX',
+                    'SRKMIX',
+                    'PR78MIX',
+                    'VDWMIX',
+                    'PRSVMIX',
+                    'PRSV2MIX',
+                    'TWUPRMIX',
+                    'TWUSRKMIX',
+                    'APISRKMIX',
+                    'IGMIX',
+                    'RKMIX',
+                    'PRMIXTranslatedConsistent',
+                    'PRMIXTranslatedPPJP',
+                    'PRMIXTranslated',
+                    'SRKMIXTranslatedConsistent',
+                    'PSRK',
+                    'MSRKMIXTranslated',
+                    'eos_mix_list',
+                    'eos_mix_no_coeffs_list',
+                    'SRKMIXTranslated'),
+ 'thermo.flash': ('sequential_substitution_2P',
+                  'sequential_substitution_2P_functional',
+                  'kijs_reduction',
+                  'sequential_substitution_2P_reduced',
+                  'stability_iteration_Michelsen_functional',
+                  'bubble_P_functional',
+                  'dew_P_functional',
+                  'nonlin_2P_newton_functional',
+                  'bubble_T_functional',
+                  'dew_T_functional',
+                  'flash_TP_functional',
+                  'sequential_substitution_GDEM3_2P',
+                  'dew_bubble_Michelsen_Mollerup',
+                  'phase_envelope_residuals',
+                  'phase_envelope_Michelsen',
+                  'bubble_T_Michelsen_Mollerup',
+                  'dew_T_Michelsen_Mollerup',
+                  'bubble_P_Michelsen_Mollerup',
+                  'dew_P_Michelsen_Mollerup',
+                  'minimize_gibbs_2P_transformed',
+                  'sequential_substitution_Mehra_2P',
+                  'nonlin_2P',
+                  'nonlin_n_2P',
+                  'sequential_substitution_NP',
+                  'minimize_gibbs_NP_transformed',
+                  'TPV_HSGUA_guesses_1P_methods',
+                  'TPV_solve_HSGUA_guesses_1P',
+                  'sequential_substitution_2P_HSGUAbeta',
+                  'sequential_substitution_2P_sat',
+                  'TP_solve_VF_guesses',
+                  'TPV_double_solve_1P',
+                  'nonlin_2P_HSGUAbeta',
+                  'sequential_substitution_2P_double',
+                  'cm_flash_tol',
+                  'nonlin_2P_newton',
+                  'dew_bubble_newton_zs',
+                  'existence_3P_Michelsen_Mollerup',
+                  'SS_VF_simultaneous',
+                  'stability_iteration_Michelsen',
+                  'assert_stab_success_2P',
+                  'nonlin_equilibrium_NP',
+                  'nonlin_spec_NP',
+                  'TPV_solve_HSGUA_guesses_VL',
+                  'solve_P_VF_IG_K_composition_independent',
+                  'solve_T_VF_IG_K_composition_independent',
+                  'cubic_Z_roots_batch',
+                  'cubic_lnphis_batch',
+                  'Rachford_Rice_batch',
+                  'stability_Michelsen_batch',
+                  'sequential_substitution_2P_batch',
+                  'Flash',
+                  'FlashCache',
+                  'FlashVL',
+                  'FlashVLN',
+                  'FlashPureVLS',
+                  'PureFluidTable'),
+ 'thermo.heat_capacity': ('heat_capacity_gas_methods',
+                          'HeatCapacityGas',
+                          'heat_capacity_liquid_methods',
+                          'HeatCapacityLiquid',
+                          'heat_capacity_solid_methods',
+                          'HeatCapacitySolid',
+                          'HeatCapacitySolidMixture',
+                          'HeatCapacityGasMixture',
+                          'HeatCapacityLiquidMixture'),
+ 'thermo.group_contribution': ('Joback',
+                               'J_BIGGS_JOBACK_SMARTS',
+                               'J_BIGGS_JOBACK_SMARTS_id_dict',
+                               'Wilson_Jasperson',
+                               'Wilson_Jasperson_Tc_increments',
+                               'Wilson_Jasperson_Pc_increments',
+                               'Wilson_Jasperson_Tc_groups',
+                               'Wilson_Jasperson_Pc_groups',
+                               'Fedors'),
+ 'thermo.interaction_parameters': ('InteractionParameterDB',
+                                   'ScalarParameterDB'),
+ 'thermo.law': ('CAN_DSL_flags',
+                'TSCA_flags',
+                'legal_status_methods',
+                'legal_status',
+                'HPV_data',
+                '_ECHATonnageDict',
+                '_EPACDRDict',
+                'economic_status',
+                'economic_status_methods',
+                'load_economic_data',
+                'load_law_data'),
+ 'thermo.bulk': ('Bulk',
+                 'BulkSettings',
+                 'default_settings',
+                 'MOLE_WEIGHTED',
+                 'MASS_WEIGHTED',
+                 'VOLUME_WEIGHTED',
+                 'EQUILIBRIUM_DERIVATIVE',
+                 'LOG_PROP_MOLE_WEIGHTED',
+                 'LOG_PROP_MASS_WEIGHTED',
+                 'LOG_PROP_VOLUME_WEIGHTED',
+                 'POWER_PROP_MOLE_WEIGHTED',
+                 'POWER_PROP_MASS_WEIGHTED',
+                 'POWER_PROP_VOLUME_WEIGHTED',
+                 'AS_ONE_GAS',
+                 'AS_ONE_LIQUID',
+                 'BEATTIE_WHALLEY_MU_VL',
+                 'MCADAMS_MU_VL',
+                 'CICCHITTI_MU_VL',
+                 'LUN_KWOK_MU_VL',
+                 'FOURAR_BORIES_MU_VL',
+                 'DUCKLER_MU_VL',
+                 'MINIMUM_PHASE_PROP',
+                 'MAXIMUM_PHASE_PROP',
+                 'FROM_DERIVATIVE_SETTINGS'),
+ 'thermo.mixture': ('Mixture',),
+ 'thermo.permittivity': ('PermittivityLiquid',),
+ 'thermo.phase_change': ('enthalpy_vaporization_methods',
+                         'EnthalpyVaporization',
+                         'enthalpy_sublimation_methods',
+                         'EnthalpySublimation'),
+ 'thermo.phases': ('Phase',
+                   'derivatives_thermodynamic',
+                   'derivatives_thermodynamic_mass',
+                   'derivatives_jacobian',
+                   'IdealGas',
+                   'CEOSLiquid',
+                   'CEOSGas',
+                   'GibbsExcessLiquid',
+                   'GibbsExcessSolid',
+                   'DryAirLemmon',
+                   'HumidAirRP1485',
+                   'HelmholtzEOS',
+                   'IAPWS95',
+                   'IAPWS95Gas',
+                   'IAPWS95Liquid',
+                   'IAPWS97',
+                   'IAPWS95DensityTable',
+                   'CoolPropPhase',
+                   'CoolPropLiquid',
+                   'CoolPropGas',
+                   'VirialCSP',
+                   'VirialGas',
+                   'VIRIAL_B_ZERO',
+                   'VIRIAL_B_PITZER_CURL',
+                   'VIRIAL_B_ABBOTT',
+                   'VIRIAL_B_TSONOPOULOS',
+                   'VIRIAL_B_TSONOPOULOS_EXTENDED',
+                   'VIRIAL_B_OCONNELL_PRAUSNITZ',
+                   'VIRIAL_B_XIANG',
+                   'VIRIAL_B_MENG',
+                   'VIRIAL_C_ZERO',
+                   'VIRIAL_C_XIANG',
+                   'VIRIAL_C_ORBEY_VERA',
+                   'GraysonStreed',
+                   'ChaoSeader',
+                   'CombinedPhase'),
+ 'thermo.phase_identification': ('vapor_score_Tpc',
+                                 'vapor_score_Vpc',
+                                 'vapor_score_Tpc_weighted',
+                                 'vapor_score_Tpc_Vpc',
+                                 'vapor_score_Wilson',
+                                 'vapor_score_Poling',
+                                 'vapor_score_PIP',
+                                 'vapor_score_Bennett_Schmidt',
+                                 'vapor_score_traces',
+                                 'score_phases_S',
+                                 'score_phases_VL',
+                                 'identity_phase_states',
+                                 'S_ID_METHODS',
+                                 'VL_ID_METHODS',
+                                 'sort_phases',
+                                 'identify_sort_phases',
+                                 'WATER_FIRST',
+                                 'WATER_LAST',
+                                 'WATER_NOT_SPECIAL',
+                                 'WATER_SORT_METHODS',
+                                 'KEY_COMPONENTS_SORT',
+                                 'PROP_SORT',
+                                 'SOLID_SORT_METHODS',
+                                 'LIQUID_SORT_METHODS',
+                                 'VL_ID_TPC',
+                                 'VL_ID_VPC',
+                                 'VL_ID_TPC_VC_WEIGHTED',
+                                 'VL_ID_TPC_VPC',
+                                 'VL_ID_WILSON',
+                                 'VL_ID_POLING',
+                                 'VL_ID_PIP',
+                                 'VL_ID_BS',
+                                 'VL_ID_TRACES',
+                                 'S_ID_D2P_DVDT'),
+ 'thermo.property_package': ('PropertyPackage',
+                             'Ideal',
+                             'Unifac',
+                             'GammaPhi',
+                             'UnifacDortmund',
+                             'IdealCaloric',
+                             'GammaPhiCaloric',
+                             'UnifacCaloric',
+                             'UnifacDortmundCaloric',
+                             'Nrtl',
+                             'WilsonPP',
+                             'StabilityTester',
+                             'eos_Z_test_phase_stability',
+                             'eos_Z_trial_phase_stability',
+                             'Stateva_Tsvetkov_TPDF_eos',
+                             'd_TPD_Michelson_modified_eos',
+                             'GceosBase'),
+ 'thermo.property_package_constants': ('PropertyPackageConstants',
+                                       'IDEAL_PKG',
+                                       'NRTL_PKG',
+                                       'UNIFAC_PKG',
+                                       'UNIFAC_DORTMUND_PKG',
+                                       'PR_PKG',
+                                       'SRK_PKG'),
+ 'thermo.regular_solution': ('RegularSolution',
+                             'regular_solution_gammas',
+                             'regular_solution_gammas_binaries',
+                             'regular_solution_gammas_binaries_jac'),
+ 'thermo.stream': ('Stream',
+                   'EnergyTypes',
+                   'EnergyStream',
+                   'StreamArgs',
+                   'EquilibriumStream',
+                   'mole_balance',
+                   'energy_balance',
+                   'FlowsheetUnit',
+                   'Flowsheet'),
+ 'thermo.interface': ('surface_tension_methods',
+                      'SurfaceTension',
+                      'surface_tension_mixture_methods',
+                      'SurfaceTensionMixture'),
+ 'thermo.thermal_conductivity': ('ThermalConductivityGasMixture',
+                                 'ThermalConductivityLiquidMixture',
+                                 'MAGOMEDOV',
+                                 'DIPPR_9H',
+                                 'FILIPPOV',
+                                 'LINDSAY_BROMLEY',
+                                 'thermal_conductivity_liquid_methods',
+                                 'ThermalConductivityLiquid',
+                                 'thermal_conductivity_gas_methods',
+                                 'thermal_conductivity_gas_methods_P',
+                                 'ThermalConductivityGas',
+                                 'GHARAGHEIZI_L',
+                                 'NICOLA',
+                                 'NICOLA_ORIGINAL',
+                                 'SATO_RIEDEL',
+                                 'SHEFFY_JOHNSON',
+                                 'BAHADORI_L',
+                                 'LAKSHMI_PRASAD',
+                                 'MISSENARD',
+                                 'DIPPR_9G'),
+ 'thermo.unifac': ('UNIFAC_gammas',
+                   'UNIFAC',
+                   'UNIFAC_psi',
+                   'DOUFMG',
+                   'DOUFSG',
+                   'UFSG',
+                   'UFMG',
+                   'DDBST_UNIFAC_assignments',
+                   'DDBST_MODIFIED_UNIFAC_assignments',
+                   'DDBST_PSRK_assignments',
+                   'UNIFAC_RQ',
+                   'Van_der_Waals_volume',
+                   'Van_der_Waals_area',
+                   'load_group_assignments_DDBST',
+                   'PSRKSG',
+                   'LLEUFSG',
+                   'LLEMG',
+                   'LUFSG',
+                   'NISTUFSG',
+                   'NISTUFMG',
+                   'VTPRSG',
+                   'VTPRMG',
+                   'NISTKTUFSG',
+                   'NISTKTUFMG',
+                   'LUFMG',
+                   'PSRKMG',
+                   'unifac_gammas_at_T',
+                   'unifac_ip_to_array',
+                   'load_unifac_ip_arrays',
+                   'compile_unifac_ip'),
+ 'thermo.utils': ('has_matplotlib',
+                  'Stateva_Tsvetkov_TPDF',
+                  'TPD',
+                  'assert_component_balance',
+                  'assert_energy_balance',
+                  'allclose_variable',
+                  'identify_phase',
+                  'phase_select_property',
+                  'MultiCheb1D',
+                  'PiecewiseChebyshev',
+                  'chebyshev_nodes_fit',
+                  'TDependentProperty',
+                  'PROPERTY_TRANSFORM_LN',
+                  'PROPERTY_TRANSFORM_DLN',
+                  'PROPERTY_TRANSFORM_D2LN',
+                  'PROPERTY_TRANSFORM_D_X',
+                  'PROPERTY_TRANSFORM_D2_X',
+                  'TPDependentProperty',
+                  'MixtureProperty',
+                  'Antoine_vectorized',
+                  'TRC_Antoine_extended_vectorized',
+                  'Wagner_vectorized',
+                  'Wagner_original_vectorized',
+                  'EQ101_vectorized',
+                  'EQ105_vectorized',
+                  'EQ106_vectorized',
+                  'EQ107_vectorized',
+                  'TRCCp_vectorized',
+                  'trunc_exp_vectorized',
+                  'vectorized_correlation_functions',
+                  'TemperatureCache',
+                  'NEGLIGIBLE',
+                  'LINEAR',
+                  'POLY_FIT',
+                  'EXP_POLY_FIT',
+                  'POLY_FIT_LN_TAU',
+                  'EXP_POLY_FIT_LN_TAU',
+                  'STABLEPOLY_FIT',
+                  'EXP_STABLEPOLY_FIT',
+                  'STABLEPOLY_FIT_LN_TAU',
+                  'EXP_STABLEPOLY_FIT_LN_TAU',
+                  'CHEB_FIT',
+                  'EXP_CHEB_FIT',
+                  'CHEB_FIT_LN_TAU',
+                  'EXP_CHEB_FIT_LN_TAU',
+                  'DIPPR_PERRY_8E',
+                  'VDI_TABULAR',
+                  'VDI_PPDS',
+                  'COOLPROP',
+                  'IAPWS'),
+ 'thermo.vapor_pressure': ('vapor_pressure_methods',
+                           'VaporPressure',
+                           'SublimationPressure',
+                           'sublimation_pressure_methods'),
+ 'thermo.viscosity': ('viscosity_liquid_methods',
+                      'viscosity_liquid_methods_P',
+                      'ViscosityLiquid',
+                      'ViscosityGas',
+                      'viscosity_gas_methods',
+                      'viscosity_gas_methods_P',
+                      'ViscosityLiquidMixture',
+                      'ViscosityGasMixture',
+                      'viscosity_liquid_mixture_methods',
+                      'viscosity_gas_mixture_methods',
+                      'MIXING_LOG_MOLAR',
+                      'MIXING_LOG_MASS',
+                      'BROKAW',
+                      'HERNING_ZIPPERER',
+                      'WILKE',
+                      'DUTT_PRASAD',
+                      'VISWANATH_NATARAJAN_3',
+                      'VISWANATH_NATARAJAN_2',
+                      'VISWANATH_NATARAJAN_2E',
+                      'LETSOU_STIEL',
+                      'PRZEDZIECKI_SRIDHAR',
+                      'LUCAS',
+                      'GHARAGHEIZI',
+                      'YOON_THODOS',
+                      'STIEL_THODOS',
+                      'LUCAS_GAS'),
+ 'thermo.volume': ('volume_liquid_methods',
+                   'volume_liquid_methods_P',
+                   'VolumeLiquid',
+                   'VolumeSupercriticalLiquid',
+                   'volume_gas_methods',
+                   'VolumeGas',
+                   'volume_gas_mixture_methods',
+                   'volume_solid_mixture_methods',
+                   'volume_solid_methods',
+                   'VolumeSolid',
+                   'VolumeLiquidMixture',
+                   'VolumeGasMixture',
+                   'VolumeSolidMixture',
+                   'Tait_parameters_COSTALD'),
+ 'thermo.chemical_utils': ('standard_entropy', 'S0_basis_converter'),
+ 'thermo.wilson': ('Wilson',
+                   'Wilson_gammas',
+                   'wilson_gammas_binaries',
+                   'wilson_gammas_binaries_jac'),
+ 'thermo.nrtl': ('NRTL',
+                 'NRTL_gammas',
+                 'NRTL_gammas_binaries',
+                 'NRTL_gammas_binaries_jac'),
+ 'thermo.uniquac': ('UNIQUAC',
+                    'UNIQUAC_gammas',
+                    'UNIQUAC_gammas_binary',
+                    'UNIQUAC_gammas_binaries'),
+ 'thermo.equilibrium': ('EquilibriumState',
+                        'PHASE_GAS',
+                        'PHASE_LIQUID0',
+                        'PHASE_LIQUID1',
+                        'PHASE_LIQUID2',
+                        'PHASE_LIQUID3',
+                        'PHASE_BULK_LIQUID',
+                        'PHASE_WATER_LIQUID',
+                        'PHASE_LIGHTEST_LIQUID',
+                        'PHASE_HEAVIEST_LIQUID',
+                        'PHASE_SOLID0',
+                        'PHASE_SOLID1',
+                        'PHASE_SOLID2',
+                        'PHASE_SOLID3',
+                        'PHASE_BULK_SOLID',
+                        'PHASE_BULK',
+                        'PHASE_REFERENCES'),
+ 'thermo.activity': ('GibbsExcess', 'IdealSolution'),
+ 'thermo.fitting': ('alpha_Twu91_objf',
+                    'alpha_Twu91_objfc',
+                    'fit_function',
+                    'Twu91_check_params',
+                    'postproc_lmfit',
+                    'alpha_poly_objf',
+                    'alpha_poly_objfc',
+                    'poly_check_params',
+                    'fit_polynomial',
+                    'poly_fit_statistics',
+                    'fit_cheb_poly_auto',
+                    'data_fit_statistics',
+                    'fit_customized'),
+ 'thermo.functional_groups': ('is_mercaptan',
+                              'is_sulfide',
+                              'is_disulfide',
+                              'is_sulfoxide',
+                              'is_sulfone',
+                              'is_sulfinic_acid',
+                              'is_sulfonic_acid',
+                              'is_sulfonate_ester',
+                              'is_thiocyanate',
+                              'is_isothiocyanate',
+                              'is_thioketone',
+                              'is_thial',
+                              'is_carbothioic_s_acid',
+                              'is_carbothioic_o_acid',
+                              'is_thiolester',
+                              'is_thionoester',
+                              'is_carbodithioic_acid',
+                              'is_carbodithio',
+                              'is_siloxane',
+                              'is_branched_alkane',
+                              'is_alkane',
+                              'is_cycloalkane',
+                              'is_alkene',
+                              'is_alkyne',
+                              'is_aromatic',
+                              'is_nitrile',
+                              'is_carboxylic_acid',
+                              'is_haloalkane',
+                              'is_fluoroalkane',
+                              'is_chloroalkane',
+                              'is_bromoalkane',
+                              'is_iodoalkane',
+                              'is_amine',
+                              'is_primary_amine',
+                              'is_secondary_amine',
+                              'is_tertiary_amine',
+                              'is_quat',
+                              'is_amide',
+                              'is_nitro',
+                              'is_amidine',
+                              'is_imine',
+                              'is_primary_ketimine',
+                              'is_secondary_ketimine',
+                              'is_primary_aldimine',
+                              'is_secondary_aldimine',
+                              'is_imide',
+                              'is_azide',
+                              'is_azo',
+                              'is_cyanate',
+                              'is_isocyanate',
+                              'is_nitrate',
+                              'is_isonitrile',
+                              'is_nitrite',
+                              'is_nitroso',
+                              'is_oxime',
+                              'is_pyridyl',
+                              'is_carbamate',
+                              'is_acyl_halide',
+                              'is_alcohol',
+                              'is_polyol',
+                              'is_acid',
+                              'is_ketone',
+                              'is_aldehyde',
+                              'is_anhydride',
+                              'is_ether',
+                              'is_phenol',
+                              'is_carbonate',
+                              'is_carboxylate',
+                              'is_hydroperoxide',
+                              'is_peroxide',
+                              'is_orthoester',
+                              'is_methylenedioxy',
+                              'is_orthocarbonate_ester',
+                              'is_carboxylic_anhydride',
+                              'is_ester',
+                              'is_boronic_acid',
+                              'is_boronic_ester',
+                              'is_borinic_acid',
+                              'is_borinic_ester',
+                              'is_phosphine',
+                              'is_phosphonic_acid',
+                              'is_phosphodiester',
+                              'is_phosphate',
+                              'is_alkyllithium',
+                              'is_alkylmagnesium_halide',
+                              'is_alkylaluminium',
+                              'is_silyl_ether',
+                              'is_organic',
+                              'is_inorganic',
+                              'count_ring_ring_attatchments',
+                              'count_rings_attatched_to_rings',
+                              'BVirial_Tsonopoulos_extended_ab')}
+
+if __name__ == '__main__':
+    import pprint
+    import thermo
+    lazy_names = thermo._lazy_names_from_modules()
+    with open(__file__) as f:
+        src = f.read()
+    start = src.index('lazy_names = {')
+    end = src.index("\n\nif __name__ == '__main__':")
+    body = pprint.pformat(lazy_names, width=79, sort_dicts=False)
+    with open(__file__, 'w') as f:
+        f.write(src[:start] + 'lazy_names = ' + body + src[end:])
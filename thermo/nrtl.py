@@ -33,7 +33,7 @@ NRTL Class
 ==========
 
 .. autoclass:: NRTL
-    :members: to_T_xs, GE, dGE_dT, d2GE_dT2, d2GE_dTdxs, dGE_dxs, d2GE_dxixjs, taus, dtaus_dT, d2taus_dT2, d3taus_dT3, alphas, Gs, dGs_dT, d2Gs_dT2, d3Gs_dT3
+    :members: to_T_xs, GE, dGE_dT, d2GE_dT2, d2GE_dTdxs, dGE_dxs, d2GE_dxixjs, taus, dtaus_dT, d2taus_dT2, d3taus_dT3, alphas, Gs, dGs_dT, d2Gs_dT2, d3Gs_dT3, GE_batch, dGE_dxs_batch, d2GE_dxixjs_batch, gammas_batch
     :undoc-members:
     :show-inheritance:
     :exclude-members: gammas
@@ -442,6 +442,47 @@ def nrtl_d2GE_dTdxs(N, T, xs, taus, dtaus_dT, Gs, dGs_dT, xj_Gs_taus_jis,
         d2GE_dTdxs[i] = -R*(T*tot1 - others)
     return d2GE_dTdxs
 
+def nrtl_xj_Gs_jis_inv_batch(xs, Gs, taus):
+    # The `xj_Gs_jis_inv` and `xj_Gs_taus_jis` sums for each row of an (M, N)
+    # array of compositions
+    return 1.0/np.dot(xs, Gs), np.dot(xs, Gs*taus)
+
+def nrtl_GE_batch(T, xs, taus, Gs):
+    xj_Gs_jis_inv, xj_Gs_taus_jis = nrtl_xj_Gs_jis_inv_batch(xs, Gs, taus)
+    return R*T*(xs*xj_Gs_taus_jis*xj_Gs_jis_inv).sum(axis=1)
+
+def nrtl_lngammas_batch(xs, taus, Gs):
+    xj_Gs_jis_inv, xj_Gs_taus_jis = nrtl_xj_Gs_jis_inv_batch(xs, Gs, taus)
+    vec0 = xs*xj_Gs_jis_inv
+    vec1 = xj_Gs_taus_jis*xj_Gs_jis_inv
+    return vec1 + np.dot(vec0, (Gs*taus).T) - np.dot(vec0*vec1, Gs.T)
+
+def nrtl_dGE_dxs_batch(T, xs, taus, Gs):
+    return R*T*nrtl_lngammas_batch(xs, taus, Gs)
+
+def nrtl_gammas_batch(xs, taus, Gs):
+    return np.exp(nrtl_lngammas_batch(xs, taus, Gs))
+
+def nrtl_d2GE_dxixjs_batch(T, xs, taus, Gs):
+    M, N = xs.shape
+    xj_Gs_jis_inv, xj_Gs_taus_jis = nrtl_xj_Gs_jis_inv_batch(xs, Gs, taus)
+    Gs_taus = Gs*taus
+    Gs_taus_T, Gs_T = Gs_taus.T.copy(), Gs.T.copy()
+    inv2 = xj_Gs_jis_inv*xj_Gs_jis_inv
+    large = xj_Gs_taus_jis*inv2
+    threes = 2.0*xs*large*xj_Gs_jis_inv
+    sixes = xs*inv2
+    RT = R*T
+    d2GE_dxixjs = np.zeros((M, N, N))
+    for i in range(N):
+        Gsi, Gs_tausi = Gs[i], Gs_taus[i]
+        tot = (Gs_tausi*xj_Gs_jis_inv + Gs_taus_T[i]*xj_Gs_jis_inv[:, i:i+1]
+               - Gsi*large - Gs_T[i]*large[:, i:i+1]
+               + np.dot(threes*Gsi, Gs_T)
+               - np.dot(sixes*Gsi, Gs_taus_T) - np.dot(sixes*Gs_tausi, Gs_T))
+        d2GE_dxixjs[:, i, :] = RT*tot
+    return d2GE_dxixjs
+
 class NRTL(GibbsExcess):
     r'''Class for representing an a liquid with excess gibbs energy represented
     by the NRTL equation. This model is capable of representing VL and LL
@@ -492,6 +533,10 @@ class NRTL(GibbsExcess):
         `c` parameters used in calculating :obj:`NRTL.alphas`, [-]
     alpha_ds : list[list[float]], optional
         `d` paraemeters used in calculating :obj:`NRTL.alphas`, [1/K]
+    T_cache_size : int, optional
+        Number of temperatures whose `tau`, `alpha` and `G` terms are kept
+        for reuse by the models created with :obj:`NRTL.to_T_xs`; 0 to
+        disable, [-]
 
     Attributes
     ----------
@@ -545,12 +590,14 @@ class NRTL(GibbsExcess):
     
     _model_attributes = ('tau_as', 'tau_bs', 'tau_es', 'tau_fs',
                          'tau_gs', 'tau_hs', 'alpha_cs', 'alpha_ds')
+    _T_only_attributes = ('_taus', '_dtaus_dT', '_d2taus_dT2', '_d3taus_dT3',
+                          '_alphas', '_Gs', '_dGs_dT', '_d2Gs_dT2', '_d3Gs_dT3')
     model_id = 100
     
     def __init__(self, T, xs, tau_coeffs=None, alpha_coeffs=None,
                  ABEFGHCD=None, tau_as=None, tau_bs=None, tau_es=None,
                  tau_fs=None, tau_gs=None, tau_hs=None, alpha_cs=None, 
-                 alpha_ds=None):
+                 alpha_ds=None, T_cache_size=16):
         self.T = T
         self.xs = xs
         self.scalar = scalar = type(xs) is list
@@ -669,6 +716,7 @@ class NRTL(GibbsExcess):
                 if r[j] != 0.0:
                     alpha_temperature_independent = False
         self.alpha_temperature_independent = alpha_temperature_independent
+        self._set_T_cache(T_cache_size)
 
 
     @property
@@ -720,6 +768,8 @@ class NRTL(GibbsExcess):
         If the new temperature is the same temperature as the existing
         temperature, if the `tau`, `Gs`, or `alphas` terms or their derivatives
         have been calculated, they will be set to the new object as well.
+        The same is done for any temperature in :obj:`T_cache <thermo.activity.GibbsExcess.T_cache>`,
+        using the last model created there.
         '''
         new = self.__class__.__new__(self.__class__)
         (new.T, new.xs, new.N, new.scalar) = T, xs, self.N, self.scalar
@@ -730,43 +780,7 @@ class NRTL(GibbsExcess):
                          self.tau_fs, self.tau_gs, self.tau_hs,
                          self.alpha_cs, self.alpha_ds, self.tau_coeffs_nonzero, self.alpha_temperature_independent)
 
-        if T == self.T:
-            try:
-                new._taus = self._taus
-            except AttributeError:
-                pass
-            try:
-                new._dtaus_dT = self._dtaus_dT
-            except AttributeError:
-                pass
-            try:
-                new._d2taus_dT2 = self._d2taus_dT2
-            except AttributeError:
-                pass
-            try:
-                new._d3taus_dT3 = self._d3taus_dT3
-            except AttributeError:
-                pass
-            try:
-                new._alphas = self._alphas
-            except AttributeError:
-                pass
-            try:
-                new._Gs = self._Gs
-            except AttributeError:
-                pass
-            try:
-                new._dGs_dT = self._dGs_dT
-            except AttributeError:
-                pass
-            try:
-                new._d2Gs_dT2 = self._d2Gs_dT2
-            except AttributeError:
-                pass
-            try:
-                new._d3Gs_dT3 = self._d3Gs_dT3
-            except AttributeError:
-                pass
+        self._transfer_T_only(new)
 
         try:
             new._zero_coeffs = self.zero_coeffs
@@ -1620,6 +1634,97 @@ class NRTL(GibbsExcess):
         return d2GE_dTdxs
 
 
+    def _batch_terms(self, T):
+        return self._batch_T_terms(T, 'taus', 'Gs')
+
+    def GE_batch(self, T, xs_matrix):
+        r'''Calculate and return the excess Gibbs energy of many liquid
+        compositions at the temperature `T` with the NRTL model, evaluating
+        all of them together without creating a model object for each.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        GE : ndarray
+            Excess Gibbs energy of each composition, [J/mol]
+
+        Examples
+        --------
+        >>> GE = NRTL(T=300.0, xs=[.5, .5], tau_as=[[0, 1.2], [0.8, 0]], alpha_cs=[[0, .3], [.3, 0]])
+        >>> GE.GE_batch(300.0, [[.5, .5], [.2, .8]])
+        array([1054.33, 658.475])
+        '''
+        taus, Gs = self._batch_terms(T)
+        return nrtl_GE_batch(T, self._batch_xs(xs_matrix), taus, Gs)
+
+    def dGE_dxs_batch(self, T, xs_matrix):
+        r'''Calculate and return the mole fraction derivatives of excess Gibbs
+        energy of many liquid compositions at the temperature `T` with the
+        NRTL model. See :obj:`GE_batch`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        dGE_dxs : ndarray
+            Mole fraction derivatives of excess Gibbs energy, one row per
+            composition, [J/mol]
+        '''
+        taus, Gs = self._batch_terms(T)
+        return nrtl_dGE_dxs_batch(T, self._batch_xs(xs_matrix), taus, Gs)
+
+    def d2GE_dxixjs_batch(self, T, xs_matrix):
+        r'''Calculate and return the second mole fraction derivatives of excess
+        Gibbs energy of many liquid compositions at the temperature `T` with
+        the NRTL model. See :obj:`GE_batch`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        d2GE_dxixjs : ndarray
+            Second mole fraction derivatives of excess Gibbs energy, size
+            number of compositions x N x N, [J/mol]
+        '''
+        taus, Gs = self._batch_terms(T)
+        return nrtl_d2GE_dxixjs_batch(T, self._batch_xs(xs_matrix), taus, Gs)
+
+    def gammas_batch(self, T, xs_matrix):
+        r'''Calculate and return the activity coefficients of many liquid
+        compositions at the temperature `T` with the NRTL model. See
+        :obj:`GE_batch`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        gammas : ndarray
+            Activity coefficients, one row per composition, [-]
+        '''
+        taus, Gs = self._batch_terms(T)
+        return nrtl_gammas_batch(self._batch_xs(xs_matrix), taus, Gs)
+
     @classmethod
     def regress_binary_parameters(cls, gammas, xs, symmetric_alphas=False,
                                   use_numba=False,
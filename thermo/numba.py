@@ -51,7 +51,11 @@ replaced = fluids.numba.numerics_dict.copy()
 def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
     import chemicals.numba
 
-    cache_blacklist = set(['sequential_substitution_2P_functional',])
+    cache_blacklist = set(['sequential_substitution_2P_functional',
+                           'stability_iteration_Michelsen_functional',
+                           'bubble_P_functional', 'dew_P_functional',
+                           'nonlin_2P_newton_functional', 'bubble_T_functional',
+                           'dew_T_functional', 'flash_TP_functional'])
     __funcs.update(normal_fluids.numba.numbafied_fluids_functions.copy())
 
     blacklist = set(['identify_sort_phases', 'score_phases_S', 'score_phases_VL',
@@ -98,8 +102,27 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                     'TPV_double_solve_1P',
                     'TPV_solve_HSGUA_guesses_VL',
                     'cm_flash_tol',
+                    'cubic_Z_roots_batch',
+                    'cubic_lnphis_batch',
+                    'Rachford_Rice_batch',
+                    'stability_Michelsen_batch',
+                    'sequential_substitution_2P_batch',
+                    'phase_envelope_residuals',
+                    'phase_envelope_Michelsen',
+                    'kijs_reduction',
+                    'sequential_substitution_2P_reduced',
+                    'kijs_sparse_structure',
+                    '_as_float_arrays', 'volume_solution_polish_vectorized',
+                    'high_alpha_one_root_vectorized',
+                    'volume_solutions_halley_vectorized',
                     'chemgroups_to_matrix',
-                    'load_unifac_ip',
+                    'load_unifac_ip', 'unifac_ip_to_array',
+                    'compile_unifac_ip', 'load_unifac_ip_arrays', '_unifac_ip_arrays',
+                    'unifac_psi_pairs', 'unifac_psis_sparse',
+                    'unifac_Theta_Psi_sums_sparse',
+                    'unifac_lnGammas_subgroups_sparse', 'unifac_pure_pairs',
+                    'unifac_lnGammas_subgroups_pure_sparse',
+                    'unifac_Xs_sparse', 'unifac_lngammas_r_sparse',
                     'FlashPureVLS',
                     ] + chemicals.numba.numba_blacklisted)
 
@@ -291,6 +314,17 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
 
              'phases.phase_utils.lnphis_direct',
              'flash.flash_utils.sequential_substitution_2P_functional',
+             'flash.flash_utils.stability_iteration_Michelsen_functional',
+             'flash.flash_utils.bubble_P_functional',
+             'flash.flash_utils.dew_P_functional',
+             'flash.flash_utils.nonlin_2P_newton_functional_err',
+             'flash.flash_utils.nonlin_2P_newton_functional',
+             'flash.flash_utils.lnphis_args_Soave_at_TP',
+             'flash.flash_utils.bubble_dew_T_functional_S',
+             'flash.flash_utils.bubble_dew_T_functional',
+             'flash.flash_utils.bubble_T_functional',
+             'flash.flash_utils.dew_T_functional',
+             'flash.flash_utils.flash_TP_functional',
              
              'fitting.data_fit_statistics',
 
@@ -79,6 +79,7 @@ from thermo.vapor_pressure import VaporPressure
 from thermo.heat_capacity import HeatCapacityGas, HeatCapacitySolid
 from thermo.utils import TDependentProperty
 from thermo.utils import COOLPROP, VDI_TABULAR, DIPPR_PERRY_8E, VDI_PPDS, POLY_FIT
+from thermo.utils.vectorized_correlations import EQ106_vectorized
 from thermo.coolprop import has_CoolProp, PropsSI, coolprop_dict, coolprop_fluids, CoolProp_failing_PT_flashes
 
 
@@ -462,6 +463,28 @@ class EnthalpyVaporization(TDependentProperty):
             Hvap = Watson(T, Hvap, Tref, self.Tc, self.Watson_exponent)
         return Hvap
 
+
+    def calculate_vectorized(self, Ts, method):
+        r'''Method to calculate heat of vaporization of a fluid at an array of temperatures with a given
+        method; the DIPPR method is are evaluated with NumPy and other methods are handled by
+        :obj:`thermo.utils.TDependentProperty.calculate_vectorized`.
+
+        Parameters
+        ----------
+        Ts : ndarray
+            Temperatures at which to calculate the property, [K]
+        method : str
+            Name of the method to use
+
+        Returns
+        -------
+        Hvaps : ndarray
+            Heats of vaporization of the liquid at Ts, [J/mol]
+        '''
+        if method == DIPPR_PERRY_8E:
+            return EQ106_vectorized(Ts, *self.Perrys2_150_coeffs)
+        return super(EnthalpyVaporization, self).calculate_vectorized(Ts, method)
+
     def test_method_validity(self, T, method):
         r'''Method to check the validity of a method. For CSP methods, the
         models are considered valid from 0 K to the critical point. For
@@ -57,7 +57,7 @@ Gas Phases
 ----------
 .. autoclass:: CEOSGas
    :show-inheritance:
-   :members: to_TP_zs, V_iter, H, S, Cp, Cv, dP_dT, dP_dV,
+   :members: to_TP_zs, V_iter, Ar_derivatives, H, S, Cp, Cv, dP_dT, dP_dV,
              d2P_dT2, d2P_dV2, d2P_dTdV,
              dS_dT_V,
              lnphis, dlnphis_dT, dlnphis_dP, __repr__
@@ -74,7 +74,7 @@ Activity Based Liquids
 ======================
 .. autoclass:: GibbsExcessLiquid
    :show-inheritance:
-   :members: __init__, H, S, Cp, gammas, Poyntings, phis_sat
+   :members: __init__, H, S, Cp, gammas, Poyntings, phis_sat, Psats_at_Ts, dPsats_dT_at_Ts, d2Psats_dT2_at_Ts, Vms_sat_at_Ts, Hvaps_at_Ts
    :exclude-members: __init__
 
 
@@ -85,7 +85,7 @@ of state.
 
 .. autoclass:: HelmholtzEOS
    :show-inheritance:
-   :members: to_TP_zs, V_iter, H, S, Cp, Cv, dP_dT, dP_dV,
+   :members: to_TP_zs, V_iter, Ar_derivatives, H, S, Cp, Cv, dP_dT, dP_dV,
              d2P_dT2, d2P_dV2, d2P_dTdV, dH_dP, dS_dP,
              lnphis, __repr__
    :exclude-members: dH_dP_V, dH_dT_V, dH_dV_P, dH_dV_T, dS_dP_V, dS_dT, dS_dT_V, dlnphis_dP, dlnphis_dT
@@ -96,7 +96,7 @@ respectively.
 
 .. autoclass:: IAPWS95
    :show-inheritance:
-   :members: T_MAX_FIXED, T_MIN_FIXED, mu, k
+   :members: T_MAX_FIXED, T_MIN_FIXED, mu, k, to_TP_zs, rho_table
 
 .. autoclass:: IAPWS95Gas
    :show-inheritance:
@@ -106,6 +106,12 @@ respectively.
    :show-inheritance:
    :members: force_phase
 
+The density of IAPWS-95 phases at a specified temperature and pressure can be
+seeded from a precomputed table.
+
+.. autoclass:: IAPWS95DensityTable
+   :members: rho
+
 
 `DryAirLemmon` is an implementation of thermophysical properties of air by
 Lemmon (2000).
@@ -24,14 +24,16 @@ SOFTWARE.
 __all__ = ['GibbsExcessLiquid', 'GibbsExcessSolid']
 
 from math import isinf, isnan
+from collections import OrderedDict
 from fluids.constants import R, R_inv
 from fluids.numerics import (horner_and_der2, derivative,
                              evaluate_linear_fits, evaluate_linear_fits_d,
                              evaluate_linear_fits_d2,
                              trunc_exp, secant)
+from fluids.numerics import numpy as np
 from chemicals.utils import log, exp, phase_identification_parameter
 from thermo.activity import IdealSolution
-from thermo.utils import POLY_FIT, PROPERTY_TRANSFORM_LN, PROPERTY_TRANSFORM_DLN, PROPERTY_TRANSFORM_D2LN, PROPERTY_TRANSFORM_D_X, PROPERTY_TRANSFORM_D2_X
+from thermo.utils import POLY_FIT, EXP_POLY_FIT, POLY_FIT_LN_TAU, EXP_POLY_FIT_LN_TAU, PROPERTY_TRANSFORM_LN, PROPERTY_TRANSFORM_DLN, PROPERTY_TRANSFORM_D2LN, PROPERTY_TRANSFORM_D_X, PROPERTY_TRANSFORM_D2_X
 from thermo.heat_capacity import HeatCapacityGas, HeatCapacityLiquid
 from thermo.volume import VolumeLiquid, VolumeSolid
 from thermo.vapor_pressure import VaporPressure, SublimationPressure
@@ -39,6 +41,125 @@ from thermo.phase_change import EnthalpyVaporization, EnthalpySublimation
 
 from thermo.phases.phase import Phase
 
+def _pad_coeffs(coeffs):
+    # Polynomials of different degree, highest power first, padded with
+    # leading zeros into one matrix
+    K = max(len(c) for c in coeffs)
+    mat = np.zeros((len(coeffs), K))
+    for i, c in enumerate(coeffs):
+        mat[i, K-len(c):] = c
+    return mat
+
+def _horner_rows(mat, x, order=0):
+    # Evaluate polynomial i, and up to two derivatives, at the values x[..., i]
+    f = x*0.0 + mat[:, 0]
+    if order == 0:
+        for k in range(1, mat.shape[1]):
+            f = f*x + mat[:, k]
+        return f
+    der = der2 = x*0.0
+    for k in range(1, mat.shape[1]):
+        der2 = der2*x + der
+        der = der*x + f
+        f = f*x + mat[:, k]
+    return f, der, der2 + der2
+
+_packed_fit_methods = {POLY_FIT: 'poly_fit', EXP_POLY_FIT: 'exp_poly_fit',
+                       POLY_FIT_LN_TAU: 'poly_fit_ln_tau',
+                       EXP_POLY_FIT_LN_TAU: 'exp_poly_fit_ln_tau'}
+
+class _PackedFits(object):
+    # The polynomial fits of one property of every component, padded into
+    # coefficient matrices
+    __slots__ = ('objs', 'exp', 'ln_tau', 'Tmins', 'Tmaxes', 'Tcs', 'coeffs')
+
+    @classmethod
+    def from_objs(cls, objs):
+        methods = tuple(obj.method for obj in objs)
+        method = methods[0]
+        if (method not in _packed_fit_methods or any(m != method for m in methods)
+                or any(obj._surrogate is not None for obj in objs)):
+            return None
+        prefix = _packed_fit_methods[method]
+        self = cls()
+        self.objs = objs
+        self.exp = method in (EXP_POLY_FIT, EXP_POLY_FIT_LN_TAU)
+        self.ln_tau = method in (POLY_FIT_LN_TAU, EXP_POLY_FIT_LN_TAU)
+        self.Tmins = np.array([getattr(obj, prefix + '_Tmin') for obj in objs])
+        self.Tmaxes = np.array([getattr(obj, prefix + '_Tmax') for obj in objs])
+        self.Tcs = np.array([getattr(obj, prefix + '_Tc') for obj in objs]) if self.ln_tau else None
+        self.coeffs = _pad_coeffs([getattr(obj, prefix + '_coeffs') for obj in objs])
+        return self
+
+    def __call__(self, Ts, order=0):
+        # Ts has shape (M, 1); the result has shape (M, N). Points outside
+        # the fits' ranges, which need each object's extrapolation, and any
+        # that fail are evaluated by the objects.
+        in_range = (Ts >= self.Tmins) & (Ts <= self.Tmaxes)
+        with np.errstate(all='ignore'):
+            if self.ln_tau:
+                tau = 1.0 - Ts/self.Tcs
+                in_range &= tau > 0.0
+                x = np.log(np.where(in_range, tau, 1.0))
+            else:
+                x = Ts
+            if order == 0:
+                f = _horner_rows(self.coeffs, x)
+                vals = np.exp(f) if self.exp else f
+            else:
+                f, df, d2f = _horner_rows(self.coeffs, x, order)
+                if self.ln_tau:
+                    # x = ln(1 - T/Tc), so dx/dT = 1/(T - Tc) and d2x/dT2 = -(dx/dT)^2
+                    dx = 1.0/(Ts - self.Tcs)
+                    df, d2f = df*dx, (d2f - df)*dx*dx
+                if order == 1:
+                    vals = np.exp(f)*df if self.exp else df
+                else:
+                    vals = np.exp(f)*(df*df + d2f) if self.exp else d2f
+        redo = ~(in_range & np.isfinite(vals))
+        if redo.any():
+            for i in np.nonzero(redo.any(axis=0))[0].tolist():
+                rows = redo[:, i]
+                Ts_i = Ts[rows, 0]
+                obj = self.objs[i]
+                vals[rows, i] = (obj.T_dependent_property(Ts_i) if order == 0
+                                 else obj.T_dependent_property_derivative(Ts_i, order))
+        return vals
+
+# The correlation lists and fit data are shared by all phases created from a
+# model; their packed forms are kept here rather than on the phases so that
+# phases still serialize to JSON
+_packed_fits = OrderedDict()
+_packed_fits_max = 64
+
+def _cached_pack(data, pack, tag=None):
+    key = (id(data), tag)
+    entry = _packed_fits.get(key)
+    if entry is None or entry[0] is not data:
+        entry = (data, pack(data))
+        _packed_fits[key] = entry
+        if len(_packed_fits) > _packed_fits_max:
+            _packed_fits.popitem(last=False)
+    return entry[1]
+
+def _packed_fits_of(objs):
+    # Repacked if a method is changed
+    return _cached_pack(objs, _PackedFits.from_objs, tuple(obj.method for obj in objs))
+
+def _pack_Vms_sat_data(Vms_sat_data):
+    return (np.array(Vms_sat_data[0]), np.array(Vms_sat_data[3]),
+            np.array(Vms_sat_data[4]), np.array(Vms_sat_data[5]),
+            _pad_coeffs(Vms_sat_data[6]), _pad_coeffs(Vms_sat_data[9]))
+
+def _Vms_sat_poly_fit_vectorized(Ts, packed):
+    Tmins, Tmaxes, Tmax_slopes, Tmax_values, coeffs, low = packed
+    Vms = _horner_rows(coeffs, Ts)
+    Vms = np.where(Ts < Tmins, _horner_rows(low, Ts), Vms)
+    return np.where(Ts > Tmaxes, (Ts - Tmaxes)*Tmax_slopes + Tmax_values, Vms)
+
+def _Ts_column(Ts):
+    return np.asarray(Ts, dtype=float).reshape(-1, 1)
+
 class GibbsExcessLiquid(Phase):
     r'''Phase based on combining Raoult's law with a
     :obj:`GibbsExcess <thermo.activity.GibbsExcess>` model, optionally
@@ -593,6 +714,42 @@ class GibbsExcessLiquid(Phase):
         VaporPressures = self.VaporPressures
         return [VaporPressures[i](T) for i in range(self.N)]
 
+    def Psats_at_Ts(self, Ts):
+        r'''Method to calculate the vapor pressures of all components at each
+        of the temperatures `Ts` at once.
+
+        When every vapor pressure uses the same kind of polynomial fit
+        ('POLY_FIT', 'EXP_POLY_FIT', 'POLY_FIT_LN_TAU' or
+        'EXP_POLY_FIT_LN_TAU'), their coefficients are padded into one matrix
+        and all of the components are evaluated in one NumPy pass; points
+        outside a fit's range are extrapolated by its
+        :obj:`VaporPressure <thermo.vapor_pressure.VaporPressure>` object as
+        usual. Otherwise each correlation is evaluated at all of the
+        temperatures together.
+
+        Parameters
+        ----------
+        Ts : list[float] or ndarray
+            Temperatures, [K]
+
+        Returns
+        -------
+        Psats : ndarray
+            Vapor pressures, shape (len(Ts), N) [Pa]
+        '''
+        return self._pures_at_Ts(self.VaporPressures, Ts)
+
+    @staticmethod
+    def _pures_at_Ts(objs, Ts, order=0):
+        Ts = _Ts_column(Ts)
+        packed = _packed_fits_of(objs)
+        if packed is not None:
+            return packed(Ts, order)
+        Ts = Ts[:, 0]
+        if order == 0:
+            return np.array([obj.T_dependent_property(Ts) for obj in objs]).T
+        return np.array([obj.T_dependent_property_derivative(Ts, order) for obj in objs]).T
+
     @staticmethod
     def _Psats_at_poly_fit(T, Psats_data, cmps):
         Psats = []
@@ -732,6 +889,20 @@ class GibbsExcessLiquid(Phase):
         return [VaporPressure.T_dependent_property_derivative(T=T)
                      for VaporPressure in self.VaporPressures]
 
+    def dPsats_dT_at_Ts(self, Ts):
+        r'''Method to calculate the first temperature derivatives of the vapor
+        pressures of all components at each of the temperatures `Ts`; the
+        result has shape (len(Ts), N) [Pa/K]. See :obj:`Psats_at_Ts`.
+        '''
+        return self._pures_at_Ts(self.VaporPressures, Ts, 1)
+
+    def d2Psats_dT2_at_Ts(self, Ts):
+        r'''Method to calculate the second temperature derivatives of the
+        vapor pressures of all components at each of the temperatures `Ts`;
+        the result has shape (len(Ts), N) [Pa/K^2]. See :obj:`Psats_at_Ts`.
+        '''
+        return self._pures_at_Ts(self.VaporPressures, Ts, 2)
+
     def dPsats_dT(self):
         try:
             return self._dPsats_dTT_dependent_property_derivative
@@ -978,6 +1149,35 @@ class GibbsExcessLiquid(Phase):
         VolumeLiquids = self.VolumeLiquids
         return [VolumeLiquids[i].T_dependent_property(T) for i in range(self.N)]
 
+    def Vms_sat_at_Ts(self, Ts):
+        r'''Method to calculate the saturation liquid molar volumes of all
+        components at each of the temperatures `Ts`; the result has shape
+        (len(Ts), N) [m^3/mol]. See :obj:`Psats_at_Ts`.
+        '''
+        if self.Vms_sat_poly_fit:
+            packed = _cached_pack(self._Vms_sat_data, _pack_Vms_sat_data)
+            return _Vms_sat_poly_fit_vectorized(_Ts_column(Ts), packed)
+        elif self.use_eos_volume:
+            Ts = _Ts_column(Ts)[:, 0]
+            eoss = self.eos_pure_instances
+            Psats = None
+            Vms = np.empty((len(Ts), self.N))
+            for j, T in enumerate(Ts):
+                T = float(T)
+                for i, e in enumerate(eoss):
+                    if T < e.Tc:
+                        Vms[j, i] = e.V_l_sat(T)
+                    else:
+                        if Psats is None:
+                            Psats = self.Psats_at_Ts(Ts)
+                        e = e.to(T=T, P=float(Psats[j, i]))
+                        try:
+                            Vms[j, i] = e.V_l
+                        except:
+                            Vms[j, i] = e.V_g
+            return Vms
+        return self._pures_at_Ts(self.VolumeLiquids, Ts)
+
     def Vms_sat(self):
         try:
             return self._Vms_sat
@@ -1151,6 +1351,17 @@ class GibbsExcessLiquid(Phase):
                 Hvaps[i] = 0.0
         return Hvaps
 
+    def Hvaps_at_Ts(self, Ts):
+        r'''Method to calculate the enthalpies of vaporization of all
+        components at each of the temperatures `Ts`; the result has shape
+        (len(Ts), N) [J/mol]. As in :obj:`Hvaps`, these are zero above the
+        critical point or where they cannot be calculated. See
+        :obj:`Psats_at_Ts`.
+        '''
+        Hvaps = self._pures_at_Ts(self.EnthalpyVaporizations, Ts)
+        Hvaps[np.isnan(Hvaps)] = 0.0
+        return Hvaps
+
     def dHvaps_dT(self):
         try:
             return self._dHvaps_dT
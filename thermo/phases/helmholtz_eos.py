@@ -30,6 +30,12 @@ class HelmholtzEOS(Phase):
 
     model_attributes = ('model_name',)
 
+    _Ar_derivatives_func = None
+    '''Optional function of (tau, delta) returning the residual Helmholtz
+    energy and all of its first and second derivatives in a single
+    evaluation; when set, :obj:`Ar_derivatives` uses it and the caloric
+    properties and pressure derivatives are calculated from it.'''
+
     def __repr__(self):
         r'''Method to create a string representation of the phase object, with
         the goal of making it easy to obtain standalone code which reproduces
@@ -61,6 +67,55 @@ class HelmholtzEOS(Phase):
     def V(self):
         return self._V
 
+    def Ar_derivatives(self):
+        r'''Method to calculate and cache the residual Helmholtz energy and
+        all of its first and second derivatives with respect to `tau` and
+        `delta`. The dimensionless Helmholtz energy derivatives used by the
+        caloric properties are all set from the result, so no further
+        evaluations of the equation of state are needed for
+        :obj:`H <thermo.phases.Phase.H>`, :obj:`S <thermo.phases.Phase.S>`,
+        :obj:`Cp <thermo.phases.Phase.Cp>`, the speed of sound, or the first
+        derivatives of pressure.
+
+        If the model has a fused function for these derivatives they are all
+        calculated together by it; otherwise the individual derivative
+        functions are called once each.
+
+        Returns
+        -------
+        derivatives : tuple(float, 6)
+            Ar, dAr_ddelta, d2Ar_ddelta2, dAr_dtau, d2Ar_dtau2 and
+            d2Ar_ddeltadtau, [-]
+
+        Examples
+        --------
+        >>> from thermo import IAPWS95
+        >>> IAPWS95(T=300.0, P=1e5, zs=[1.0]).Ar_derivatives()
+        (-9.573378, -0.322878, 1.783776, -7.702827, -1.269926, -0.198559)
+        '''
+        try:
+            return self._Ar_derivatives
+        except:
+            pass
+        tau, delta = self.tau, self.delta
+        func = self._Ar_derivatives_func
+        if func is not None:
+            ders = func(tau, delta)
+        else:
+            ders = (self._Ar_func(tau, delta), self._dAr_ddelta_func(tau, delta),
+                    self._d2Ar_ddelta2_func(tau, delta), self._dAr_dtau_func(tau, delta),
+                    self._d2Ar_dtau2_func(tau, delta), self._d2Ar_ddeltadtau_func(tau, delta))
+        Ar, dAr_ddelta, d2Ar_ddelta2, dAr_dtau, d2Ar_dtau2, d2Ar_ddeltadtau = ders
+        delta_inv = 1.0/delta
+        self._A = self.A0 + Ar
+        self._dA_ddelta = dAr_ddelta + delta_inv
+        self._d2A_ddelta2 = d2Ar_ddelta2 - delta_inv*delta_inv
+        self._dA_dtau = dAr_dtau + self.dA0_dtau
+        self._d2A_dtau2 = d2Ar_dtau2 + self.d2A0_dtau2
+        self._d2A_ddeltadtau = d2Ar_ddeltadtau
+        self._Ar_derivatives = ders
+        return ders
+
     def A(self):
         try:
             return self._A
@@ -231,6 +286,8 @@ class HelmholtzEOS(Phase):
             return self._S
         except:
             pass
+        if self._Ar_derivatives_func is not None:
+            self.Ar_derivatives()
         try:
             dA_dtau = self._dA_dtau
         except:
@@ -252,6 +309,8 @@ class HelmholtzEOS(Phase):
             return self._dS_dT_V
         except:
             pass
+        if self._Ar_derivatives_func is not None:
+            self.Ar_derivatives()
         try:
             d2A_dtau2 = self._d2A_dtau2
         except:
@@ -266,6 +325,8 @@ class HelmholtzEOS(Phase):
             return self._dS_dV_T
         except:
             pass
+        if self._Ar_derivatives_func is not None:
+            self.Ar_derivatives()
         try:
             dA_ddelta = self._dA_ddelta
         except:
@@ -304,6 +365,8 @@ class HelmholtzEOS(Phase):
             return self._H
         except:
             pass
+        if self._Ar_derivatives_func is not None:
+            self.Ar_derivatives()
         try:
             dA_dtau = self._dA_dtau
         except:
@@ -334,6 +397,8 @@ class HelmholtzEOS(Phase):
             return self._dH_dT_V
         except:
             pass
+        if self._Ar_derivatives_func is not None:
+            self.Ar_derivatives()
         try:
             dA_dtau = self._dA_dtau
         except:
@@ -363,6 +428,8 @@ class HelmholtzEOS(Phase):
             return self._dH_dV_T
         except:
             pass
+        if self._Ar_derivatives_func is not None:
+            self.Ar_derivatives()
         try:
             dA_ddelta = self._dA_ddelta
         except:
@@ -399,6 +466,8 @@ class HelmholtzEOS(Phase):
             return self._Cv
         except:
             pass
+        if self._Ar_derivatives_func is not None:
+            self.Ar_derivatives()
         try:
             d2A_dtau2 = self._d2A_dtau2
         except:
@@ -412,6 +481,8 @@ class HelmholtzEOS(Phase):
             return self._Cp
         except:
             pass
+        if self._Ar_derivatives_func is not None:
+            self.Ar_derivatives()
         tau, delta = self.tau, self.delta
         try:
             d2A_dtau2 = self._d2A_dtau2
@@ -443,6 +514,8 @@ class HelmholtzEOS(Phase):
             return self._dP_dT
         except:
             pass
+        if self._Ar_derivatives_func is not None:
+            self.Ar_derivatives()
         try:
             dA_ddelta = self._dA_ddelta
         except:
@@ -459,6 +532,8 @@ class HelmholtzEOS(Phase):
             return self._dP_dV
         except:
             pass
+        if self._Ar_derivatives_func is not None:
+            self.Ar_derivatives()
         try:
             dA_ddelta = self._dA_ddelta
         except:
@@ -21,15 +21,334 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 '''
 
-__all__ = ['IAPWS95', 'IAPWS95Gas', 'IAPWS95Liquid', 'IAPWS97']
+__all__ = ['IAPWS95', 'IAPWS95Gas', 'IAPWS95Liquid', 'IAPWS97', 'IAPWS95DensityTable']
 
+from math import exp, log, sqrt
+from fluids.numerics import numpy as np
 from chemicals import iapws
 from chemicals.viscosity import mu_IAPWS
 from chemicals.thermal_conductivity import k_IAPWS
 from .helmholtz_eos import HelmholtzEOS
-from chemicals.utils import rho_to_Vm, Vm_to_rho
+from chemicals.utils import rho_to_Vm, Vm_to_rho, hash_any_primitive
 from .phase import Phase
 
+# Polynomial and exponential terms 1-51 of the IAPWS-95 residual Helmholtz
+# energy, n*delta^d*tau^t*exp(-delta^c); c = 0 for the polynomial terms.
+iapws95_Ar_ns = np.array([0.012533547935523, 7.8957634722828, -8.7803203303561, 0.31802509345418,
+    -0.26145533859358, -0.0078199751687981, 0.0088089493102134, -0.66856572307965, 0.20433810950965,
+    -6.6212605039687e-05, -0.19232721156002, -0.25709043003438, 0.16074868486251, -0.040092828925807,
+    3.9343422603254e-07, -7.5941377088144e-06, 0.00056250979351888, -1.5608652257135e-05,
+    1.1537996422951e-09, 3.6582165144204e-07, -1.3251180074668e-12, -6.2639586912454e-10,
+    -0.10793600908932, 0.017611491008752, 0.22132295167546, -0.40247669763528, 0.58083399985759,
+    0.0049969146990806, -0.031358700712549, -0.74315929710341, 0.4780732991548, 0.020527940895948,
+    -0.13636435110343, 0.014180634400617, 0.0083326504880713, -0.029052336009585, 0.038615085574206,
+    -0.020393486513704, -0.0016554050063734, 0.0019955571979541, 0.00015870308324157,
+    -1.638856834253e-05, 0.043613615723811, 0.034994005463765, -0.076788197844621, 0.022446277332006,
+    -6.2689710414685e-05, -5.5711118565645e-10, -0.19905718354408, 0.31777497330738, -0.11841182425981])
+iapws95_Ar_ds = np.array([1.0, 1.0, 1.0, 2.0, 2.0, 3.0, 4.0, 1.0, 1.0, 1.0, 2.0, 2.0, 3.0, 4.0, 4.0, 5.0,
+    7.0, 9.0, 10.0, 11.0, 13.0, 15.0, 1.0, 2.0, 2.0, 2.0, 3.0, 4.0, 4.0, 4.0, 5.0, 6.0, 6.0, 7.0, 9.0, 9.0,
+    9.0, 9.0, 9.0, 10.0, 10.0, 12.0, 3.0, 4.0, 4.0, 5.0, 14.0, 3.0, 6.0, 6.0, 6.0])
+iapws95_Ar_ts = np.array([-0.5, 0.875, 1.0, 0.5, 0.75, 0.375, 1.0, 4.0, 6.0, 12.0, 1.0, 5.0, 4.0, 2.0,
+    13.0, 9.0, 3.0, 4.0, 11.0, 4.0, 13.0, 1.0, 7.0, 1.0, 9.0, 10.0, 10.0, 3.0, 7.0, 10.0, 10.0, 6.0, 10.0,
+    10.0, 1.0, 2.0, 3.0, 4.0, 8.0, 6.0, 9.0, 8.0, 16.0, 22.0, 23.0, 23.0, 10.0, 50.0, 44.0, 46.0, 50.0])
+iapws95_Ar_cs = np.array([0.0]*7 + [1.0]*15 + [2.0]*20 + [3.0]*4 + [4.0] + [6.0]*4)
+iapws95_Ar_ts_tm1 = iapws95_Ar_ts*(iapws95_Ar_ts - 1.0)
+# Powers of delta are looked up from delta**_iapws95_Ar_powers by index; the
+# polynomial terms are multiplied by e so exp(-delta^0) cancels out
+_iapws95_Ar_powers = np.arange(16.0)
+_iapws95_Ar_d_idx = iapws95_Ar_ds.astype(int)
+_iapws95_Ar_c_idx = iapws95_Ar_cs.astype(int)
+_iapws95_Ar_ds_m1 = iapws95_Ar_ds - 1.0
+_iapws95_Ar_ns_scaled = iapws95_Ar_ns*np.where(iapws95_Ar_cs == 0.0, exp(1.0), 1.0)
+
+
+def iapws95_Ar_derivatives(tau, delta):
+    r'''Calculates the residual Helmholtz energy of water according to the
+    IAPWS-95 formulation and all of its first and second derivatives in a
+    single evaluation. The terms shared by the derivatives (the powers of
+    `tau` and `delta` and the exponentials) are computed only once, which is
+    faster than calling each derivative function in
+    :obj:`chemicals.iapws` separately.
+
+    Parameters
+    ----------
+    tau : float
+        Dimensionless temperature, (647.096 K)/T [-]
+    delta : float
+        Dimensionless density, rho/(322 kg/m^3), [-]
+
+    Returns
+    -------
+    Ar : float
+        Residual Helmholtz energy A/(RT) [-]
+    dAr_ddelta : float
+        First derivative with respect to `delta`, [-]
+    d2Ar_ddelta2 : float
+        Second derivative with respect to `delta`, [-]
+    dAr_dtau : float
+        First derivative with respect to `tau`, [-]
+    d2Ar_dtau2 : float
+        Second derivative with respect to `tau`, [-]
+    d2Ar_ddeltadtau : float
+        Second derivative with respect to `delta` and `tau`, [-]
+
+    Notes
+    -----
+    At exactly `delta` = 1 the nonanalytic terms are evaluated by the
+    functions in :obj:`chemicals.iapws`, which have special handling for that
+    point.
+
+    Examples
+    --------
+    >>> iapws95_Ar_derivatives(647.096/300.0, 999.0/322.0)
+    (-9.575777, -0.309332, 1.786253, -7.704333, -1.261641, -0.198403)
+    '''
+    if delta == 1.0:
+        return (iapws.iapws95_Ar(tau, delta), iapws.iapws95_dAr_ddelta(tau, delta),
+                iapws.iapws95_d2Ar_ddelta2(tau, delta), iapws.iapws95_dAr_dtau(tau, delta),
+                iapws.iapws95_d2Ar_dtau2(tau, delta), iapws.iapws95_d2Ar_ddeltadtau(tau, delta))
+    # For each term f, delta*df/ddelta = f*g and tau*df/dtau = f*t
+    delta_powers = delta**_iapws95_Ar_powers
+    delta_cs = delta_powers[_iapws95_Ar_c_idx]
+    fs = _iapws95_Ar_ns_scaled*delta_powers[_iapws95_Ar_d_idx]*tau**iapws95_Ar_ts*np.exp(-delta_cs)
+    c_delta_cs = iapws95_Ar_cs*delta_cs
+    fgs = fs*(iapws95_Ar_ds - c_delta_cs)
+    Ar = float(fs.sum())
+    dAr = float(fgs.sum())
+    # g - 1 is formed directly to avoid cancellation at low densities
+    d2Ar_dd = float(np.dot(fgs, _iapws95_Ar_ds_m1 - c_delta_cs) - np.dot(fs, iapws95_Ar_cs*c_delta_cs))
+    dAr_t = float(np.dot(fs, iapws95_Ar_ts))
+    d2Ar_tt = float(np.dot(fs, iapws95_Ar_ts_tm1))
+    d2Ar_dt = float(np.dot(fgs, iapws95_Ar_ts))
+
+    # Gaussian terms 52-54; all have d = 3, alpha = 20, epsilon = 1
+    delta2, tau2 = delta*delta, tau*tau
+    dm = delta - 1.0
+    dm2 = dm*dm
+    x0 = delta2*delta*exp(-20.0*dm2)
+    g = 3.0 - 40.0*delta*dm
+    tm = tau - 1.21
+    f1 = x0*exp(-150.0*tm*tm)
+    f2 = 31.546140237781*tau*f1
+    f1 *= -31.306260323435
+    k1 = -300.0*tau*tm
+    k2 = k1 + 1.0
+    tm = tau - 1.25
+    f3 = -2521.3154341695*tau2*tau2*x0*exp(-250.0*tm*tm)
+    k3 = 4.0 - 500.0*tau*tm
+    fs = f1 + f2 + f3
+    fks = f1*k1 + f2*k2 + f3*k3
+    Ar += fs
+    dAr += fs*g
+    d2Ar_dd += fs*(g*g - 3.0 - 40.0*delta2)
+    dAr_t += fks
+    d2Ar_tt += (f1*(k1*k1 - 300.0*tau2) + f2*(k2*k2 - 1.0 - 300.0*tau2)
+                + f3*(k3*k3 - 4.0 - 500.0*tau2))
+    d2Ar_dt += fks*g
+
+    # Nonanalytic terms 55-56; both have a = 3.5, B = 0.2, A = 0.32, beta = 0.3
+    tm = tau - 1.0
+    tm2 = tm*tm
+    p1 = dm2**0.666666666666666741
+    theta = 0.32*p1*dm2 - tm
+    pa = dm2*dm2*sqrt(dm2)
+    Delta = theta*theta + 0.2*pa*dm2
+    Delta_inv = 1.0/Delta
+    x1 = 2.13333333333333339*theta*p1 + 1.4*pa
+    dDelta = dm*x1
+    d2Delta = (x1 + 7.0*pa + 2.27555555555555567*p1*p1*dm2
+               + 2.84444444444444455*theta*p1)
+    for n, b, C, D in ((-0.14874640856724, 0.85, 28.0, 700.0),
+                       (0.31806110878444, 0.95, 32.0, 800.0)):
+        psi = exp(-C*dm2 - D*tm2)
+        psi_d = -2.0*C*dm*psi
+        psi_dd = 2.0*C*(2.0*C*dm2 - 1.0)*psi
+        psi_t = -2.0*D*tm*psi
+        psi_tt = 2.0*D*(2.0*D*tm2 - 1.0)*psi
+        psi_dt = 4.0*C*D*dm*tm*psi
+        # n*Delta^b and its derivatives
+        Db = n*Delta**b
+        Db1 = b*Db*Delta_inv
+        Db2 = (b - 1.0)*Db1*Delta_inv
+        Db_d = Db1*dDelta
+        Db_t = -2.0*theta*Db1
+        x2 = psi + delta*psi_d
+        Ar += Db*delta*psi
+        dAr += delta*(Db*x2 + Db_d*delta*psi)
+        d2Ar_dd += delta2*(Db*(2.0*psi_d + delta*psi_dd) + 2.0*Db_d*x2
+                           + (Db1*d2Delta + Db2*dDelta*dDelta)*delta*psi)
+        dAr_t += tau*delta*(Db_t*psi + Db*psi_t)
+        d2Ar_tt += tau2*delta*((2.0*Db1 + 4.0*theta*theta*Db2)*psi + 2.0*Db_t*psi_t + Db*psi_tt)
+        d2Ar_dt += delta*tau*(Db*(psi_t + delta*psi_dt) + delta*Db_d*psi_t + Db_t*x2
+                              - (2.13333333333333339*Db1*dm*p1 + 2.0*theta*Db2*dDelta)*delta*psi)
+    delta_inv, tau_inv = 1.0/delta, 1.0/tau
+    return (Ar, dAr*delta_inv, d2Ar_dd*delta_inv*delta_inv, dAr_t*tau_inv,
+            d2Ar_tt*tau_inv*tau_inv, d2Ar_dt*delta_inv*tau_inv)
+
+def iapws95_rho_from_guess(T, P, rho):
+    r'''Calculate the density of water according to the IAPWS-95 standard
+    given a temperature `T`, pressure `P`, and an initial guess for the
+    density such as the density of a nearby state. The phase is determined as
+    in :obj:`chemicals.iapws.iapws95_rho`; a guess in the other phase is moved
+    to the saturated density of the correct phase before iterating, so the
+    same root is found whichever side of the saturation curve the guess is on.
+
+    Newton's method is stopped once a step is smaller than 1e-8 of the
+    density; because convergence is quadratic by then, the remaining error is
+    well below that of :obj:`chemicals.iapws.iapws95_rho`. A guess from the
+    same state converges in one evaluation. If the iteration does not
+    converge, :obj:`chemicals.iapws.iapws95_rho` is used instead.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    rho : float
+        Initial guess for the mass density, [kg/m^3]
+
+    Returns
+    -------
+    rho : float
+        Mass density of water, [kg/m^3]
+
+    Examples
+    --------
+    >>> iapws95_rho_from_guess(330.0, 8e5, 990.0)
+    985.0917
+    '''
+    tau = iapws.iapws95_Tc/T
+    a, b = 1e-20, 5000.0
+    if T < iapws.iapws95_Tc:
+        if P < iapws.iapws95_Psat(T):
+            b = iapws.iapws95_rhog_sat(T)
+        else:
+            a = iapws.iapws95_rhol_sat(T)
+    if rho <= a:
+        rho = a
+    elif rho >= b:
+        rho = b
+    for _ in range(20):
+        err, derr = iapws.iapws95_rho_err(rho, T, tau, P)
+        if err < 0.0:
+            a = rho
+        else:
+            b = rho
+        drho = -err/derr
+        if drho < -200.0:
+            drho = -200.0
+        elif drho > 200.0:
+            drho = 200.0
+        rho_new = rho + drho
+        if rho_new > b or rho_new < a:
+            rho_new = 0.5*(a + b)
+        elif abs(drho) < 1e-8*rho:
+            return rho_new
+        rho = rho_new
+    return iapws.iapws95_rho(T, P)
+
+
+class IAPWS95DensityTable(object):
+    r'''Class for tabulating the density of water from the IAPWS-95
+    standard on a grid of temperature and pressure, to seed the density
+    solver of :obj:`IAPWS95` phases. The logarithm of density is tabulated
+    at nodes evenly spaced in `T` and `ln(P)` and interpolated bilinearly;
+    the lookup only provides an initial guess, which
+    :obj:`iapws95_rho_from_guess` converges to the exact density, so cells
+    crossed by the saturation curve are harmless.
+
+    Parameters
+    ----------
+    Tmin : float, optional
+        Lowest temperature of the table, [K]
+    Tmax : float, optional
+        Highest temperature of the table, [K]
+    Pmin : float, optional
+        Lowest pressure of the table, [Pa]
+    Pmax : float, optional
+        Highest pressure of the table, [Pa]
+    T_points : int, optional
+        Number of temperature nodes, [-]
+    P_points : int, optional
+        Number of pressure nodes, [-]
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups inside the table, [-]
+    misses : int
+        Number of lookups outside the table, [-]
+
+    Examples
+    --------
+    >>> table = IAPWS95DensityTable(Tmin=300.0, Tmax=500.0, Pmin=1e5, Pmax=1e7, T_points=20, P_points=20)
+    >>> liquid = IAPWS95Liquid(T=350.0, P=2e6, zs=[1.0], rho_table=table)
+    >>> liquid.rho_mass()
+    974.5733
+    >>> table.hits
+    1
+    '''
+    def __repr__(self):
+        return '<IAPWS95DensityTable, T %g-%g K, P %g-%g Pa, %dx%d nodes>' %(
+            self.Tmin, self.Tmax, self.Pmin, self.Pmax, self.T_points, self.P_points)
+
+    def __init__(self, Tmin=273.16, Tmax=1273.15, Pmin=611.657, Pmax=1e8,
+                 T_points=60, P_points=60):
+        self.Tmin, self.Tmax, self.Pmin, self.Pmax = Tmin, Tmax, Pmin, Pmax
+        self.T_points, self.P_points = T_points, P_points
+        self.lnPmin = lnPmin = log(Pmin)
+        self.dT = dT = (Tmax - Tmin)/(T_points - 1)
+        self.dlnP = dlnP = (log(Pmax) - lnPmin)/(P_points - 1)
+        self.Ts = Ts = [Tmin + i*dT for i in range(T_points)]
+        self.Ps = Ps = [exp(lnPmin + j*dlnP) for j in range(P_points)]
+        ln_rhos = []
+        for T in Ts:
+            row = []
+            for P in Ps:
+                try:
+                    row.append(log(iapws.iapws95_rho(T, P)))
+                except ValueError:
+                    row.append(None)
+            ln_rhos.append(row)
+        self.ln_rhos = ln_rhos
+        self.hits = self.misses = 0
+
+    def rho(self, T, P):
+        r'''Interpolate the mass density of water at `T` and `P` from the
+        table, or return None if the point is outside it.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+
+        Returns
+        -------
+        rho : float
+            Approximate mass density of water, [kg/m^3]
+        '''
+        x = (T - self.Tmin)/self.dT
+        y = (log(P) - self.lnPmin)/self.dlnP
+        T_cells, P_cells = self.T_points - 1, self.P_points - 1
+        if not (0.0 <= x <= T_cells and 0.0 <= y <= P_cells):
+            self.misses += 1
+            return None
+        i, j = min(int(x), T_cells - 1), min(int(y), P_cells - 1)
+        ln_rhos = self.ln_rhos
+        v00, v01 = ln_rhos[i][j], ln_rhos[i][j+1]
+        v10, v11 = ln_rhos[i+1][j], ln_rhos[i+1][j+1]
+        if v00 is None or v01 is None or v10 is None or v11 is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        x -= i
+        y -= j
+        return exp(v00 + x*(v10 - v00) + y*(v01 - v00 + x*(v11 - v10 - v01 + v00)))
+
+
 class IAPWS95(HelmholtzEOS):
     model_name = 'iapws95'
     _MW = iapws.iapws95_MW
@@ -70,35 +389,96 @@ class IAPWS95(HelmholtzEOS):
     _d2Ar_ddelta2_func = staticmethod(iapws.iapws95_d2Ar_ddelta2)
     _dAr_ddelta_func = staticmethod(iapws.iapws95_dAr_ddelta)
     _Ar_func = staticmethod(iapws.iapws95_Ar)
-
-
-    def __init__(self, T=None, P=None, zs=None):
+    _Ar_derivatives_func = staticmethod(iapws95_Ar_derivatives)
+
+
+    rho_table = None
+    '''Optional :obj:`IAPWS95DensityTable` used to seed the density solver
+    for temperature and pressure specifications; it is passed on to the
+    phases created from this one. As it does not change any result, it is
+    not part of the hash of the phase and is not serialized by
+    :obj:`as_json <thermo.phases.Phase.as_json>`.'''
+
+    def as_json(self):
+        d = Phase.as_json(self)
+        d.pop('rho_table', None)
+        return d
+
+    def __hash__(self):
+        if 'rho_table' not in self.__dict__:
+            return Phase.__hash__(self)
+        self.model_hash(False)
+        self.model_hash(True)
+        self.state_hash()
+        d = self.__dict__.copy()
+        del d['rho_table']
+        return hash_any_primitive((self.__class__.__name__, d))
+
+    def __init__(self, T=None, P=None, zs=None, rho_table=None):
         self.T = T
         self.P = P
-        self._rho_mass = rho_mass = iapws.iapws95_rho(T, P)
+        if rho_table is not None:
+            self.rho_table = rho_table
+        self._rho_mass = rho_mass = self._rho_mass_TP(T, P, None)
         self._V = rho_to_Vm(rho=rho_mass, MW=self._MW)
         self.tau = tau = self.Tc/T
         self.delta = delta = rho_mass*self.rhoc_mass_inv
         self.A0, self.dA0_dtau, self.d2A0_dtau2, self.d3A0_dtau3 = iapws.iapws95_A0_tau_derivatives(tau, delta)
 
-    def to_TP_zs(self, T, P, zs):
+    def _rho_mass_TP(self, T, P, warm_start):
+        if warm_start is not None:
+            return iapws95_rho_from_guess(T, P, warm_start._rho_mass)
+        rho_table = self.rho_table
+        if rho_table is not None:
+            rho = rho_table.rho(T, P)
+            if rho is not None:
+                return iapws95_rho_from_guess(T, P, rho)
+        return iapws.iapws95_rho(T, P)
+
+    def to_TP_zs(self, T, P, zs, warm_start=None):
+        r'''Method to create a new phase at the specified temperature and
+        pressure. The density is solved for from `warm_start` if it is given,
+        otherwise from the :obj:`rho_table` if there is one, and otherwise
+        from scratch.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+        zs : list[float]
+            Mole fractions, [-]
+        warm_start : IAPWS95, optional
+            Phase at a nearby state whose density is used as the initial
+            guess, [-]
+
+        Returns
+        -------
+        new : IAPWS95
+            New phase at the specified conditions, [-]
+        '''
         new = self.__class__.__new__(self.__class__)
         new.zs = zs
         new.T = T
         new.P = P
-        new._rho_mass = rho_mass = iapws.iapws95_rho(T, P)
+        if self.rho_table is not None:
+            new.rho_table = self.rho_table
+        new._rho_mass = rho_mass = self._rho_mass_TP(T, P, warm_start)
         new._V = rho_to_Vm(rho=rho_mass, MW=self._MW)
         new.tau = tau = new.Tc/T
         new.delta = delta = rho_mass*new.rhoc_mass_inv
         new.A0, new.dA0_dtau, new.d2A0_dtau2, new.d3A0_dtau3 = iapws.iapws95_A0_tau_derivatives(tau, delta)
         return new
 
-    def to(self, zs, T=None, P=None, V=None):
+    def to(self, zs, T=None, P=None, V=None, warm_start=None):
         new = self.__class__.__new__(self.__class__)
         new.zs = zs
+        if self.rho_table is not None:
+            new.rho_table = self.rho_table
         if T is not None and P is not None:
             new.T = T
-            new._rho_mass = rho_mass = iapws.iapws95_rho(T, P)
+            new._rho_mass = rho_mass = self._rho_mass_TP(T, P, warm_start)
             new._V = rho_to_Vm(rho=rho_mass, MW=self._MW)
             new.P = P
         elif T is not None and V is not None:
@@ -29,6 +29,7 @@ from chemicals.utils import log, mixing_simple, dxs_to_dns, dxs_to_dn_partials
 from thermo.heat_capacity import HeatCapacityGas
 from thermo.phases.phase import Phase
 from thermo.phases.ceos import CEOSGas
+from thermo.utils.temperature_cache import TemperatureCache
 
 
 from chemicals.virial import (BVirial_Pitzer_Curl,BVirial_Pitzer_Curl_fast,
@@ -45,7 +46,7 @@ from chemicals.virial import (BVirial_Pitzer_Curl,BVirial_Pitzer_Curl_fast,
                                 BVirial_Meng_vec, BVirial_Meng_mat,
                                 BVirial_Oconnell_Prausnitz,BVirial_Oconnell_Prausnitz_vec,
                                 BVirial_Oconnell_Prausnitz_mat,
-                                BVirial_Xiang_vec,
+                                BVirial_Xiang_vec, BVirial_Xiang_mat,
                               Z_from_virial_density_form, BVirial_mixture,
                               dBVirial_mixture_dzs, d2BVirial_mixture_dzizjs, d3BVirial_mixture_dzizjzks,
                               CVirial_mixture_Orentlicher_Prausnitz,
@@ -119,6 +120,7 @@ class VirialCSP(object):
                  B_model_Meng_as=None,
                  B_model_Tsonopoulos_extended_as=None,
                  B_model_Tsonopoulos_extended_bs=None,
+                 T_cache_size=16,
                  ):
         self.Tcs = Tcs
         self.Pcs = Pcs
@@ -181,6 +183,8 @@ class VirialCSP(object):
 
         self.C_model = C_model
         self.C_zero = C_model == VIRIAL_C_ZERO
+        # Shared by every model created with `to`
+        self.T_cache = TemperatureCache(T_cache_size) if T_cache_size else None
         
     def to(self, T):
         new = self.__class__.__new__(self.__class__)
@@ -211,8 +215,69 @@ class VirialCSP(object):
         new.cross_C_model_omegaijs = self.cross_C_model_omegaijs
         new.C_model = self.C_model
         new.C_zero = self.C_zero
+        new.T_cache = self.T_cache
         new.T = T
         return new
+
+    def _at_T_cached(self, T, key, calc):
+        T_cache = self.T_cache
+        if T_cache is None:
+            return calc(T)
+        values = T_cache.lookup(T, key)
+        if values is None:
+            values = calc(T)
+            T_cache.store(T, key, values)
+        return values
+
+    def _at_Ts(self, Ts, key, calc):
+        values = [self._at_T_cached(T, key, calc) for T in Ts]
+        return tuple(array([v[i] for v in values]) for i in range(4))
+
+    def B_interactions_at_Ts(self, Ts):
+        r'''Compute the cross second virial coefficient matrices and their
+        first three temperature derivatives at each of the temperatures `Ts`.
+        Results already in the temperature cache are reused, and new ones are
+        added to it.
+
+        Parameters
+        ----------
+        Ts : list[float]
+            Temperatures, [K]
+
+        Returns
+        -------
+        Bs : ndarray
+            Second virial coefficients, shape (len(Ts), N, N) [m^3/mol]
+        dB_dTs : ndarray
+            First temperature derivatives, [m^3/mol/K]
+        d2B_dT2s : ndarray
+            Second temperature derivatives, [m^3/mol/K^2]
+        d3B_dT3s : ndarray
+            Third temperature derivatives, [m^3/mol/K^3]
+        '''
+        return self._at_Ts(Ts, 'B_interactions', self.B_interactions_at_T)
+
+    def B_pures_at_Ts(self, Ts):
+        r'''Compute the pure component second virial coefficients and their
+        first three temperature derivatives at each of the temperatures `Ts`;
+        the results have shape (len(Ts), N). See :obj:`B_interactions_at_Ts`.
+        '''
+        return self._at_Ts(Ts, 'B_pures', self.B_pures_at_T)
+
+    def C_interactions_at_Ts(self, Ts):
+        r'''Compute the cross third virial coefficient matrices and their
+        first three temperature derivatives at each of the temperatures `Ts`;
+        the results have shape (len(Ts), N, N). See
+        :obj:`B_interactions_at_Ts`.
+        '''
+        return self._at_Ts(Ts, 'C_interactions', self.C_interactions_at_T)
+
+    def C_pures_at_Ts(self, Ts):
+        r'''Compute the pure component third virial coefficients and their
+        first three temperature derivatives at each of the temperatures `Ts`;
+        the results have shape (len(Ts), N). See :obj:`B_interactions_at_Ts`.
+        '''
+        return self._at_Ts(Ts, 'C_pures', self.C_pures_at_T)
         
         
         
@@ -262,7 +327,7 @@ class VirialCSP(object):
     
     
     def _set_B_and_der_interactions(self):
-        Bs_interactions, dB_dTs_interactions, d2B_dT2s_interactions, d3B_dT3s_interactions = self.B_interactions_at_T(self.T)
+        Bs_interactions, dB_dTs_interactions, d2B_dT2s_interactions, d3B_dT3s_interactions = self._at_T_cached(self.T, 'B_interactions', self.B_interactions_at_T)
         
         self.Bs_interactions = Bs_interactions
         self.dB_dTs_interactions = dB_dTs_interactions
@@ -315,7 +380,7 @@ class VirialCSP(object):
         return Bs_pure, dB_dTs_pure, d2B_dT2s_pure, d3B_dT3s_pure
     
     def _set_B_and_der_pure(self):
-        Bs_pure, dB_dTs_pure, d2B_dT2s_pure, d3B_dT3s_pure = self.B_pures_at_T(self.T)
+        Bs_pure, dB_dTs_pure, d2B_dT2s_pure, d3B_dT3s_pure = self._at_T_cached(self.T, 'B_pures', self.B_pures_at_T)
         
         self.Bs_pure = Bs_pure
         self.dB_dTs_pure = dB_dTs_pure
@@ -423,7 +488,7 @@ class VirialCSP(object):
     
 
     def _set_C_and_der_pure(self):
-        Cs_pure, dC_dTs_pure, d2C_dT2s_pure, d3C_dT3s_pure = self.C_pures_at_T(self.T)
+        Cs_pure, dC_dTs_pure, d2C_dT2s_pure, d3C_dT3s_pure = self._at_T_cached(self.T, 'C_pures', self.C_pures_at_T)
         
         self.Cs_pure = Cs_pure
         self.dC_dTs_pure = dC_dTs_pure
@@ -432,7 +497,7 @@ class VirialCSP(object):
         self.pure_C_calculated = True
 
     def _set_C_and_der_interactions(self):
-        Cs_interactions, dC_dTs_interactions, d2C_dT2s_interactions, d3C_dT3s_interactions = self.C_interactions_at_T(self.T)
+        Cs_interactions, dC_dTs_interactions, d2C_dT2s_interactions, d3C_dT3s_interactions = self._at_T_cached(self.T, 'C_interactions', self.C_interactions_at_T)
         
         self.Cs_interactions = Cs_interactions
         self.dC_dTs_interactions = dC_dTs_interactions
@@ -32,7 +32,7 @@ Regular Solution Class
 ======================
 
 .. autoclass:: RegularSolution
-    :members: to_T_xs, GE, dGE_dT, d2GE_dT2, d3GE_dT3, d2GE_dTdxs, dGE_dxs, d2GE_dxixjs, d3GE_dxixjxks
+    :members: to_T_xs, GE, dGE_dT, d2GE_dT2, d3GE_dT3, d2GE_dTdxs, dGE_dxs, d2GE_dxixjs, d3GE_dxixjxks, GE_batch, dGE_dxs_batch, d2GE_dxixjs_batch
     :undoc-members:
     :show-inheritance:
     :exclude-members:
@@ -188,6 +188,38 @@ def regular_solution_d3GE_dxixjxks(Vs, SPs, Hi_sums, dGE_dxs, N, GE, xsVs_sum_in
     return d3GE_dxixjxks
 
 
+def regular_solution_Hs_batch(SPs, coeffs):
+    # The composition independent `Hi` terms of `regular_solution_Hi_sums`
+    SPs_diff = SPs[:, None] - SPs[None, :]
+    return np.outer(SPs, SPs)*(coeffs + coeffs.T) + SPs_diff*SPs_diff
+
+def regular_solution_GE_batch(xs, Vs, SPs, coeffs):
+    # Batch functions take an (M, N) array of compositions
+    xsVs = xs*Vs
+    return 0.5*(xsVs*np.dot(xsVs, regular_solution_Hs_batch(SPs, coeffs))).sum(axis=1)/xsVs.sum(axis=1)
+
+def regular_solution_dGE_dxs_batch(xs, Vs, SPs, coeffs):
+    xsVs = xs*Vs
+    xsVs_sum_inv = 1.0/xsVs.sum(axis=1)
+    Hi_sums = Vs*np.dot(xsVs, regular_solution_Hs_batch(SPs, coeffs))
+    GE = 0.5*(xs*Hi_sums).sum(axis=1)*xsVs_sum_inv
+    return (Hi_sums - GE[:, None]*Vs)*xsVs_sum_inv[:, None]
+
+def regular_solution_d2GE_dxixjs_batch(xs, Vs, SPs, coeffs):
+    M, N = xs.shape
+    xsVs = xs*Vs
+    xsVs_sum_inv = 1.0/xsVs.sum(axis=1)
+    Hs = regular_solution_Hs_batch(SPs, coeffs)
+    Hi_sums = Vs*np.dot(xsVs, Hs)
+    GE = 0.5*(xs*Hi_sums).sum(axis=1)*xsVs_sum_inv
+    dGE_dxs = (Hi_sums - GE[:, None]*Vs)*xsVs_sum_inv[:, None]
+    d2GE_dxixjs = np.zeros((M, N, N))
+    for i in range(N):
+        v0 = (Vs[i]*GE - Hi_sums[:, i])*xsVs_sum_inv*xsVs_sum_inv
+        v1 = Vs[i]*xsVs_sum_inv
+        d2GE_dxixjs[:, i, :] = v0[:, None]*Vs + v1[:, None]*(Vs*Hs[i] - dGE_dxs)
+    return d2GE_dxixjs
+
 class RegularSolution(GibbsExcess):
     r'''Class for representing an a liquid with excess gibbs energy represented
     by the Regular Solution model. This model is not temperature dependent and
@@ -688,6 +720,75 @@ class RegularSolution(GibbsExcess):
         return 0.0
 
 
+    def _batch_terms(self):
+        return array(self.Vs), array(self.SPs), array(self.lambda_coeffs)
+
+    def GE_batch(self, T, xs_matrix):
+        r'''Calculate and return the excess Gibbs energy of many liquid
+        compositions with the regular solution model, evaluating all of them
+        together without creating a model object for each. The result does
+        not depend on temperature.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        GE : ndarray
+            Excess Gibbs energy of each composition, [J/mol]
+
+        Examples
+        --------
+        >>> GE = RegularSolution(T=298.15, xs=[0.5, 0.5], Vs=[0.05868e-3, 0.01807e-3], SPs=[26140.0, 47860.0])
+        >>> GE.GE_batch(298.15, [[0.5, 0.5], [0.1, 0.9]])
+        array([3258.81, 2034.27])
+        '''
+        return regular_solution_GE_batch(self._batch_xs(xs_matrix), *self._batch_terms())
+
+    def dGE_dxs_batch(self, T, xs_matrix):
+        r'''Calculate and return the mole fraction derivatives of excess Gibbs
+        energy of many liquid compositions with the regular solution model.
+        See :obj:`GE_batch`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        dGE_dxs : ndarray
+            Mole fraction derivatives of excess Gibbs energy, one row per
+            composition, [J/mol]
+        '''
+        return regular_solution_dGE_dxs_batch(self._batch_xs(xs_matrix), *self._batch_terms())
+
+    def d2GE_dxixjs_batch(self, T, xs_matrix):
+        r'''Calculate and return the second mole fraction derivatives of excess
+        Gibbs energy of many liquid compositions with the regular solution
+        model. See :obj:`GE_batch`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        d2GE_dxixjs : ndarray
+            Second mole fraction derivatives of excess Gibbs energy, size
+            number of compositions x N x N, [J/mol]
+        '''
+        return regular_solution_d2GE_dxixjs_batch(self._batch_xs(xs_matrix), *self._batch_terms())
+
     @classmethod
     def regress_binary_parameters(cls, gammas, xs, Vs, SPs, Ts, symmetric=False,
                                   use_numba=False,
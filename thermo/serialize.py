@@ -26,12 +26,19 @@ For reporting bugs, adding feature requests, or submitting pull requests,
 please use the `GitHub issue tracker <https://github.com/CalebBell/chemicals/>`_.
 
 .. contents:: :local:
+
+Binary Snapshots
+----------------
+.. autofunction:: thermo.serialize.dump_snapshot
+.. autofunction:: thermo.serialize.load_snapshot
 '''
 # This module SHOULD NOT import anything from thermo
+import sys
+import struct
 from fluids.numerics import numpy as np
 from chemicals.utils import PY37
 
-__all__ = ['object_from_json', 'json_default']
+__all__ = ['object_from_json', 'json_default', 'dump_snapshot', 'load_snapshot']
 try:
     array = np.array
     int_types = frozenset([np.short, np.ushort, np.intc, np.uintc, np.int_,
@@ -198,3 +205,138 @@ def json_default(obj):
     if hasattr(obj, 'as_json'):
         return obj.as_json()
     raise TypeError()
+
+
+SNAPSHOT_MAGIC = b'THERMOSS'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_ALIGNMENT = 64
+# magic, version, number of buffers, length of the pickle stream
+_snapshot_header = '<8sIIQ'
+# Out-of-band buffers need pickle protocol 5, added in Python 3.8
+SNAPSHOT_BUFFERS = sys.version_info >= (3, 8)
+
+def _align(offset):
+    return -(-offset//SNAPSHOT_ALIGNMENT)*SNAPSHOT_ALIGNMENT
+
+def dump_snapshot(obj, path=None):
+    r'''Serialize any thermo object - a flasher along with everything it
+    references, a phase, an equation of state or a constants or correlations
+    package - to a compact binary snapshot.
+
+    The object graph is pickled with protocol 5, except that NumPy arrays are
+    written out of band as raw, aligned buffers instead of being converted to
+    lists as in the JSON format; :obj:`load_snapshot` can memory-map them.
+    Before Python 3.8, protocol 4 is used and the arrays are stored in the
+    pickle stream itself; those snapshots load on any version but do not
+    share memory with the file.
+
+    Parameters
+    ----------
+    obj : object
+        Object to serialize, [-]
+    path : str, optional
+        File to write the snapshot to; if not provided, the snapshot is
+        returned, [-]
+
+    Returns
+    -------
+    snapshot : bytes or None
+        The snapshot, if `path` was not given, [-]
+
+    Notes
+    -----
+    As with `pickle`, only load snapshots from trusted sources.
+
+    Examples
+    --------
+    >>> from thermo import PRMIX
+    >>> eos = PRMIX(T=115, P=1E6, Tcs=[126.1, 190.6], Pcs=[33.94E5, 46.04E5], omegas=[0.04, 0.011], zs=[0.5, 0.5], kijs=[[0,0],[0,0]])
+    >>> load_snapshot(dump_snapshot(eos)) == eos
+    True
+    '''
+    import pickle
+    buffers = []
+    if SNAPSHOT_BUFFERS:
+        data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    else:
+        data = pickle.dumps(obj, protocol=4)
+    raws = [b.raw() for b in buffers]
+
+    table_start = struct.calcsize(_snapshot_header)
+    offset = table_start + 16*len(raws) + len(data)
+    table = []
+    for raw in raws:
+        offset = _align(offset)
+        table.append((offset, raw.nbytes))
+        offset += raw.nbytes
+
+    out = bytearray(offset)
+    struct.pack_into(_snapshot_header, out, 0, SNAPSHOT_MAGIC, SNAPSHOT_VERSION,
+                     len(raws), len(data))
+    for i, entry in enumerate(table):
+        struct.pack_into('<QQ', out, table_start + 16*i, *entry)
+    pos = table_start + 16*len(raws)
+    out[pos:pos + len(data)] = data
+    for (start, size), raw in zip(table, raws):
+        out[start:start + size] = raw
+    if path is None:
+        return bytes(out)
+    with open(path, 'wb') as f:
+        f.write(out)
+
+def load_snapshot(snapshot, mmap=False):
+    r'''Load an object from a binary snapshot created by
+    :obj:`dump_snapshot`.
+
+    Parameters
+    ----------
+    snapshot : bytes or str
+        The snapshot, or the path of a file containing it, [-]
+    mmap : bool, optional
+        If True and `snapshot` is a path, memory-map the file so the NumPy
+        arrays in the object share pages with the file (and with any other
+        process which loaded it); pages are only copied if an array is
+        modified, [-]
+
+    Returns
+    -------
+    obj : object
+        Deserialized object, [-]
+
+    Examples
+    --------
+    >>> load_snapshot(dump_snapshot({'a': 1}))
+    {'a': 1}
+    '''
+    import pickle
+    if isinstance(snapshot, (bytes, bytearray, memoryview)):
+        # One copy, so the arrays are writable
+        buf = memoryview(bytearray(snapshot))
+    elif mmap:
+        import mmap as mmap_module
+        with open(snapshot, 'rb') as f:
+            mapped = mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_COPY)
+        buf = memoryview(mapped)
+    else:
+        with open(snapshot, 'rb') as f:
+            buf = memoryview(bytearray(f.read()))
+
+    table_start = struct.calcsize(_snapshot_header)
+    if len(buf) < table_start:
+        raise ValueError("Not a thermo snapshot")
+    magic, version, N, data_size = struct.unpack_from(_snapshot_header, buf, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Not a thermo snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError("Unsupported snapshot version %d" %(version))
+    pos = table_start + 16*N
+    if not N:
+        return pickle.loads(buf[pos:pos + data_size])
+    if not SNAPSHOT_BUFFERS:
+        raise ValueError("Snapshot contains out-of-band arrays, which need "
+                         "Python 3.8 or later to load")
+    buffers = []
+    for i in range(N):
+        start, size = struct.unpack_from('<QQ', buf, table_start + 16*i)
+        buffers.append(buf[start:start + size])
+    return pickle.loads(buf[pos:pos + data_size], buffers=buffers)
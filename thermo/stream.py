@@ -22,7 +22,8 @@ SOFTWARE.'''
 
 from __future__ import division
 
-__all__ = ['Stream', 'EnergyTypes', 'EnergyStream', 'StreamArgs', 'EquilibriumStream', 'mole_balance', 'energy_balance']
+__all__ = ['Stream', 'EnergyTypes', 'EnergyStream', 'StreamArgs', 'EquilibriumStream',
+           'mole_balance', 'energy_balance', 'FlowsheetUnit', 'Flowsheet']
 
 #import enum
 try:
@@ -38,6 +39,7 @@ from chemicals.utils import mixing_simple, normalize, Vfs_to_zs, ws_to_zs, zs_to
 from thermo.mixture import Mixture, preprocess_mixture_composition
 from thermo.equilibrium import EquilibriumState
 from thermo.flash import Flash
+from fluids.numerics import UnconvergedError, numpy as np
 from fluids.pump import voltages_1_phase_residential, voltages_3_phase, residential_power_frequencies
 
 
@@ -51,9 +53,26 @@ base_specifications = {'zs': None, 'ws': None, 'Vfls': None, 'Vfgs': None,
                        'T': None, 'P': None, 'VF': None, 'H': None,
                        'Hm': None, 'S': None, 'Sm': None, 'energy': None}
 
+stream_composition_keys = ('zs', 'ws', 'Vfls', 'Vfgs', 'ns', 'ms', 'Qls', 'Qgs')
+stream_composition_flow_keys = ('ns', 'ms', 'Qls', 'Qgs')
+stream_extensive_flow_keys = ('n', 'm', 'Q')
+stream_state_keys = ('T', 'P', 'VF', 'H', 'H_mass', 'S', 'S_mass', 'energy')
+
+def _spec_equal(a, b):
+    # Specifications may be None, numbers, lists or arrays
+    if a is None or b is None:
+        return a is b
+    if isinstance(a, (list, tuple, np.ndarray)) or isinstance(b, (list, tuple, np.ndarray)):
+        return np.array_equal(a, b)
+    return a == b
+
 class StreamArgs(object):
     flashed = False
     _state_cache = None
+    hot_start = None
+    '''Previously flashed state used as the `hot_start` of :obj:`flash_state`
+    when none is provided; set by :obj:`Flowsheet` to the result of the last
+    pass.'''
 
     def __init__(self, IDs=None, zs=None, ws=None, Vfls=None, Vfgs=None,
                  T=None, P=None,
@@ -661,6 +680,9 @@ class StreamArgs(object):
             n = self.n_calc
             if n is None:
                 m = self.m_calc
+            if n == 0.0 or m == 0.0:
+                # No flow carries no energy; the composition is undefined
+                return 0.0
             if m is not None or n is not None:
                 mixture = self.mixture
                 if mixture is not None:
@@ -975,7 +997,7 @@ class StreamArgs(object):
 #        return False
 
     def update(self, **kwargs):
-        for key, value in kwargs:
+        for key, value in kwargs.items():
             setattr(self, key, value)
 
     def flash(self, hot_start=None, existing_flash=None):
@@ -1082,7 +1104,14 @@ class StreamArgs(object):
                 except:
                     pass
 
-            m = self.property_package.flash(T=T, P=P, zs=zs, H=H, S=S, VF=VF, hot_start=hot_start)
+            if hot_start is None and self.hot_start is not None:
+                try:
+                    m = self.property_package.flash(T=T, P=P, zs=zs, H=H, S=S, VF=VF, hot_start=self.hot_start)
+                except Exception:
+                    # The previous state may be a poor guess after large changes
+                    m = self.property_package.flash(T=T, P=P, zs=zs, H=H, S=S, VF=VF)
+            else:
+                m = self.property_package.flash(T=T, P=P, zs=zs, H=H, S=S, VF=VF, hot_start=hot_start)
             self._mixture = m
             self._state_cache = state_cache
             return m
@@ -1677,6 +1706,11 @@ class EquilibriumStream(EquilibriumState):
                  existing_flash=None):
 
         constants = flasher.constants
+        stream_specs = {'zs': zs, 'ws': ws, 'Vfls': Vfls, 'Vfgs': Vfgs,
+                        'ns': ns, 'ms': ms, 'Qls': Qls, 'Qgs': Qgs,
+                        'n': n, 'm': m, 'Q': Q, 'T': T, 'P': P, 'VF': VF,
+                        'H': H, 'H_mass': H_mass, 'S': S, 'S_mass': S_mass,
+                        'energy': energy, 'Vf_TP': Vf_TP, 'Q_TP': Q_TP}
 
         # Composition information
         composition_option_count = 0
@@ -1853,6 +1887,110 @@ class EquilibriumStream(EquilibriumState):
         self.ns = [n*zi for zi in zs]
         self._ws = ws = [zi*MWi*MW_inv for zi, MWi in zip(zs, constants.MWs)]
         self.ms = [m*wi for wi in ws]
+        self.stream_specs = stream_specs
+
+    updates = 0
+    '''Number of calls to :obj:`update` on this stream.'''
+    flashes_avoided = 0
+    '''Number of calls to :obj:`update` which did not need a flash because
+    only the extensive flow rate of the stream changed.'''
+
+    def update(self, **kwargs):
+        r'''Change specifications of the stream in place. The previous state
+        of the stream is used as the `hot_start` of the new flash; if only the
+        total flow rate `n`, `m` or `Q` changes (and the state is not
+        specified by `energy`), or no specification actually changes, the
+        flash is skipped entirely and the phase results are reused.
+
+        A composition or flow rate replaces the previous composition or flow
+        rate. A state specification replaces the previous value of the same
+        variable; to change the kind of state specification, give both state
+        variables.
+
+        Parameters
+        ----------
+        kwargs : dict
+            Specifications to set, with the names of the arguments of
+            :obj:`EquilibriumStream`, [-]
+
+        Notes
+        -----
+        The number of calls, and of flashes avoided, are stored in
+        :obj:`updates` and :obj:`flashes_avoided`.
+
+        Examples
+        --------
+        >>> from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, HeatCapacityGas, IdealGas, FlashPureVLS
+        >>> constants = ChemicalConstantsPackage(Tcs=[647.14], Pcs=[22048320.0], omegas=[0.344], MWs=[18.01528], CASs=['7732-18-5'])
+        >>> correlations = PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=[HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759]))])
+        >>> flasher = FlashPureVLS(constants, correlations, IdealGas(HeatCapacityGases=correlations.HeatCapacityGases), [], [])
+        >>> stream = EquilibriumStream(flasher, zs=[1.0], n=2.0, T=500.0, P=1e5)
+        >>> stream.update(n=3.0)
+        >>> stream.update(T=510.0)
+        >>> stream.T, stream.n, stream.updates, stream.flashes_avoided
+        (510.0, 3.0, 2, 1)
+        '''
+        old = self.stream_specs
+        specs = old.copy()
+        changed = False
+        for key, value in kwargs.items():
+            if key not in specs:
+                raise ValueError("Unrecognized specification '%s'" %(key,))
+            if isinstance(value, np.ndarray):
+                # The flashers take lists
+                value = value.tolist()
+            if _spec_equal(old[key], value):
+                continue
+            changed = True
+            if key in stream_composition_keys:
+                for k in stream_composition_keys:
+                    specs[k] = None
+                if key in stream_composition_flow_keys:
+                    specs['n'] = specs['m'] = specs['Q'] = None
+                elif not any(old[k] is not None for k in stream_extensive_flow_keys):
+                    # The flow came with the composition; keep it
+                    specs['n'] = self.n
+            elif key in stream_extensive_flow_keys:
+                specs['n'] = specs['m'] = specs['Q'] = None
+                if any(old[k] is not None for k in stream_composition_flow_keys):
+                    for k in stream_composition_keys:
+                        specs[k] = None
+                    specs['zs'] = self.zs
+            specs[key] = value
+
+        state_count = sum(specs[k] is not None for k in stream_state_keys)
+        if state_count > 2:
+            raise ValueError("Too many state specifications; to change the kind "
+                             "of state specification, specify both state variables")
+
+        intensive_same = True
+        for key in stream_state_keys:
+            if not _spec_equal(specs[key], old[key]):
+                intensive_same = False
+        if specs['energy'] is not None:
+            # The enthalpy depends on the flow rate
+            intensive_same = intensive_same and specs['n'] == old['n'] and specs['m'] == old['m'] and specs['Q'] == old['Q']
+        for key in stream_composition_keys:
+            if (specs[key] is not None and not _spec_equal(specs[key], old[key])
+                    and not (key == 'zs' and _spec_equal(specs[key], self.zs))):
+                intensive_same = False
+        if specs['Vf_TP'] != old['Vf_TP']:
+            intensive_same = False
+
+        updates, flashes_avoided = self.updates + 1, self.flashes_avoided
+        if not changed or intensive_same:
+            new = EquilibriumStream(self.flasher, existing_flash=self, **specs)
+            flashes_avoided += 1
+        else:
+            try:
+                new = EquilibriumStream(self.flasher, hot_start=self, **specs)
+            except Exception:
+                # The previous state may not be a usable guess after large changes
+                new = EquilibriumStream(self.flasher, **specs)
+        d = self.__dict__
+        d.clear()
+        d.update(new.__dict__)
+        self.updates, self.flashes_avoided = updates, flashes_avoided
 
 
     @property
@@ -2277,4 +2415,470 @@ def energy_balance(inlets, outlets):
                 set_energy -= v
         inlets[in_unknown_idx].energy = set_energy
         return True
-    return False
\ No newline at end of file
+    return False
+
+def _stream_compounds(stream):
+    N = getattr(stream, 'N', None)
+    if N is not None:
+        return N
+    if stream.equilibrium_pkg:
+        return stream.pkg.constants.N
+    if stream.IDs:
+        return len(stream.IDs)
+    s = stream.specifications
+    for key in ('zs', 'ws', 'Vfls', 'Vfgs', 'ns', 'ms', 'Qls', 'Qgs'):
+        if s[key] is not None:
+            return len(s[key])
+    return None
+
+def _copy_specifications(specifications):
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in specifications.items()}
+
+def _restore_specifications(stream, specifications):
+    s = stream.specifications
+    for k, v in specifications.items():
+        s[k] = list(v) if isinstance(v, list) else v
+    # The previous result is the best starting point for the next flash
+    stream.hot_start = stream.__dict__.get('_mixture', None)
+
+def _strongly_connected_components(successors):
+    # Tarjan's algorithm; components are found in reverse topological order
+    index, lowlink, stack, on_stack, components = {}, {}, [], set(), []
+    def visit(v):
+        index[v] = lowlink[v] = len(index)
+        stack.append(v)
+        on_stack.add(v)
+        for w in successors[v]:
+            if w not in index:
+                visit(w)
+                lowlink[v] = min(lowlink[v], lowlink[w])
+            elif w in on_stack:
+                lowlink[v] = min(lowlink[v], index[w])
+        if lowlink[v] == index[v]:
+            component = []
+            while True:
+                w = stack.pop()
+                on_stack.discard(w)
+                component.append(w)
+                if w == v:
+                    break
+            components.append(sorted(component))
+    for v in range(len(successors)):
+        if v not in index:
+            visit(v)
+    components.reverse()
+    return components
+
+
+class FlowsheetUnit(object):
+    r'''A unit operation in a :obj:`Flowsheet`, described only by its
+    material and energy balances. The streams are closed with
+    :obj:`mole_balance` and :obj:`energy_balance` until neither makes any more
+    progress. Any other relation the unit imposes - a split fraction, an
+    outlet temperature, a reaction - is set on the streams by the `calculate`
+    hook, which is called with the unit before the balances.
+
+    :obj:`EnergyStream` objects may be inlets or outlets; they take part only
+    in the energy balance.
+
+    Parameters
+    ----------
+    inlets : list[StreamArgs or EquilibriumStream or EnergyStream]
+        Streams entering the unit, [-]
+    outlets : list[StreamArgs or EquilibriumStream or EnergyStream]
+        Streams leaving the unit, [-]
+    calculate : callable, optional
+        Function called as `calculate(unit)` at the start of every solve, [-]
+    energy : bool, optional
+        Whether or not to perform the energy balance, [-]
+    compounds : int, optional
+        Number of components; found from the streams if not provided, [-]
+    name : str, optional
+        Name of the unit, [-]
+    '''
+    def __repr__(self):
+        return '<FlowsheetUnit %s, %d inlets, %d outlets>' %(self.name, len(self.inlets), len(self.outlets))
+
+    def __init__(self, inlets, outlets, calculate=None, energy=True,
+                 compounds=None, name=None):
+        self.inlets = list(inlets)
+        self.outlets = list(outlets)
+        self.calculate = calculate
+        self.energy = energy
+        self.name = name
+        if compounds is None:
+            for stream in self.inlets + self.outlets:
+                if not isinstance(stream, EnergyStream):
+                    compounds = _stream_compounds(stream)
+                    if compounds is not None:
+                        break
+            if compounds is None:
+                raise ValueError("Could not determine the number of compounds "
+                                 "of unit %s; specify `compounds`" %(name,))
+        self.compounds = compounds
+
+    def solve(self):
+        r'''Close the material and energy balances of the unit as far as the
+        specifications of its streams allow.
+
+        Returns
+        -------
+        progress : bool
+            Whether or not any stream specification was calculated, [-]
+        '''
+        if self.calculate is not None:
+            self.calculate(self)
+        inlets, outlets = self.inlets, self.outlets
+        material_inlets = [s for s in inlets if not isinstance(s, EnergyStream)]
+        material_outlets = [s for s in outlets if not isinstance(s, EnergyStream)]
+        compounds = self.compounds
+        changed = False
+        while True:
+            progress = mole_balance(material_inlets, material_outlets, compounds)
+            if self.energy:
+                progress = energy_balance(inlets, outlets) or progress
+            if not progress:
+                return changed
+            changed = True
+
+
+class _TearStream(object):
+    def __init__(self, stream, consumers, compounds):
+        self.stream = stream
+        self.consumers = consumers
+        self.N = compounds
+        self.values = None
+        self.P = None
+        self.guess = StreamArgs(IDs=stream.IDs, pkg=stream.pkg, Vf_TP=stream.Vf_TP,
+                                Q_TP=stream.Q_TP, single_composition_basis=stream.single_composition_basis)
+
+    def setup(self, specifications):
+        # The flow of the tear stream is always iterated on; the energy only
+        # when the user has not fixed the state
+        state = {k: specifications[k] for k in ('T', 'P', 'VF', 'H', 'Hm', 'S', 'Sm', 'energy')
+                 if specifications[k] is not None}
+        self.state = state
+        self.energy = 'energy' not in state and len(state) < 2
+        size = self.N + self.energy
+        if self.values is None or len(self.values) != size:
+            stream, values = self.stream, None
+            try:
+                ns = stream.ns_calc
+                if ns is not None and None not in ns:
+                    values = list(ns)
+                    if self.energy:
+                        energy = stream.energy_calc
+                        values.append(energy if energy is not None else 0.0)
+            except Exception:
+                values = None
+            if values is None:
+                values = [0.0]*size
+            self.values = values
+
+    def set_guess(self, values):
+        guess = self.guess
+        s = guess.specifications
+        for k in s:
+            if k != 'IDs':
+                s[k] = None
+        s.update(self.state)
+        N = self.N
+        s['ns'] = list(values[:N])
+        if self.energy:
+            s['energy'] = float(values[N])
+            if len(self.state) == 0 and self.P is not None:
+                s['P'] = self.P
+        guess.hot_start = guess.__dict__.get('_mixture', None)
+
+    def calculated(self):
+        stream = self.stream
+        ns = stream.ns_calc
+        if ns is None or None in ns:
+            return None
+        values = list(ns)
+        if self.energy:
+            energy = stream.energy_calc
+            if energy is None:
+                return None
+            values.append(energy)
+        self.P = stream.specifications['P']
+        return values
+
+
+class Flowsheet(object):
+    r'''Sequential-modular solver for a network of :obj:`FlowsheetUnit`
+    objects, connected by sharing :obj:`StreamArgs` instances - a stream which
+    is an outlet of one unit and an inlet of another joins them.
+
+    The units are grouped into the strongly connected components of that
+    graph and solved in topological order. A group of more than one unit (or
+    a unit feeding itself) is a recycle loop; the streams closing it are
+    torn, replaced at their consumers by guessed streams, and their component
+    flows and energy flows are converged with Wegstein or Broyden
+    acceleration. Every stream computed in a pass is flashed starting from its
+    state in the previous pass.
+
+    Each time :obj:`solve` is called, all streams are first reset to the
+    specifications they had when the flowsheet was created; use
+    :obj:`update` to change a specification afterwards. Flow specifications of
+    a tear stream only provide the initial guess.
+
+    Parameters
+    ----------
+    units : list[FlowsheetUnit]
+        Units of the flowsheet, [-]
+    method : str, optional
+        Recycle convergence method, one of 'wegstein', 'broyden' or
+        'substitution', [-]
+    xtol : float, optional
+        Convergence tolerance on the tear stream component flows relative to
+        the stream's total flow, and on its energy flow relative to
+        :math:`|E| + nRT_{ref}`, [-]
+    maxiter : int, optional
+        Maximum number of passes through a recycle loop, [-]
+
+    Attributes
+    ----------
+    order : list[list[FlowsheetUnit]]
+        Groups of units in calculation order, [-]
+    tears : list[list[StreamArgs]]
+        Tear streams of each group, empty for groups without recycle, [-]
+    iterations : int
+        Number of passes through recycle loops in the last :obj:`solve`, [-]
+    '''
+    methods = ('wegstein', 'broyden', 'substitution')
+    wegstein_q_min = -5.0
+    wegstein_q_max = 0.0
+
+    def __repr__(self):
+        return '<Flowsheet, %d units, %d recycle loops>' %(len(self.units), sum(1 for t in self.tears if t))
+
+    def __init__(self, units, method='wegstein', xtol=1e-9, maxiter=100):
+        if method not in self.methods:
+            raise ValueError("Method must be one of %s" %(self.methods,))
+        self.units = units = list(units)
+        self.method = method
+        self.xtol = xtol
+        self.maxiter = maxiter
+        self.iterations = 0
+
+        streams, producers, consumers = {}, {}, {}
+        for i, unit in enumerate(units):
+            for s in unit.outlets:
+                if isinstance(s, EnergyStream):
+                    streams[id(s)] = s
+                elif isinstance(s, StreamArgs):
+                    if id(s) in producers:
+                        raise ValueError("A stream is an outlet of more than one unit")
+                    streams[id(s)] = s
+                    producers[id(s)] = i
+            for s in unit.inlets:
+                if isinstance(s, EnergyStream):
+                    streams[id(s)] = s
+                elif isinstance(s, StreamArgs):
+                    streams[id(s)] = s
+                    consumers.setdefault(id(s), []).append(i)
+        self._streams = list(streams.values())
+        self._specifications = {k: self._snapshot(s) for k, s in streams.items()}
+
+        successors = [[] for _ in units]
+        for k, i in producers.items():
+            for j in consumers.get(k, ()):
+                if j not in successors[i]:
+                    successors[i].append(j)
+
+        self._sequences, self._tears, self._resets = [], [], []
+        for component in _strongly_connected_components(successors):
+            members = set(component)
+            if len(component) == 1 and component[0] not in successors[component[0]]:
+                sequence, tears = component, []
+            else:
+                # Start from the units fed from outside the loop, and tear the
+                # streams which go back against the depth-first order
+                entries = [i for i in component
+                           if any(producers.get(id(s)) not in members
+                                  for s in units[i].inlets if isinstance(s, StreamArgs))]
+                visited, post = set(), []
+                def visit(v):
+                    visited.add(v)
+                    for w in successors[v]:
+                        if w in members and w not in visited:
+                            visit(w)
+                    post.append(v)
+                for v in entries + component:
+                    if v not in visited:
+                        visit(v)
+                sequence = post[::-1]
+                position = {v: k for k, v in enumerate(sequence)}
+                tears = []
+                for v in sequence:
+                    for s in units[v].outlets:
+                        if isinstance(s, StreamArgs):
+                            back = [j for j in consumers.get(id(s), ())
+                                    if j in members and position[j] <= position[v]]
+                            if back:
+                                tears.append(_TearStream(s, back, units[v].compounds))
+            # Streams recalculated on every pass: all but those coming from
+            # earlier groups
+            resets = {}
+            for i in sequence:
+                for s in units[i].inlets + units[i].outlets:
+                    if id(s) in streams and producers.get(id(s), i) in members:
+                        resets[id(s)] = s
+            self._sequences.append(sequence)
+            self._tears.append(tears)
+            self._resets.append(list(resets.values()))
+
+        self.order = [[units[i] for i in sequence] for sequence in self._sequences]
+        self.tears = [[tear.stream for tear in tears] for tears in self._tears]
+
+    def update(self, stream, **kwargs):
+        r'''Change specifications of one of the streams of the flowsheet; the
+        new specifications are kept for every later :obj:`solve`.
+
+        Parameters
+        ----------
+        stream : StreamArgs or EnergyStream
+            Stream to change, [-]
+        kwargs : dict
+            Specifications to set, by attribute name
+        '''
+        self._restore(stream)
+        for key, value in kwargs.items():
+            setattr(stream, key, value)
+        self._specifications[id(stream)] = self._snapshot(stream)
+
+    @staticmethod
+    def _snapshot(stream):
+        if isinstance(stream, EnergyStream):
+            return stream.Q
+        return _copy_specifications(stream.specifications)
+
+    def _restore(self, stream):
+        if isinstance(stream, EnergyStream):
+            stream.Q = self._specifications[id(stream)]
+        else:
+            _restore_specifications(stream, self._specifications[id(stream)])
+
+    def solve(self):
+        r'''Solve the flowsheet; the results are stored in the streams.
+        The converged tear streams of this solve are the initial guesses of
+        the next.
+        '''
+        units = self.units
+        self.iterations = 0
+        for stream in self._streams:
+            self._restore(stream)
+        for index, sequence in enumerate(self._sequences):
+            if self._tears[index]:
+                self._converge(index)
+            else:
+                for i in sequence:
+                    units[i].solve()
+        # Propagate anything which can only be found from downstream
+        for _ in range(len(units)):
+            progress = False
+            for unit in units:
+                if unit.solve():
+                    progress = True
+            if not progress:
+                break
+
+    def _evaluate(self, index, x):
+        units = self.units
+        sequence, tears = self._sequences[index], self._tears[index]
+        for stream in self._resets[index]:
+            self._restore(stream)
+        k = 0
+        saved = []
+        for tear in tears:
+            size = tear.N + tear.energy
+            tear.set_guess(x[k:k+size])
+            k += size
+            for j in tear.consumers:
+                unit = units[j]
+                saved.append((unit, unit.inlets))
+                unit.inlets = [tear.guess if s is tear.stream else s for s in unit.inlets]
+        try:
+            for _ in range(len(sequence) + 1):
+                progress = False
+                for i in sequence:
+                    if units[i].solve():
+                        progress = True
+                if not progress:
+                    break
+        finally:
+            for unit, inlets in reversed(saved):
+                unit.inlets = inlets
+        g = []
+        for tear in tears:
+            values = tear.calculated()
+            if values is None:
+                raise ValueError("Tear stream %s could not be calculated; the "
+                                 "recycle loop is underspecified" %(tear.stream,))
+            g.extend(values)
+        return g
+
+    def _converge(self, index):
+        tears = self._tears[index]
+        specifications = self._specifications
+        flows, x = [], []
+        for tear in tears:
+            tear.setup(specifications[id(tear.stream)])
+            x.extend(tear.values)
+            flows.extend([True]*tear.N)
+            if tear.energy:
+                flows.append(False)
+        x = np.array(x, dtype=float)
+        flows = np.array(flows)
+        method = self.method
+        q_min, q_max = self.wegstein_q_min, self.wegstein_q_max
+        x_prev = g_prev = F_prev = y_prev = H_inv = scale = None
+        for _ in range(self.maxiter):
+            g = np.array(self._evaluate(index, x), dtype=float)
+            self.iterations += 1
+            if scale is None:
+                scale = []
+                k = 0
+                for tear in tears:
+                    n = float(np.abs(g[k:k+tear.N]).sum()) or 1.0
+                    scale.extend([n]*tear.N)
+                    k += tear.N
+                    if tear.energy:
+                        scale.append(abs(g[k]) + n*R*298.15)
+                        k += 1
+                scale = np.array(scale)
+            F = (g - x)/scale
+            if np.abs(F).max() < self.xtol:
+                k = 0
+                for tear in tears:
+                    size = tear.N + tear.energy
+                    tear.values = g[k:k+size].tolist()
+                    k += size
+                return
+            if method == 'broyden':
+                y = x/scale
+                if H_inv is None:
+                    # Start from direct substitution
+                    H_inv = -np.eye(len(x))
+                else:
+                    dy, dF = y - y_prev, F - F_prev
+                    H_dF = H_inv.dot(dF)
+                    denominator = dy.dot(H_dF)
+                    if denominator != 0.0:
+                        H_inv += np.outer(dy - H_dF, dy.dot(H_inv))/denominator
+                y_prev, F_prev = y, F
+                x_new = (y - H_inv.dot(F))*scale
+            elif method == 'wegstein' and x_prev is not None:
+                dx, dg = x - x_prev, g - g_prev
+                moved = dx != 0.0
+                s = np.where(moved, dg/np.where(moved, dx, 1.0), 0.0)
+                q = np.where(s != 1.0, s/np.where(s != 1.0, s - 1.0, 1.0), q_min)
+                q = np.clip(q, q_min, q_max)
+                x_new = q*x + (1.0 - q)*g
+            else:
+                x_new = g
+            x_prev, g_prev = x, g
+            x = np.where(flows, np.maximum(x_new, 0.0), x_new)
+        raise UnconvergedError("Recycle loop with tear streams %s did not converge "
+                               "in %d iterations" %([tear.stream for tear in tears], self.maxiter))
@@ -80,6 +80,16 @@ def check_np_output_activity(model, modelnp, modelnp2):
             assert type(getattr(modelnp2, attr)()) is np.ndarray
 
 
+def check_batch_activity(model, T, xs_matrix, rtol=1e-12):
+    # The batch methods must match a model created for each composition
+    for attr in ('GE', 'dGE_dxs', 'd2GE_dxixjs', 'gammas'):
+        calc = getattr(model, attr + '_batch')(T, xs_matrix)
+        expect = np.array([getattr(model.to_T_xs(T, xs=list(xs) if model.scalar else np.array(xs)), attr)()
+                           for xs in xs_matrix])
+        assert type(calc) is np.ndarray
+        assert calc.shape == expect.shape
+        assert_allclose(calc, expect, rtol=rtol, atol=rtol*np.abs(expect).max())
+
 def plot_unsupported(reason, color='r'):
     '''Helper function - draw a plot with an `x` over it displaying a message
     why that plot is not supported.
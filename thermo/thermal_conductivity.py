@@ -454,6 +454,29 @@ class ThermalConductivityLiquid(TPDependentProperty):
             return self._base_calculate(T, method)
         return kl
 
+    def calculate_vectorized(self, Ts, method):
+        r'''Method to calculate the low-pressure thermal conductivity of a liquid at an array of temperatures with a given
+        method; the DIPPR and VDI PPDS methods are are evaluated with NumPy and other methods are handled by
+        :obj:`thermo.utils.TDependentProperty.calculate_vectorized`.
+
+        Parameters
+        ----------
+        Ts : ndarray
+            Temperatures at which to calculate the property, [K]
+        method : str
+            Name of the method to use
+
+        Returns
+        -------
+        kls : ndarray
+            Thermal conductivities of the liquid at Ts and a low pressure, [W/m/K]
+        '''
+        if method == DIPPR_PERRY_8E:
+            return EQ100(Ts, *self.Perrys2_315_coeffs)
+        elif method == VDI_PPDS:
+            return horner(self.VDI_PPDS_coeffs, Ts)
+        return super(ThermalConductivityLiquid, self).calculate_vectorized(Ts, method)
+
     def calculate_P(self, T, P, method):
         r'''Method to calculate pressure-dependent liquid thermal conductivity
         at temperature `T` and pressure `P` with a given method.
@@ -1120,6 +1143,29 @@ class ThermalConductivityGas(TPDependentProperty):
             return self._base_calculate(T, method)
         return kg
 
+    def calculate_vectorized(self, Ts, method):
+        r'''Method to calculate the low-pressure thermal conductivity of a gas at an array of temperatures with a given
+        method; the DIPPR and VDI PPDS methods are are evaluated with NumPy and other methods are handled by
+        :obj:`thermo.utils.TDependentProperty.calculate_vectorized`.
+
+        Parameters
+        ----------
+        Ts : ndarray
+            Temperatures at which to calculate the property, [K]
+        method : str
+            Name of the method to use
+
+        Returns
+        -------
+        kgs : ndarray
+            Thermal conductivities of the gas at Ts and a low pressure, [W/m/K]
+        '''
+        if method == DIPPR_PERRY_8E:
+            return EQ102(Ts, *self.Perrys2_314_coeffs)
+        elif method == VDI_PPDS:
+            return horner(self.VDI_PPDS_coeffs, Ts)
+        return super(ThermalConductivityGas, self).calculate_vectorized(Ts, method)
+
     def calculate_P(self, T, P, method):
         r'''Method to calculate pressure-dependent gas thermal conductivity
         at temperature `T` and pressure `P` with a given method.
@@ -49,6 +49,12 @@ Misc Functions
 .. autofunction:: chemgroups_to_matrix
 .. autofunction:: load_group_assignments_DDBST
 
+Interaction Parameter Arrays
+----------------------------
+.. autofunction:: unifac_ip_to_array
+.. autofunction:: load_unifac_ip_arrays
+.. autofunction:: compile_unifac_ip
+
 Data for Original UNIFAC
 ------------------------
 .. autodata:: UFSG
@@ -145,12 +151,14 @@ __all__ = ['UNIFAC_gammas','UNIFAC', 'UNIFAC_psi', 'DOUFMG', 'DOUFSG', 'UFSG', '
             'LUFSG', 'NISTUFSG', 'NISTUFMG',
            'VTPRSG', 'VTPRMG', 'NISTKTUFSG', 'NISTKTUFMG',
            'LUFMG', 'PSRKMG',
-           'unifac_gammas_at_T']
+           'unifac_gammas_at_T', 'unifac_ip_to_array', 'load_unifac_ip_arrays',
+           'compile_unifac_ip']
 import os
 from fluids.constants import R
 from fluids.numerics import numpy as np
 from chemicals.utils import log, exp, dxs_to_dns, can_load_data, PY37
 from thermo.activity import GibbsExcess
+from thermo.base import data_dir
 
 try:
     array, zeros, npexp, array_equal = np.array, np.zeros, np.exp, np.array_equal
@@ -2571,6 +2579,157 @@ def load_unifac_ip():
     _unifac_ip_loaded = True
 
 
+_unifac_ip_names = ('UFIP', 'LLEUFIP', 'LUFIP', 'DOUFIP2006', 'DOUFIP2016',
+                    'NISTUFIP', 'NISTKTUFIP', 'PSRKIP', 'VTPRIP')
+_unifac_ip_files = ('UNIFAC original interaction parameters.tsv',
+                    'UNIFAC LLE interaction parameters.tsv',
+                    'UNIFAC Lyngby interaction parameters.tsv',
+                    'UNIFAC modified Dortmund interaction parameters 2006.tsv',
+                    'UNIFAC modified Dortmund interaction parameters.tsv',
+                    'UNIFAC modified NIST 2015 interaction parameters.tsv',
+                    'NIST KT 2011 interaction parameters.tsv',
+                    'PSRK interaction parameters.tsv',
+                    'VTPR 2012 interaction parameters.tsv',
+                    'VTPR 2014 interaction parameters.tsv',
+                    'VTPR 2016 interaction parameters.tsv')
+_unifac_ip_folder = os.path.join(os.path.dirname(__file__), 'Phase Change')
+# Written to the user's thermo data directory, never the installed package;
+# without one (no appdirs) the arrays are only kept in memory
+unifac_ip_arrays_path = (os.path.join(data_dir, 'UNIFAC interaction parameters.snapshot')
+                         if data_dir else None)
+
+def unifac_ip_to_array(interaction_data):
+    r'''Convert UNIFAC interaction parameters stored as nested dictionaries,
+    such as :obj:`DOUFIP2016`, to a dense array indexed by
+    [coefficient][main group][main group]. Models with a single interaction
+    parameter have their `b` and `c` coefficients set to zero, as do pairs of
+    main groups without parameters.
+
+    Parameters
+    ----------
+    interaction_data : dict[int: dict[int: tuple(a_mn, b_mn, c_mn)]]
+        UNIFAC interaction parameter data, [-]
+
+    Returns
+    -------
+    interaction_array : ndarray
+        Coefficients `a`, `b`, and `c` of each pair of main groups, size 3 by
+        one more than the largest main group ID squared, [-]
+
+    Examples
+    --------
+    >>> unifac_ip_to_array({1: {2: 86.02}, 2: {1: -35.36}})[0]
+    array([[  0.  ,   0.  ,   0.  ],
+           [  0.  ,   0.  ,  86.02],
+           [  0.  , -35.36,   0.  ]])
+    '''
+    M = 1 + max([main1 for main1 in interaction_data]
+                + [main2 for row in interaction_data.values() for main2 in row])
+    interaction_array = zeros((3, M, M))
+    for main1, row in interaction_data.items():
+        for main2, v in row.items():
+            try:
+                interaction_array[:, main1, main2] = v[0], v[1], v[2]
+            except TypeError:
+                interaction_array[0, main1, main2] = v
+    return interaction_array
+
+def _unifac_ip_arrays():
+    if not _unifac_ip_loaded: load_unifac_ip()
+    module_data = globals()
+    return {name: unifac_ip_to_array(module_data[name]) for name in _unifac_ip_names}
+
+def compile_unifac_ip(path=None):
+    r'''Convert all of the UNIFAC interaction parameter tables included with
+    thermo to the array form of :obj:`unifac_ip_to_array`, and write them to
+    a binary file which :obj:`load_unifac_ip_arrays` can memory-map. This is
+    done automatically the first time the arrays are needed, or when the data
+    files are newer than the binary file.
+
+    Parameters
+    ----------
+    path : str, optional
+        File to write; defaults to the file read by
+        :obj:`load_unifac_ip_arrays`, in the user's thermo data directory.
+        If there is no such directory, nothing is written, [-]
+
+    Returns
+    -------
+    interaction_arrays : dict[str: ndarray]
+        Arrays of each table, indexed by the name of the table (e.g.
+        'DOUFIP2016'), [-]
+    '''
+    from thermo.serialize import dump_snapshot
+    interaction_arrays = _unifac_ip_arrays()
+    if path is None:
+        path = unifac_ip_arrays_path
+        if path is None:
+            return interaction_arrays
+    folder = os.path.dirname(path)
+    if folder and not os.path.isdir(folder):
+        os.makedirs(folder)
+    # Write to a temporary file first so other processes never map a partial file
+    tmp_path = '%s.%d.tmp' %(path, os.getpid())
+    try:
+        dump_snapshot(interaction_arrays, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return interaction_arrays
+
+UNIFAC_IP_ARRAYS = None
+def load_unifac_ip_arrays():
+    r'''Load the array form of all of the UNIFAC interaction parameter tables
+    included with thermo, memory-mapping the binary file written by
+    :obj:`compile_unifac_ip` in the user's thermo data directory. The file is
+    regenerated if it is missing, unreadable, or older than the data files.
+    If it cannot be written for any reason, there is no user data directory,
+    or Python is older than 3.8 (which cannot memory-map the file), the
+    arrays are created and kept in memory instead.
+
+    Returns
+    -------
+    interaction_arrays : dict[str: ndarray]
+        Arrays of each table, indexed by the name of the table (e.g.
+        'DOUFIP2016'), [-]
+
+    Examples
+    --------
+    >>> arrays = load_unifac_ip_arrays()
+    >>> arrays['DOUFIP2016'][:, 1, 7]
+    array([ 1.3913e+03, -3.6156e+00,  1.1440e-03])
+    '''
+    global UNIFAC_IP_ARRAYS
+    if UNIFAC_IP_ARRAYS is not None:
+        return UNIFAC_IP_ARRAYS
+    from thermo.serialize import load_snapshot, SNAPSHOT_BUFFERS
+    path = unifac_ip_arrays_path
+    arrays = None
+    if path is not None and SNAPSHOT_BUFFERS:
+        try:
+            mtime = os.path.getmtime(path)
+            current = all(os.path.getmtime(os.path.join(_unifac_ip_folder, name)) < mtime
+                          for name in _unifac_ip_files)
+        except OSError:
+            current = False
+        if current:
+            try:
+                arrays = load_snapshot(path, mmap=True)
+            except Exception:
+                pass
+        if arrays is None:
+            try:
+                arrays = compile_unifac_ip(path)
+            except Exception:
+                # The file is only an optimization
+                pass
+    if arrays is None:
+        arrays = _unifac_ip_arrays()
+    UNIFAC_IP_ARRAYS = arrays
+    return arrays
+
+
 if PY37:
     def __getattr__(name):
         if name in ('UFIP', 'LLEUFIP', 'LUFIP', 'DOUFIP2006', 'DOUFIP2016',
@@ -3763,6 +3922,69 @@ def unifac_lnGammas_subgroups_pure(N, N_groups, Qs, Thetas_pure, cmp_group_idx,
             row[i] = v
     return lnGammas_subgroups_pure
 
+# Sparse form of the group interaction terms, used by UNIFAC(sparse=True).
+# A group pair without interaction parameters has psi = 1, so the psi matrix
+# is stored as psi - 1 at the pairs (psi_rows[i], psi_cols[i]) which have any
+# nonzero parameter; the sums over groups are then a plain sum plus a sparse
+# product, evaluated here with bincount.
+def unifac_psi_pairs(psi_a, psi_b, psi_c):
+    nonzero = (psi_a != 0.0) | (psi_b != 0.0) | (psi_c != 0.0)
+    psi_rows, psi_cols = np.nonzero(nonzero)
+    return psi_rows, psi_cols
+
+def unifac_psis_sparse(T, version, psi_a, psi_b, psi_c, psi_rows, psi_cols):
+    a, b, c = psi_a[psi_rows, psi_cols], psi_b[psi_rows, psi_cols], psi_c[psi_rows, psi_cols]
+    mT_inv = -1.0/T
+    if version == 4 or version == 5:
+        T0 = 298.15
+        return np.expm1(mT_inv*(a + b*(T - T0) + c*(T*log(T0/T) + T - T0)))
+    return np.expm1(a*mT_inv - b - c*T)
+
+def unifac_Theta_Psi_sums_sparse(N_groups, Thetas, psi_rows, psi_cols, psis_sparse):
+    return Thetas.sum() + np.bincount(psi_cols, weights=Thetas[psi_rows]*psis_sparse, minlength=N_groups)
+
+def unifac_lnGammas_subgroups_sparse(N_groups, Qs, Thetas, Theta_Psi_sums, Theta_Psi_sum_invs,
+                                     psi_rows, psi_cols, psis_sparse):
+    ws = Thetas*Theta_Psi_sum_invs
+    sums = ws.sum() + np.bincount(psi_rows, weights=ws[psi_cols]*psis_sparse, minlength=N_groups)
+    return Qs*(1.0 - sums - np.log(Theta_Psi_sums))
+
+def unifac_pure_pairs(N, vs):
+    # Every ordered pair of subgroups (m, k) present in the same component i;
+    # the pure component terms only involve these blocks of the psi matrix
+    cmps, groups = np.nonzero(vs.T)
+    counts = np.bincount(cmps, minlength=N)
+    starts = np.cumsum(counts) - counts
+    repeats = counts[cmps]
+    first = np.repeat(np.arange(len(cmps)), repeats)
+    second = starts[cmps[first]] + np.arange(len(first)) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+    return cmps[first], groups[first], groups[second]
+
+def unifac_lnGammas_subgroups_pure_sparse(T, N, N_groups, version, Qs, vs, Thetas_pure, psi_a, psi_b, psi_c):
+    pair_cmps, pair_rows, pair_cols = unifac_pure_pairs(N, vs)
+    psis_block = 1.0 + unifac_psis_sparse(T, version, psi_a, psi_b, psi_c, pair_rows, pair_cols)
+    offsets = pair_cmps*N_groups
+    size = N*N_groups
+    Theta_pure_Psi_sums = np.bincount(offsets + pair_cols, weights=Thetas_pure[pair_cmps, pair_rows]*psis_block,
+                                      minlength=size).reshape(N, N_groups)
+    present = Theta_pure_Psi_sums != 0.0
+    ws = np.zeros((N, N_groups))
+    ws[present] = Thetas_pure[present]/Theta_pure_Psi_sums[present]
+    sums = np.bincount(offsets + pair_rows, weights=ws[pair_cmps, pair_cols]*psis_block,
+                       minlength=size).reshape(N, N_groups)
+    Theta_pure_Psi_sums[~present] = 1.0
+    lnGammas_subgroups_pure = Qs[:, None]*(1.0 - np.log(Theta_pure_Psi_sums.T) - sums.T)
+    lnGammas_subgroups_pure[vs == 0] = 0.0
+    return lnGammas_subgroups_pure
+
+def unifac_Xs_sparse(xs, vs):
+    Xs = vs @ xs
+    Xs_sum_inv = 1.0/Xs.sum()
+    return Xs*Xs_sum_inv, Xs_sum_inv
+
+def unifac_lngammas_r_sparse(lnGammas_subgroups_pure, lnGammas_subgroups, vs):
+    return lnGammas_subgroups @ vs - (vs*lnGammas_subgroups_pure).sum(axis=0)
+
 def unifac_dlnGammas_subgroups_pure_dT(N, N_groups, Qs, psis, dpsis_dT,
                                        Thetas_pure, Theta_pure_Psi_sum_invs, Fs_pure, cmp_group_idx,
                                        dlnGammas_subgroups_pure_dT=None, vec0=None):
@@ -4031,6 +4253,88 @@ def unifac_gammas_at_T(xs, N, N_groups, vs, rs, qs, Qs,
             gammas[i] = exp(lngammas_r[i] + lngammas_c[i])
     return gammas
 
+def unifac_Ws_batch(xs, Qs, vs):
+    # Batch functions take an (M, N) array of compositions. The rows of `Ws`
+    # are the products of `Qs` and the group amounts, so the `Thetas` are
+    # each row normalized.
+    return np.dot(xs, vs.T)*Qs
+
+def unifac_lngammas_r_batch(xs, Qs, vs, psis, lnGammas_pure_sums):
+    Ws = unifac_Ws_batch(xs, Qs, vs)
+    Ws_psis = np.dot(Ws, psis)
+    lnGammas_subgroups = Qs*(1.0 - np.log(Ws_psis/Ws.sum(axis=1)[:, None])
+                             - np.dot(Ws/Ws_psis, psis.T))
+    return np.dot(lnGammas_subgroups, vs) - lnGammas_pure_sums
+
+def unifac_lngammas_c_batch(xs, version, rs, qs, rs_34):
+    Vis_modified = rs_34/np.dot(xs, rs_34)[:, None]
+    lngammas_c = 1.0 - Vis_modified + np.log(Vis_modified)
+    if version != 4:
+        Vis_Fis = (rs/qs)*(np.dot(xs, qs)/np.dot(xs, rs))[:, None]
+        lngammas_c -= 5.0*qs*(1.0 - Vis_Fis + np.log(Vis_Fis))
+    return lngammas_c
+
+def unifac_GE_batch(T, xs, version, rs, qs, rs_34, Qs, vs, psis, lnGammas_pure_sums):
+    Ws = unifac_Ws_batch(xs, Qs, vs)
+    Theta_Psi_sums = np.dot(Ws, psis)/Ws.sum(axis=1)[:, None]
+    gE = -(Ws*np.log(Theta_Psi_sums)).sum(axis=1) - np.dot(xs, lnGammas_pure_sums)
+    if version != 3:
+        xs_sum, r34x_sum = xs.sum(axis=1), np.dot(xs, rs_34)
+        gE += xs_sum - 1.0 + np.dot(xs, np.log(rs_34)) - xs_sum*np.log(r34x_sum)
+        if version != 4:
+            qx_sum = np.dot(xs, qs)
+            gE -= 5.0*(np.dot(xs, qs*np.log(rs/qs)) + qx_sum*np.log(qx_sum/np.dot(xs, rs)))
+    return R*T*gE
+
+def unifac_dGE_dxs_batch(T, xs, version, rs, qs, rs_34, Qs, vs, psis, lnGammas_pure_sums):
+    # The residual part of GE/RT is homogeneous in the group amounts, so its
+    # derivatives are the residual lngammas
+    dgE = unifac_lngammas_r_batch(xs, Qs, vs, psis, lnGammas_pure_sums)
+    if version != 3:
+        r34x_sum = np.dot(xs, rs_34)
+        dgE += (1.0 + np.log(rs_34) - np.log(r34x_sum)[:, None]
+                - (xs.sum(axis=1)/r34x_sum)[:, None]*rs_34)
+        if version != 4:
+            rx_sum, qx_sum = np.dot(xs, rs), np.dot(xs, qs)
+            dgE -= 5.0*(qs*(np.log(rs/qs) + 1.0 + np.log(qx_sum/rx_sum)[:, None])
+                        - (qx_sum/rx_sum)[:, None]*rs)
+    return R*T*dgE
+
+def unifac_d2GE_dxixjs_batch(T, xs, version, rs, qs, rs_34, Qs, vs, psis, lnGammas_pure_sums):
+    M, N = xs.shape
+    Ws = unifac_Ws_batch(xs, Qs, vs)
+    Ws_sum_inv = 1.0/Ws.sum(axis=1)
+    Ws_psis_inv = 1.0/np.dot(Ws, psis)
+    vec0 = Ws*Ws_psis_inv*Ws_psis_inv
+    # Component by group matrices of the group derivatives
+    vsQs = vs.T*Qs
+    vsQs_psis = np.dot(vsQs, psis)
+    vsQs_T, vsQs_psis_T = vsQs.T.copy(), vsQs_psis.T.copy()
+    vsQs_sums = vsQs.sum(axis=1)
+    if version != 3:
+        xs_sum, r34x_sum_inv = xs.sum(axis=1), 1.0/np.dot(xs, rs_34)
+        rx_sum_inv, qx_sum = 1.0/np.dot(xs, rs), np.dot(xs, qs)
+    RT = R*T
+    d2GE_dxixjs = np.zeros((M, N, N))
+    for i in range(N):
+        tot = (vsQs_sums[i]*vsQs_sums*Ws_sum_inv[:, None]
+               + np.dot(vec0*vsQs_psis[i], vsQs_psis_T)
+               - np.dot(Ws_psis_inv*vsQs[i], vsQs_psis_T)
+               - np.dot(Ws_psis_inv*vsQs_psis[i], vsQs_T))
+        if version != 3:
+            tot += (xs_sum*r34x_sum_inv*r34x_sum_inv)[:, None]*(rs_34[i]*rs_34) - r34x_sum_inv[:, None]*(rs_34[i] + rs_34)
+            if version != 4:
+                tot -= 5.0*(qs[i]*qs/qx_sum[:, None] - rx_sum_inv[:, None]*(qs[i]*rs + rs[i]*qs)
+                            + (qx_sum*rx_sum_inv*rx_sum_inv)[:, None]*(rs[i]*rs))
+        d2GE_dxixjs[:, i, :] = RT*tot
+    return d2GE_dxixjs
+
+def unifac_gammas_batch(xs, version, rs, qs, rs_34, Qs, vs, psis, lnGammas_pure_sums):
+    lngammas = unifac_lngammas_r_batch(xs, Qs, vs, psis, lnGammas_pure_sums)
+    if version != 3:
+        lngammas += unifac_lngammas_c_batch(xs, version, rs, qs, rs_34)
+    return np.exp(lngammas)
+
 def unifac_dgammas_dxs(N, xs, gammas, dlngammas_r_dxs, dlngammas_c_dxs, dgammas_dxs=None):
     if dgammas_dxs is None:
         dgammas_dxs = [[0.0]*N for _ in range(N)] # numba: delete
@@ -4291,6 +4595,18 @@ class UNIFAC(GibbsExcess):
         * 4 - Lyngby/Larsen has different combinatorial, 2/3 power
         * 5 - UNIFAC KT (2 params for psi, Lyngby/Larsen formulation;
           otherwise same as original)
+    T_cache_size : int, optional
+        Number of temperatures whose `psi` terms and pure-component subgroup
+        activity coefficients are kept for reuse by the models created with
+        :obj:`UNIFAC.to_T_xs`; 0 to disable, [-]
+    sparse : bool, optional
+        Whether to store the `psi` terms only for the pairs of subgroups with
+        nonzero interaction parameters, and calculate the subgroup sums of
+        the activity coefficients as vectorized sparse products; the pure
+        component terms use only the subgroups of each component. Requires
+        numpy inputs. Temperature and composition derivatives still use the
+        full `psi` matrices. This is much faster for mixtures with many
+        subgroups, [-]
 
     Attributes
     ----------
@@ -4298,6 +4614,12 @@ class UNIFAC(GibbsExcess):
         Temperature, [K]
     xs : list[float]
         Mole fractions, [-]
+    psi_rows : list[int]
+        Indexes of the first subgroup of each interacting pair; only set
+        if `sparse` is True, [-]
+    psi_cols : list[int]
+        Indexes of the second subgroup of each interacting pair; only set
+        if `sparse` is True, [-]
 
     Notes
     -----
@@ -4364,7 +4686,7 @@ class UNIFAC(GibbsExcess):
 
     @staticmethod
     def from_subgroups(T, xs, chemgroups, subgroups=None,
-                       interaction_data=None, version=0):
+                       interaction_data=None, version=0, sparse=False):
         r'''Method to construct a UNIFAC object from a dictionary of
         interaction parameters parameters and a list of dictionaries of UNIFAC keys.
         As the actual implementation is matrix based not dictionary based, this method
@@ -4383,11 +4705,15 @@ class UNIFAC(GibbsExcess):
             UNIFAC subgroup data; available dictionaries in this module include
             UFSG (original), DOUFSG (Dortmund), or NISTUFSG. The default depends
             on the given `version`, [-]
-        interaction_data : dict[int: dict[int: tuple(a_mn, b_mn, c_mn)]], optional
+        interaction_data : dict[int: dict[int: tuple(a_mn, b_mn, c_mn)]] or ndarray, optional
             UNIFAC interaction parameter data; available dictionaries in this
             module include UFIP (original), DOUFIP2006 (Dortmund parameters
             published in 2006), DOUFIP2016 (Dortmund parameters published in
-            2016), and NISTUFIP. The default depends on the given `version`, [-]
+            2016), and NISTUFIP. The array form of
+            :obj:`unifac_ip_to_array` is also accepted, and is faster for
+            mixtures with many subgroups. The default depends on the given
+            `version`, and uses the array form of the matching table from
+            :obj:`load_unifac_ip_arrays`, [-]
         version : int, optional
             Which version of the model to use. Defaults to 0, [-]
 
@@ -4398,6 +4724,9 @@ class UNIFAC(GibbsExcess):
             * 4 - Lyngby/Larsen has different combinatorial, 2/3 power
             * 5 - UNIFAC KT (2 params for psi, Lyngby/Larsen formulation;
               otherwise same as original)
+        sparse : bool, optional
+            Whether to use the sparse form of the `psi` terms; see
+            :obj:`UNIFAC`, [-]
 
         Returns
         -------
@@ -4415,6 +4744,11 @@ class UNIFAC(GibbsExcess):
             For version 1, the interaction data defaults to the Dortmund parameters
             publshed in 2016 (not 2006).
 
+        The default interaction data is read from the data files included with
+        thermo; to use a table which has been modified in memory (for
+        example, with parameters added to :obj:`DOUFIP2016`), pass it as
+        `interaction_data`.
+
         Examples
         --------
         Mixture of ['benzene', 'cyclohexane', 'acetone', 'ethanol']
@@ -4444,21 +4778,21 @@ class UNIFAC(GibbsExcess):
             else:
                 raise ValueError("'version' must be a number from 0 to 5")
         if interaction_data is None:
-            if not _unifac_ip_loaded: load_unifac_ip()
             if version == 0:
-                interaction_data = UFIP
+                interaction_data = 'UFIP'
             elif version == 1:
-                interaction_data = DOUFIP2016
+                interaction_data = 'DOUFIP2016'
             elif version == 2:
-                interaction_data = PSRKIP
+                interaction_data = 'PSRKIP'
             elif version == 3:
-                interaction_data = VTPRIP
+                interaction_data = 'VTPRIP'
             elif version == 4:
-                interaction_data = LUFIP
+                interaction_data = 'LUFIP'
             elif version == 5:
-                interaction_data = NISTKTUFIP
+                interaction_data = 'NISTKTUFIP'
             else:
                 raise ValueError("'version' must be a number from 0 to 5")
+            interaction_data = load_unifac_ip_arrays()[interaction_data]
 
         scalar = type(xs) is list
         rs = []
@@ -4491,35 +4825,53 @@ class UNIFAC(GibbsExcess):
         Qs = [subgroups[group].Q for group in subgroup_list]
         vs = chemgroups_to_matrix(chemgroups)
 
-        psi_a, psi_b, psi_c = [], [], []
-        for sub1 in subgroup_list:
-            a_row, b_row, c_row = [], [], []
-            for sub2 in subgroup_list:
-                main1 = subgroups[sub1].main_group_id
-                main2 = subgroups[sub2].main_group_id
-                try:
-                    v = interaction_data[main1][main2]
+        if not isinstance(interaction_data, dict):
+            # Gather all pairs of main groups at once from the array form
+            mains = array([subgroups[sub].main_group_id for sub in subgroup_list])
+            known = mains < interaction_data.shape[1]
+            idx = np.where(known, mains, 0)
+            psi_a, psi_b, psi_c = interaction_data[:, idx[:, None], idx[None, :]]
+            if not known.all():
+                for psi in (psi_a, psi_b, psi_c):
+                    psi[~known, :] = 0.0
+                    psi[:, ~known] = 0.0
+            if scalar:
+                psi_a, psi_b, psi_c = psi_a.tolist(), psi_b.tolist(), psi_c.tolist()
+        else:
+            psi_a, psi_b, psi_c = [], [], []
+            for sub1 in subgroup_list:
+                a_row, b_row, c_row = [], [], []
+                for sub2 in subgroup_list:
+                    main1 = subgroups[sub1].main_group_id
+                    main2 = subgroups[sub2].main_group_id
                     try:
-                        a_row.append(v[0])
-                        b_row.append(v[1])
-                        c_row.append(v[2])
-                    except:
-                        a_row.append(v)
-                        b_row.append(0.0)
-                        c_row.append(0.0)
-                except KeyError:
-                        a_row.append(0.0)
-                        b_row.append(0.0)
-                        c_row.append(0.0)
-            psi_a.append(a_row), psi_b.append(b_row), psi_c.append(c_row)
+                        v = interaction_data[main1][main2]
+                        try:
+                            a_row.append(v[0])
+                            b_row.append(v[1])
+                            c_row.append(v[2])
+                        except:
+                            a_row.append(v)
+                            b_row.append(0.0)
+                            c_row.append(0.0)
+                    except KeyError:
+                            a_row.append(0.0)
+                            b_row.append(0.0)
+                            c_row.append(0.0)
+                psi_a.append(a_row), psi_b.append(b_row), psi_c.append(c_row)
 
 
 #        debug = (rs, qs, Qs, vs, (psi_a, psi_b, psi_c))
         if scalar:
-            return UNIFAC(T=T, xs=xs, rs=rs, qs=qs, Qs=Qs, vs=vs, psi_abc=(psi_a, psi_b, psi_c), version=version)
-        return UNIFAC(T=T, xs=xs, rs=array(rs), qs=array(qs), Qs=array(Qs), vs=array(vs), psi_abc=(array(psi_a), array(psi_b), array(psi_c)), version=version)
+            return UNIFAC(T=T, xs=xs, rs=rs, qs=qs, Qs=Qs, vs=vs, psi_abc=(psi_a, psi_b, psi_c), version=version, sparse=sparse)
+        return UNIFAC(T=T, xs=xs, rs=array(rs), qs=array(qs), Qs=array(Qs), vs=array(vs), psi_abc=(array(psi_a), array(psi_b), array(psi_c)), version=version, sparse=sparse)
 
     _model_attributes = ('rs', 'qs', 'psi_a', 'psi_b', 'psi_c', 'version')
+    _T_only_attributes = ('_psis', '_dpsis_dT', '_d2psis_dT2', '_d3psis_dT3',
+                          '_lnGammas_subgroups_pure', '_dlnGammas_subgroups_pure_dT',
+                          '_d2lnGammas_subgroups_pure_dT2', '_d3lnGammas_subgroups_pure_dT3',
+                          '_psis_sparse')
+    sparse = False
 
     def __repr__(self):  # pragma: no cover
 
@@ -4528,12 +4880,14 @@ class UNIFAC(GibbsExcess):
         s += 'T=%s, xs=%s, rs=%s, qs=%s' %(self.T, self.xs, self.rs, self.qs)
         s += ', Qs=%s, vs=%s, psi_abc=%s, version=%s' %(self.Qs, self.vs,
                                                         psi_abc, self.version)
+        if self.sparse:
+            s += ', sparse=True'
         s += ')'
         return s
 
 
     def __init__(self, T, xs, rs, qs, Qs, vs, psi_coeffs=None, psi_abc=None,
-                 version=0):
+                 version=0, T_cache_size=16, sparse=False):
         self.T = T
         self.xs = xs
         self.scalar = scalar = type(xs) is list
@@ -4565,6 +4919,11 @@ class UNIFAC(GibbsExcess):
         self.N = N = len(rs)
         self.version = version
         self.skip_comb = version == 3
+        if sparse:
+            if scalar:
+                raise ValueError("The sparse form of the psi terms requires numpy inputs")
+            self.sparse = True
+            self.psi_rows, self.psi_cols = unifac_psi_pairs(self.psi_a, self.psi_b, self.psi_c)
 
         if self.version == 1:
             power = 0.75
@@ -4580,43 +4939,42 @@ class UNIFAC(GibbsExcess):
             else:
                 self.rs_34 = rs**power
 
-        self.cmp_v_count = cmp_v_count = []
-        for i in range(N):
-            tot = 0
-            for group in range(N_groups):
-                tot += vs[group][i]
-            cmp_v_count.append(tot)
-        if scalar:
-            cmp_v_count_inv = [1.0/ni for ni in cmp_v_count]
-        else:
-            self.cmp_v_count = cmp_v_count = array(cmp_v_count)
-            cmp_v_count_inv = 1.0/cmp_v_count
-        self.cmp_v_count_inv = cmp_v_count_inv
-
-        # Matrix of [component][list(indexes to groups in component)], list of list
-        cmp_group_idx = [[j for j in range(N_groups) if vs[j][i]] for i in range(N)]
-        # TODO figure out the best way to handle this with numba
-        # as each array was supposedly a different shape
         if not scalar:
-            cmp_group_idx = tuple(array(v) for v in cmp_group_idx)
-        self.cmp_group_idx = cmp_group_idx
+            vs_array = array(vs)
+            self.cmp_v_count = cmp_v_count = vs_array.sum(axis=0)
+            self.cmp_v_count_inv = 1.0/cmp_v_count
+            # Indexes of the groups in each component, and of the components
+            # with each group
+            # TODO figure out the best way to handle this with numba
+            # as each array was supposedly a different shape
+            self.cmp_group_idx = tuple(vs_array[:, i].nonzero()[0] for i in range(N))
+            self.group_cmp_idx = tuple(vs_array[k].nonzero()[0] for k in range(N_groups))
+        else:
+            self.cmp_v_count = cmp_v_count = []
+            for i in range(N):
+                tot = 0
+                for group in range(N_groups):
+                    tot += vs[group][i]
+                cmp_v_count.append(tot)
+            self.cmp_v_count_inv = [1.0/ni for ni in cmp_v_count]
 
+            # Matrix of [component][list(indexes to groups in component)], list of list
+            self.cmp_group_idx = cmp_group_idx = [[j for j in range(N_groups) if vs[j][i]] for i in range(N)]
 
-        group_cmp_idx = []
-        for k in range(N_groups):
-            temp = []
-            for i in range(N):
-                groups2 = cmp_group_idx[i]
-                if k in groups2:
-                    temp.append(i)
-            group_cmp_idx.append(temp)
-        if not scalar:
-            group_cmp_idx = tuple(array(v) for v in group_cmp_idx)
-        self.group_cmp_idx = group_cmp_idx
+            group_cmp_idx = []
+            for k in range(N_groups):
+                temp = []
+                for i in range(N):
+                    groups2 = cmp_group_idx[i]
+                    if k in groups2:
+                        temp.append(i)
+                group_cmp_idx.append(temp)
+            self.group_cmp_idx = group_cmp_idx
 
         # Calculate the composition and temperature independent parameters on initialization
         self.Thetas_pure()
         self.Xs_pure()
+        self._set_T_cache(T_cache_size)
 
     def to_T_xs(self, T, xs):
         r'''Method to construct a new :obj:`UNIFAC` instance at
@@ -4640,6 +4998,8 @@ class UNIFAC(GibbsExcess):
         If the new temperature is the same temperature as the existing
         temperature, if the `psi` terms or their derivatives have been
         calculated, they will be set to the new object as well.
+        The same is done for any temperature in :obj:`T_cache <thermo.activity.GibbsExcess.T_cache>`,
+        using the last model created there.
         If the mole fractions are the same, various subgroup terms are also
         kept.
         '''
@@ -4664,6 +5024,8 @@ class UNIFAC(GibbsExcess):
         new.skip_comb = self.skip_comb
 
         new.psi_a, new.psi_b, new.psi_c = self.psi_a, self.psi_b, self.psi_c
+        if self.sparse:
+            new.sparse, new.psi_rows, new.psi_cols = True, self.psi_rows, self.psi_cols
 
         try:
             new.rs_34 = self.rs_34
@@ -4672,42 +5034,7 @@ class UNIFAC(GibbsExcess):
 
         new._Thetas_pure = self._Thetas_pure
         new._Xs_pure = self._Xs_pure
-        if T == self.T:
-            # interaction parameters that depend on T only
-            try:
-                new._psis = self._psis
-            except AttributeError:
-                pass
-            try:
-                new._dpsis_dT = self._dpsis_dT
-            except AttributeError:
-                pass
-            try:
-                new._d2psis_dT2 = self._d2psis_dT2
-            except AttributeError:
-                pass
-            try:
-                new._d3psis_dT3 = self._d3psis_dT3
-            except AttributeError:
-                pass
-
-            # pure parameters that depend on T only
-            try:
-                new._lnGammas_subgroups_pure = self._lnGammas_subgroups_pure
-            except AttributeError:
-                pass
-            try:
-                new._dlnGammas_subgroups_pure_dT = self._dlnGammas_subgroups_pure_dT
-            except AttributeError:
-                pass
-            try:
-                new._d2lnGammas_subgroups_pure_dT2 = self._d2lnGammas_subgroups_pure_dT2
-            except AttributeError:
-                pass
-            try:
-                new._d3lnGammas_subgroups_pure_dT3 = self._d3lnGammas_subgroups_pure_dT3
-            except AttributeError:
-                pass
+        self._transfer_T_only(new)
         if (self.scalar and xs == self.xs) or (not self.scalar and array_equal(xs, self.xs)):
             try:
                 new._Fis = self._Fis
@@ -4827,6 +5154,11 @@ class UNIFAC(GibbsExcess):
         except AttributeError:
             pass
         T, N_groups = self.T, self.N_groups
+        if self.sparse:
+            psis = np.ones((N_groups, N_groups))
+            psis[self.psi_rows, self.psi_cols] += self.psis_sparse()
+            self._psis = psis
+            return psis
 #        mT_inv = -1.0/T
         psi_a, psi_b, psi_c = self.psi_a, self.psi_b, self.psi_c
         if self.scalar:
@@ -4837,6 +5169,29 @@ class UNIFAC(GibbsExcess):
         self._psis = unifac_psis(T, N_groups, self.version, psi_a, psi_b, psi_c, psis)
         return psis
 
+    def psis_sparse(self):
+        r'''Calculate the :math:`\Psi_{mn} - 1` terms of the pairs of subgroups
+        with nonzero interaction parameters, :obj:`psi_rows <UNIFAC>` and
+        :obj:`psi_cols <UNIFAC>`. Only available when the model was created
+        with `sparse` set to True. The :math:`\Psi` terms of all other pairs
+        are 1.
+
+        Calculating the difference from one directly keeps the precision of
+        terms close to 1.
+
+        Returns
+        -------
+        psis_sparse : list[float]
+            `psi` terms minus one, size number of interacting pairs [-]
+        '''
+        try:
+            return self._psis_sparse
+        except AttributeError:
+            pass
+        self._psis_sparse = unifac_psis_sparse(self.T, self.version, self.psi_a, self.psi_b, self.psi_c,
+                                               self.psi_rows, self.psi_cols)
+        return self._psis_sparse
+
     def dpsis_dT(self):
         r'''Calculate the :math:`\Psi` term first temperature derivative
         matrix for all groups interacting with all other groups.
@@ -5496,6 +5851,9 @@ class UNIFAC(GibbsExcess):
         # is an index, numbered sequentially by the number of subgroups in the mixture
         vs, xs = self.vs, self.xs
         N, N_groups = self.N, self.N_groups
+        if self.sparse:
+            self._Xs, self.Xs_sum_inv = unifac_Xs_sparse(xs, vs)
+            return self._Xs
         if self.scalar:
             Xs = [0.0]*N_groups
         else:
@@ -5717,11 +6075,14 @@ class UNIFAC(GibbsExcess):
             Thetas = self._Thetas
         except AttributeError:
             Thetas = self.Thetas()
+        N_groups = self.N_groups
+        if self.sparse:
+            self.Theta_Psi_sums = unifac_Theta_Psi_sums_sparse(N_groups, Thetas, self.psi_rows, self.psi_cols, self.psis_sparse())
+            return self.Theta_Psi_sums
         try:
             psis = self._psis
         except AttributeError:
             psis = self.psis()
-        N_groups = self.N_groups
 
         if self.scalar:
             Theta_Psi_sums = [0.0]*N_groups
@@ -6015,10 +6376,6 @@ class UNIFAC(GibbsExcess):
             Thetas = self._Thetas
         except AttributeError:
             Thetas = self.Thetas()
-        try:
-            psis = self._psis
-        except AttributeError:
-            psis = self.psis()
         try:
             Theta_Psi_sums = self.Theta_Psi_sums
         except AttributeError:
@@ -6029,6 +6386,14 @@ class UNIFAC(GibbsExcess):
             Theta_Psi_sum_invs = self._Theta_Psi_sum_invs()
 
         N, N_groups, Qs = self.N, self.N_groups, self.Qs
+        if self.sparse:
+            self._lnGammas_subgroups = unifac_lnGammas_subgroups_sparse(N_groups, Qs, Thetas, Theta_Psi_sums, Theta_Psi_sum_invs,
+                                                                        self.psi_rows, self.psi_cols, self.psis_sparse())
+            return self._lnGammas_subgroups
+        try:
+            psis = self._psis
+        except AttributeError:
+            psis = self.psis()
 
         if self.scalar:
             lnGammas_subgroups = [0.0]*N_groups
@@ -6506,7 +6871,8 @@ class UNIFAC(GibbsExcess):
         if self.scalar:
             Xs_pure = [[0.0]*N for _ in range(N_groups)]
         else:
-            Xs_pure = zeros((N_groups, N))
+            self._Xs_pure = Xs_pure = array(vs)*cmp_v_count_inv
+            return Xs_pure
         self._Xs_pure = unifac_Xs_pure(N, N_groups, vs, cmp_v_count_inv, Xs_pure)
         return Xs_pure
 
@@ -6536,7 +6902,9 @@ class UNIFAC(GibbsExcess):
         if self.scalar:
             Thetas_pure = [[0.0]*N_groups for _ in range(N)]
         else:
-            Thetas_pure = zeros((N, N_groups))
+            QXs = Qs[:, None]*Xs_pure
+            self._Thetas_pure = Thetas_pure = (QXs*(1.0/QXs.sum(axis=0))).T.copy()
+            return Thetas_pure
 
         # Revised! Keep in order [component][subgroup]
         self._Thetas_pure = unifac_Thetas_pure(N, N_groups, Xs_pure, Qs, Thetas_pure)
@@ -6565,12 +6933,16 @@ class UNIFAC(GibbsExcess):
             return self._lnGammas_subgroups_pure
         except AttributeError:
             pass
+        N, N_groups, Qs = self.N, self.N_groups, self.Qs
+        Thetas_pure, cmp_group_idx = self._Thetas_pure, self.cmp_group_idx
+        if self.sparse:
+            self._lnGammas_subgroups_pure = unifac_lnGammas_subgroups_pure_sparse(self.T, N, N_groups, self.version, Qs, self.vs, Thetas_pure,
+                                                                                  self.psi_a, self.psi_b, self.psi_c)
+            return self._lnGammas_subgroups_pure
         try:
             psis = self._psis
         except AttributeError:
             psis = self.psis()
-        N, N_groups, Qs = self.N, self.N_groups, self.Qs
-        Thetas_pure, cmp_group_idx = self._Thetas_pure, self.cmp_group_idx
 
         if self.scalar:
             lnGammas_subgroups_pure = [[0.0]*N for _ in range(N_groups)]
@@ -6816,7 +7188,10 @@ class UNIFAC(GibbsExcess):
             lngammas_r = zeros(N)
 
         if N != 1:
-            unifac_lngammas_r(N, N_groups, lnGammas_subgroups_pure, lnGammas_subgroups, vs, lngammas_r)
+            if self.sparse:
+                lngammas_r = unifac_lngammas_r_sparse(lnGammas_subgroups_pure, lnGammas_subgroups, vs)
+            else:
+                unifac_lngammas_r(N, N_groups, lnGammas_subgroups_pure, lnGammas_subgroups, vs, lngammas_r)
 
         self._lngammas_r = lngammas_r
 
@@ -7295,6 +7670,118 @@ class UNIFAC(GibbsExcess):
         self._gammas = gammas
         return gammas
 
+    def _batch_terms(self, T):
+        if self.sparse:
+            psis_sparse, lnGammas_subgroups_pure = self._batch_T_terms(T, 'psis_sparse', 'lnGammas_subgroups_pure')
+            N_groups = self.N_groups
+            psis = np.ones((N_groups, N_groups))
+            psis[self.psi_rows, self.psi_cols] += psis_sparse
+        else:
+            psis, lnGammas_subgroups_pure = self._batch_T_terms(T, 'psis', 'lnGammas_subgroups_pure')
+        vs, rs = array(self.vs), array(self.rs)
+        rs_34 = array(self.rs_34) if self.version in (1, 4) else rs
+        lnGammas_pure_sums = (vs*lnGammas_subgroups_pure).sum(axis=0)
+        return (self.version, rs, array(self.qs), rs_34, array(self.Qs), vs, psis,
+                lnGammas_pure_sums)
+
+    def GE_batch(self, T, xs_matrix):
+        r'''Calculate and return the excess Gibbs energy of many liquid
+        compositions at the temperature `T` with the UNIFAC model, evaluating
+        all of them together without creating a model object for each.
+
+        .. math::
+            \frac{G^E}{RT} = \sum_i x_i \ln \gamma_i^c - \sum_k Q_k n_k
+            \ln\left(\sum_m \Theta_m \Psi_{mk}\right)
+            - \sum_i x_i \sum_k \nu_k^{(i)} \ln \Gamma_k^{(i)}
+
+        where :math:`n_k` is the amount of group `k` per mole of mixture. The
+        derivatives of the residual part with respect to the group amounts
+        are the :math:`\ln \Gamma_k`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        GE : ndarray
+            Excess Gibbs energy of each composition, [J/mol]
+
+        Notes
+        -----
+        The :math:`\Psi` matrix is used in its dense form, also by models
+        created with `sparse` set.
+
+        Examples
+        --------
+        >>> GE = UNIFAC.from_subgroups(T=373.15, xs=[0.2, 0.8], chemgroups=[{9:6}, {1:1, 2:1, 14:1}], version=0)
+        >>> GE.GE_batch(373.15, [[0.2, 0.8], [0.5, 0.5]])
+        array([ 728.722, 1211.17])
+        '''
+        return unifac_GE_batch(T, self._batch_xs(xs_matrix), *self._batch_terms(T))
+
+    def dGE_dxs_batch(self, T, xs_matrix):
+        r'''Calculate and return the mole fraction derivatives of excess Gibbs
+        energy of many liquid compositions at the temperature `T` with the
+        UNIFAC model. See :obj:`GE_batch`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        dGE_dxs : ndarray
+            Mole fraction derivatives of excess Gibbs energy, one row per
+            composition, [J/mol]
+        '''
+        return unifac_dGE_dxs_batch(T, self._batch_xs(xs_matrix), *self._batch_terms(T))
+
+    def d2GE_dxixjs_batch(self, T, xs_matrix):
+        r'''Calculate and return the second mole fraction derivatives of excess
+        Gibbs energy of many liquid compositions at the temperature `T` with
+        the UNIFAC model. See :obj:`GE_batch`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        d2GE_dxixjs : ndarray
+            Second mole fraction derivatives of excess Gibbs energy, size
+            number of compositions x N x N, [J/mol]
+        '''
+        return unifac_d2GE_dxixjs_batch(T, self._batch_xs(xs_matrix), *self._batch_terms(T))
+
+    def gammas_batch(self, T, xs_matrix):
+        r'''Calculate and return the activity coefficients of many liquid
+        compositions at the temperature `T` with the UNIFAC model. See
+        :obj:`GE_batch`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        gammas : ndarray
+            Activity coefficients, one row per composition, [-]
+        '''
+        return unifac_gammas_batch(self._batch_xs(xs_matrix), *self._batch_terms(T))
+
     def dgammas_dT(self):
         r'''Calculates the first temperature derivative of activity
         coefficients with the UNIFAC model.
@@ -35,7 +35,8 @@ UNIQUAC Class
 .. autoclass:: UNIQUAC
     :members: to_T_xs, GE, dGE_dT, d2GE_dT2, d3GE_dT3, d2GE_dTdxs, dGE_dxs,
               d2GE_dxixjs, taus, dtaus_dT, d2taus_dT2, d3taus_dT3, phis, 
-              thetas, regress_binary_parameters
+              thetas, regress_binary_parameters, GE_batch, dGE_dxs_batch,
+              d2GE_dxixjs_batch
     :undoc-members:
     :show-inheritance:
     :exclude-members:
@@ -305,6 +306,50 @@ def uniquac_d2GE_dTdxs(N, T, xs, qs, taus, phis, phis_inv, dphis_dxs, thetas, dt
         d2GE_dTdxs[i] = R*(-T*Ttot + tot)
     return d2GE_dTdxs
 
+def uniquac_GE_batch(T, xs, z, rs, qs, taus):
+    # Batch functions take an (M, N) array of compositions. The combinatorial
+    # terms are written with the sums of `rs*xs` and `qs*xs` in place of
+    # `phis` and `thetas`.
+    rsxs_sum, qsxs_sum = np.dot(xs, rs), np.dot(xs, qs)
+    log_rsxs_sum, log_qsxs_sum = np.log(rsxs_sum), np.log(qsxs_sum)
+    qsxs_taus_jis = np.dot(xs, taus*qs[:, None])
+    gE = (np.dot(xs, np.log(rs)) - xs.sum(axis=1)*log_rsxs_sum
+          + 0.5*z*(np.dot(xs, qs*np.log(qs/rs)) + qsxs_sum*(log_rsxs_sum - log_qsxs_sum))
+          - (qs*xs*np.log(qsxs_taus_jis)).sum(axis=1) + qsxs_sum*log_qsxs_sum)
+    return R*T*gE
+
+def uniquac_dGE_dxs_batch(T, xs, z, rs, qs, taus):
+    rsxs_sum, qsxs_sum = np.dot(xs, rs), np.dot(xs, qs)
+    log_rsxs_sum, log_qsxs_sum = np.log(rsxs_sum), np.log(qsxs_sum)
+    qsxs_taus_jis = np.dot(xs, taus*qs[:, None])
+    rs_rsxs_sum = rs/rsxs_sum[:, None]
+    dGE_dxs = (np.log(rs) - log_rsxs_sum[:, None] - xs.sum(axis=1)[:, None]*rs_rsxs_sum
+               + 0.5*z*(qs*(np.log(qs/rs) - 1.0 + (log_rsxs_sum - log_qsxs_sum)[:, None])
+                        + qsxs_sum[:, None]*rs_rsxs_sum)
+               + qs*(1.0 + log_qsxs_sum[:, None] - np.log(qsxs_taus_jis)
+                     - np.dot(qs*xs/qsxs_taus_jis, taus.T)))
+    return R*T*dGE_dxs
+
+def uniquac_d2GE_dxixjs_batch(T, xs, z, rs, qs, taus):
+    M, N = xs.shape
+    rsxs_sum_inv, qsxs_sum_inv = 1.0/np.dot(xs, rs), 1.0/np.dot(xs, qs)
+    qsxs_taus_jis_inv = 1.0/np.dot(xs, taus*qs[:, None])
+    vec0 = qs*xs*qsxs_taus_jis_inv*qsxs_taus_jis_inv
+    taus_T = taus.T.copy()
+    # Terms multiplied by rs_i*rs_j and qs_i*qs_j
+    rr = (xs.sum(axis=1) - 0.5*z/qsxs_sum_inv)*rsxs_sum_inv*rsxs_sum_inv
+    qq = (1.0 - 0.5*z)*qsxs_sum_inv
+    RT = R*T
+    d2GE_dxixjs = np.zeros((M, N, N))
+    for i in range(N):
+        tot = (rr[:, None]*(rs[i]*rs)
+               + (0.5*z*(qs[i]*rs + rs[i]*qs) - rs[i] - rs)*rsxs_sum_inv[:, None]
+               + (qs[i]*qs)*(qq[:, None] + np.dot(vec0*taus[i], taus_T)
+                             - taus_T[i]*qsxs_taus_jis_inv[:, i:i+1]
+                             - taus[i]*qsxs_taus_jis_inv))
+        d2GE_dxixjs[:, i, :] = RT*tot
+    return d2GE_dxixjs
+
 class UNIQUAC(GibbsExcess):
     r'''Class for representing an a liquid with excess gibbs energy represented
     by the UNIQUAC equation. This model is capable of representing VL and LL
@@ -356,6 +401,9 @@ class UNIQUAC(GibbsExcess):
         `e` parameters used in calculating :obj:`UNIQUAC.taus`, [K^2]
     tau_fs : list[list[float]] or None, optional
         `f` parameters used in calculating :obj:`UNIQUAC.taus`, [1/K^2]
+    T_cache_size : int, optional
+        Number of temperatures whose `tau` terms are kept for reuse by the
+        models created with :obj:`UNIQUAC.to_T_xs`; 0 to disable, [-]
 
     Attributes
     ----------
@@ -499,6 +547,7 @@ class UNIQUAC(GibbsExcess):
     _model_attributes = ('tau_coeffs_A', 'tau_coeffs_B', 'tau_coeffs_C',
                         'tau_coeffs_D', 'tau_coeffs_E', 'tau_coeffs_F',
                         'rs', 'qs')
+    _T_only_attributes = ('_taus', '_dtaus_dT', '_d2taus_dT2', '_d3taus_dT3')
 
     def __repr__(self):
         s = '%s(T=%s, xs=%s, rs=%s, qs=%s, ABCDEF=%s)' %(self.__class__.__name__, repr(self.T), repr(self.xs), repr(self.rs), repr(self.qs),
@@ -508,7 +557,7 @@ class UNIQUAC(GibbsExcess):
 
     def __init__(self, T, xs, rs, qs, tau_coeffs=None, ABCDEF=None, 
                  tau_as=None, tau_bs=None, tau_cs=None, tau_ds=None, 
-                 tau_es=None, tau_fs=None):
+                 tau_es=None, tau_fs=None, T_cache_size=16):
         self.T = T
         self.xs = xs
         self.scalar = scalar = type(rs) is list
@@ -589,6 +638,7 @@ class UNIQUAC(GibbsExcess):
                 self.tau_coeffs_F = zero_coeffs
             else:
                 self.tau_coeffs_F = ABCDEF[5]
+        self._set_T_cache(T_cache_size)
 
     def to_T_xs(self, T, xs):
         r'''Method to construct a new :obj:`UNIQUAC` instance at
@@ -612,6 +662,8 @@ class UNIQUAC(GibbsExcess):
         If the new temperature is the same temperature as the existing
         temperature, if the `tau` terms or their derivatives have been
         calculated, they will be set to the new object as well.
+        The same is done for any temperature in :obj:`T_cache <thermo.activity.GibbsExcess.T_cache>`,
+        using the last model created there.
         '''
         new = self.__class__.__new__(self.__class__)
         new.T = T
@@ -626,23 +678,7 @@ class UNIQUAC(GibbsExcess):
          new.tau_coeffs_D, new.tau_coeffs_E, new.tau_coeffs_F) = (self.tau_coeffs_A, self.tau_coeffs_B, self.tau_coeffs_C,
                          self.tau_coeffs_D, self.tau_coeffs_E, self.tau_coeffs_F)
 
-        if T == self.T:
-            try:
-                new._taus = self._taus
-            except AttributeError:
-                pass
-            try:
-                new._dtaus_dT = self._dtaus_dT
-            except AttributeError:
-                pass
-            try:
-                new._d2taus_dT2 = self._d2taus_dT2
-            except AttributeError:
-                pass
-            try:
-                new._d3taus_dT3 = self._d3taus_dT3
-            except AttributeError:
-                pass
+        self._transfer_T_only(new)
         return new
     
 
@@ -1583,6 +1619,78 @@ class UNIQUAC(GibbsExcess):
         self._d2GE_dxixjs = d2GE_dxixjs
         return d2GE_dxixjs
 
+    def _batch_terms(self, T):
+        taus, = self._batch_T_terms(T, 'taus')
+        return array(self.rs), array(self.qs), taus
+
+    def GE_batch(self, T, xs_matrix):
+        r'''Calculate and return the excess Gibbs energy of many liquid
+        compositions at the temperature `T` with the UNIQUAC model, evaluating
+        all of them together without creating a model object for each.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        GE : ndarray
+            Excess Gibbs energy of each composition, [J/mol]
+
+        Examples
+        --------
+        >>> GE = UNIQUAC(T=343.15, xs=[0.252, 0.748], rs=[2.11, 0.92], qs=[1.97, 1.4], tau_bs=[[0, -80.0], [-295.0, 0]])
+        >>> GE.GE_batch(343.15, [[0.252, 0.748], [0.5, 0.5]])
+        array([1304.07, 1461.1])
+        '''
+        rs, qs, taus = self._batch_terms(T)
+        return uniquac_GE_batch(T, self._batch_xs(xs_matrix), self.z, rs, qs, taus)
+
+    def dGE_dxs_batch(self, T, xs_matrix):
+        r'''Calculate and return the mole fraction derivatives of excess Gibbs
+        energy of many liquid compositions at the temperature `T` with the
+        UNIQUAC model. See :obj:`GE_batch`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        dGE_dxs : ndarray
+            Mole fraction derivatives of excess Gibbs energy, one row per
+            composition, [J/mol]
+        '''
+        rs, qs, taus = self._batch_terms(T)
+        return uniquac_dGE_dxs_batch(T, self._batch_xs(xs_matrix), self.z, rs, qs, taus)
+
+    def d2GE_dxixjs_batch(self, T, xs_matrix):
+        r'''Calculate and return the second mole fraction derivatives of excess
+        Gibbs energy of many liquid compositions at the temperature `T` with
+        the UNIQUAC model. See :obj:`GE_batch`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        d2GE_dxixjs : ndarray
+            Second mole fraction derivatives of excess Gibbs energy, size
+            number of compositions x N x N, [J/mol]
+        '''
+        rs, qs, taus = self._batch_terms(T)
+        return uniquac_d2GE_dxixjs_batch(T, self._batch_xs(xs_matrix), self.z, rs, qs, taus)
+
     @classmethod
     def regress_binary_parameters(cls, gammas, xs, rs, qs, use_numba=False,
                                   do_statistics=True, **kwargs):
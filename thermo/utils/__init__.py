@@ -43,7 +43,7 @@ Temperature Dependent
              extrapolate, test_method_validity, calculate, from_json, as_json,
              interpolation_T, interpolation_T_inv, interpolation_property,
              interpolation_property_inv, T_limits, __repr__,
-             add_correlation
+             add_correlation, compile, uncompile, surrogate_cache_dir
    :undoc-members:
 
 Temperature and Pressure Dependent
@@ -71,6 +71,21 @@ Temperature, Pressure, and Composition Dependent
     :undoc-members:
     :show-inheritance:
 
+Piecewise Chebyshev Surrogates
+------------------------------
+.. autoclass:: PiecewiseChebyshev
+    :members: fit, derivative, integral, as_json, from_json
+.. autofunction:: chebyshev_nodes_fit
+
+Temperature Caches
+------------------
+.. autoclass:: TemperatureCache
+    :members: lookup, store, clear
+
+Vectorized Correlations
+-----------------------
+.. automodule:: thermo.utils.vectorized_correlations
+
 '''
 NEGLIGIBLE = 'NEGLIGIBLE'
 LINEAR = 'LINEAR'
@@ -108,6 +123,10 @@ from . import tp_dependent_property
 from .tp_dependent_property import *
 from . import mixture_property
 from .mixture_property import *
+from . import vectorized_correlations
+from .vectorized_correlations import *
+from . import temperature_cache
+from .temperature_cache import *
 
 __all__ = (
     *functional.__all__,
@@ -115,6 +134,8 @@ __all__ = (
     *t_dependent_property.__all__,
     *tp_dependent_property.__all__,
     *mixture_property.__all__,
+    *vectorized_correlations.__all__,
+    *temperature_cache.__all__,
     NEGLIGIBLE, LINEAR, POLY_FIT, EXP_POLY_FIT, POLY_FIT_LN_TAU, EXP_POLY_FIT_LN_TAU, 
     STABLEPOLY_FIT, EXP_STABLEPOLY_FIT, STABLEPOLY_FIT_LN_TAU, EXP_STABLEPOLY_FIT_LN_TAU,
     CHEB_FIT, EXP_CHEB_FIT, CHEB_FIT_LN_TAU, EXP_CHEB_FIT_LN_TAU,
@@ -20,9 +20,12 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
-__all__ = ['MultiCheb1D']
+__all__ = ['MultiCheb1D', 'PiecewiseChebyshev', 'chebyshev_nodes_fit']
 
-from bisect import bisect_left
+from bisect import bisect_left, bisect_right
+from math import cos, pi
+from fluids.numerics import (chebval, chebder, chebint,
+                             polynomial_offset_scale, numpy as np)
 
 class MultiCheb1D(object):
     '''Simple class to store set of coefficients for multiple chebyshev
@@ -49,3 +52,297 @@ class MultiCheb1D(object):
             c0 = c[-i] - c1
             c1 = tmp + c1*x2
         return c0 + c1*x
+
+
+def chebyshev_nodes_fit(f, xmin, xmax, deg):
+    r'''Fit a Chebyshev series of degree `deg` to the function `f` by
+    interpolating it at the Chebyshev nodes of the first kind in the interval
+    [`xmin`, `xmax`]. The coefficients are obtained with the discrete
+    orthogonality relation of the Chebyshev polynomials, so no linear solve
+    is required.
+
+    Parameters
+    ----------
+    f : callable
+        Function of one variable to fit, [-]
+    xmin : float
+        Lower limit of the fit, [-]
+    xmax : float
+        Upper limit of the fit, [-]
+    deg : int
+        Degree of the series, [-]
+
+    Returns
+    -------
+    coeffs : list[float]
+        Chebyshev coefficients in the scaled variable, [-]
+
+    Examples
+    --------
+    >>> coeffs = chebyshev_nodes_fit(lambda x: x*x, 0.0, 2.0, 2)
+    >>> [round(c, 12) for c in coeffs]
+    [1.5, 2.0, 0.5]
+    '''
+    n = deg + 1
+    half_range, mid = 0.5*(xmax - xmin), 0.5*(xmax + xmin)
+    thetas = [pi*(k + 0.5)/n for k in range(n)]
+    fs = [f(mid + half_range*cos(theta)) for theta in thetas]
+    coeffs = [0.0]*n
+    for j in range(n):
+        tot = 0.0
+        for k in range(n):
+            tot += fs[k]*cos(j*thetas[k])
+        coeffs[j] = 2.0*tot/n
+    coeffs[0] *= 0.5
+    return coeffs
+
+
+def _chebval_rows(u, C):
+    # Clenshaw recurrence where row i of `C` holds the coefficients used for
+    # the scaled point u[i]
+    m = C.shape[1]
+    if m == 1:
+        return C[:, 0].copy()
+    c0, c1 = C[:, -2], C[:, -1]
+    u2 = 2.0*u
+    for i in range(3, m + 1):
+        c0, c1 = C[:, -i] - c1, c0 + c1*u2
+    return c0 + c1*u
+
+
+class PiecewiseChebyshev(object):
+    r'''Class to store a piecewise Chebyshev approximation of a function of
+    one variable and evaluate it, its derivatives, and its integral.
+
+    The pieces are created by :obj:`PiecewiseChebyshev.fit`, which bisects
+    the fitting interval until every piece reproduces the function to the
+    requested tolerance. Derivative and integral series are obtained
+    analytically from the fitted series; the integral pieces are offset so
+    the integral is continuous across the breakpoints.
+
+    All evaluation methods also accept NumPy arrays, in which case every
+    element is evaluated at once.
+
+    Parameters
+    ----------
+    points : list[float]
+        Boundaries of the pieces, in increasing order; one more than the
+        number of pieces, [-]
+    coeffs : list[list[float]]
+        Chebyshev coefficients of each piece in the scaled variable, [-]
+
+    Attributes
+    ----------
+    xmin : float
+        Lower limit of the approximation, [-]
+    xmax : float
+        Upper limit of the approximation, [-]
+    N : int
+        Number of pieces, [-]
+
+    Examples
+    --------
+    >>> from math import exp
+    >>> approx = PiecewiseChebyshev.fit(exp, 0.0, 2.0, rtol=1e-13)
+    >>> round(approx(1.0), 12), round(approx.derivative(1.0), 12)
+    (2.718281828459, 2.718281828459)
+    >>> round(approx.integral(0.0, 2.0), 12)
+    6.389056098931
+    '''
+    def __init__(self, points, coeffs):
+        self.points = points = [float(v) for v in points]
+        self.coeffs = coeffs = [[float(v) for v in c] for c in coeffs]
+        self.N = N = len(coeffs)
+        if len(points) != N + 1:
+            raise ValueError("There must be one more point than set of coefficients")
+        self.xmin, self.xmax = points[0], points[-1]
+        # Interior breakpoints only; used to locate the piece
+        self._inner_points = points[1:-1]
+
+        offsets, scales, int_coeffs = [], [], []
+        for i in range(N):
+            offset, scale = polynomial_offset_scale(points[i], points[i+1])
+            offsets.append(offset)
+            scales.append(scale)
+            int_coeffs.append(chebint(coeffs[i], scl=1.0/scale))
+        self.offsets = offsets
+        self.scales = scales
+        self.int_coeffs = int_coeffs
+        # Constant added to each piece's antiderivative so that it measures
+        # the integral from xmin and is continuous across the breakpoints
+        int_bases = [0.0]*N
+        int_bases[0] = -chebval(points[0], int_coeffs[0], offsets[0], scales[0])
+        for i in range(1, N):
+            int_bases[i] = (int_bases[i-1]
+                            + chebval(points[i], int_coeffs[i-1], offsets[i-1], scales[i-1])
+                            - chebval(points[i], int_coeffs[i], offsets[i], scales[i]))
+        self.int_bases = int_bases
+        self._der_coeffs = {}
+        self._arrays = {}
+
+    def __repr__(self):
+        return '%s(points=%s, coeffs=%s)' %(self.__class__.__name__, self.points, self.coeffs)
+
+    def piece(self, x):
+        r'''Return the index of the piece containing `x`; values outside the
+        range are assigned to the first or last piece.'''
+        return bisect_right(self._inner_points, x)
+
+    def __call__(self, x):
+        if type(x) is np.ndarray:
+            return self._evaluate_array(x, 'value', self.coeffs)
+        i = bisect_right(self._inner_points, x)
+        return chebval(x, self.coeffs[i], self.offsets[i], self.scales[i])
+
+    def _evaluate_array(self, x, key, coeffs):
+        try:
+            inner, offsets, scales, C = self._arrays[key]
+        except KeyError:
+            arrays = self._arrays.get('value')
+            if arrays is None:
+                inner, offsets, scales = (np.array(self._inner_points), np.array(self.offsets),
+                                          np.array(self.scales))
+            else:
+                inner, offsets, scales = arrays[:3]
+            C = np.array(coeffs)
+            self._arrays[key] = inner, offsets, scales, C
+        idx = np.searchsorted(inner, x, side='right')
+        return _chebval_rows(offsets[idx] + scales[idx]*x, C[idx])
+
+    def derivative_coeffs(self, order=1):
+        r'''Return (and cache) the Chebyshev coefficients of each piece of
+        the `order`-th derivative of the approximation.'''
+        try:
+            return self._der_coeffs[order]
+        except KeyError:
+            pass
+        if order == 1:
+            prev = self.coeffs
+        else:
+            prev = self.derivative_coeffs(order - 1)
+        scales = self.scales
+        new = []
+        for i in range(self.N):
+            c = prev[i]
+            new.append(chebder(c, m=1, scl=scales[i]) if len(c) > 1 else [0.0])
+        self._der_coeffs[order] = new
+        return new
+
+    def derivative(self, x, order=1):
+        r'''Evaluate the `order`-th derivative of the approximation at
+        `x`.'''
+        if type(x) is np.ndarray:
+            return self._evaluate_array(x, order, self.derivative_coeffs(order))
+        i = bisect_right(self._inner_points, x)
+        return chebval(x, self.derivative_coeffs(order)[i], self.offsets[i], self.scales[i])
+
+    def _integral_from_xmin(self, x):
+        if type(x) is np.ndarray:
+            idx = np.searchsorted(self._inner_points, x, side='right')
+            return (np.array(self.int_bases)[idx]
+                    + self._evaluate_array(x, 'integral', self.int_coeffs))
+        i = bisect_right(self._inner_points, x)
+        return self.int_bases[i] + chebval(x, self.int_coeffs[i], self.offsets[i], self.scales[i])
+
+    def integral(self, x1, x2):
+        r'''Evaluate the integral of the approximation from `x1` to
+        `x2`; if either is an array, both are broadcast.'''
+        if type(x1) is np.ndarray or type(x2) is np.ndarray:
+            x1, x2 = np.broadcast_arrays(np.asarray(x1, dtype=float), np.asarray(x2, dtype=float))
+        return self._integral_from_xmin(x2) - self._integral_from_xmin(x1)
+
+    def as_json(self):
+        r'''Create a JSON-friendly representation of the approximation.'''
+        return {'points': self.points, 'coeffs': self.coeffs}
+
+    @classmethod
+    def from_json(cls, json_repr):
+        r'''Recreate an approximation from the output of
+        :obj:`PiecewiseChebyshev.as_json`.'''
+        return cls(json_repr['points'], json_repr['coeffs'])
+
+    @classmethod
+    def fit(cls, f, xmin, xmax, rtol=1e-10, atol=0.0, deg=12,
+            max_pieces=256, min_width=1e-6, truncate=False):
+        r'''Create a piecewise Chebyshev approximation of `f` accurate to
+        `rtol` (relative) and `atol` (absolute) on [`xmin`, `xmax`].
+
+        Each piece is a degree `deg` interpolant at the Chebyshev nodes; the
+        error is checked at the midpoints between the nodes, and pieces which
+        fail the check are bisected. A piece which is still not accurate
+        once it is narrower than `min_width` is an error unless `truncate`
+        is set, in which case the approximation range is reduced to exclude
+        it - the lower limit is raised if nothing has converged yet, otherwise
+        the upper limit is lowered to the start of the piece. This is useful
+        for functions with a singularity at an end point, such as properties
+        near the critical point.
+
+        Parameters
+        ----------
+        f : callable
+            Function of one variable to fit, [-]
+        xmin : float
+            Lower limit of the fit, [-]
+        xmax : float
+            Upper limit of the fit, [-]
+        rtol : float, optional
+            Relative tolerance, [-]
+        atol : float, optional
+            Absolute tolerance, [-]
+        deg : int, optional
+            Degree of each piece, [-]
+        max_pieces : int, optional
+            Maximum number of pieces before giving up, [-]
+        min_width : float, optional
+            Smallest piece width, relative to the full range, [-]
+        truncate : bool, optional
+            Whether to reduce the range to exclude pieces which cannot be
+            converged instead of raising an error, [-]
+
+        Returns
+        -------
+        approx : PiecewiseChebyshev
+            Fitted approximation, [-]
+        '''
+        if not xmax > xmin:
+            raise ValueError("xmax must be larger than xmin")
+        width_limit = min_width*(xmax - xmin)
+        # Test points are the extrema of T_{deg+1} between the nodes
+        n = deg + 1
+        test_us = [cos(pi*k/n) for k in range(1, n)]
+        done = []
+        pending = [(xmin, xmax)]
+        while pending:
+            a, b = pending.pop()
+            coeffs = chebyshev_nodes_fit(f, a, b, deg)
+            offset, scale = polynomial_offset_scale(a, b)
+            half_range, mid = 0.5*(b - a), 0.5*(b + a)
+            converged = True
+            for u in test_us:
+                x = mid + half_range*u
+                exact = f(x)
+                err = abs(chebval(x, coeffs, offset, scale) - exact)
+                if err > rtol*abs(exact) + atol:
+                    converged = False
+                    break
+            if converged:
+                done.append((a, b, coeffs))
+            elif (b - a) < width_limit:
+                if not truncate:
+                    raise ValueError("Could not converge the approximation "
+                                     "near x=%s" %(x))
+                # Pieces are processed in order; before anything converges
+                # the lower end moves up, afterwards the upper end moves down
+                if done:
+                    break
+            else:
+                mid_pt = 0.5*(a + b)
+                pending.append((mid_pt, b))
+                pending.append((a, mid_pt))
+            if len(done) + len(pending) > max_pieces:
+                raise ValueError("Approximation requires more than %d pieces" %(max_pieces))
+        if not done:
+            raise ValueError("Could not converge any part of the approximation")
+        done.sort()
+        points = [v[0] for v in done] + [done[-1][1]]
+        return cls(points, [v[2] for v in done])
@@ -26,11 +26,13 @@ __all__ = ['TDependentProperty', 'PROPERTY_TRANSFORM_LN', 'PROPERTY_TRANSFORM_DL
            'PROPERTY_TRANSFORM_D2LN', 'PROPERTY_TRANSFORM_D_X', 'PROPERTY_TRANSFORM_D2_X']
 
 import os
+import json
+import hashlib
 try:
     from random import uniform
 except: # pragma: no cover
     pass
-from math import inf, exp, log
+from math import inf, nan, exp, log
 
 from fluids.numerics import (quad, brenth, secant, linspace, newton,
                              polyint, polyint_over_x, derivative, 
@@ -68,6 +70,10 @@ from fluids.numerics import (quad, brenth, secant, linspace, newton,
 
 import fluids
 import chemicals
+from thermo.utils.multi_cheb_1d import PiecewiseChebyshev
+from thermo.utils.vectorized_correlations import (vectorized_correlation_functions, trunc_exp_vectorized,
+                                                  Antoine_vectorized, EQ101_vectorized,
+                                                  EQ106_vectorized)
 from chemicals.utils import isnan, log, e, hash_any_primitive
 from chemicals.vapor_pressure import (Antoine, Antoine_AB_coeffs_from_point,
                                       DIPPR101_ABC_coeffs_from_point, 
@@ -279,6 +285,58 @@ class ConstantLocalMethod:
     def f_int_over_T(self, Ta, Tb):
         return self.value * log(Tb/Ta)
 
+class PropertySurrogate:
+    __slots__ = ('method', 'Tmin', 'Tmax', 'rtol', 'fit', 'fit_over_T')
+
+    def __init__(self, method, Tmin, Tmax, rtol, fit, fit_over_T):
+        self.method = method
+        self.Tmin = Tmin
+        self.Tmax = Tmax
+        self.rtol = rtol
+        self.fit = fit
+        self.fit_over_T = fit_over_T
+
+    def as_json(self):
+        return {'method': self.method, 'Tmin': self.Tmin, 'Tmax': self.Tmax,
+                'rtol': self.rtol, 'fit': self.fit.as_json(),
+                'fit_over_T': self.fit_over_T.as_json()}
+
+    @classmethod
+    def from_json(cls, d):
+        return cls(d['method'], d['Tmin'], d['Tmax'], d['rtol'],
+                   PiecewiseChebyshev.from_json(d['fit']),
+                   PiecewiseChebyshev.from_json(d['fit_over_T']))
+
+ndarray = np.ndarray
+
+def _surrogate_key_default(obj):
+    # JSON fallback for model data in surrogate cache keys
+    if isinstance(obj, ndarray):
+        return obj.tolist()
+    return repr(obj)
+
+def _elementwise_or_nan(f, x):
+    # Failures become NaN, to be retried by the scalar code path
+    vals = []
+    for v in x.tolist():
+        try:
+            vals.append(f(v))
+        except Exception:
+            vals.append(nan)
+    return np.array(vals, dtype=float)
+
+def _apply_elementwise(f, x):
+    # Transforms such as `interpolation_T` are written for floats; use them on
+    # the whole array if they support it, otherwise one element at a time
+    try:
+        return np.broadcast_to(np.asarray(f(x), dtype=float), x.shape)
+    except (TypeError, ValueError):
+        return _elementwise_or_nan(f, x)
+
+def _ln_tau_array(Ts, Tc):
+    below = Ts < Tc
+    return np.log(np.where(below, 1.0 - Ts/Tc, 1.0)), below
+
 # Intended for internal use only; should be interned
 PROPERTY_TRANSFORM_LN = 'lnx'
 PROPERTY_TRANSFORM_DLN = 'dlnxoverdT'
@@ -468,6 +526,14 @@ class TDependentProperty(object):
     pure_references = ()
     pure_reference_types = ()
 
+    _surrogate = None
+    '''Piecewise Chebyshev surrogate of the selected method, created by
+    :obj:`compile <thermo.utils.TDependentProperty.compile>`'''
+
+    surrogate_cache_dir = None
+    '''Directory in which compiled surrogates are stored and looked up; if
+    None, surrogates are not cached to disk'''
+
     obj_references = ()
     obj_references_types = ()
 
@@ -1158,7 +1224,8 @@ class TDependentProperty(object):
 
     hash_ignore_props = ('extrapolation_coeffs', 'prop_cached',
                          'TP_cached', 'tabular_data_interpolators',
-                         'tabular_data_interpolators_P', 'T_cached')
+                         'tabular_data_interpolators_P', 'T_cached',
+                         '_surrogate')
     def __hash__(self):
         d = self.__dict__
         # extrapolation values and interpolation objects should be ignored
@@ -1250,7 +1317,15 @@ class TDependentProperty(object):
         -------
         prop : float
             Calculated property, [`units`]
+
+        Notes
+        -----
+        `T` may also be a NumPy array, in which case an array of the same
+        shape is returned and nothing is cached; see
+        :obj:`T_dependent_property <thermo.utils.TDependentProperty.T_dependent_property>`.
         '''
+        if type(T) is ndarray:
+            return self.T_dependent_property(T)
         if T == self.T_cached:
             return self.prop_cached
         else:
@@ -1287,7 +1362,7 @@ class TDependentProperty(object):
         d['all_methods'] = list(d['all_methods'])
         d['tabular_data_interpolators'] = {}
 
-        ignored = ('correlations', 'extrapolation_coeffs')
+        ignored = ('correlations', 'extrapolation_coeffs', '_surrogate')
         for i in ignored:
             try: del d[i]
             except: pass
@@ -1324,6 +1399,28 @@ class TDependentProperty(object):
         except:
             pass
 
+    def __getstate__(self):
+        # As in `as_json`, data objects shared with the databanks are stored
+        # as the CAS number and looked up again on load; interpolators are
+        # keyed by the `id` of their transforms and cannot be reused
+        d = self.__dict__.copy()
+        for name in self._json_obj_by_CAS:
+            if name in d:
+                d[name] = self.CASRN
+        d['tabular_data_interpolators'] = {}
+        if 'tabular_data_interpolators_P' in d:
+            d['tabular_data_interpolators_P'] = {}
+        return d
+
+    def __setstate__(self, d):
+        by_CAS = [name for name in self._json_obj_by_CAS if name in d]
+        if by_CAS:
+            loaded = d.copy()
+            self._load_json_CAS_references(loaded)
+            for name in by_CAS:
+                d[name] = loaded[name]
+        self.__dict__.update(d)
+
     @classmethod
     def from_json(cls, json_repr):
         r'''Method to create a property model from a JSON
@@ -2215,6 +2312,128 @@ class TDependentProperty(object):
                   repr(self.exp_cheb_fit_ln_tau_Tc),
                   repr(self.exp_cheb_fit_ln_tau_coeffs))
 
+    def compile(self, method=None, rtol=1e-10, Tmin=None, Tmax=None,
+                deg=12, cache_dir=None):
+        r'''Method to replace the selected `method` with a piecewise
+        Chebyshev surrogate, which is much faster to evaluate than most
+        correlations and also provides analytical derivatives and integrals.
+
+        The surrogate is fit with :obj:`PiecewiseChebyshev.fit <thermo.utils.PiecewiseChebyshev.fit>`
+        to the relative tolerance `rtol`. Once compiled,
+        :obj:`T_dependent_property <thermo.utils.TDependentProperty.T_dependent_property>`,
+        :obj:`T_dependent_property_derivative <thermo.utils.TDependentProperty.T_dependent_property_derivative>`,
+        :obj:`T_dependent_property_integral <thermo.utils.TDependentProperty.T_dependent_property_integral>`, and
+        :obj:`T_dependent_property_integral_over_T <thermo.utils.TDependentProperty.T_dependent_property_integral_over_T>`
+        use the surrogate whenever the compiled method is selected and the
+        temperatures are inside [`Tmin`, `Tmax`]; otherwise the normal
+        calculation (including extrapolation) is performed.
+
+        Parameters
+        ----------
+        method : str, optional
+            Method to compile; defaults to the selected method, [-]
+        rtol : float, optional
+            Relative tolerance the surrogate must reproduce the property to,
+            [-]
+        Tmin : float, optional
+            Lower temperature limit of the surrogate; defaults to the lower
+            limit of the method, [K]
+        Tmax : float, optional
+            Upper temperature limit of the surrogate; defaults to the upper
+            limit of the method, [K]
+        deg : int, optional
+            Degree of each Chebyshev piece, [-]
+        cache_dir : str, optional
+            Directory to store the surrogate in and look it up from; defaults
+            to :obj:`surrogate_cache_dir <thermo.utils.TDependentProperty.surrogate_cache_dir>`, [-]
+
+        Notes
+        -----
+        Properties with a singularity at the end of the range, such as those
+        that go to zero at the critical point, cannot always be fit to the
+        requested tolerance right up to the limit; in that case the surrogate
+        range stops just short of it and the method itself is used beyond.
+
+        The tolerance is checked on the property itself at points in between
+        the fitting nodes; derivatives and integrals come from the same
+        series and are generally slightly less accurate.
+
+        The disk cache key is a hash of the model's JSON data (including all
+        of its coefficients), the method, and the fit settings.
+
+        Examples
+        --------
+        >>> from thermo import VaporPressure
+        >>> obj = VaporPressure(CASRN='7732-18-5')
+        >>> obj.compile(rtol=1e-12)
+        >>> abs(obj(400.0)/obj.calculate(400.0, obj.method) - 1.0) < 1e-11
+        True
+        >>> obj.uncompile()
+        '''
+        if method is None:
+            method = self._method
+        if method is None:
+            raise ValueError("No method selected to compile")
+        if Tmin is None or Tmax is None:
+            try:
+                T_low, T_high = self.T_limits[method]
+            except KeyError:
+                raise ValueError("Method '%s' has no temperature limits; "
+                                 "specify `Tmin` and `Tmax`" %(method))
+            if Tmin is None:
+                Tmin = T_low
+            if Tmax is None:
+                Tmax = T_high
+        if cache_dir is None:
+            cache_dir = self.surrogate_cache_dir
+        if cache_dir is not None:
+            key = '%s|%r|%r|%r|%d|%s' %(method, rtol, Tmin, Tmax, deg, self._surrogate_model_key())
+            path = os.path.join(cache_dir, '%s_%s.json' %(self.__class__.__name__,
+                                hashlib.sha256(key.encode('utf-8')).hexdigest()))
+            if os.path.exists(path):
+                try:
+                    with open(path) as f:
+                        self._surrogate = PropertySurrogate.from_json(json.load(f))
+                except (OSError, ValueError, KeyError, TypeError):
+                    # Unreadable cache file; fit the surrogate again
+                    pass
+                else:
+                    self.T_cached = None
+                    return
+
+        calculate, valid = self.calculate, self.test_property_validity
+        def f(T):
+            prop = calculate(T, method)
+            if not valid(prop):
+                raise ValueError("%s method '%s' computed an invalid value of %s %s "
+                                 "at T=%s K" %(self.name, method, prop, self.units, T))
+            return prop
+        fit = PiecewiseChebyshev.fit(f, Tmin, Tmax, rtol=rtol, deg=deg,
+                                     truncate=True)
+        fit_over_T = PiecewiseChebyshev.fit(lambda T: f(T)/T, fit.xmin, fit.xmax,
+                                            rtol=rtol, deg=deg, truncate=True)
+        self._surrogate = PropertySurrogate(method, fit_over_T.xmin, fit_over_T.xmax,
+                                            rtol, fit, fit_over_T)
+        self.T_cached = None
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(self._surrogate.as_json(), f)
+
+    def _surrogate_model_key(self):
+        # Serialized model data the disk cache of surrogates is keyed on;
+        # cached values are not part of it
+        d = self.as_json()
+        for k in self.hash_ignore_props:
+            d.pop(k, None)
+        return json.dumps(d, sort_keys=True, default=_surrogate_key_default)
+
+    def uncompile(self):
+        r'''Method to remove a surrogate created by
+        :obj:`compile <thermo.utils.TDependentProperty.compile>`.'''
+        self._surrogate = None
+        self.T_cached = None
+
     def _base_calculate(self, T, method):
         if method == POLY_FIT:
             return horner(self.poly_fit_coeffs, T)
@@ -2296,12 +2515,26 @@ class TDependentProperty(object):
         T : float
             Temperature at which to calculate the property, [K]
 
+        `T` may also be a NumPy array. The selected method is then evaluated
+        for all temperatures inside its limits at once with
+        :obj:`calculate_vectorized <thermo.utils.TDependentProperty.calculate_vectorized>`,
+        and the rest are extrapolated with
+        :obj:`extrapolate_vectorized <thermo.utils.TDependentProperty.extrapolate_vectorized>`.
+        Elements which fail or are invalid are retried one at a time, and
+        are returned as NaN where the scalar calculation would return None.
+
         Returns
         -------
         prop : float
             Calculated property, [`units`]
         '''
+        if type(T) is ndarray:
+            return self._T_dependent_property_array(T)
         method = self._method
+        surrogate = self._surrogate
+        if (surrogate is not None and method == surrogate.method
+                and surrogate.Tmin <= T <= surrogate.Tmax):
+            return surrogate.fit(T)
         if method is None:
             if self.RAISE_PROPERTY_CALCULATION_ERROR: 
                 raise RuntimeError("No %s method selected for component with CASRN '%s'" %(self.name.lower(), self.CASRN))
@@ -2330,6 +2563,116 @@ class TDependentProperty(object):
             elif self.RAISE_PROPERTY_CALCULATION_ERROR: 
                 raise RuntimeError("%s method '%s' is not valid at T=%s K for component with CASRN '%s'" %(self.name, method, T, self.CASRN))
     
+    def _T_dependent_property_scalar_or_nan(self, T):
+        prop = self.T_dependent_property(T)
+        return nan if prop is None else prop
+
+    def _T_dependent_property_array(self, Ts):
+        shape = Ts.shape
+        Ts = Ts.astype(float).ravel()
+        props = np.full(Ts.shape, nan)
+        method = self._method
+        T_limits = self.T_limits
+        if method is not None and method in T_limits:
+            todo = np.ones(Ts.shape, dtype=bool)
+            surrogate = self._surrogate
+            if surrogate is not None and method == surrogate.method:
+                mask = (Ts >= surrogate.Tmin) & (Ts <= surrogate.Tmax)
+                props[mask] = surrogate.fit(Ts[mask])
+                todo &= ~mask
+            T_low, T_high = T_limits[method]
+            in_range = (Ts >= T_low) & (Ts <= T_high)
+            out_range = todo & ~in_range
+            in_range &= todo
+            with np.errstate(all='ignore'):
+                if in_range.any():
+                    try:
+                        vals = np.asarray(self.calculate_vectorized(Ts[in_range], method), dtype=float)
+                    except Exception:
+                        pass
+                    else:
+                        valid = (vals >= self.property_min) & (vals <= self.property_max)
+                        props[in_range] = np.where(valid, vals, nan)
+                if self._extrapolation is not None and out_range.any():
+                    try:
+                        vals = np.asarray(self.extrapolate_vectorized(Ts[out_range], method), dtype=float)
+                    except Exception:
+                        pass
+                    else:
+                        # Overflows raise in the scalar extrapolation
+                        props[out_range] = np.where(np.isfinite(vals), vals, nan)
+        # Retrying failures one at a time also raises the usual errors
+        # when RAISE_PROPERTY_CALCULATION_ERROR is set
+        retry = np.isnan(props)
+        if retry.any():
+            props[retry] = [self._T_dependent_property_scalar_or_nan(T) for T in Ts[retry].tolist()]
+        return props.reshape(shape)
+
+    def calculate_vectorized(self, Ts, method):
+        r'''Method to calculate a property with a specified method at an array
+        of temperatures, with no validity checking or error handling.
+
+        Property classes override this for the methods they can evaluate with
+        NumPy (such as Antoine and DIPPR equations), and call
+        :obj:`_base_calculate_vectorized` for the rest; the fits, tabular
+        data, and correlations added with :obj:`add_correlation` are
+        handled there. Any other method is evaluated with
+        :obj:`calculate` one element at a time.
+
+        Parameters
+        ----------
+        Ts : ndarray
+            Temperatures at which to calculate the property, [K]
+        method : str
+            Method name to use
+
+        Returns
+        -------
+        props : ndarray
+            Calculated property, [`units`]
+        '''
+        return self._base_calculate_vectorized(Ts, method)
+
+    def _base_calculate_vectorized(self, Ts, method):
+        if method == POLY_FIT:
+            return horner(self.poly_fit_coeffs, Ts)
+        elif method == EXP_POLY_FIT:
+            return trunc_exp_vectorized(horner(self.exp_poly_fit_coeffs, Ts))
+        elif method == POLY_FIT_LN_TAU:
+            lntau, below = _ln_tau_array(Ts, self.poly_fit_ln_tau_Tc)
+            return np.where(below, horner(self.poly_fit_ln_tau_coeffs, lntau), 0.0)
+        elif method == EXP_POLY_FIT_LN_TAU:
+            lntau, below = _ln_tau_array(Ts, self.exp_poly_fit_ln_tau_Tc)
+            return np.where(below, np.exp(horner(self.exp_poly_fit_ln_tau_coeffs, lntau)), 0.0)
+        elif method == STABLEPOLY_FIT:
+            return horner_stable(Ts, self.stablepoly_fit_coeffs, self.stablepoly_fit_offset, self.stablepoly_fit_scale)
+        elif method == EXP_STABLEPOLY_FIT:
+            return trunc_exp_vectorized(horner_stable(Ts, self.exp_stablepoly_fit_coeffs, self.exp_stablepoly_fit_offset, self.exp_stablepoly_fit_scale))
+        elif method == CHEB_FIT:
+            return chebval(Ts, self.cheb_fit_coeffs, self.cheb_fit_offset, self.cheb_fit_scale)
+        elif method == EXP_CHEB_FIT:
+            return trunc_exp_vectorized(chebval(Ts, self.exp_cheb_fit_coeffs, self.exp_cheb_fit_offset, self.exp_cheb_fit_scale))
+        elif method == CHEB_FIT_LN_TAU:
+            lntau, below = _ln_tau_array(Ts, self.cheb_fit_ln_tau_Tc)
+            return np.where(below, chebval(lntau, self.cheb_fit_ln_tau_coeffs, self.cheb_fit_ln_tau_offset, self.cheb_fit_ln_tau_scale), 0.0)
+        elif method == STABLEPOLY_FIT_LN_TAU:
+            lntau, below = _ln_tau_array(Ts, self.stablepoly_fit_ln_tau_Tc)
+            return np.where(below, horner_stable(lntau, self.stablepoly_fit_ln_tau_coeffs, self.stablepoly_fit_ln_tau_offset, self.stablepoly_fit_ln_tau_scale), 0.0)
+        elif method == EXP_CHEB_FIT_LN_TAU:
+            lntau, below = _ln_tau_array(Ts, self.exp_cheb_fit_ln_tau_Tc)
+            return np.where(below, trunc_exp_vectorized(chebval(lntau, self.exp_cheb_fit_ln_tau_coeffs, self.exp_cheb_fit_ln_tau_offset, self.exp_cheb_fit_ln_tau_scale)), 0.0)
+        elif method == EXP_STABLEPOLY_FIT_LN_TAU:
+            lntau, below = _ln_tau_array(Ts, self.exp_stablepoly_fit_ln_tau_Tc)
+            return np.where(below, np.exp(horner_stable(lntau, self.exp_stablepoly_fit_ln_tau_coeffs, self.exp_stablepoly_fit_offset_ln_tau, self.exp_stablepoly_fit_scale_ln_tau)), 0.0)
+        elif method in self.tabular_data:
+            return self.interpolate_vectorized(Ts, method)
+        elif method in self.correlations:
+            call, kwargs, _ = self.correlations[method]
+            call_vectorized = vectorized_correlation_functions.get(call)
+            if call_vectorized is not None:
+                return call_vectorized(Ts, **kwargs)
+        return _elementwise_or_nan(lambda T: self.calculate(T, method), Ts)
+
     def calculate_transform(self, T, method, transform):
         if transform == PROPERTY_TRANSFORM_LN:
             if method == EXP_POLY_FIT:
@@ -2692,6 +3035,44 @@ class TDependentProperty(object):
             prop = self.interpolation_property_inv(prop)
 
         return float(prop)
+
+    def interpolate_vectorized(self, Ts, name):
+        r'''Array version of :obj:`interpolate`; the cubic spline is used for
+        the temperatures inside the tabular data and linear extrapolation for
+        the rest.
+
+        Parameters
+        ----------
+        Ts : ndarray
+            Temperatures at which to interpolate the property, [K]
+        name : str
+            The name assigned to the tabular data set
+
+        Returns
+        -------
+        props : ndarray
+            Calculated property, [`units`]
+        '''
+        key = (name, id(self.interpolation_T), id(self.interpolation_property), id(self.interpolation_property_inv))
+        if key not in self.tabular_data_interpolators:
+            # Creates the interpolators
+            self.interpolate(Ts[0], name)
+        extrapolator, spline = self.tabular_data_interpolators[key]
+        Ts_data = self.tabular_data[name][0]
+
+        Ts_interp = Ts
+        if self.interpolation_T:
+            Ts_interp = _apply_elementwise(self.interpolation_T, Ts)
+        if spline:
+            use_spline = (Ts >= Ts_data[0]) & (Ts <= Ts_data[-1])
+            props = np.empty(Ts.shape)
+            props[use_spline] = spline(Ts_interp[use_spline])
+            props[~use_spline] = extrapolator(Ts_interp[~use_spline])
+        else:
+            props = np.asarray(extrapolator(Ts_interp), dtype=float)
+        if self.interpolation_property:
+            props = _apply_elementwise(self.interpolation_property_inv, props)
+        return props
     
 
     def add_correlation(self, name, model, Tmin, Tmax, **kwargs):
@@ -3118,19 +3499,30 @@ class TDependentProperty(object):
         .. math::
             \text{derivative} = \frac{d (\text{property})}{d T}
 
+        An array of temperatures may also be given; the surrogate from
+        :obj:`compile` and the polynomial and Chebyshev fits are evaluated
+        with NumPy, and other methods one element at a time. Failed
+        evaluations are NaN in the result.
+
         Parameters
         ----------
-        T : float
+        T : float or ndarray
             Temperature at which to calculate the derivative, [K]
         order : int
             Order of the derivative, >= 1
 
         Returns
         -------
-        derivative : float
+        derivative : float or ndarray
             Calculated derivative property, [`units/K^order`]
         '''
+        if type(T) is ndarray:
+            return self._T_dependent_property_derivative_array(T, order)
         method = self._method 
+        surrogate = self._surrogate
+        if (surrogate is not None and method == surrogate.method
+                and surrogate.Tmin <= T <= surrogate.Tmax):
+            return surrogate.fit.derivative(T, order)
         T_limits = self.T_limits
         extrapolation = self._extrapolation
         if method in T_limits:
@@ -3166,6 +3558,66 @@ class TDependentProperty(object):
                     %(order, self.name.lower(), method, T, self.CASRN)
                 )
 
+    def _T_dependent_property_derivative_array(self, Ts, order):
+        shape = Ts.shape
+        Ts = Ts.astype(float).ravel()
+        ders = np.full(Ts.shape, nan)
+        method = self._method
+        todo = np.ones(Ts.shape, dtype=bool)
+        surrogate = self._surrogate
+        if surrogate is not None and method == surrogate.method:
+            mask = (Ts >= surrogate.Tmin) & (Ts <= surrogate.Tmax)
+            ders[mask] = surrogate.fit.derivative(Ts[mask], order)
+            todo &= ~mask
+        if method in self.T_limits:
+            T_low, T_high = self.T_limits[method]
+            in_range = todo & (Ts >= T_low) & (Ts <= T_high)
+            if in_range.any():
+                try:
+                    with np.errstate(all='ignore'):
+                        vals = np.asarray(self.calculate_derivative_vectorized(Ts[in_range], method, order), dtype=float)
+                except Exception:
+                    pass
+                else:
+                    ders[in_range] = np.where(np.isfinite(vals), vals, nan)
+        retry = np.isnan(ders)
+        if retry.any():
+            der = self.T_dependent_property_derivative
+            ders[retry] = [nan if d is None else d for d in (der(T, order) for T in Ts[retry].tolist())]
+        return ders.reshape(shape)
+
+    def calculate_derivative_vectorized(self, Ts, method, order=1):
+        r'''Method to calculate a derivative of a property with respect to
+        temperature at an array of temperatures using a specified method.
+        The polynomial and Chebyshev fits are evaluated with NumPy; other
+        methods call :obj:`calculate_derivative` one element at a time, with
+        NaN for any that fail.
+
+        Parameters
+        ----------
+        Ts : ndarray
+            Temperatures at which to calculate the derivative, [K]
+        method : str
+            Method for which to find the derivative
+        order : int
+            Order of the derivative, >= 1
+
+        Returns
+        -------
+        derivatives : ndarray
+            Calculated derivative property, [`units/K^order`]
+        '''
+        if order <= 3:
+            if method == POLY_FIT:
+                return (horner_and_der, horner_and_der2, horner_and_der3)[order-1](self.poly_fit_coeffs, Ts)[order]
+            if method == STABLEPOLY_FIT:
+                f = (horner_stable_and_der, horner_stable_and_der2, horner_stable_and_der3)[order-1]
+                return f(Ts, self.stablepoly_fit_coeffs, self.stablepoly_fit_offset, self.stablepoly_fit_scale)[order]
+            if method == CHEB_FIT:
+                coeffs = (self.cheb_fit_d1_coeffs, self.cheb_fit_d2_coeffs, self.cheb_fit_d3_coeffs)[order-1]
+                return chebval(Ts, coeffs, self.cheb_fit_offset, self.cheb_fit_scale)
+        return _elementwise_or_nan(lambda T: self.calculate_derivative(T, method, order), Ts)
+
     def calculate_integral(self, T1, T2, method):
         r'''Method to calculate the integral of a property with respect to
         temperature, using a specified method. Uses SciPy's `quad` function
@@ -3219,22 +3671,33 @@ class TDependentProperty(object):
         .. math::
             \text{integral} = \int_{T_1}^{T_2} \text{property} \; dT
 
+        Either limit may also be an array; the limits are broadcast against
+        each other and the result is an array, NaN where the integral could
+        not be evaluated. Only intervals within the range of the surrogate
+        from :obj:`compile` are evaluated with NumPy.
+
         Parameters
         ----------
-        T1 : float
+        T1 : float or ndarray
             Lower limit of integration, [K]
-        T2 : float
+        T2 : float or ndarray
             Upper limit of integration, [K]
 
         Returns
         -------
-        integral : float
+        integral : float or ndarray
             Calculated integral of the property over the given range,
             [`units*K`]
         
         '''
+        if type(T1) is ndarray or type(T2) is ndarray:
+            return self._T_dependent_property_integral_array(T1, T2, 'fit')
         if T2 < T1: return - self.T_dependent_property_integral(T2, T1)
         method = self._method 
+        surrogate = self._surrogate
+        if (surrogate is not None and method == surrogate.method
+                and surrogate.Tmin <= T1 and T2 <= surrogate.Tmax):
+            return surrogate.fit.integral(T1, T2)
         T_limits = self.T_limits
         extrapolation = self._extrapolation
         integral = 0.
@@ -3305,6 +3768,27 @@ class TDependentProperty(object):
                 return None
         return integral
 
+    def _T_dependent_property_integral_array(self, T1, T2, fit_name):
+        T1, T2 = np.broadcast_arrays(np.asarray(T1, dtype=float), np.asarray(T2, dtype=float))
+        shape = T1.shape
+        T1, T2 = T1.ravel(), T2.ravel()
+        integrals = np.full(T1.shape, nan)
+        surrogate = self._surrogate
+        if surrogate is not None and self._method == surrogate.method:
+            mask = ((T1 >= surrogate.Tmin) & (T1 <= surrogate.Tmax)
+                    & (T2 >= surrogate.Tmin) & (T2 <= surrogate.Tmax))
+            if mask.any():
+                integrals[mask] = getattr(surrogate, fit_name).integral(T1[mask], T2[mask])
+        retry = np.isnan(integrals)
+        if retry.any():
+            if fit_name == 'fit':
+                integral = self.T_dependent_property_integral
+            else:
+                integral = self.T_dependent_property_integral_over_T
+            vals = [integral(a, b) for a, b in zip(T1[retry].tolist(), T2[retry].tolist())]
+            integrals[retry] = [nan if v is None else v for v in vals]
+        return integrals.reshape(shape)
+
     def calculate_integral_over_T(self, T1, T2, method):
         r'''Method to calculate the integral of a property over temperature
         with respect to temperature, using a specified method. Uses SciPy's
@@ -3359,21 +3843,30 @@ class TDependentProperty(object):
         .. math::
             \text{integral} = \int_{T_1}^{T_2} \frac{\text{property}}{T} \; dT
 
+        Either limit may also be an array, as in
+        :obj:`T_dependent_property_integral`.
+
         Parameters
         ----------
-        T1 : float
+        T1 : float or ndarray
             Lower limit of integration, [K]
-        T2 : float
+        T2 : float or ndarray
             Upper limit of integration, [K]
 
         Returns
         -------
-        integral : float
+        integral : float or ndarray
             Calculated integral of the property over the given range,
             [`units`]
         '''
+        if type(T1) is ndarray or type(T2) is ndarray:
+            return self._T_dependent_property_integral_array(T1, T2, 'fit_over_T')
         if T2 < T1: return - self.T_dependent_property_integral_over_T(T2, T1)
         method = self._method 
+        surrogate = self._surrogate
+        if (surrogate is not None and method == surrogate.method
+                and surrogate.Tmin <= T1 and T2 <= surrogate.Tmax):
+            return surrogate.fit_over_T.integral(T1, T2)
         T_limits = self.T_limits
         extrapolation = self._extrapolation
         integral = 0.
@@ -3663,6 +4156,92 @@ class TDependentProperty(object):
         return val
     
 
+    def extrapolate_vectorized(self, Ts, method):
+        r'''Array version of :obj:`extrapolate`, for temperatures which are
+        all outside the limits of `method`. The low and high temperature
+        extrapolations are each applied to their part of the array at once;
+        extrapolation settings without a NumPy implementation are evaluated
+        with :obj:`extrapolate` one element at a time.
+
+        Parameters
+        ----------
+        Ts : ndarray
+            Temperatures at which to extrapolate the property, [K]
+        method : str
+            The method to use, [-]
+
+        Returns
+        -------
+        props : ndarray
+            Calculated property; NaN where the extrapolation fails or for
+            negative temperatures, [`units`]
+        '''
+        T_low, T_high = self.T_limits[method]
+        props = np.full(Ts.shape, nan)
+        low = Ts <= T_low
+        for is_low, mask, T_lim in ((True, low, T_low), (False, ~low, T_high)):
+            if mask.any():
+                try:
+                    props[mask] = self._extrapolate_vectorized_side(Ts[mask], method, is_low, T_lim)
+                except Exception:
+                    pass
+        if self._extrapolation_min is not None:
+            props = np.where(props < self._extrapolation_min, self._extrapolation_min, props)
+        if self._extrapolation_max is not None:
+            props = np.where(props > self._extrapolation_max, self._extrapolation_max, props)
+        props[Ts < 0.0] = nan
+        return props
+
+    def _extrapolate_vectorized_side(self, Ts, method, low, T_lim):
+        extrapolation = self._extrapolation_low if low else self._extrapolation_high
+        key = (extrapolation, method, low)
+        extrapolation_coeffs = self.extrapolation_coeffs
+        if key in extrapolation_coeffs:
+            coeffs = extrapolation_coeffs[key]
+        else:
+            extrapolation_coeffs[key] = coeffs = self._get_extrapolation_coeffs(*key)
+        if extrapolation == 'linear':
+            v, d = coeffs
+            interpolation_T = self.interpolation_T
+            interpolation_property_inv = self.interpolation_property_inv
+            if interpolation_T is not None:
+                T_lim = interpolation_T(T_lim)
+                Ts = _apply_elementwise(interpolation_T, Ts)
+            vals = v + d*(Ts - T_lim)
+            if interpolation_property_inv is not None:
+                vals = _apply_elementwise(interpolation_property_inv, vals)
+            return vals
+        elif extrapolation == 'log(linear)':
+            v, d = coeffs
+            return np.exp(v + d*(Ts - T_lim))
+        elif extrapolation == 'constant':
+            return np.full(Ts.shape, coeffs)
+        elif extrapolation == 'AntoineAB':
+            A, B = coeffs
+            return Antoine_vectorized(Ts, A=A, B=B, C=0.0, base=e)
+        elif extrapolation == 'nolimit':
+            return self.calculate_vectorized(Ts, method)
+        elif extrapolation == 'DIPPR101_ABC':
+            A, B, C = coeffs
+            return EQ101_vectorized(Ts, A, B, C, 0.0, 0.0)
+        elif extrapolation == 'DIPPR106_AB':
+            A, B = coeffs
+            return EQ106_vectorized(Ts, self.Tc, A, B)
+        elif extrapolation == 'DIPPR106_ABC':
+            A, B, C = coeffs
+            return EQ106_vectorized(Ts, self.Tc, A, B, C)
+        elif extrapolation == 'EXP_POLY_LN_TAU2' or extrapolation == 'EXP_POLY_LN_TAU3':
+            lntau, below = _ln_tau_array(Ts, self.Tc)
+            return np.where(below, np.exp(horner(coeffs, lntau)), 0.0)
+        elif extrapolation == 'interp1d':
+            if self.interpolation_T is not None:
+                Ts = _apply_elementwise(self.interpolation_T, Ts)
+            props = np.asarray(coeffs(Ts), dtype=float)
+            if self.interpolation_property is not None:
+                props = _apply_elementwise(self.interpolation_property_inv, props)
+            return props
+        return _elementwise_or_nan(lambda T: self.extrapolate(T, method), Ts)
+
     def extrapolate_derivative(self, T, method, order, in_range='error'):
         r'''Extrapolate the derivative of a given method according to the
         :obj:`extrapolation` setting.
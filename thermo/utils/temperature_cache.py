@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2023, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+'''
+
+__all__ = ['TemperatureCache']
+
+from collections import OrderedDict
+
+
+class TemperatureCache(object):
+    r'''Least-recently-used store of temperature-only intermediate results of
+    a model, keyed on the exact temperature. A model shares one instance with
+    all the objects created from it at new conditions, so phases created at
+    the same temperature during a flash compute those intermediates once.
+
+    Each temperature holds any number of named results. Caches of the same
+    size compare equal, as their contents never change a model's results.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Number of temperatures kept, [-]
+
+    Attributes
+    ----------
+    hits : int
+        Number of stored results reused, [-]
+    misses : int
+        Number of lookups which found nothing to reuse, [-]
+
+    Examples
+    --------
+    >>> cache = TemperatureCache(max_size=2)
+    >>> cache.lookup(300.0, 'taus') is None
+    True
+    >>> cache.store(300.0, 'taus', [0.1, 0.2])
+    >>> cache.lookup(300.0, 'taus')
+    [0.1, 0.2]
+    >>> cache.hits, cache.misses
+    (1, 1)
+    '''
+    __slots__ = ('max_size', 'entries', 'hits', 'misses')
+
+    def __repr__(self):
+        return '<TemperatureCache, %d temperatures, hits=%d, misses=%d>' %(len(self.entries), self.hits, self.misses)
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other.max_size == self.max_size
+
+    def __hash__(self):
+        return hash((self.__class__.__name__, self.max_size))
+
+    def __init__(self, max_size=16):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = self.misses = 0
+
+    def lookup(self, T, key):
+        r'''Return the result `key` stored for temperature `T`, or None if
+        there is none.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        key : str
+            Name of the result, [-]
+
+        Returns
+        -------
+        value : object
+            Stored result or None, [-]
+        '''
+        entry = self.entries.get(T)
+        if entry is not None:
+            value = entry.get(key)
+            if value is not None:
+                self.entries.move_to_end(T)
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def store(self, T, key, value):
+        r'''Store the result `key` for temperature `T`, removing the least
+        recently used temperature if the cache is full.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        key : str
+            Name of the result, [-]
+        value : object
+            Result, [-]
+        '''
+        self.entry(T)[key] = value
+
+    def entry(self, T):
+        r'''Return the dictionary of results stored for temperature `T`,
+        creating it if needed and marking it as the most recently used, for
+        callers reading or storing several results at once. The counters are
+        not changed.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+
+        Returns
+        -------
+        entry : dict
+            Results stored for `T`, by name, [-]
+        '''
+        entries = self.entries
+        entry = entries.get(T)
+        if entry is None:
+            entries[T] = entry = {}
+            if len(entries) > self.max_size:
+                entries.popitem(last=False)
+        else:
+            entries.move_to_end(T)
+        return entry
+
+    def clear(self):
+        r'''Remove all stored results and reset the counters.'''
+        self.entries.clear()
+        self.hits = self.misses = 0
+
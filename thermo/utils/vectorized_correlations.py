@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2023, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+This module contains NumPy implementations of the temperature-dependent
+correlations most commonly used by :obj:`thermo.utils.TDependentProperty`
+objects. Each accepts an array of temperatures and reproduces the branches of
+the scalar function in :obj:`chemicals` with masks, so the results are the
+same as calling the scalar function on each element.
+
+These are used by
+:obj:`calculate_vectorized <thermo.utils.TDependentProperty.calculate_vectorized>`;
+:obj:`vectorized_correlation_functions` maps each scalar function to its array
+implementation.
+
+.. autofunction:: thermo.utils.vectorized_correlations.Antoine_vectorized
+.. autofunction:: thermo.utils.vectorized_correlations.TRC_Antoine_extended_vectorized
+.. autofunction:: thermo.utils.vectorized_correlations.Wagner_vectorized
+.. autofunction:: thermo.utils.vectorized_correlations.Wagner_original_vectorized
+.. autofunction:: thermo.utils.vectorized_correlations.EQ101_vectorized
+.. autofunction:: thermo.utils.vectorized_correlations.EQ105_vectorized
+.. autofunction:: thermo.utils.vectorized_correlations.EQ106_vectorized
+.. autofunction:: thermo.utils.vectorized_correlations.EQ107_vectorized
+.. autofunction:: thermo.utils.vectorized_correlations.TRCCp_vectorized
+.. autofunction:: thermo.utils.vectorized_correlations.trunc_exp_vectorized
+.. autodata:: thermo.utils.vectorized_correlations.vectorized_correlation_functions
+'''
+
+__all__ = ['Antoine_vectorized', 'TRC_Antoine_extended_vectorized',
+           'Wagner_vectorized', 'Wagner_original_vectorized',
+           'EQ101_vectorized', 'EQ105_vectorized', 'EQ106_vectorized',
+           'EQ107_vectorized', 'TRCCp_vectorized', 'trunc_exp_vectorized',
+           'vectorized_correlation_functions']
+
+from fluids.constants import R
+from fluids.numerics import numpy as np
+from chemicals.vapor_pressure import (Antoine, TRC_Antoine_extended, Wagner,
+                                      Wagner_original)
+from chemicals.dippr import EQ100, EQ101, EQ102, EQ104, EQ105, EQ106, EQ107
+from chemicals.heat_capacity import TRCCp
+
+# log(1.7976931348623157e308); exp of anything larger overflows
+_exp_max = 709.782712893384
+
+def trunc_exp_vectorized(x):
+    r'''Array version of :obj:`fluids.numerics.trunc_exp`; values which would
+    overflow are truncated to the largest float instead of becoming `inf`.
+
+    Examples
+    --------
+    >>> trunc_exp_vectorized(np.array([0.0, 1000.0]))
+    array([1.00000000e+000, 1.79769313e+308])
+    '''
+    return np.exp(np.minimum(x, _exp_max))
+
+def Antoine_vectorized(T, A, B, C, base=10.0):
+    r'''Array version of :obj:`chemicals.vapor_pressure.Antoine`.
+
+    Examples
+    --------
+    >>> Antoine_vectorized(np.array([100.0, 5.0]), 8.7687, 395.744, -6.469)
+    array([34478.36734964,     0.        ])
+    '''
+    T_C = T + C
+    positive = T_C > 0.0
+    return np.where(positive, base**(A - B/np.where(positive, T_C, 1.0)), 0.0)
+
+def TRC_Antoine_extended_vectorized(T, Tc, to, A, B, C, n, E, F):
+    r'''Array version of :obj:`chemicals.vapor_pressure.TRC_Antoine_extended`.
+
+    Examples
+    --------
+    >>> TRC_Antoine_extended_vectorized(np.array([400.0]), 508.1, 67.0, 7.1,
+    ...                                 1200.0, -50.0, 2.0, 10., 20.)
+    array([4758.33126377])
+    '''
+    x = np.maximum((T - to - 273.15)/Tc, 0.0)
+    x4 = x*x*x*x
+    T_C = T + C
+    positive = T_C > 0.0
+    return np.where(positive, 10.**(A - B/np.where(positive, T_C, 1.0)
+                                    + 0.43429*x**n + x4*x4*(E + F*x4)), 0.0)
+
+def Wagner_vectorized(T, Tc, Pc, a, b, c, d):
+    r'''Array version of :obj:`chemicals.vapor_pressure.Wagner`.
+
+    Examples
+    --------
+    >>> Wagner_vectorized(np.array([100.0, 200.0]), 190.551, 4599200, -6.02242,
+    ...                   1.26652, -0.5707, -1.366)
+    array([  34415.00476264, 4599200.        ])
+    '''
+    Tr = np.minimum(T/Tc, 1.0)
+    tau = 1.0 - Tr
+    tau_rt = np.sqrt(tau)
+    tau15 = tau*tau_rt
+    tau25 = tau*tau15
+    return Pc*np.exp((a + b*tau_rt + tau15*(c + d*tau25))*tau/Tr)
+
+def Wagner_original_vectorized(T, Tc, Pc, a, b, c, d):
+    r'''Array version of :obj:`chemicals.vapor_pressure.Wagner_original`.
+
+    Examples
+    --------
+    >>> Wagner_original_vectorized(np.array([100.0]), 190.53, 4596420.,
+    ...                            a=-6.00435, b=1.1885, c=-0.834082, d=-1.22833)
+    array([34520.4460145])
+    '''
+    Tr = np.minimum(T/Tc, 1.0)
+    zero = Tr == 0.0
+    Tr_safe = np.where(zero, 1.0, Tr)
+    tau = 1.0 - Tr_safe
+    tau2 = tau*tau
+    tau_Tr = tau/Tr_safe
+    return np.where(zero, 0.0, Pc*np.exp(((d*tau2*tau + c)*tau2 + a + b*np.sqrt(tau))*tau_Tr))
+
+def EQ101_vectorized(T, A, B, C=0.0, D=0.0, E=0.0):
+    r'''Array version of :obj:`chemicals.dippr.EQ101` (values only).
+
+    Examples
+    --------
+    >>> EQ101_vectorized(np.array([300.0]), 73.649, -7258.2, -7.3037, 4.1653E-6, 2)
+    array([3537.44834546])
+    '''
+    with np.errstate(over='ignore'):
+        T_E = np.minimum(T**E, 1e250)
+    with np.errstate(divide='ignore'):
+        ln_T = np.log(T)
+    ln_T = np.where(T == 0.0, -744.4400719213812, ln_T)
+    return trunc_exp_vectorized(A + B/T + C*ln_T + D*T_E)
+
+def EQ105_vectorized(T, A, B, C, D):
+    r'''Array version of :obj:`chemicals.dippr.EQ105` (values only).
+
+    Examples
+    --------
+    >>> EQ105_vectorized(np.array([300.0]), 0.70824, 0.26411, 507.6, 0.27537)
+    array([7.5931701])
+    '''
+    problematic = 1. - T/C
+    if D < 1.0:
+        problematic = np.maximum(problematic, 0.0)
+    return A*B**(-(1. + problematic**D))
+
+def EQ106_vectorized(T, Tc, A, B, C=0.0, D=0.0, E=0.0):
+    r'''Array version of :obj:`chemicals.dippr.EQ106` (values only).
+
+    Examples
+    --------
+    >>> EQ106_vectorized(np.array([300.0, 700.0]), 647.096, 0.17766, 2.567, -3.3377, 1.9699)
+    array([0.07231499, 0.        ])
+    '''
+    Tr = T/Tc
+    tau = 1.0 - Tr
+    positive = tau > 0.0
+    power = B + Tr*(C + Tr*(D + E*Tr))
+    with np.errstate(over='ignore'):
+        ans = A*np.where(positive, tau, 1.0)**power
+    ans = np.where(np.isfinite(ans), ans, 1e300)
+    return np.where(positive, ans, 0.0)
+
+def EQ107_vectorized(T, A=0, B=0, C=0, D=0, E=0):
+    r'''Array version of :obj:`chemicals.dippr.EQ107` (values only).
+
+    Examples
+    --------
+    >>> EQ107_vectorized(np.array([300.0]), 33363., 26790., 2610.5, 8896., 1169)
+    array([33585.90452769])
+    '''
+    C_T = C/T
+    t0 = 2.0*C_T/(trunc_exp_vectorized(C_T) - trunc_exp_vectorized(-C_T))
+    E_T = E/T
+    t1 = 2.0*E_T/(trunc_exp_vectorized(-E_T) + trunc_exp_vectorized(E_T))
+    return A + B*t0*t0 + D*t1*t1
+
+def TRCCp_vectorized(T, a0, a1, a2, a3, a4, a5, a6, a7):
+    r'''Array version of :obj:`chemicals.heat_capacity.TRCCp`.
+
+    Examples
+    --------
+    >>> TRCCp_vectorized(np.array([300.0]), 4.0, 7.65, 720., 3.565, -0.052,
+    ...                  -1.55, 288., 0.)
+    array([40.97174103])
+    '''
+    y = np.where(T <= a7, 0.0, (T - a7)/(T + a6))
+    T_inv = 1.0/T
+    y2 = y*y
+    T_m_a7 = T - a7
+    T_m_a7_safe = np.where(T_m_a7 == 0.0, 1.0, T_m_a7)
+    a5_term = np.where(T_m_a7 == 0.0, 0.0, a5/(T_m_a7_safe*T_m_a7_safe))
+    return R*(a0 + (a1*T_inv*T_inv)*np.exp(-a2*T_inv) + y2*(a3 + (a4 - a5_term)*y2*y2*y2))
+
+vectorized_correlation_functions = {
+    Antoine: Antoine_vectorized,
+    TRC_Antoine_extended: TRC_Antoine_extended_vectorized,
+    Wagner: Wagner_vectorized,
+    Wagner_original: Wagner_original_vectorized,
+    EQ100: EQ100,
+    EQ101: EQ101_vectorized,
+    EQ102: EQ102,
+    EQ104: EQ104,
+    EQ105: EQ105_vectorized,
+    EQ106: EQ106_vectorized,
+    EQ107: EQ107_vectorized,
+    TRCCp: TRCCp_vectorized,
+}
+'''Dictionary of scalar correlation function: array implementation. Functions
+which are already written with only arithmetic operations map to themselves.'''
@@ -79,6 +79,9 @@ from chemicals.iapws import iapws95_Tc, iapws95_Psat, iapws95_dPsat_dT
 from chemicals import vapor_pressure
 from thermo.utils import TDependentProperty
 from thermo.utils import VDI_TABULAR, DIPPR_PERRY_8E, VDI_PPDS, COOLPROP, EOS, IAPWS
+from thermo.utils.vectorized_correlations import (Antoine_vectorized, TRC_Antoine_extended_vectorized,
+                                                  Wagner_vectorized, Wagner_original_vectorized,
+                                                  EQ101_vectorized)
 from thermo.coolprop import has_CoolProp, PropsSI, coolprop_dict, coolprop_fluids
 from thermo.base import source_path
 
@@ -438,6 +441,42 @@ class VaporPressure(TDependentProperty):
             return self._base_calculate(T, method)
         return Psat
 
+    def calculate_vectorized(self, Ts, method):
+        r'''Method to calculate vapor pressure of a fluid at an array of
+        temperatures with a given method; the Wagner, Antoine, and DIPPR
+        methods are evaluated with NumPy and other methods are handled by
+        :obj:`thermo.utils.TDependentProperty.calculate_vectorized`.
+
+        Parameters
+        ----------
+        Ts : ndarray
+            Temperatures at which to calculate vapor pressure, [K]
+        method : str
+            Name of the method to use
+
+        Returns
+        -------
+        Psats : ndarray
+            Vapor pressures at Ts, [Pa]
+        '''
+        if method == WAGNER_MCGARRY:
+            return Wagner_original_vectorized(Ts, self.WAGNER_MCGARRY_Tc, self.WAGNER_MCGARRY_Pc, *self.WAGNER_MCGARRY_coefs)
+        elif method == WAGNER_POLING:
+            return Wagner_vectorized(Ts, self.WAGNER_POLING_Tc, self.WAGNER_POLING_Pc, *self.WAGNER_POLING_coefs)
+        elif method == ANTOINE_EXTENDED_POLING:
+            return TRC_Antoine_extended_vectorized(Ts, *self.ANTOINE_EXTENDED_POLING_coefs)
+        elif method == ANTOINE_POLING:
+            A, B, C = self.ANTOINE_POLING_coefs
+            return Antoine_vectorized(Ts, A, B, C, base=10.0)
+        elif method == ANTOINE_WEBBOOK:
+            A, B, C = self.ANTOINE_WEBBOOK_coefs
+            return Antoine_vectorized(Ts, A, B, C, base=e)
+        elif method == DIPPR_PERRY_8E:
+            return EQ101_vectorized(Ts, *self.Perrys2_8_coeffs)
+        elif method == VDI_PPDS:
+            return Wagner_vectorized(Ts, self.VDI_PPDS_Tc, self.VDI_PPDS_Pc, *self.VDI_PPDS_coeffs)
+        return super(VaporPressure, self).calculate_vectorized(Ts, method)
+
     def test_method_validity(self, T, method):
         r'''Method to check the validity of a method. Follows the given
         ranges for all coefficient-based methods. For CSP methods, the models
@@ -117,6 +117,7 @@ from chemicals.identifiers import CAS_to_int
 from chemicals.miscdata import JOBACK
 
 from thermo.utils import NEGLIGIBLE, DIPPR_PERRY_8E, POLY_FIT, VDI_TABULAR, VDI_PPDS, COOLPROP, LINEAR
+from thermo.utils.vectorized_correlations import EQ101_vectorized
 from thermo.volume import VolumeGas, VolumeLiquid
 from thermo.vapor_pressure import VaporPressure
 
@@ -535,6 +536,36 @@ class ViscosityLiquid(TPDependentProperty):
             return self._base_calculate(T, method)
         return mu
 
+    def calculate_vectorized(self, Ts, method):
+        r'''Method to calculate the low-pressure viscosity of a liquid at an array of temperatures with a given
+        method; the DIPPR and Viswanath-Natarajan methods are are evaluated with NumPy and other methods are handled by
+        :obj:`thermo.utils.TDependentProperty.calculate_vectorized`.
+
+        Parameters
+        ----------
+        Ts : ndarray
+            Temperatures at which to calculate the property, [K]
+        method : str
+            Name of the method to use
+
+        Returns
+        -------
+        mus : ndarray
+            Viscosities of the liquid at Ts and a low pressure, [Pa*s]
+        '''
+        if method == DIPPR_PERRY_8E:
+            return EQ101_vectorized(Ts, *self.Perrys2_313_coeffs)
+        elif method == DUTT_PRASAD:
+            A, B, C = self.DUTT_PRASAD_coeffs
+            return Viswanath_Natarajan_3(Ts, A, B, C)
+        elif method == VISWANATH_NATARAJAN_3:
+            A, B, C = self.VISWANATH_NATARAJAN_3_coeffs
+            return Viswanath_Natarajan_3(Ts, A, B, C)
+        elif method == VISWANATH_NATARAJAN_2:
+            A, B = self.VISWANATH_NATARAJAN_2_coeffs
+            return np.exp(A + B/Ts)
+        return super(ViscosityLiquid, self).calculate_vectorized(Ts, method)
+
     def test_method_validity(self, T, method):
         r'''Method to check the validity of a method. Follows the given
         ranges for all coefficient-based methods. For CSP methods, the models
@@ -940,6 +971,29 @@ class ViscosityGas(TPDependentProperty):
 
         return mu
 
+    def calculate_vectorized(self, Ts, method):
+        r'''Method to calculate the low-pressure viscosity of a gas at an array of temperatures with a given
+        method; the DIPPR and VDI PPDS methods are are evaluated with NumPy and other methods are handled by
+        :obj:`thermo.utils.TDependentProperty.calculate_vectorized`.
+
+        Parameters
+        ----------
+        Ts : ndarray
+            Temperatures at which to calculate the property, [K]
+        method : str
+            Name of the method to use
+
+        Returns
+        -------
+        mus : ndarray
+            Viscosities of the gas at Ts and a low pressure, [Pa*s]
+        '''
+        if method == DIPPR_PERRY_8E:
+            return EQ102(Ts, *self.Perrys2_312_coeffs)
+        elif method == VDI_PPDS:
+            return horner(self.VDI_PPDS_coeffs, Ts)
+        return super(ViscosityGas, self).calculate_vectorized(Ts, method)
+
     def test_method_validity(self, T, method):
         r'''Method to check the validity of a temperature-dependent
         low-pressure method. For CSP most methods, the all methods are
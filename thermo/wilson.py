@@ -33,7 +33,7 @@ Wilson Class
 ============
 
 .. autoclass:: Wilson
-    :members: to_T_xs, GE, dGE_dT, d2GE_dT2, d3GE_dT3, d2GE_dTdxs, dGE_dxs, d2GE_dxixjs, d3GE_dxixjxks, lambdas, dlambdas_dT, d2lambdas_dT2, d3lambdas_dT3, from_DDBST, from_DDBST_as_matrix
+    :members: to_T_xs, GE, dGE_dT, d2GE_dT2, d3GE_dT3, d2GE_dTdxs, dGE_dxs, d2GE_dxixjs, d3GE_dxixjxks, lambdas, dlambdas_dT, d2lambdas_dT2, d3lambdas_dT3, from_DDBST, from_DDBST_as_matrix, GE_batch, dGE_dxs_batch, d2GE_dxixjs_batch, gammas_batch
     :undoc-members:
     :show-inheritance:
     :exclude-members: gammas
@@ -209,6 +209,32 @@ def wilson_gammas(xs, N, lambdas, xj_Lambda_ijs_inv, gammas=None, vec0=None):
 
     return gammas
 
+def wilson_GE_batch(T, xs, lambdas):
+    # Batch functions take an (M, N) array of compositions
+    log_xj_Lambda_ijs = np.log(np.dot(xs, lambdas.T))
+    return -R*T*(xs*log_xj_Lambda_ijs).sum(axis=1)
+
+def wilson_dGE_dxs_batch(T, xs, lambdas):
+    xj_Lambda_ijs = np.dot(xs, lambdas.T)
+    return -R*T*(np.log(xj_Lambda_ijs) + np.dot(xs/xj_Lambda_ijs, lambdas))
+
+def wilson_d2GE_dxixjs_batch(T, xs, lambdas):
+    M, N = xs.shape
+    xj_Lambda_ijs_inv = 1.0/np.dot(xs, lambdas.T)
+    vec0 = xs*xj_Lambda_ijs_inv*xj_Lambda_ijs_inv
+    lambdas_T = lambdas.T.copy()
+    RT = R*T
+    d2GE_dxixjs = np.zeros((M, N, N))
+    for k in range(N):
+        d2GE_dxixjs[:, k, :] = RT*(np.dot(vec0*lambdas_T[k], lambdas)
+                                   - lambdas[k]*xj_Lambda_ijs_inv[:, k:k+1]
+                                   - lambdas_T[k]*xj_Lambda_ijs_inv)
+    return d2GE_dxixjs
+
+def wilson_gammas_batch(xs, lambdas):
+    xj_Lambda_ijs_inv = 1.0/np.dot(xs, lambdas.T)
+    return np.exp(1.0 - np.dot(xs*xj_Lambda_ijs_inv, lambdas))*xj_Lambda_ijs_inv
+
 MIN_LAMBDA_WILSON = 1e-20
 
 def wilson_gammas_binaries(xs, lambda12, lambda21, calc=None):
@@ -397,6 +423,9 @@ class Wilson(GibbsExcess):
         `e` parameters used in calculating :obj:`Wilson.lambdas`, [K^2]
     lambda_fs : list[list[float]], optional
         `f` parameters used in calculating :obj:`Wilson.lambdas`, [1/K^2]
+    T_cache_size : int, optional
+        Number of temperatures whose `lambda` terms are kept for reuse by the
+        models created with :obj:`Wilson.to_T_xs`; 0 to disable, [-]
 
     Attributes
     ----------
@@ -720,7 +749,7 @@ class Wilson(GibbsExcess):
         return (a_mat, b_mat, c_mat, d_mat, e_mat, f_mat)
 
     def __init__(self, T, xs, lambda_coeffs=None, ABCDEF=None, lambda_as=None, lambda_bs=None,
-                 lambda_cs=None, lambda_ds=None, lambda_es=None, lambda_fs=None):
+                 lambda_cs=None, lambda_ds=None, lambda_es=None, lambda_fs=None, T_cache_size=16):
         self.T = T
         self.xs = xs
         self.scalar = scalar = type(xs) is list
@@ -805,10 +834,12 @@ class Wilson(GibbsExcess):
                     break
                     
             lambda_coeffs_nonzero[k] = nonzero
+        self._set_T_cache(T_cache_size)
 
 
     _model_attributes = ('lambda_as', 'lambda_bs', 'lambda_cs',
                         'lambda_ds', 'lambda_es', 'lambda_fs')
+    _T_only_attributes = ('_lambdas', '_dlambdas_dT', '_d2lambdas_dT2', '_d3lambdas_dT3')
 
     def __repr__(self):
         
@@ -841,6 +872,8 @@ class Wilson(GibbsExcess):
         If the new temperature is the same temperature as the existing
         temperature, if the `lambda` terms or their derivatives have been
         calculated, they will be set to the new object as well.
+        The same is done for any temperature in :obj:`T_cache <thermo.activity.GibbsExcess.T_cache>`,
+        using the last model created there.
         '''
         new = self.__class__.__new__(self.__class__)
         new.T = T
@@ -853,26 +886,7 @@ class Wilson(GibbsExcess):
                  self.lambda_ds, self.lambda_es, self.lambda_fs)
         new.lambda_coeffs_nonzero = self.lambda_coeffs_nonzero
 
-        if T == self.T:
-            try:
-                new._lambdas = self._lambdas
-            except AttributeError:
-                pass
-
-            try:
-                new._dlambdas_dT = self._dlambdas_dT
-            except AttributeError:
-                pass
-
-            try:
-                new._d2lambdas_dT2 = self._d2lambdas_dT2
-            except AttributeError:
-                pass
-
-            try:
-                new._d3lambdas_dT3 = self._d3lambdas_dT3
-            except AttributeError:
-                pass
+        self._transfer_T_only(new)
         return new
 
     def lambdas(self):
@@ -1592,6 +1606,94 @@ class Wilson(GibbsExcess):
         self._gammas = gammas
         return gammas
 
+    def _batch_terms(self, T):
+        lambdas, = self._batch_T_terms(T, 'lambdas')
+        return lambdas
+
+    def GE_batch(self, T, xs_matrix):
+        r'''Calculate and return the excess Gibbs energy of many liquid
+        compositions at the temperature `T` with the Wilson model, evaluating
+        all of them together without creating a model object for each.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        GE : ndarray
+            Excess Gibbs energy of each composition, [J/mol]
+
+        Examples
+        --------
+        >>> GE = Wilson(T=331.42, xs=[0.5, 0.5], ABCDEF=([[0.0, 3.870101271243586], [0.07939943395502425, 0.0]], [[0.0, -1917.2096099114794], [-313.7522384428703, 0.0]], None, None, None, None))
+        >>> GE.GE_batch(331.42, [[0.5, 0.5], [0.25, 0.75]])
+        array([1237.38, 1026.49])
+        '''
+        return wilson_GE_batch(T, self._batch_xs(xs_matrix), self._batch_terms(T))
+
+    def dGE_dxs_batch(self, T, xs_matrix):
+        r'''Calculate and return the mole fraction derivatives of excess Gibbs
+        energy of many liquid compositions at the temperature `T` with the
+        Wilson model. See :obj:`GE_batch`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        dGE_dxs : ndarray
+            Mole fraction derivatives of excess Gibbs energy, one row per
+            composition, [J/mol]
+        '''
+        return wilson_dGE_dxs_batch(T, self._batch_xs(xs_matrix), self._batch_terms(T))
+
+    def d2GE_dxixjs_batch(self, T, xs_matrix):
+        r'''Calculate and return the second mole fraction derivatives of excess
+        Gibbs energy of many liquid compositions at the temperature `T` with
+        the Wilson model. See :obj:`GE_batch`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        d2GE_dxixjs : ndarray
+            Second mole fraction derivatives of excess Gibbs energy, size
+            number of compositions x N x N, [J/mol]
+        '''
+        return wilson_d2GE_dxixjs_batch(T, self._batch_xs(xs_matrix), self._batch_terms(T))
+
+    def gammas_batch(self, T, xs_matrix):
+        r'''Calculate and return the activity coefficients of many liquid
+        compositions at the temperature `T` with the Wilson model. See
+        :obj:`GE_batch`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one composition per row, [-]
+
+        Returns
+        -------
+        gammas : ndarray
+            Activity coefficients, one row per composition, [-]
+        '''
+        return wilson_gammas_batch(self._batch_xs(xs_matrix), self._batch_terms(T))
+
     @classmethod
     def regress_binary_parameters(cls, gammas, xs, use_numba=False,
                                   do_statistics=True, **kwargs):